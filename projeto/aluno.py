@@ -1,7 +1,15 @@
-import json  # Módulo para trabalhar com dados JSON (serialização/desserialização)
-import os    # Módulo para interagir com o sistema operacional (e.g., caminhos de arquivo)
-from auxiliar import load_json, save_json, TURMAS_JSON_PATH, LISTAS_DE_EXERCICIOS_DIR, PROGRESO_ALUNOS_JSON_PATH
-# Importa funções auxiliares e caminhos de arquivos JSON de configuração do sistema.
+from auxiliar import get_backend, valida_nome_lista
+# Importa as funções auxiliares de acesso ao armazenamento e de validação dos nomes das listas.
+# Turmas, listas e progresso são lidos e gravados pelo backend de armazenamento configurado (get_backend()).
+import estatisticas  # Estatísticas de desempenho das turmas, atualizadas a cada evento de progresso.
+import correcao      # Motor de correção das listas (mesmas regras para resultado, revisão e estatísticas).
+import gabaritos     # Gabarito compilado de cada lista, guardado por hash do conteúdo (correção sem reler a lista).
+from respostas import Respostas  # Respostas do aluno com um byte por questão (usadas como um dicionário).
+from modelos import Exercicio, Progresso  # Exercícios com as opções válidas já calculadas (ver modelos.py).
+
+# Quantidade de exercícios exibidos por página nas telas de visualização e revisão de uma lista.
+# Cada página é lida sem interpretar o restante da lista (ver carrega_pagina_lista em auxiliar.py).
+EXERCICIOS_POR_PAGINA = 10
 
 def _get_aluno_turmas_e_listas(matricula_aluno: int) -> dict:
     """
@@ -16,22 +24,9 @@ def _get_aluno_turmas_e_listas(matricula_aluno: int) -> dict:
               dos nomes dos arquivos JSON das listas de exercícios associadas a cada turma.
               Ex: {'Turma A': ['matematica.json', 'portugues.json'], 'Turma B': []}
     """
-    # Carrega todos os dados de turmas do arquivo JSON de turmas.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
-    
-    # Inicializa um dicionário para armazenar as turmas e listas do aluno específico.
-    aluno_listas_por_turma = {}
-
-    # Itera sobre cada turma no dicionário de turmas.
-    for nome_turma, dados_turma in turmas_data.items():
-        # Verifica se a matrícula do aluno está na lista de alunos da turma atual.
-        # Usa .get("alunos", []) para garantir que não haverá erro se a chave 'alunos' não existir.
-        if matricula_aluno in dados_turma.get("alunos", []):
-            # Se o aluno estiver na turma, adiciona o nome da turma como chave e suas listas como valor.
-            # Usa .get("listas", []) para garantir que não haverá erro se a chave 'listas' não existir.
-            aluno_listas_por_turma[nome_turma] = dados_turma.get("listas", [])
-            
-    return aluno_listas_por_turma
+    # Consulta o backend de armazenamento pelas turmas em que o aluno está matriculado.
+    # No backend SQLite a consulta usa o índice de matrículas por aluno.
+    return get_backend().turmas_do_aluno(matricula_aluno)
 
 def abrir_lista(matricula_aluno: int):
     """
@@ -80,13 +75,11 @@ def abrir_lista(matricula_aluno: int):
             nome_arquivo_lista = lista_escolhida_info['nome_arquivo']
             turma_origem = lista_escolhida_info['turma']
             
-            # Constrói o caminho completo para o arquivo JSON da lista de exercícios.
-            lista_full_path = os.path.join(LISTAS_DE_EXERCICIOS_DIR, nome_arquivo_lista)
-            # Carrega os exercícios da lista. Retorna uma lista vazia se o arquivo não for encontrado/válido.
-            exercicios = load_json(lista_full_path, [])
+            # Consulta apenas a quantidade de exercícios: a lista só é lida inteira se o aluno for respondê-la.
+            _, total_exercicios = get_backend().carrega_pagina_lista(nome_arquivo_lista, 0, 0)
 
             # Verifica se a lista de exercícios está vazia.
-            if not exercicios:
+            if not total_exercicios:
                 print(f"A lista '{nome_arquivo_lista}' está vazia ou não pôde ser carregada.")
                 return
 
@@ -94,22 +87,21 @@ def abrir_lista(matricula_aluno: int):
             print(f"\nAbrindo lista: {nome_arquivo_lista} (Turma: {turma_origem})")
             print("1. Visualizar Exercícios")
             print("2. Responder Exercícios")
+            print("3. Responder Exercícios com Correção Imediata")
             sub_escolha = input("Escolha uma opção: ")
 
             if sub_escolha == '1':
-                # Opção de apenas visualizar os exercícios.
+                # Opção de apenas visualizar os exercícios, uma página por vez.
                 print("\n--- Visualizando Exercícios ---")
-                for i, ex in enumerate(exercicios):
-                    print(f"\nExercício {i+1}:")
-                    print(f"Tema: {ex.get('Tema', 'N/A')}")
-                    print(f"Enunciado: {ex.get('Enunciado', 'N/A')}")
-                    print(f"A) {ex.get('Alternativa A', 'N/A')}")
-                    print(f"B) {ex.get('Alternativa B', 'N/A')}")
-                    print(f"C) {ex.get('Alternativa C', 'N/A')}")
-                input("\nPressione Enter para continuar...") # Pausa para o aluno ler.
-            elif sub_escolha == '2':
-                # Opção de responder os exercícios, chamando a função específica.
-                responder_lista(matricula_aluno, nome_arquivo_lista, exercicios)
+                _navega_paginas(nome_arquivo_lista, _exibe_exercicio)
+            elif sub_escolha in ('2', '3'):
+                # Opção de responder os exercícios, chamando a função específica (com a correção de cada
+                # questão logo após a resposta na opção 3).
+                # Os exercícios são apenas lidos, então a instância compartilhada do cache é usada (sem cópia).
+                # O hash da versão carregada permite reaproveitar o gabarito compilado (ver gabaritos.da_lista).
+                exercicios, hash_lista = get_backend().carrega_lista_versionada(nome_arquivo_lista, somente_leitura=True)
+                responder_lista(matricula_aluno, nome_arquivo_lista, exercicios, feedback_imediato=(sub_escolha == '3'),
+                                hash_lista=hash_lista)
             else:
                 print("Opção inválida.")
         else:
@@ -119,25 +111,169 @@ def abrir_lista(matricula_aluno: int):
         print("Entrada inválida. Digite um número válido.")
 
 
-def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list):
+def _exibe_exercicio(indice: int, ex: dict):
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Exibir um exercício (tema, enunciado e alternativas) na tela de visualização de uma lista.
+
+    Args:
+        indice (int): O índice do exercício na lista (a partir de 0).
+        ex (Exercicio | dict): O exercício.
+
+    Returns:
+        None
+    """
+    ex = Exercicio.de(ex)
+    print(f"\nExercício {indice+1}:")
+    print(f"Tema: {ex.get('Tema', 'N/A')}")
+    print(f"Enunciado: {ex.get('Enunciado', 'N/A')}")
+    texto_a, texto_b, texto_c = ex.alternativas
+    print(f"A) {texto_a}")
+    print(f"B) {texto_b}")
+    print(f"C) {texto_c}")
+
+def _navega_paginas(nome_lista_json: str, exibe_exercicio):
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Exibir os exercícios de uma lista em páginas de EXERCICIOS_POR_PAGINA, lendo do backend
+              apenas a página exibida. O aluno avança com Enter, volta com 'a', salta para uma página
+              pelo número ou sai com 's'; Enter na última página também encerra a exibição.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        exibe_exercicio: Função chamada com (índice do exercício na lista, exercício) para cada exercício da página.
+
+    Returns:
+        None: Esta função não retorna valor; ela interage diretamente com o usuário via console.
+    """
+    backend = get_backend()
+    inicio = 0 # Índice do primeiro exercício da página atual.
+    while True:
+        exercicios, total = backend.carrega_pagina_lista(nome_lista_json, inicio, EXERCICIOS_POR_PAGINA)
+        if total == 0:
+            print(f"A lista '{nome_lista_json}' está vazia ou não pôde ser carregada.")
+            return
+        if inicio >= total:
+            # A lista diminuiu desde a última página (ex: foi regravada): volta para a última página existente.
+            inicio = (total - 1) // EXERCICIOS_POR_PAGINA * EXERCICIOS_POR_PAGINA
+            continue
+
+        for deslocamento, ex in enumerate(exercicios):
+            exibe_exercicio(inicio + deslocamento, ex)
+
+        pagina_atual = inicio // EXERCICIOS_POR_PAGINA + 1
+        num_paginas = (total + EXERCICIOS_POR_PAGINA - 1) // EXERCICIOS_POR_PAGINA
+        print(f"\n--- Página {pagina_atual} de {num_paginas} (exercícios {inicio+1} a {inicio+len(exercicios)} de {total}) ---")
+        opcao = input("Enter para a próxima página, 'a' para a anterior, o número de uma página ou 's' para sair: ").strip().lower()
+        if opcao == 's':
+            return
+        elif opcao == '':
+            if pagina_atual == num_paginas:
+                return # Última página: encerra a exibição.
+            inicio += EXERCICIOS_POR_PAGINA
+        elif opcao == 'a':
+            inicio = max(0, inicio - EXERCICIOS_POR_PAGINA)
+        elif opcao.isdigit() and 1 <= int(opcao) <= num_paginas:
+            inicio = (int(opcao) - 1) * EXERCICIOS_POR_PAGINA
+        else:
+            print("Opção inválida.")
+
+def _detalha_erros(exercicios: list, respostas_dadas: dict, situacoes: list) -> list:
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Montar os detalhes dos exercícios errados, com o texto da resposta do aluno e da resposta correta.
+
+    Args:
+        exercicios (list): A lista de exercícios (Exercicio ou dicionários).
+        respostas_dadas (dict): As respostas do aluno (chave: índice do exercício como string, valor: letra).
+        situacoes (list): A situação de cada questão, calculada por correcao.corrige_aluno.
+
+    Returns:
+        list: Dicionários com 'exercicio', 'tema', 'enunciado', 'sua_resposta' e 'resposta_correta'.
+    """
+    erros_detalhes = [] # Lista para armazenar detalhes dos exercícios errados.
+
+    for i, ex in enumerate(exercicios):
+        # Apenas os erros são detalhados para o aluno.
+        if situacoes[i] != correcao.ERRO:
+            continue
+        ex = Exercicio.de(ex) # Opções válidas, resposta correta e textos já calculados na leitura.
+        resposta_aluno = respostas_dadas.get(str(i)) # Resposta que o aluno deu para este exercício (pode ser None se não respondeu).
+
+        # Converte a letra da resposta do aluno para o texto da alternativa para exibição.
+        sua_resposta_texto_detalhe = "N/A"
+        if resposta_aluno in ex.opcoes:
+            sua_resposta_texto_detalhe = ex.texto_opcao(resposta_aluno).upper()
+        elif resposta_aluno == "não respondida": # Caso a resposta seja explicitamente 'não respondida'
+            sua_resposta_texto_detalhe = "Não Respondida"
+        else: # Caso de alguma resposta inválida salva (muito improvável agora, mas para robustez)
+            sua_resposta_texto_detalhe = "Inválida"
+
+        # Converte a letra da resposta correta para o texto da alternativa para exibição.
+        resposta_correta_texto_detalhe = "N/A"
+        if ex.indice_resposta is not None:
+            resposta_correta_texto_detalhe = ex.texto_opcao(ex.resposta).upper()
+
+        # Adiciona os detalhes do erro à lista de erros.
+        erros_detalhes.append({
+            'exercicio': i + 1,
+            'tema': ex.get('Tema', 'N/A'),
+            'enunciado': ex.get('Enunciado', 'N/A'),
+            'sua_resposta': sua_resposta_texto_detalhe,
+            'resposta_correta': resposta_correta_texto_detalhe
+        })
+    return erros_detalhes
+
+def _exibe_correcao_imediata(ex: Exercicio, situacao: int):
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Exibir a correção de uma questão logo após a resposta (modo de correção imediata de responder_lista).
+
+    Args:
+        ex (Exercicio): O exercício respondido.
+        situacao (int): A situação da resposta (correcao.ACERTO ou correcao.ERRO), calculada pelo gabarito compilado.
+
+    Returns:
+        None
+    """
+    if situacao == correcao.ACERTO:
+        print("Resposta correta!")
+    elif ex.indice_resposta is None:
+        print("Resposta registrada. Este exercício não tem resposta correta definida.")
+    else:
+        print(f"Resposta incorreta. Resposta correta: {ex.resposta.upper()}) {ex.texto_opcao(ex.resposta)}")
+
+def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list, feedback_imediato: bool = False,
+                    hash_lista: str = None):
     """
     Objetivo: Permite ao aluno responder a uma lista de exercícios, salvando seu progresso.
+              Cada resposta (e cada 'parar', 'voltar', conclusão ou reinício) é registrada como um evento
+              no diário de progresso, sem reescrever o progresso de todos os alunos.
               Permite continuar de onde parou ou refazer a lista.
               Permite voltar para a questão anterior.
               Ao final, calcula e exibe o desempenho (acertos, erros, não respondidas).
+              No modo de correção imediata, cada resposta também é corrigida e o resultado exibido na hora.
 
     Args:
         matricula_aluno (int): Matrícula do aluno.
         nome_lista_json (str): Nome do arquivo JSON da lista de exercícios sendo respondida.
-        exercicios (list): A lista de dicionários de exercícios carregada.
+        exercicios (list): A lista de exercícios carregada (Exercicio ou dicionários).
+        feedback_imediato (bool, optional): Se True, exibe a correção de cada questão logo após a resposta.
+                                            Padrão para False.
+        hash_lista (str, optional): O hash da versão dos exercícios (ver backend.carrega_lista_versionada). Sem ele,
+                                    o gabarito é compilado a partir dos exercícios a cada chamada. Padrão para None.
 
     Returns:
         None: Esta função não retorna valor; ela interage diretamente com o usuário.
     """
-    # Carrega os dados de progresso de todos os alunos.
-    progresso_alunos_data = load_json(PROGRESO_ALUNOS_JSON_PATH, {})
-    
+    backend = get_backend()
     matricula_str = str(matricula_aluno) # Converte a matrícula para string, pois é usada como chave no JSON.
+    # Exercícios do cache de listas já são Exercicio (sem cópia); as opções válidas de cada um já estão calculadas.
+    exercicios = [Exercicio.de(ex) for ex in exercicios]
+
+    # Carrega apenas o progresso deste aluno, mantendo a mesma estrutura
+    # matrícula -> lista -> dados usada no restante da função.
+    progresso_alunos_data = {matricula_str: backend.carrega_progresso_aluno(matricula_aluno)}
 
     # Inicializa a estrutura de progresso para o aluno, se não existir.
     if matricula_str not in progresso_alunos_data:
@@ -145,12 +281,15 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
     
     # Inicializa a estrutura de progresso para a lista específica para o aluno, se não existir.
     if nome_lista_json not in progresso_alunos_data[matricula_str]:
-        progresso_alunos_data[matricula_str][nome_lista_json] = {
-            'progresso': 0, # Índice do próximo exercício a ser respondido (começa em 0).
-            'respostas': {}, # Dicionário para armazenar as respostas dadas (chave: índice do exercício, valor: resposta do aluno).
-            'status': 'iniciado' # Status da lista para o aluno ('iniciado' ou 'completo').
-        }
+        # Progresso 0 (índice do próximo exercício), sem respostas e com status 'iniciado' (ver modelos.Progresso).
+        progresso_alunos_data[matricula_str][nome_lista_json] = Progresso.novo()
     
+    # Gabarito compilado da lista (ver gabaritos.py) e contribuição atual do aluno para as estatísticas das suas turmas.
+    # As estatísticas são atualizadas uma única vez, quando o aluno para ou completa a lista (ver estatisticas.py),
+    # e não a cada resposta: a atualização substitui a contribuição do aluno, então basta a do fim da sessão.
+    gabarito_lista = gabaritos.da_lista(nome_lista_json, exercicios, hash_lista)
+    contribuicao_aluno = estatisticas.contribuicao(progresso_alunos_data[matricula_str][nome_lista_json], gabarito_lista)
+
     # Lógica para permitir refazer a lista se ela já estiver completa.
     current_status = progresso_alunos_data[matricula_str][nome_lista_json].get('status', 'iniciado')
     if current_status == 'completo':
@@ -159,9 +298,9 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
         if refazer == 's':
             # Reseta o progresso e as respostas para permitir que a lista seja refeita.
             progresso_alunos_data[matricula_str][nome_lista_json]['progresso'] = 0
-            progresso_alunos_data[matricula_str][nome_lista_json]['respostas'] = {}
+            progresso_alunos_data[matricula_str][nome_lista_json]['respostas'] = Respostas()
             progresso_alunos_data[matricula_str][nome_lista_json]['status'] = 'iniciado'
-            save_json(progresso_alunos_data, PROGRESO_ALUNOS_JSON_PATH)
+            backend.registra_evento(matricula_aluno, nome_lista_json, "reinicio")
             print("Lista reiniciada com sucesso!")
         else:
             print("Voltando ao menu do aluno.")
@@ -186,21 +325,12 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
         print(f"\nExercício {indice_atual + 1} de {len(exercicios)}:")
         print(f"Tema: {ex.get('Tema', 'N/A')}")
         print(f"Enunciado: {ex.get('Enunciado', 'N/A')}")
-        
-        # Extrai as alternativas do exercício.
-        alternativas = [
-            ex.get('Alternativa A', 'N/A'),
-            ex.get('Alternativa B', 'N/A'),
-            ex.get('Alternativa C', 'N/A')
-        ]
-        
-        opcoes_validas = [] # Lista de letras válidas para as opções (e.g., 'a', 'b', 'c').
-        # Exibe as alternativas formatadas e preenche as opções válidas.
-        for idx_alt, alt_text in enumerate(alternativas):
-            if alt_text != 'N/A': # Apenas exibe alternativas que têm conteúdo.
-                letra_opcao = chr(65 + idx_alt) # Converte o índice (0, 1, 2) para letra (A, B, C).
-                print(f"{letra_opcao}) {alt_text}")
-                opcoes_validas.append(letra_opcao.lower()) # Adiciona a letra em minúsculo para validação.
+
+        # Letras das alternativas preenchidas (e.g., ('a', 'b', 'c')), calculadas uma vez na leitura da lista.
+        opcoes_validas = ex.opcoes
+        # Exibe apenas as alternativas que têm conteúdo.
+        for letra_opcao in opcoes_validas:
+            print(f"{letra_opcao.upper()}) {ex.texto_opcao(letra_opcao)}")
 
         # Constrói o prompt de entrada, incluindo opções para 'voltar' e 'parar'.
         prompt_opcoes = f"Sua resposta ({'/'.join(opcoes_validas)}"
@@ -215,7 +345,9 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
             if resposta == 'parar':
                 # Salva o progresso e as respostas antes de sair.
                 progresso_alunos_data[matricula_str][nome_lista_json]['progresso'] = indice_atual # Salva o índice da questão atual.
-                save_json(progresso_alunos_data, PROGRESO_ALUNOS_JSON_PATH)
+                backend.registra_evento(matricula_aluno, nome_lista_json, "parar", progresso=indice_atual)
+                estatisticas.atualiza_aluno(matricula_aluno, nome_lista_json, gabarito_lista,
+                                            contribuicao_aluno, progresso_alunos_data[matricula_str][nome_lista_json])
                 print("Progresso salvo. Você pode continuar esta lista mais tarde.")
                 return # Sai da função.
             
@@ -223,6 +355,8 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
                 # Permite voltar à questão anterior.
                 print("Voltando para a questão anterior...")
                 indice_atual -= 1 # Decrementa o índice para retroceder.
+                progresso_alunos_data[matricula_str][nome_lista_json]['progresso'] = indice_atual
+                backend.registra_evento(matricula_aluno, nome_lista_json, "voltar", progresso=indice_atual)
                 break # Sai do loop interno, o loop externo redesenhará a questão anterior.
             elif resposta == 'voltar' and indice_atual == 0:
                 # Impede que o aluno volte além da primeira questão.
@@ -230,69 +364,33 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
             elif resposta in opcoes_validas:
                 # Se a resposta é uma opção válida, salva-a e avança para a próxima questão.
                 respostas_dadas[str(indice_atual)] = resposta # Salva a resposta do exercício atual.
+                # Registra a resposta após cada resposta para maior segurança (um único registro por resposta).
+                backend.registra_evento(matricula_aluno, nome_lista_json, "resposta",
+                                        indice=indice_atual, resposta=resposta, progresso=indice_atual + 1)
+                if feedback_imediato:
+                    # Correção da questão pelo gabarito compilado: uma consulta ao vetor, sem reler a lista.
+                    _exibe_correcao_imediata(ex, gabarito_lista.corrige(indice_atual, resposta))
                 indice_atual += 1 # Incrementa o índice para a próxima questão.
-                # Salva o progresso e as respostas após cada resposta para maior segurança.
                 progresso_alunos_data[matricula_str][nome_lista_json]['progresso'] = indice_atual
                 progresso_alunos_data[matricula_str][nome_lista_json]['respostas'] = respostas_dadas
-                save_json(progresso_alunos_data, PROGRESO_ALUNOS_JSON_PATH)
                 break # Sai do loop interno para o loop externo prosseguir.
             else:
                 print("Opção inválida. Tente novamente.")
         
     # Se o loop 'while indice_atual < len(exercicios)' terminar, significa que todos os exercícios foram respondidos.
     progresso_alunos_data[matricula_str][nome_lista_json]['status'] = 'completo' # Marca a lista como completa.
-    save_json(progresso_alunos_data, PROGRESO_ALUNOS_JSON_PATH) # Salva o status final.
+    backend.registra_evento(matricula_aluno, nome_lista_json, "completo") # Salva o status final.
+    estatisticas.atualiza_aluno(matricula_aluno, nome_lista_json, gabarito_lista,
+                                contribuicao_aluno, progresso_alunos_data[matricula_str][nome_lista_json])
     print("\nVocê completou esta lista de exercícios!")
 
     # --- Cálculo e Exibição dos Resultados Finais ---
-    acertos = 0
-    erros = 0
-    nao_respondidas = 0
-    erros_detalhes = [] # Lista para armazenar detalhes dos exercícios errados.
-
-    for i, ex in enumerate(exercicios):
-        resposta_aluno = respostas_dadas.get(str(i)) # Resposta que o aluno deu para este exercício (pode ser None se não respondeu).
-        resposta_correta = ex.get('RespostaCorreta', '').lower() # A resposta correta (letra em minúsculo) salva no JSON.
-
-        # Obtém as opções válidas (letras 'a', 'b', 'c') para este exercício, para ajudar na exibição do texto.
-        opcoes_validas_ex = []
-        for idx_alt, alt_text in enumerate([ex.get('Alternativa A', 'N/A'), ex.get('Alternativa B', 'N/A'), ex.get('Alternativa C', 'N/A')]):
-            if alt_text != 'N/A':
-                opcoes_validas_ex.append(chr(65+idx_alt).lower())
-
-        if resposta_aluno is None:
-            nao_respondidas += 1
-        elif resposta_aluno == resposta_correta: # Compara a letra da resposta do aluno com a letra da resposta correta.
-            acertos += 1
-        else:
-            erros += 1
-            # Para exibir o texto completo da alternativa, não apenas a letra, recriamos a lista de textos.
-            alternativas_ex_text = [ex.get('Alternativa A', ''), ex.get('Alternativa B', ''), ex.get('Alternativa C', '')]
-            
-            # Converte a letra da resposta do aluno para o texto da alternativa para exibição.
-            sua_resposta_texto_detalhe = "N/A"
-            if resposta_aluno in opcoes_validas_ex:
-                idx_resp_aluno = opcoes_validas_ex.index(resposta_aluno)
-                sua_resposta_texto_detalhe = alternativas_ex_text[idx_resp_aluno].upper()
-            elif resposta_aluno == "não respondida": # Caso a resposta seja explicitamente 'não respondida'
-                sua_resposta_texto_detalhe = "Não Respondida"
-            else: # Caso de alguma resposta inválida salva (muito improvável agora, mas para robustez)
-                sua_resposta_texto_detalhe = "Inválida"
-
-            # Converte a letra da resposta correta para o texto da alternativa para exibição.
-            resposta_correta_texto_detalhe = "N/A"
-            if resposta_correta in opcoes_validas_ex:
-                idx_resp_correta = opcoes_validas_ex.index(resposta_correta)
-                resposta_correta_texto_detalhe = alternativas_ex_text[idx_resp_correta].upper()
-
-            # Adiciona os detalhes do erro à lista de erros.
-            erros_detalhes.append({
-                'exercicio': i + 1,
-                'tema': ex.get('Tema', 'N/A'),
-                'enunciado': ex.get('Enunciado', 'N/A'),
-                'sua_resposta': sua_resposta_texto_detalhe,
-                'resposta_correta': resposta_correta_texto_detalhe
-            })
+    # A correção (acertos, erros e não respondidas) é feita pelo motor de correção (ver correcao.py).
+    resultado = correcao.corrige_aluno(gabarito_lista, respostas_dadas)
+    acertos = resultado["acertos"]
+    erros = resultado["erros"]
+    nao_respondidas = resultado["nao_respondidas"]
+    erros_detalhes = _detalha_erros(exercicios, respostas_dadas, resultado["situacoes"]) # Detalhes dos exercícios errados.
 
     # Imprime o resumo dos resultados.
     print("\n--- Resultados Finais ---")
@@ -314,6 +412,217 @@ def responder_lista(matricula_aluno: int, nome_lista_json: str, exercicios: list
     input("\nPressione Enter para continuar...") # Pausa para o aluno ler os resultados.
 
 
+# --- Envio da Lista Inteira ---
+# Para respostas coletadas fora do console (ex: folhas de respostas lidas por uma leitora óptica), a lista
+# inteira é enviada de uma vez: as respostas são validadas contra as alternativas de cada exercício, gravadas
+# como um único evento 'envio' (a lista fica 'completo') e corrigidas na hora. As chaves das respostas são os
+# índices dos exercícios a partir de 0, como no progresso gravado; respostas vazias contam como não respondidas.
+
+def _valida_respostas(gabarito_lista: correcao.GabaritoCompilado, respostas) -> tuple:
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Validar as respostas enviadas para uma lista inteira.
+
+    Args:
+        gabarito_lista (GabaritoCompilado): O gabarito compilado da lista (ver gabaritos.py), com as alternativas válidas.
+        respostas (dict): Índice do exercício (int ou str, a partir de 0) -> letra da resposta.
+
+    Returns:
+        tuple: (respostas_normalizadas, mensagem). 'respostas_normalizadas' usa as chaves e letras no formato do
+               progresso ({'0': 'a', ...}); 'mensagem' descreve o primeiro problema encontrado, ou é None.
+    """
+    if not isinstance(respostas, dict):
+        return None, "As respostas devem ser um mapeamento de índice do exercício para a letra."
+    normalizadas = {}
+    problemas = []
+    for indice, letra in respostas.items():
+        try:
+            i = int(indice)
+        except (TypeError, ValueError):
+            problemas.append(f"índice '{indice}' inválido")
+            continue
+        if not 0 <= i < len(gabarito_lista):
+            problemas.append(f"exercício {indice} não existe (a lista tem {len(gabarito_lista)})")
+            continue
+        if letra is None or str(letra).strip() == "":
+            continue # Não respondida.
+        letra = str(letra).strip().lower()
+        if not gabarito_lista.opcao_valida(i, letra):
+            problemas.append(f"resposta '{letra}' inválida para o exercício {i + 1}")
+            continue
+        normalizadas[str(i)] = letra
+    if problemas:
+        return None, "Respostas inválidas: " + "; ".join(problemas) + "."
+    return normalizadas, None
+
+def envia_respostas(matricula_aluno: int, nome_lista_json: str, respostas: dict) -> dict:
+    """
+    Objetivo: Enviar de uma vez todas as respostas de um aluno para uma lista, marcando-a como completa.
+              As respostas são gravadas em um único evento e o resultado é o mesmo exibido por responder_lista.
+
+    Args:
+        matricula_aluno (int): Matrícula do aluno.
+        nome_lista_json (str): Nome do arquivo JSON da lista de exercícios.
+        respostas (dict): Índice do exercício (a partir de 0) -> letra da resposta ('a', 'b', 'c').
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação, uma 'mensagem' descritiva e, em caso de sucesso,
+              'total', 'acertos', 'erros', 'nao_respondidas' e 'erros_detalhes'.
+    """
+    resultado = envia_respostas_lote([{"matricula": matricula_aluno, "lista": nome_lista_json, "respostas": respostas}])
+    if resultado["erros"]:
+        return {"status": "erro", "mensagem": resultado["erros"][0]["mensagem"]}
+    correcao_aluno = dict(resultado["resultados"][0])
+    for chave in ("registro", "matricula", "lista"):
+        del correcao_aluno[chave]
+    return {"status": "sucesso", "mensagem": f"Respostas da lista '{nome_lista_json}' enviadas com sucesso!", **correcao_aluno}
+
+def envia_respostas_lote(envios: list) -> dict:
+    """
+    Objetivo: Enviar as respostas de vários alunos de uma vez (ex: importação de uma leitora de folhas de respostas).
+              Cada envio é validado separadamente; os válidos são gravados juntos (uma transação no backend SQLite,
+              um acréscimo por aluno no backend JSON) e as estatísticas de cada turma são atualizadas uma única vez.
+
+    Args:
+        envios (list): Dicionários com 'matricula', 'lista' e 'respostas' (como em envia_respostas).
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação ('sucesso', 'aviso' se parte dos envios falhou, 'erro' se
+              nenhum foi gravado), uma 'mensagem' descritiva, a quantidade de 'enviados', os 'erros'
+              ([{'registro', 'mensagem'}], com a posição do envio a partir de 1) e os 'resultados' de cada envio
+              gravado ([{'registro', 'matricula', 'lista', 'total', 'acertos', 'erros', 'nao_respondidas', 'erros_detalhes'}]).
+    """
+    backend = get_backend()
+    erros = []
+    validos = [] # (posição, matrícula, lista, respostas normalizadas).
+    exercicios_por_lista = {} # Cache das listas já carregadas neste lote: (exercícios, hash da versão); (None, None) se a lista não existe.
+    gabaritos_por_lista = {}  # Gabarito compilado de cada lista do lote (ver gabaritos.py).
+    vistos = set()
+
+    for posicao, envio in enumerate(envios, start=1):
+        try:
+            matricula = int(envio.get("matricula"))
+        except (TypeError, ValueError, AttributeError):
+            erros.append({"registro": posicao, "mensagem": "Matrícula inválida."})
+            continue
+        nome_lista_json = str(envio.get("lista") or "").strip()
+        if nome_lista_json not in exercicios_por_lista:
+            try:
+                existe = backend.lista_existe(valida_nome_lista(nome_lista_json))
+            except ValueError:
+                existe = False # Nome que não é de uma lista (ex: '../usuarios.json').
+            exercicios_por_lista[nome_lista_json] = (backend.carrega_lista_versionada(nome_lista_json, somente_leitura=True)
+                                                     if existe else (None, None))
+        exercicios, hash_lista = exercicios_por_lista[nome_lista_json]
+        if exercicios is None:
+            erros.append({"registro": posicao, "mensagem": f"A lista '{nome_lista_json}' não existe."})
+            continue
+        if nome_lista_json not in gabaritos_por_lista:
+            gabaritos_por_lista[nome_lista_json] = gabaritos.da_lista(nome_lista_json, exercicios, hash_lista)
+        if not any(nome_lista_json in listas for listas in _get_aluno_turmas_e_listas(matricula).values()):
+            erros.append({"registro": posicao, "mensagem": f"O aluno {matricula} não está em uma turma com a lista '{nome_lista_json}'."})
+            continue
+        if (matricula, nome_lista_json) in vistos:
+            erros.append({"registro": posicao, "mensagem": f"Envio repetido do aluno {matricula} para a lista '{nome_lista_json}'."})
+            continue
+        respostas, mensagem = _valida_respostas(gabaritos_por_lista[nome_lista_json], envio.get("respostas"))
+        if mensagem:
+            erros.append({"registro": posicao, "mensagem": mensagem})
+            continue
+        vistos.add((matricula, nome_lista_json))
+        validos.append((posicao, matricula, nome_lista_json, respostas))
+
+    resultados = []
+    if validos:
+        # Progresso anterior dos alunos, para retirar das estatísticas a contribuição que será substituída.
+        progresso_anterior = backend.carrega_progresso_alunos(sorted({v[1] for v in validos}), somente_leitura=True)
+        backend.registra_eventos([{"matricula": matricula, "lista": nome_lista_json, "evento": "envio",
+                                   "respostas": respostas, "progresso": len(exercicios_por_lista[nome_lista_json][0])}
+                                  for _, matricula, nome_lista_json, respostas in validos])
+
+        mudancas_por_lista = {} # Nome da lista -> [(matrícula, contribuição anterior, novo progresso)].
+        for posicao, matricula, nome_lista_json, respostas in validos:
+            exercicios = exercicios_por_lista[nome_lista_json][0]
+            gabarito_lista = gabaritos_por_lista[nome_lista_json]
+            anterior = estatisticas.contribuicao(progresso_anterior.get(str(matricula), {}).get(nome_lista_json), gabarito_lista)
+            mudancas_por_lista.setdefault(nome_lista_json, []).append(
+                (matricula, anterior, {'progresso': len(exercicios), 'respostas': respostas, 'status': 'completo'}))
+
+            resultado = correcao.corrige_aluno(gabarito_lista, respostas)
+            resultados.append({
+                "registro": posicao, "matricula": matricula, "lista": nome_lista_json,
+                "total": len(exercicios), "acertos": resultado["acertos"], "erros": resultado["erros"],
+                "nao_respondidas": resultado["nao_respondidas"],
+                "erros_detalhes": _detalha_erros(exercicios, respostas, resultado["situacoes"]),
+            })
+        for nome_lista_json, mudancas in mudancas_por_lista.items():
+            estatisticas.atualiza_alunos(nome_lista_json, gabaritos_por_lista[nome_lista_json], mudancas)
+
+    status = "sucesso" if not erros else ("aviso" if resultados else "erro")
+    return {"status": status, "mensagem": f"{len(resultados)} envio(s) gravado(s), {len(erros)} erro(s).",
+            "enviados": len(resultados), "erros": erros, "resultados": resultados}
+
+
+def _exibe_revisao(i: int, ex: dict, respostas_aluno: dict, gabarito_lista: correcao.GabaritoCompilado):
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Exibir a revisão de um exercício: a questão, a resposta dada pelo aluno, a resposta correta e o status.
+
+    Args:
+        i (int): O índice do exercício na lista (a partir de 0).
+        ex (Exercicio | dict): O exercício.
+        respostas_aluno (dict): As respostas do aluno (chave: índice do exercício como string, valor: letra).
+        gabarito_lista (GabaritoCompilado): O gabarito compilado da lista (ver gabaritos.py).
+
+    Returns:
+        None
+    """
+    ex = Exercicio.de(ex) # Opções válidas, resposta correta e textos já calculados na leitura.
+    # Corrige a questão pelo gabarito compilado (ver correcao.py), com as mesmas regras da lista inteira.
+    if i < len(gabarito_lista):
+        situacao = gabarito_lista.corrige(i, respostas_aluno.get(str(i)))
+    else: # A lista cresceu depois de o gabarito ser obtido: a questão é corrigida pelo próprio exercício.
+        situacao = correcao.corrige_aluno([ex], {"0": respostas_aluno.get(str(i))})["situacoes"][0]
+    resposta_dada = respostas_aluno.get(str(i), "Não respondida") # Resposta do aluno.
+    resposta_correta = ex.resposta # Resposta correta do exercício (letra em minúsculo, "" se não definida).
+
+    print(f"\nExercício {i+1}:")
+    print(f"Tema: {ex.get('Tema', 'N/A')}")
+    print(f"Enunciado: {ex.get('Enunciado', 'N/A')}")
+
+    # Exibe as alternativas completas do exercício.
+    texto_a, texto_b, texto_c = ex.alternativas
+    print(f"A) {texto_a}")
+    print(f"B) {texto_b}")
+    print(f"C) {texto_c}")
+
+    # Formata a resposta do aluno para exibição (letra para texto da alternativa).
+    sua_resposta_texto = "Não respondida"
+    if resposta_dada in ex.opcoes:
+        sua_resposta_texto = ex.texto_opcao(resposta_dada).upper()
+    elif resposta_dada == "não respondida":
+        sua_resposta_texto = resposta_dada.upper()
+    else:
+        sua_resposta_texto = "Resposta Inválida: " + resposta_dada.upper()
+
+    # Formata a resposta correta para exibição (letra para texto da alternativa).
+    resposta_correta_texto_ex = "Não Definida"
+    if ex.indice_resposta is not None:
+        resposta_correta_texto_ex = ex.texto_opcao(resposta_correta).upper()
+
+    print(f"Sua Resposta: {sua_resposta_texto}")
+    if resposta_correta: # Verifica se a resposta correta foi definida para o exercício.
+        print(f"Resposta Correta: {resposta_correta_texto_ex}")
+        # Situação da questão calculada pelo motor de correção.
+        if situacao == correcao.ACERTO:
+             print("Status: Correta")
+        elif situacao == correcao.NAO_RESPONDIDA:
+             print("Status: Não Respondida")
+        else:
+             print("Status: Incorreta")
+    else:
+        print("Status: Resposta correta não definida para este exercício.")
+
 def revisar_lista(matricula_aluno: int):
     """
     Objetivo: Permite ao aluno revisar uma lista de exercícios que já respondeu (total ou parcialmente).
@@ -326,9 +635,10 @@ def revisar_lista(matricula_aluno: int):
         None: Esta função não retorna valor; interage diretamente com o usuário.
     """
     print("\n--- Revisar Lista ---")
-    # Carrega os dados de progresso de todos os alunos.
-    progresso_alunos_data = load_json(PROGRESO_ALUNOS_JSON_PATH, {})
+    backend = get_backend()
     matricula_str = str(matricula_aluno)
+    # Carrega apenas o progresso deste aluno. Apenas consulta: sem cópia.
+    progresso_alunos_data = {matricula_str: backend.carrega_progresso_aluno(matricula_aluno, somente_leitura=True)}
 
     # Verifica se o aluno tem algum progresso registrado.
     if matricula_str not in progresso_alunos_data or not progresso_alunos_data[matricula_str]:
@@ -362,64 +672,16 @@ def revisar_lista(matricula_aluno: int):
             nome_lista_json = lista_info['nome_lista']
             respostas_aluno = lista_info['dados'].get('respostas', {}) # Respostas dadas pelo aluno.
 
-            # Carrega os exercícios da lista para ter o enunciado e as alternativas corretas.
-            lista_full_path = os.path.join(LISTAS_DE_EXERCICIOS_DIR, nome_lista_json)
-            exercicios = load_json(lista_full_path, [])
-
-            if not exercicios:
+            # Verifica se a lista tem exercícios (sem lê-la inteira).
+            _, total_exercicios = backend.carrega_pagina_lista(nome_lista_json, 0, 0)
+            if not total_exercicios:
                 print(f"Não foi possível carregar os exercícios para a lista '{nome_lista_json}'.")
                 return
 
             print(f"\n--- Revisão da Lista: {nome_lista_json} ---")
-            # Itera sobre cada exercício para exibir a revisão.
-            for i, ex in enumerate(exercicios):
-                resposta_dada = respostas_aluno.get(str(i), "Não respondida") # Resposta do aluno.
-                resposta_correta = ex.get('RespostaCorreta', '').lower() # Resposta correta do exercício.
-
-                print(f"\nExercício {i+1}:")
-                print(f"Tema: {ex.get('Tema', 'N/A')}")
-                print(f"Enunciado: {ex.get('Enunciado', 'N/A')}")
-                
-                # Exibe as alternativas completas do exercício.
-                alternativas_ex = [
-                    ex.get('Alternativa A', 'N/A'),
-                    ex.get('Alternativa B', 'N/A'),
-                    ex.get('Alternativa C', 'N/A')
-                ]
-                print(f"A) {alternativas_ex[0]}")
-                print(f"B) {alternativas_ex[1]}")
-                print(f"C) {alternativas_ex[2]}")
-                
-                # Para converter a letra da resposta para o texto da alternativa para exibição.
-                opcoes_validas_ex = [chr(65+j).lower() for j, alt_text in enumerate(alternativas_ex) if alt_text != 'N/A']
-
-                # Formata a resposta do aluno para exibição (letra para texto da alternativa).
-                sua_resposta_texto = "Não respondida"
-                if resposta_dada in opcoes_validas_ex:
-                    sua_resposta_texto = alternativas_ex[opcoes_validas_ex.index(resposta_dada)].upper()
-                elif resposta_dada == "não respondida":
-                    sua_resposta_texto = resposta_dada.upper()
-                else:
-                    sua_resposta_texto = "Resposta Inválida: " + resposta_dada.upper()
-
-                # Formata a resposta correta para exibição (letra para texto da alternativa).
-                resposta_correta_texto_ex = "Não Definida"
-                if resposta_correta in opcoes_validas_ex:
-                    resposta_correta_texto_ex = alternativas_ex[opcoes_validas_ex.index(resposta_correta)].upper()
-
-                print(f"Sua Resposta: {sua_resposta_texto}")
-                if resposta_correta: # Verifica se a resposta correta foi definida para o exercício.
-                    print(f"Resposta Correta: {resposta_correta_texto_ex}")
-                    # Compara a resposta do aluno (letra) com a resposta correta (letra).
-                    if resposta_dada == resposta_correta:
-                         print("Status: Correta")
-                    elif resposta_dada == "não respondida":
-                         print("Status: Não Respondida")
-                    else:
-                         print("Status: Incorreta")
-                else:
-                    print("Status: Resposta correta não definida para este exercício.")
-            input("\nPressione Enter para continuar...") # Pausa para o aluno ler a revisão.
+            # Exibe a revisão uma página por vez; cada página é lida e corrigida separadamente.
+            gabarito_lista = gabaritos.da_lista(nome_lista_json) # Da memória ou do disco, sem reler a lista.
+            _navega_paginas(nome_lista_json, lambda i, ex: _exibe_revisao(i, ex, respostas_aluno, gabarito_lista))
         else:
             print("Opção inválida.")
     except ValueError:
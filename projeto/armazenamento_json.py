@@ -0,0 +1,1202 @@
+import os  # Importa o módulo 'os' para manipular os caminhos das listas de exercícios.
+import sys      # Lê os argumentos da linha de comando (ex: 'python armazenamento_json.py migrar').
+import time     # Momento da conferência do catálogo de listas (ver catalogo_listas).
+import json     # Registros do log do catálogo de listas (uma linha JSON por lista alterada).
+import threading  # Protege a junção em memória da base com o log do catálogo de listas.
+import re       # Usado para montar nomes de arquivo seguros a partir dos nomes das turmas.
+import hashlib  # Usado para que nomes de turmas diferentes nunca gerem o mesmo arquivo.
+import auxiliar   # Funções load_json/save_json e caminhos dos arquivos (lidos no momento da chamada).
+import listas_exercicios  # Formato de acréscimo (JSONL) dos arquivos das listas de exercícios.
+import progresso  # Armazenamento do progresso dos alunos (partições por aluno + diário de eventos).
+import diretorio_usuarios  # Usuários: log de registros + índice de hash (ver diretorio_usuarios.py).
+from modelos import Turma  # Cópia editável de uma turma, como objeto com __slots__ (ver modelos.py).
+
+# --- Backend de Armazenamento em Arquivos JSON ---
+# Implementa a interface de armazenamento descrita em auxiliar.py usando arquivos JSON:
+# 'usuarios.json' (lido pelo diretório indexado de 'diretorio_usuarios'), um documento por turma (ver abaixo),
+# uma lista de exercícios por arquivo em LISTAS_DE_EXERCICIOS_DIR e o progresso dos alunos gerenciado pelo módulo 'progresso'.
+# As leituras passam pelo cache de load_json; as gravações reescrevem apenas o arquivo afetado.
+# Vários processos podem usar os mesmos arquivos: as alterações de uma turma são feitas sob a trava do
+# documento da turma (auxiliar.trava_arquivo); catálogo, índice, listas e estatísticas usam gravações otimistas
+# (auxiliar.atualiza_json) e o progresso e os usuários travam apenas o registro afetado.
+
+# --- Turmas Particionadas ---
+# Cada turma é gravada em seu próprio documento, no diretório ao lado de 'turmas.json' ('json/turmas/'):
+#   catalogo.json       -> {nome da turma: arquivo}, alterado apenas quando uma turma é criada
+#   <nome>-<hash>.json  -> {"alunos": [...], "listas": [...]}, um por turma (ver _arquivo_turma)
+# Alterar uma turma regrava só o seu documento, e turmas diferentes nunca disputam a mesma trava.
+# O antigo 'turmas.json' (um único arquivo com todas as turmas) continua aceito: se ele existir, é importado
+# automaticamente para os documentos das turmas e renomeado para 'turmas.json.migrado' (ver migra_turmas_monolitico).
+
+# --- Catálogo de Listas de Exercícios ---
+# Os metadados de cada lista (tamanho, quantidade de exercícios, temas e hash do conteúdo; ver auxiliar.resumo_lista)
+# ficam em um catálogo persistido ao lado do diretório de listas, no mesmo esquema do diretório de usuários
+# (ver diretorio_usuarios.py): uma base e um log somente de acréscimo, em que vale o último registro de cada lista.
+#   listas_de_exercicios_catalogo.json -> base: {"formato", "diretorio": mtime do diretório, "verificado_ns":
+#                                         momento da conferência, "listas": {nome: metadados},
+#                                         "log": [inode do log, bytes do log já incluídos na base]}
+#   listas_de_exercicios_catalogo.log  -> uma linha {"nome", "entrada"} por lista gravada desde a base
+# Enquanto o mtime do diretório for o gravado, o catálogo é usado sem nenhum acesso aos arquivos das listas.
+# Criar, remover ou regravar (de forma atômica) uma lista muda esse mtime; nesse caso os arquivos são
+# conferidos com os.stat, só os que mudaram são abertos de novo e o resultado é gravado como nova base.
+# Acréscimos de exercícios não mudam o diretório: salva_lista e acrescenta_exercicio(s) (usados por
+# professor.cria_exercicio(s)) acrescentam ao log a entrada da lista alterada, sem regravar o catálogo.
+# Um acréscimo também não relê a lista: a entrada anterior é estendida com os exercícios novos
+# (auxiliar.estende_resumo_lista), desde que ela descreva o arquivo como estava antes do acréscimo (mesma
+# assinatura); caso contrário, a entrada é refeita a partir do arquivo.
+# A leitura junta a base com o log (cada processo lê só as linhas novas) e, quando o log passa de
+# CATALOGO_LOG_MAX_REGISTROS registros, compacta-o: grava uma nova base com tudo e recomeça o log vazio.
+# Se o log não for o indicado pela base (ex: queda no meio de uma compactação) ou o catálogo for de outro
+# formato (FORMATO_CATALOGO_LISTAS), ele é refeito a partir do diretório.
+
+# --- Índice de Matrículas por Aluno ---
+# Para que abrir o menu de um aluno não percorra todas as turmas, é mantido um índice persistido
+# ao lado dos documentos das turmas, no diretório 'turmas_indice/':
+#   versao.json   -> {"formato": FORMATO_INDICE}, gravado quando o índice termina de ser construído
+#   <balde>.json  -> {matrícula: [turmas]}, com as matrículas distribuídas em NUM_BALDES_INDICE arquivos
+# O índice pode conter turmas a mais, mas nunca a menos: a matrícula é registrada nele antes de ser gravada
+# na turma e retirada só depois. turmas_do_aluno confere cada turma indicada no documento da própria turma.
+
+# Versão do formato do catálogo de listas (3: base + log de acréscimos; o hash é encadeado linha a linha,
+# ver auxiliar.hash_linhas).
+FORMATO_CATALOGO_LISTAS = 3
+# Quantidade de registros no log do catálogo a partir da qual uma leitura o compacta na base.
+CATALOGO_LOG_MAX_REGISTROS = 1024
+
+# Junção da base com o log já lida neste processo, para que cada leitura processe só as linhas novas do log:
+# {"base": instância da base (cache de load_json), "inode", "consumido": bytes do log já aplicados,
+#  "listas": nome -> metadados (instância compartilhada), "registros": linhas aplicadas}, por caminho do log.
+_catalogo_memoria = {}
+_catalogo_lock = threading.Lock()
+
+# Quantidade de arquivos (baldes) em que o índice de matrículas é dividido.
+NUM_BALDES_INDICE = 64
+
+# Versão do formato do índice; índices de outro formato (ou incompletos) são reconstruídos na próxima consulta.
+FORMATO_INDICE = 2
+
+# --- Matrículas das Turmas em Memória ---
+# Os alunos de cada turma são mantidos em memória como um conjunto (set), para que verificar, inserir e
+# remover uma matrícula custe tempo constante mesmo em turmas muito grandes. No documento da turma eles
+# continuam gravados como uma lista, sempre ordenada, para manter o formato estável.
+# Cada conjunto vale para uma versão do documento da turma (auxiliar.versao_json) e é recriado se ele mudar.
+_alunos_em_memoria = {}  # Nome da turma -> (versão do documento da turma, conjunto de matrículas).
+
+def inicializa():
+    """
+    Objetivo: Garantir que os diretórios e arquivos JSON essenciais existam.
+
+    Returns:
+        None
+    """
+    os.makedirs(auxiliar.LISTAS_DE_EXERCICIOS_DIR, exist_ok=True)
+    os.makedirs(_turmas_dir(), exist_ok=True)
+    _migra_se_necessario()
+    diretorio_usuarios.inicializa()
+
+# --- Usuários ---
+# Buscas e inserções leem ou gravam apenas o registro do usuário (ver diretorio_usuarios.py).
+
+def busca_usuario(matricula_str: str) -> dict:
+    """
+    Objetivo: Buscar um usuário pela matrícula.
+
+    Args:
+        matricula_str (str): A matrícula do usuário (como string).
+
+    Returns:
+        dict: Uma cópia dos dados do usuário, ou None se a matrícula não existir.
+    """
+    return diretorio_usuarios.busca(matricula_str)
+
+def busca_usuarios(matriculas: list) -> dict:
+    """
+    Objetivo: Buscar vários usuários de uma vez (ex: os alunos de uma turma).
+
+    Args:
+        matriculas (list): As matrículas procuradas (inteiros ou strings).
+
+    Returns:
+        dict: Matrícula (string) -> cópia dos dados do usuário, apenas para as matrículas encontradas.
+    """
+    return diretorio_usuarios.busca_varios(matriculas)
+
+def insere_usuario(usuario: dict) -> bool:
+    """
+    Objetivo: Cadastrar um novo usuário.
+
+    Args:
+        usuario (dict): Os dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi cadastrado, False se a matrícula já existia.
+    """
+    return diretorio_usuarios.insere(usuario)
+
+def insere_usuarios(usuarios: list) -> list:
+    """
+    Objetivo: Cadastrar vários usuários de uma vez (uma única gravação do log e do índice).
+
+    Args:
+        usuarios (list): Os dados de cada usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        list: Para cada usuário, True se foi cadastrado ou False se a matrícula já existia.
+    """
+    return diretorio_usuarios.insere_varios(usuarios)
+
+def atualiza_usuario(usuario: dict) -> bool:
+    """
+    Objetivo: Regravar os dados de um usuário existente (ex: a senha convertida para hash).
+
+    Args:
+        usuario (dict): Os novos dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi atualizado, False se a matrícula não existia.
+    """
+    return diretorio_usuarios.atualiza(usuario)
+
+def todos_usuarios() -> dict:
+    """
+    Objetivo: Retornar todos os usuários (lê o diretório inteiro; para migrações e importações).
+
+    Returns:
+        dict: Matrícula (string) -> dados do usuário.
+    """
+    return diretorio_usuarios.todos()
+
+# --- Turmas ---
+
+def _turmas_dir() -> str:
+    """
+    Objetivo: Retornar o diretório dos documentos das turmas, ao lado de 'turmas.json'.
+    Ex: 'json/turmas.json' -> 'json/turmas/'.
+
+    Returns:
+        str: O caminho do diretório.
+    """
+    return os.path.splitext(auxiliar.TURMAS_JSON_PATH)[0]
+
+def _catalogo_path() -> str:
+    """
+    Objetivo: Retornar o caminho do catálogo de turmas ({nome da turma: arquivo}).
+
+    Returns:
+        str: O caminho do arquivo 'catalogo.json'.
+    """
+    return os.path.join(_turmas_dir(), "catalogo.json")
+
+def _arquivo_turma(nome_turma: str) -> str:
+    """
+    Objetivo: Montar o nome do arquivo de uma turma: o nome da turma com caracteres seguros, seguido
+    de um hash do nome completo (para que turmas diferentes nunca compartilhem o arquivo).
+    Ex: 'Turma A' -> 'Turma_A-<12 dígitos hexadecimais>.json'.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        str: O nome do arquivo (sem diretório).
+    """
+    legivel = re.sub(r"[^0-9A-Za-z_-]+", "_", nome_turma)[:40] or "turma"
+    return f"{legivel}-{hashlib.sha1(nome_turma.encode('utf-8')).hexdigest()[:12]}.json"
+
+def _turma_path(nome_turma: str) -> str:
+    """
+    Objetivo: Retornar o caminho do documento de uma turma.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        str: O caminho do arquivo da turma.
+    """
+    return os.path.join(_turmas_dir(), _arquivo_turma(nome_turma))
+
+def _registra_no_catalogo(nome_turma: str):
+    """
+    Objetivo: Incluir uma turma no catálogo, se ela ainda não estiver nele.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        None
+    """
+    if nome_turma in auxiliar.load_json(_catalogo_path(), {}, somente_leitura=True):
+        return
+    def inclui(catalogo):
+        if nome_turma in catalogo:
+            return False, None
+        catalogo[nome_turma] = _arquivo_turma(nome_turma)
+        return True, None
+    auxiliar.atualiza_json(_catalogo_path(), inclui, {})
+
+def _grava_turma(nome_turma: str, dados_turma: dict, alunos: set = None):
+    """
+    Objetivo: Gravar o documento de uma turma e manter válido o conjunto de matrículas em memória.
+    Deve ser chamada sob a trava do documento da turma.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        dados_turma (dict): Os dados completos da turma.
+        alunos (set, optional): O conjunto de matrículas correspondente a 'dados_turma', se já montado.
+                                Padrão para None (o conjunto será montado na próxima consulta).
+
+    Returns:
+        None
+    """
+    caminho = _turma_path(nome_turma)
+    versao_anterior = auxiliar.versao_json(caminho)
+    auxiliar.save_json(dados_turma, caminho)
+    versao_nova = auxiliar.versao_json(caminho)
+    _alunos_em_memoria.pop(nome_turma, None)
+    if alunos is not None and versao_nova != versao_anterior: # Se a gravação falhou, o conjunto não vale mais.
+        _alunos_em_memoria[nome_turma] = (versao_nova, alunos)
+
+def lista_turmas() -> list:
+    """
+    Objetivo: Listar os nomes de todas as turmas (lê apenas o catálogo).
+
+    Returns:
+        list: Os nomes das turmas.
+    """
+    _migra_se_necessario()
+    return list(auxiliar.load_json(_catalogo_path(), {}, somente_leitura=True).keys())
+
+def busca_turma(nome_turma: str, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Buscar os dados de uma turma ({"alunos": [...], "listas": [...]}).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        somente_leitura (bool, optional): Se True, retorna a instância compartilhada do cache (um dicionário),
+                                          que não deve ser alterada. Padrão para False.
+
+    Returns:
+        Turma: Uma cópia dos dados da turma (ver modelos.py), ou None se a turma não existir.
+               Documentos malformados (e a instância do cache) são retornados como gravados.
+    """
+    _migra_se_necessario()
+    caminho = _turma_path(nome_turma)
+    if auxiliar.versao_json(caminho) is None:
+        return None
+    dados_turma = auxiliar.load_json(caminho, {}, somente_leitura=True)
+    if somente_leitura or not isinstance(dados_turma, dict):
+        return dados_turma
+    return Turma.from_json({chave: list(valor) if isinstance(valor, list) else valor for chave, valor in dados_turma.items()})
+
+def cria_turma(nome_turma: str) -> bool:
+    """
+    Objetivo: Criar uma turma vazia.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        bool: True se a turma foi criada, False se já existia.
+    """
+    _migra_se_necessario()
+    caminho = _turma_path(nome_turma)
+    with auxiliar.trava_arquivo(caminho):
+        nova = auxiliar.versao_json(caminho) is None
+        if nova:
+            _grava_turma(nome_turma, {"alunos": [], "listas": []}, set())
+        # O documento é gravado antes do catálogo; se o processo parar entre os dois, a próxima
+        # tentativa de criar a turma completa o catálogo.
+        _registra_no_catalogo(nome_turma)
+        return nova
+
+def salva_turma(nome_turma: str, dados_turma: dict):
+    """
+    Objetivo: Gravar os dados completos de uma turma (usado para corrigir estruturas inválidas).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        dados_turma (dict): Os dados da turma ({"alunos": [...], "listas": [...]}).
+
+    Returns:
+        None
+    """
+    _migra_se_necessario()
+    with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+        novos = dados_turma.get("alunos", []) if isinstance(dados_turma, dict) else []
+        antigos = _alunos_da_turma(nome_turma)
+        _atualiza_indice_alunos([m for m in novos if m not in antigos], nome_turma, inserir=True)
+        _grava_turma(nome_turma, dados_turma)
+        _registra_no_catalogo(nome_turma)
+        novos = set(novos)
+        _atualiza_indice_alunos([m for m in antigos if m not in novos], nome_turma, inserir=False)
+
+def _alunos_da_turma(nome_turma: str) -> set:
+    """
+    Objetivo: Retornar o conjunto de matrículas de uma turma, reaproveitando o conjunto em memória
+    se o documento da turma não mudou desde que ele foi montado.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        set: O conjunto de matrículas (compartilhado; alterações devem ser seguidas de _grava_turma),
+             vazio se a turma não existir ou estiver malformada.
+    """
+    caminho = _turma_path(nome_turma)
+    # A versão é lida antes dos dados: se o arquivo mudar no meio, o conjunto será apenas remontado depois.
+    versao = auxiliar.versao_json(caminho)
+    entrada = _alunos_em_memoria.get(nome_turma)
+    if entrada is not None and versao is not None and entrada[0] == versao:
+        return entrada[1]
+    dados_turma = auxiliar.load_json(caminho, {}, somente_leitura=True)
+    alunos = set(dados_turma.get("alunos", [])) if isinstance(dados_turma, dict) else set()
+    if versao is not None:
+        _alunos_em_memoria[nome_turma] = (versao, alunos)
+    return alunos
+
+def _salva_alunos_da_turma(nome_turma: str, alunos: set):
+    """
+    Objetivo: Gravar o documento da turma com os alunos como lista ordenada.
+    Deve ser chamada sob a trava do documento da turma.
+
+    Args:
+        nome_turma (str): O nome da turma alterada.
+        alunos (set): O conjunto de matrículas atualizado da turma.
+
+    Returns:
+        None
+    """
+    dados_turma = auxiliar.load_json(_turma_path(nome_turma), {})
+    dados_turma["alunos"] = sorted(alunos)
+    _grava_turma(nome_turma, dados_turma, alunos)
+
+def adiciona_aluno_turma(nome_turma: str, matricula: int) -> bool:
+    """
+    Objetivo: Matricular um aluno em uma turma existente. Os alunos são gravados em ordem crescente de matrícula.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        bool: True se o aluno foi inserido, False se já estava na turma.
+    """
+    _migra_se_necessario()
+    with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+        alunos = _alunos_da_turma(nome_turma)
+        if matricula in alunos: # Verificação em tempo constante (conjunto em memória).
+            return False
+        _atualiza_indice_alunos([matricula], nome_turma, inserir=True)
+        alunos.add(matricula)
+        _salva_alunos_da_turma(nome_turma, alunos)
+        return True
+
+def adiciona_alunos_turma(nome_turma: str, matriculas: list) -> list:
+    """
+    Objetivo: Matricular vários alunos em uma turma existente, gravando o documento da turma e cada
+    balde do índice de matrículas uma única vez.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matriculas (list): As matrículas dos alunos.
+
+    Returns:
+        list: Para cada matrícula, True se o aluno foi inserido ou False se já estava na turma
+              (ou apareceu antes na própria lista).
+    """
+    _migra_se_necessario()
+    with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+        alunos = _alunos_da_turma(nome_turma)
+        resultados = []
+        inseridos = []
+        vistos = set()
+        for matricula in matriculas:
+            novo = matricula not in alunos and matricula not in vistos
+            if novo:
+                vistos.add(matricula)
+                inseridos.append(matricula)
+            resultados.append(novo)
+        if inseridos:
+            _atualiza_indice_alunos(inseridos, nome_turma, inserir=True)
+            alunos.update(inseridos)
+            _salva_alunos_da_turma(nome_turma, alunos)
+        return resultados
+
+def remove_aluno_turma(nome_turma: str, matricula: int) -> bool:
+    """
+    Objetivo: Remover um aluno de uma turma existente.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        bool: True se o aluno foi removido, False se não estava na turma.
+    """
+    _migra_se_necessario()
+    with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+        alunos = _alunos_da_turma(nome_turma)
+        if matricula not in alunos: # Verificação em tempo constante (conjunto em memória).
+            return False
+        alunos.discard(matricula)
+        _salva_alunos_da_turma(nome_turma, alunos)
+        _atualiza_indice_alunos([matricula], nome_turma, inserir=False)
+        return True
+
+def adiciona_lista_turma(nome_turma: str, nome_lista_json: str) -> bool:
+    """
+    Objetivo: Associar uma lista de exercícios a uma turma existente.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        nome_lista_json (str): O nome do arquivo da lista de exercícios.
+
+    Returns:
+        bool: True se a lista foi associada, False se já estava associada.
+    """
+    _migra_se_necessario()
+    with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+        dados_turma = auxiliar.load_json(_turma_path(nome_turma), {})
+        if nome_lista_json in dados_turma["listas"]:
+            return False
+        alunos = _alunos_da_turma(nome_turma) # Os alunos não mudam: o conjunto em memória continua valendo.
+        dados_turma["listas"].append(nome_lista_json)
+        _grava_turma(nome_turma, dados_turma, alunos)
+        return True
+
+def migra_turmas_monolitico() -> dict:
+    """
+    Objetivo: Dividir o arquivo monolítico 'turmas.json' em um documento por turma.
+    O arquivo é tratado como a versão mais recente: as turmas presentes nele substituem os documentos
+    de mesmo nome (ele só reaparece se for gravado por fora, ex: restaurado de uma cópia ou gerado).
+    Ao final, o índice de matrículas é atualizado e o arquivo é renomeado para '<nome>.migrado'.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva do resultado.
+    """
+    caminho = auxiliar.TURMAS_JSON_PATH
+    with auxiliar.trava_arquivo(caminho):
+        # Outro processo pode ter feito a migração enquanto esta esperava pela trava.
+        auxiliar.descarrega_escritas(caminho)
+        if not os.path.exists(caminho):
+            return {"status": "aviso", "mensagem": "Nenhuma turma no formato antigo para migrar."}
+        turmas_data = auxiliar.load_json(caminho, {}, somente_leitura=True)
+        for nome_turma, dados_turma in turmas_data.items():
+            with auxiliar.trava_arquivo(_turma_path(nome_turma)):
+                _grava_turma(nome_turma, dados_turma)
+                _registra_no_catalogo(nome_turma)
+        reconstroi_indice_matriculas()
+        # Os documentos precisam estar em disco antes de o arquivo antigo sair do lugar.
+        auxiliar.descarrega_escritas()
+        # O arquivo antigo é preservado (renomeado) como cópia de segurança.
+        os.replace(caminho, caminho + ".migrado")
+    return {"status": "sucesso", "mensagem": f"{len(turmas_data)} turma(s) migrada(s) para '{_turmas_dir()}'."}
+
+def _migra_se_necessario():
+    """
+    Objetivo: Importar 'turmas.json' para os documentos das turmas, se ele existir (custa apenas um os.stat).
+
+    Returns:
+        None
+    """
+    if auxiliar.versao_json(auxiliar.TURMAS_JSON_PATH) is not None:
+        migra_turmas_monolitico()
+
+def _indice_dir() -> str:
+    """
+    Objetivo: Retornar o diretório do índice de matrículas, ao lado de 'turmas.json'.
+    Ex: 'json/turmas.json' -> 'json/turmas_indice/'.
+
+    Returns:
+        str: O caminho do diretório do índice.
+    """
+    return os.path.splitext(auxiliar.TURMAS_JSON_PATH)[0] + "_indice"
+
+def _indice_balde_path(matricula_str: str) -> str:
+    """
+    Objetivo: Retornar o arquivo do índice que contém uma matrícula.
+
+    Args:
+        matricula_str (str): A matrícula (como string).
+
+    Returns:
+        str: O caminho do arquivo do balde.
+    """
+    return os.path.join(_indice_dir(), auxiliar.calcula_balde(matricula_str, NUM_BALDES_INDICE) + ".json")
+
+def _indice_pronto() -> bool:
+    """
+    Objetivo: Verificar se o índice de matrículas já foi construído no formato atual.
+
+    Returns:
+        bool: True se 'versao.json' indicar FORMATO_INDICE.
+    """
+    versao = auxiliar.load_json(os.path.join(_indice_dir(), "versao.json"), {}, somente_leitura=True)
+    return versao.get("formato") == FORMATO_INDICE
+
+def reconstroi_indice_matriculas():
+    """
+    Objetivo: Reconstruir o índice de matrículas a partir dos documentos de todas as turmas.
+    É chamada automaticamente quando o índice não existe (ou é de um formato antigo) e pode ser usada
+    para recuperação. As matrículas são acrescentadas aos baldes existentes em vez de substituí-los,
+    para não apagar registros feitos ao mesmo tempo por outros processos; registros a mais são
+    descartados na consulta (ver turmas_do_aluno).
+
+    Returns:
+        None
+    """
+    caminho_versao = os.path.join(_indice_dir(), "versao.json")
+    with auxiliar.trava_arquivo(caminho_versao):
+        baldes = {} # Caminho do balde -> {matrícula: [turmas]}.
+        for nome_turma in auxiliar.load_json(_catalogo_path(), {}, somente_leitura=True):
+            for matricula in _alunos_da_turma(nome_turma):
+                matricula_str = str(matricula)
+                balde = baldes.setdefault(_indice_balde_path(matricula_str), {})
+                balde.setdefault(matricula_str, []).append(nome_turma)
+
+        for caminho, novas in baldes.items():
+            def acrescenta(balde, novas=novas):
+                alterou = False
+                for matricula_str, turmas in novas.items():
+                    turmas_aluno = balde.setdefault(matricula_str, [])
+                    for nome_turma in turmas:
+                        if nome_turma not in turmas_aluno:
+                            turmas_aluno.append(nome_turma)
+                            alterou = True
+                return alterou, None
+            auxiliar.atualiza_json(caminho, acrescenta, {})
+        # A marca de formato é gravada por último: um índice interrompido no meio é reconstruído de novo.
+        auxiliar.save_json({"formato": FORMATO_INDICE}, caminho_versao)
+
+def _atualiza_indice_alunos(matriculas: list, nome_turma: str, inserir: bool):
+    """
+    Objetivo: Registrar (ou retirar) no índice as matrículas de alunos em uma turma.
+    Cada balde afetado é alterado uma única vez, sem perder alterações concorrentes de outras turmas.
+
+    Args:
+        matriculas (list): As matrículas dos alunos.
+        nome_turma (str): O nome da turma.
+        inserir (bool): True para registrar as matrículas, False para removê-las.
+
+    Returns:
+        None
+    """
+    por_balde = {} # Caminho do balde -> matrículas (strings) que estão nele.
+    for matricula in matriculas:
+        matricula_str = str(matricula)
+        por_balde.setdefault(_indice_balde_path(matricula_str), []).append(matricula_str)
+    for caminho, matriculas_balde in por_balde.items():
+        def altera(balde, matriculas_balde=matriculas_balde):
+            alterou = False
+            for matricula_str in matriculas_balde:
+                turmas_aluno = balde.setdefault(matricula_str, [])
+                if inserir and nome_turma not in turmas_aluno:
+                    turmas_aluno.append(nome_turma)
+                    alterou = True
+                elif not inserir and nome_turma in turmas_aluno:
+                    turmas_aluno.remove(nome_turma)
+                    alterou = True
+                if not turmas_aluno:
+                    del balde[matricula_str]
+            return alterou, None
+        auxiliar.atualiza_json(caminho, altera, {})
+
+def turmas_do_aluno(matricula: int) -> dict:
+    """
+    Objetivo: Buscar as turmas em que um aluno está matriculado e as listas associadas a cada uma,
+    consultando o índice de matrículas e apenas os documentos das turmas indicadas por ele.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        dict: Nome da turma -> lista com os nomes dos arquivos das listas de exercícios da turma.
+    """
+    _migra_se_necessario()
+    if not _indice_pronto():
+        # Outro processo pode estar construindo o índice: espera por ele e confere de novo.
+        with auxiliar.trava_arquivo(os.path.join(_indice_dir(), "versao.json")):
+            if not _indice_pronto():
+                reconstroi_indice_matriculas()
+
+    matricula_str = str(matricula)
+    aluno_listas_por_turma = {}
+    for nome_turma in auxiliar.load_json(_indice_balde_path(matricula_str), {}, somente_leitura=True).get(matricula_str, []):
+        # O índice pode indicar turmas a mais (ver o comentário do índice): vale o documento da turma.
+        if matricula in _alunos_da_turma(nome_turma):
+            dados_turma = auxiliar.load_json(_turma_path(nome_turma), {}, somente_leitura=True)
+            aluno_listas_por_turma[nome_turma] = list(dados_turma.get("listas", []))
+    return aluno_listas_por_turma
+
+# --- Listas de Exercícios ---
+
+def _lista_path(nome_lista_json: str) -> str:
+    """
+    Objetivo: Montar o caminho do arquivo de uma lista de exercícios.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+
+    Returns:
+        str: O caminho completo do arquivo.
+
+    Raises:
+        ValueError: Se o nome não for um nome de arquivo de lista válido (ver auxiliar.valida_nome_lista),
+                    para que nenhum nome leve a arquivos fora do diretório de listas.
+    """
+    return os.path.join(auxiliar.LISTAS_DE_EXERCICIOS_DIR, auxiliar.valida_nome_lista(nome_lista_json))
+
+def lista_existe(nome_lista_json: str) -> bool:
+    """
+    Objetivo: Verificar se uma lista de exercícios existe.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+
+    Returns:
+        bool: True se a lista existir (inclusive se ainda estiver pendente em um bloco 'lote_escrita').
+    """
+    caminho = _lista_path(nome_lista_json)
+    return os.path.exists(caminho) or auxiliar._busca_pendente(caminho)[0]
+
+def nomes_listas() -> list:
+    """
+    Objetivo: Listar os nomes de todas as listas de exercícios (lê apenas o catálogo de listas).
+
+    Returns:
+        list: Os nomes dos arquivos '.json' do diretório de listas (inclusive os ainda pendentes em um bloco 'lote_escrita').
+    """
+    return list(catalogo_listas(somente_leitura=True))
+
+def _catalogo_listas_path() -> str:
+    """
+    Objetivo: Retornar o caminho da base do catálogo de listas, ao lado do diretório de listas.
+    Ex: 'json/listas_de_exercicios/' -> 'json/listas_de_exercicios_catalogo.json'.
+
+    Returns:
+        str: O caminho do arquivo da base do catálogo.
+    """
+    return os.path.normpath(auxiliar.LISTAS_DE_EXERCICIOS_DIR) + "_catalogo.json"
+
+def _catalogo_log_path() -> str:
+    """
+    Objetivo: Retornar o caminho do log do catálogo de listas, ao lado da base.
+    Ex: 'json/listas_de_exercicios/' -> 'json/listas_de_exercicios_catalogo.log'.
+
+    Returns:
+        str: O caminho do arquivo do log do catálogo.
+    """
+    return os.path.normpath(auxiliar.LISTAS_DE_EXERCICIOS_DIR) + "_catalogo.log"
+
+def _le_catalogo_listas() -> tuple:
+    """
+    Objetivo: Ler o catálogo gravado, juntando a base com os registros do log (lendo só as linhas
+    acrescentadas desde a última leitura deste processo).
+
+    Returns:
+        tuple: (base, listas, registros): a base gravada (instância compartilhada do cache; {} se ela não existir
+               ou for de outro formato), nome da lista -> metadados (instância compartilhada, que não deve ser
+               alterada) e a quantidade de registros do log aplicados. 'listas' é None se o log não for o indicado
+               pela base (ex: queda no meio de uma compactação): o catálogo precisa ser refeito.
+    """
+    base = auxiliar.load_json(_catalogo_listas_path(), {}, somente_leitura=True)
+    if base.get("formato") != FORMATO_CATALOGO_LISTAS or not isinstance(base.get("log"), list):
+        return {}, None, 0
+    inode, inicio = base["log"]
+    caminho_log = _catalogo_log_path()
+    chave = os.path.abspath(caminho_log)
+    try:
+        f = open(caminho_log, 'rb')
+    except FileNotFoundError:
+        return base, None, 0
+    with f:
+        st = os.fstat(f.fileno())
+        if st.st_ino != inode or st.st_size < inicio:
+            return base, None, 0
+        with _catalogo_lock:
+            memoria = _catalogo_memoria.get(chave)
+        if memoria is None or memoria["base"] is not base or memoria["inode"] != inode:
+            memoria = {"base": base, "inode": inode, "consumido": inicio, "listas": base.get("listas", {}),
+                       "registros": 0}
+        if st.st_size > memoria["consumido"]:
+            f.seek(memoria["consumido"])
+            novo = f.read(st.st_size - memoria["consumido"])
+            # Só linhas completas: uma gravação em andamento é aplicada na próxima leitura.
+            completo = novo.rfind(b"\n") + 1
+            if completo:
+                listas = dict(memoria["listas"]) # A instância anterior pode estar em uso por quem a recebeu.
+                registros = memoria["registros"]
+                for linha in novo[:completo].splitlines():
+                    try:
+                        registro = json.loads(linha)
+                        listas[registro["nome"]] = registro["entrada"]
+                    except (ValueError, KeyError, TypeError):
+                        continue # Resto de uma gravação interrompida.
+                    registros += 1
+                memoria = dict(memoria, consumido=memoria["consumido"] + completo, listas=listas,
+                               registros=registros)
+        with _catalogo_lock:
+            _catalogo_memoria[chave] = memoria
+    return base, memoria["listas"], memoria["registros"]
+
+def _grava_catalogo_listas(listas: dict, mtime_diretorio: int, verificado_ns: int):
+    """
+    Objetivo: Gravar uma nova base do catálogo com todas as entradas e recomeçar o log vazio.
+    Deve ser chamada com a trava do catálogo (auxiliar.trava_arquivo da base).
+    O log novo é gravado primeiro (com outro inode): até a base nova ser gravada, a base antiga não o
+    reconhece e o catálogo é refeito, em vez de perder os registros do log antigo.
+
+    Args:
+        listas (dict): Nome da lista -> metadados.
+        mtime_diretorio (int): O mtime do diretório de listas da última conferência.
+        verificado_ns (int): O momento da última conferência.
+
+    Returns:
+        None
+    """
+    caminho_log = _catalogo_log_path()
+    auxiliar._grava_atomico(caminho_log, b"")
+    base = {"formato": FORMATO_CATALOGO_LISTAS, "diretorio": mtime_diretorio, "verificado_ns": verificado_ns,
+            "listas": listas, "log": [os.stat(caminho_log).st_ino, 0]}
+    auxiliar._grava_atomico(_catalogo_listas_path(), auxiliar.serializa_json(base))
+
+def _registra_catalogo_lista(nome_lista_json: str, entrada: dict):
+    """
+    Objetivo: Acrescentar ao log do catálogo a entrada nova de uma lista, sem regravar o catálogo.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        entrada (dict): Os metadados da lista.
+
+    Returns:
+        None
+    """
+    with auxiliar.trava_arquivo(_catalogo_listas_path()):
+        listas = _le_catalogo_listas()[1]
+        if listas is None:
+            return # Catálogo a ser refeito: a conferência com o diretório encontrará a lista como ela está.
+        if listas.get(nome_lista_json) == entrada:
+            return
+        linha = (json.dumps({"nome": nome_lista_json, "entrada": entrada}, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(_catalogo_log_path(), 'ab') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                # Se uma gravação anterior foi interrompida no meio da linha, começa o registro em uma linha nova.
+                with open(_catalogo_log_path(), 'rb') as f_leitura:
+                    f_leitura.seek(f.tell() - 1)
+                    if f_leitura.read(1) != b"\n":
+                        linha = b"\n" + linha
+            f.write(linha)
+            auxiliar.fsync_arquivo(f, _catalogo_log_path())
+
+def _compacta_catalogo_listas():
+    """
+    Objetivo: Incorporar o log do catálogo à base, se ele ainda tiver mais de CATALOGO_LOG_MAX_REGISTROS registros.
+
+    Returns:
+        None
+    """
+    with auxiliar.trava_arquivo(_catalogo_listas_path()):
+        base, listas, registros = _le_catalogo_listas()
+        if listas is not None and registros > CATALOGO_LOG_MAX_REGISTROS:
+            _grava_catalogo_listas(listas, base.get("diretorio"), base.get("verificado_ns", 0))
+
+def _resumo_arquivo_lista(caminho: str) -> dict:
+    """
+    Objetivo: Montar a entrada do catálogo de uma lista a partir do arquivo em disco.
+    O os.stat é feito antes da leitura: se o arquivo mudar no meio, a assinatura gravada não confere
+    e a entrada é refeita na próxima conferência.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        dict: Os metadados da lista (auxiliar.resumo_lista) com 'modificado' e 'assinatura', ou None se o arquivo não existir.
+    """
+    try:
+        st = os.stat(caminho)
+        with open(caminho, 'rb') as f:
+            conteudo = f.read()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    # Listas corrompidas aparecem no catálogo, mas sem exercícios. O hash é o da forma canônica,
+    # então não muda quando uma lista do formato antigo é convertida.
+    exercicios = listas_exercicios.interpreta(conteudo)[0]
+    entrada = auxiliar.resumo_lista(exercicios, listas_exercicios.serializa(exercicios))
+    entrada["tamanho"] = st.st_size
+    entrada["modificado"] = st.st_mtime
+    entrada["assinatura"] = list(auxiliar._assinatura_arquivo(st))
+    return entrada
+
+def _revalida_catalogo_listas(mtime_diretorio: int) -> dict:
+    """
+    Objetivo: Conferir o catálogo de listas com o diretório (um os.stat por arquivo), refazendo apenas
+    as entradas de listas novas ou alteradas, e gravar o resultado como nova base (se algo mudou).
+    A conferência é feita sob a trava do catálogo, para que nenhum registro do log se perca na regravação.
+
+    Args:
+        mtime_diretorio (int): O mtime do diretório lido antes da listagem.
+
+    Returns:
+        dict: Nome da lista -> metadados, em ordem alfabética.
+    """
+    with auxiliar.trava_arquivo(_catalogo_listas_path()):
+        base, anteriores, _ = _le_catalogo_listas()
+        log_valido = anteriores is not None
+        if not log_valido:
+            anteriores = base.get("listas", {}) # Entradas conferidas pela assinatura, como as demais.
+        listas = {}
+        for nome in sorted(os.listdir(auxiliar.LISTAS_DE_EXERCICIOS_DIR)):
+            if not nome.endswith(".json") or nome.startswith("."):
+                continue # Não é uma lista (ex: arquivos ocultos ou temporários; ver auxiliar.valida_nome_lista).
+            caminho = _lista_path(nome)
+            entrada = anteriores.get(nome)
+            try:
+                if entrada is None or entrada.get("assinatura") != list(auxiliar._assinatura_arquivo(os.stat(caminho))):
+                    entrada = _resumo_arquivo_lista(caminho)
+            except FileNotFoundError:
+                entrada = None # Removida durante a conferência.
+            if entrada is not None:
+                listas[nome] = entrada
+        agora = time.time_ns()
+        # Logo depois de uma alteração, as conferências se repetem (ver catalogo_listas), mas só regravam o
+        # catálogo se ele mudou ou quando a conferência passa a valer definitivamente.
+        if (not log_valido or listas != anteriores or base.get("diretorio") != mtime_diretorio
+                or agora - mtime_diretorio >= auxiliar._JANELA_RECENTE_NS):
+            _grava_catalogo_listas(listas, mtime_diretorio, agora)
+    return listas
+
+def catalogo_listas(somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Retornar os metadados de todas as listas de exercícios (ver o comentário do catálogo no
+    início do módulo), sem abrir os arquivos das listas se o diretório não mudou.
+
+    Args:
+        somente_leitura (bool, optional): Se True, retorna a instância compartilhada do cache, que não deve
+                                          ser alterada. Padrão para False.
+
+    Returns:
+        dict: Nome da lista -> {"tamanho", "exercicios", "temas", "hash", "modificado", "assinatura"}
+              (inclusive listas ainda pendentes em um bloco 'lote_escrita', com 'modificado' e 'assinatura' None).
+    """
+    try:
+        mtime_diretorio = os.stat(auxiliar.LISTAS_DE_EXERCICIOS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        mtime_diretorio = None
+    base, listas, registros = _le_catalogo_listas()
+    if mtime_diretorio is None:
+        listas = {}
+    elif (listas is not None and base.get("diretorio") == mtime_diretorio
+          and base.get("verificado_ns", 0) - mtime_diretorio >= auxiliar._JANELA_RECENTE_NS):
+        # Conferido bem depois da última alteração do diretório: uma alteração no mesmo instante
+        # (com o mesmo mtime) não pode ter passado despercebida.
+        if registros > CATALOGO_LOG_MAX_REGISTROS:
+            _compacta_catalogo_listas()
+    else:
+        listas = _revalida_catalogo_listas(mtime_diretorio)
+
+    # Listas gravadas em um bloco 'lote_escrita' ainda não estão no diretório.
+    diretorio = os.path.abspath(auxiliar.LISTAS_DE_EXERCICIOS_DIR)
+    with auxiliar._escrita_lock:
+        pendentes = [(caminho, dados) for caminho, (_, dados) in auxiliar._escritas_pendentes.items()
+                     if os.path.dirname(caminho) == diretorio and caminho.endswith(".json")]
+    if pendentes:
+        listas = dict(listas)
+        for caminho, dados in pendentes:
+            exercicios = dados if isinstance(dados, list) else []
+            entrada = auxiliar.resumo_lista(exercicios, listas_exercicios.serializa(exercicios))
+            listas[os.path.basename(caminho)] = dict(entrada, modificado=None, assinatura=None)
+    if somente_leitura:
+        return listas
+    return {nome: dict(entrada, temas=list(entrada["temas"])) for nome, entrada in listas.items()}
+
+def _entrada_vigente(nome_lista_json: str) -> dict:
+    """
+    Objetivo: Obter a entrada do catálogo de uma lista se ela descrever o arquivo como ele está agora
+    (mesma assinatura), para que um acréscimo possa apenas estendê-la. Deve ser chamada sob a trava da lista.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+
+    Returns:
+        dict: A entrada (instância compartilhada, não alterar), ou None se ela não existir ou estiver desatualizada.
+    """
+    entrada = (_le_catalogo_listas()[1] or {}).get(nome_lista_json)
+    try:
+        st = os.stat(_lista_path(nome_lista_json))
+    except FileNotFoundError:
+        return None
+    if entrada is None or entrada.get("assinatura") != list(auxiliar._assinatura_arquivo(st)):
+        return None
+    return entrada
+
+def _atualiza_catalogo_lista(nome_lista_json: str, anterior: dict = None, acrescentados: list = None):
+    """
+    Objetivo: Registrar no log do catálogo a entrada de uma lista que acabou de ser gravada, para que a
+    próxima conferência do diretório não precise abri-la.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        anterior (dict, optional): A entrada da lista antes de um acréscimo (ver _entrada_vigente). Se informada
+                                   com 'acrescentados', é apenas estendida, sem ler a lista. Padrão para None.
+        acrescentados (list, optional): Os exercícios acrescentados. Padrão para None (a entrada é refeita do arquivo,
+                                        como também acontece se nenhum foi gravado, ex: por um erro de gravação).
+
+    Returns:
+        None
+    """
+    caminho = _lista_path(nome_lista_json)
+    if auxiliar._busca_pendente(caminho)[0]:
+        return # Gravação agrupada: a lista entra no catálogo quando for gravada (o diretório muda).
+    if anterior is not None and acrescentados:
+        try:
+            st = os.stat(caminho)
+        except FileNotFoundError:
+            return
+        entrada = auxiliar.estende_resumo_lista(anterior, acrescentados, listas_exercicios.linhas(acrescentados))
+        # Os campos do arquivo valem para o arquivo em disco (que pode ter sido convertido do formato antigo).
+        entrada.update(tamanho=st.st_size, modificado=st.st_mtime, assinatura=list(auxiliar._assinatura_arquivo(st)))
+    else:
+        entrada = _resumo_arquivo_lista(caminho)
+    if entrada is not None:
+        _registra_catalogo_lista(nome_lista_json, entrada)
+
+def carrega_lista(nome_lista_json: str, somente_leitura: bool = False) -> list:
+    """
+    Objetivo: Carregar os exercícios de uma lista.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        somente_leitura (bool, optional): Se True, retorna a instância compartilhada do cache. Padrão para False.
+
+    Returns:
+        list: Os exercícios (dicionários), ou uma lista vazia se a lista não existir.
+    """
+    return listas_exercicios.carrega(_lista_path(nome_lista_json), somente_leitura=somente_leitura)
+
+def carrega_lista_versionada(nome_lista_json: str, somente_leitura: bool = False) -> tuple:
+    """
+    Objetivo: Carregar os exercícios de uma lista junto com o hash do catálogo da versão carregada
+    (ver gabaritos.da_lista), sem recalculá-lo: a entrada do catálogo vale se a assinatura dela for a do
+    arquivo de onde os exercícios foram lidos.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        somente_leitura (bool, optional): Se True, retorna a instância compartilhada do cache. Padrão para False.
+
+    Returns:
+        tuple: (exercícios, hash da versão carregada, ou None se o catálogo não a descrever).
+    """
+    exercicios, assinatura = listas_exercicios.carrega_com_assinatura(_lista_path(nome_lista_json), somente_leitura)
+    if assinatura is None:
+        return exercicios, None
+    entrada = catalogo_listas(somente_leitura=True).get(nome_lista_json)
+    if entrada is None or entrada.get("assinatura") != list(assinatura):
+        return exercicios, None
+    return exercicios, entrada["hash"]
+
+def carrega_pagina_lista(nome_lista_json: str, inicio: int, quantidade: int) -> tuple:
+    """
+    Objetivo: Carregar uma página de exercícios de uma lista sem interpretar a lista inteira
+    (pelo índice de posições da lista; ver listas_exercicios.pagina).
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        inicio (int): O índice do primeiro exercício da página (a partir de 0).
+        quantidade (int): A quantidade máxima de exercícios da página.
+
+    Returns:
+        tuple: (exercícios da página (dicionários), quantidade total de exercícios da lista).
+    """
+    return listas_exercicios.pagina(_lista_path(nome_lista_json), inicio, quantidade)
+
+def salva_lista(nome_lista_json: str, exercicios: list):
+    """
+    Objetivo: Gravar todos os exercícios de uma lista (criando-a se necessário), no formato de acréscimo.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        exercicios (list): Os exercícios (dicionários).
+
+    Returns:
+        None
+    """
+    listas_exercicios.grava(_lista_path(nome_lista_json), exercicios)
+    _atualiza_catalogo_lista(nome_lista_json)
+
+def acrescenta_exercicio(nome_lista_json: str, exercicio: dict) -> list:
+    """
+    Objetivo: Acrescentar um exercício ao final de uma lista (criando-a se necessário). Ver acrescenta_exercicios.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        exercicio (dict): O exercício a ser acrescentado.
+
+    Returns:
+        list: O exercício acrescentado, como gravado (em uma lista com um elemento).
+    """
+    return acrescenta_exercicios(nome_lista_json, [exercicio])
+
+def acrescenta_exercicios(nome_lista_json: str, exercicios: list) -> list:
+    """
+    Objetivo: Acrescentar vários exercícios ao final de uma lista (criando-a se necessário) com uma única
+    gravação, que escreve apenas as linhas novas (ver listas_exercicios.py). O acréscimo e a atualização
+    do catálogo são feitos sob a trava da lista, então exercícios acrescentados ao mesmo tempo por outros
+    processos não são perdidos e a entrada do catálogo é estendida na mesma ordem dos acréscimos.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista.
+        exercicios (list): Os exercícios a serem acrescentados, na ordem.
+
+    Returns:
+        list: Apenas os exercícios acrescentados, como gravados (dicionários novos).
+    """
+    caminho = _lista_path(nome_lista_json)
+    with auxiliar.trava_arquivo(caminho):
+        auxiliar.descarrega_escritas(caminho) # A entrada anterior deve descrever a lista já gravada.
+        anterior = _entrada_vigente(nome_lista_json)
+        acrescentados = listas_exercicios.acrescenta(caminho, exercicios)
+        _atualiza_catalogo_lista(nome_lista_json, anterior, acrescentados)
+    return acrescentados
+
+# --- Progresso dos Alunos ---
+
+def carrega_progresso_aluno(matricula: int, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de um aluno (nome da lista -> dados). Ver progresso.carrega_progresso_aluno.
+    """
+    return progresso.carrega_progresso_aluno(matricula, somente_leitura=somente_leitura)
+
+def carrega_progresso_alunos(matriculas: list, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de vários alunos. Ver progresso.carrega_progresso_alunos.
+    """
+    return progresso.carrega_progresso_alunos(matriculas, somente_leitura=somente_leitura)
+
+def registra_evento(matricula: int, nome_lista_json: str, evento: str, **campos):
+    """
+    Objetivo: Registrar um evento de progresso. Ver progresso.registra_evento.
+    """
+    progresso.registra_evento(matricula, nome_lista_json, evento, **campos)
+
+def registra_eventos(eventos: list):
+    """
+    Objetivo: Registrar vários eventos de progresso (ex: envios de uma turma inteira). Cada evento é uma
+    única linha acrescentada ao diário do aluno correspondente.
+
+    Args:
+        eventos (list): Dicionários com 'matricula', 'lista', 'evento' e os campos do evento.
+
+    Returns:
+        None
+    """
+    for evento in eventos:
+        campos = {chave: valor for chave, valor in evento.items() if chave not in ("matricula", "lista", "evento")}
+        progresso.registra_evento(evento["matricula"], evento["lista"], evento["evento"], **campos)
+
+# --- Estatísticas das Turmas ---
+
+def _estatisticas_path(nome_turma: str) -> str:
+    """
+    Objetivo: Retornar o arquivo que guarda as estatísticas de uma turma, ao lado de 'turmas.json'.
+    Ex: 'json/turmas.json' -> 'json/turmas_estatisticas/<arquivo da turma>'.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        str: O caminho do arquivo de estatísticas da turma.
+    """
+    diretorio = os.path.splitext(auxiliar.TURMAS_JSON_PATH)[0] + "_estatisticas"
+    return os.path.join(diretorio, _arquivo_turma(nome_turma))
+
+def _contribuicoes_path(nome_turma: str, nome_lista_json: str) -> str:
+    """
+    Objetivo: Retornar o arquivo que guarda as contribuições dos alunos de uma turma para as estatísticas
+    de uma lista, separado das estatísticas da turma (lidas ao visualizá-la).
+    Ex: 'json/turmas_estatisticas/<arquivo da turma>' -> 'json/turmas_estatisticas/<turma>/<nome da lista>'.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        nome_lista_json (str): O nome da lista de exercícios.
+
+    Returns:
+        str: O caminho do arquivo de contribuições.
+    """
+    diretorio = os.path.splitext(_estatisticas_path(nome_turma))[0]
+    return os.path.join(diretorio, auxiliar.valida_nome_lista(nome_lista_json))
+
+def carrega_estatisticas_turma(nome_turma: str, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar as estatísticas de desempenho de uma turma (ver estatisticas.py), sem as contribuições dos alunos.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        somente_leitura (bool, optional): Se True, retorna a instância do cache (não alterar). Padrão para False.
+
+    Returns:
+        dict: Nome da lista -> estatísticas da lista, ou um dicionário vazio se não houver.
+    """
+    return auxiliar.load_json(_estatisticas_path(nome_turma), {}, somente_leitura=somente_leitura)
+
+def salva_estatisticas_turma(nome_turma: str, estatisticas: dict, contribuicoes: dict = None):
+    """
+    Objetivo: Gravar as estatísticas de desempenho de uma turma e, opcionalmente, as contribuições dos alunos.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        estatisticas (dict): Nome da lista -> estatísticas da lista.
+        contribuicoes (dict, optional): Nome da lista -> documento de contribuições da lista. Padrão para None.
+
+    Returns:
+        None
+    """
+    caminho = _estatisticas_path(nome_turma)
+    # A trava das estatísticas também protege os arquivos de contribuições da turma (ver atualiza_estatisticas_turma).
+    with auxiliar.trava_arquivo(caminho):
+        # As contribuições são gravadas antes: as estatísticas lidas ao visualizar a turma só mudam depois delas.
+        for nome_lista_json, documento in (contribuicoes or {}).items():
+            auxiliar.save_json(documento, _contribuicoes_path(nome_turma, nome_lista_json))
+        auxiliar.save_json(estatisticas, caminho)
+
+def atualiza_estatisticas_turma(nome_turma: str, funcao, listas: list = ()):
+    """
+    Objetivo: Alterar as estatísticas de uma turma (e as contribuições dos alunos de algumas listas) sem perder
+    atualizações concorrentes de outros processos. A gravação só é feita se 'funcao' indicar alteração.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        funcao (callable): Recebe as estatísticas da turma (nome da lista -> estatísticas) e as contribuições
+                           (nome da lista -> documento, {} se não houver), que podem ser alteradas, e retorna
+                           True se as alterou. Pode ser chamada mais de uma vez.
+        listas (list, optional): As listas cujas contribuições são carregadas, ou None para todas as listas
+                                 das estatísticas. Padrão para () (nenhuma).
+
+    Returns:
+        None
+    """
+    caminho = _estatisticas_path(nome_turma)
+    if listas is not None and not listas:
+        # Só as estatísticas: controle de concorrência otimista (ver auxiliar.atualiza_json).
+        auxiliar.atualiza_json(caminho, lambda estatisticas: (funcao(estatisticas, {}), None), {})
+        return
+    # Estatísticas e contribuições são lidas e gravadas sob a mesma trava, que também exclui as gravações de
+    # atualiza_json (feitas sob ela e só se as estatísticas não mudaram desde a leitura).
+    with auxiliar.trava_arquivo(caminho):
+        estatisticas = auxiliar.load_json(caminho, {})
+        nomes = list(estatisticas) if listas is None else list(listas)
+        contribuicoes = {nome: auxiliar.load_json(_contribuicoes_path(nome_turma, nome), {}) for nome in nomes}
+        if not funcao(estatisticas, contribuicoes):
+            return
+        # As contribuições são gravadas antes (ver salva_estatisticas_turma); só as alteradas são regravadas.
+        for nome, documento in contribuicoes.items():
+            caminho_contribuicoes = _contribuicoes_path(nome_turma, nome)
+            if documento != auxiliar.load_json(caminho_contribuicoes, {}, somente_leitura=True):
+                auxiliar.save_json(documento, caminho_contribuicoes)
+        auxiliar.save_json(estatisticas, caminho)
+
+if __name__ == "__main__":
+    # Uso: python armazenamento_json.py migrar -> divide o turmas.json em um documento por turma.
+    if len(sys.argv) > 1 and sys.argv[1] == "migrar":
+        print(migra_turmas_monolitico()["mensagem"])
+    else:
+        print("Uso: python armazenamento_json.py migrar")
@@ -0,0 +1,886 @@
+import json       # As estatísticas das turmas (e as contribuições dos alunos) são guardadas como texto JSON.
+import os         # Importa o módulo 'os' para manipular o caminho do banco de dados.
+import sqlite3    # Banco de dados SQLite da biblioteca padrão do Python.
+import sys        # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'importar').
+import time       # Momento da última alteração de cada lista no catálogo de listas.
+import threading  # Cada thread usa sua própria conexão com o banco (conexões SQLite não devem ser compartilhadas).
+import auxiliar   # Caminhos dos arquivos (lidos no momento da chamada).
+import listas_exercicios  # Forma canônica das listas, usada no hash do catálogo de listas.
+from respostas import Respostas  # Respostas do progresso com um byte por questão (como no backend JSON).
+from modelos import Exercicio, Progresso, Turma, Usuario  # Registros lidos como objetos com __slots__ (ver modelos.py).
+
+# --- Backend de Armazenamento em SQLite ---
+# Implementa a interface de armazenamento descrita em auxiliar.py em um único banco SQLite
+# (auxiliar.SQLITE_DB_PATH), em modo WAL para que leitores não bloqueiem escritores.
+# Cada operação é uma consulta pontual ou a atualização de uma única linha, usando os índices das tabelas,
+# em vez de carregar e regravar arquivos inteiros.
+# Para copiar os dados de uma instalação em JSON: 'python armazenamento_sqlite.py importar'.
+
+# Tempo máximo (em segundos) de espera por uma trava do banco antes de desistir.
+TIMEOUT_TRAVA_S = 30
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    matricula TEXT PRIMARY KEY,
+    nome TEXT,
+    idade INTEGER,
+    tipo TEXT,
+    senha TEXT
+);
+CREATE TABLE IF NOT EXISTS turmas (
+    nome TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS matriculas (
+    turma TEXT NOT NULL REFERENCES turmas(nome),
+    matricula INTEGER NOT NULL,
+    PRIMARY KEY (turma, matricula)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_matriculas_aluno ON matriculas(matricula);
+CREATE TABLE IF NOT EXISTS turma_listas (
+    turma TEXT NOT NULL REFERENCES turmas(nome),
+    lista TEXT NOT NULL,
+    posicao INTEGER NOT NULL,
+    PRIMARY KEY (turma, lista)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS listas (
+    nome TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS exercicios (
+    lista TEXT NOT NULL REFERENCES listas(nome),
+    indice INTEGER NOT NULL,
+    tema TEXT,
+    enunciado TEXT,
+    alternativa_a TEXT,
+    alternativa_b TEXT,
+    alternativa_c TEXT,
+    resposta_correta TEXT,
+    PRIMARY KEY (lista, indice)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS catalogo_listas (
+    nome TEXT PRIMARY KEY REFERENCES listas(nome),
+    tamanho INTEGER NOT NULL,
+    exercicios INTEGER NOT NULL,
+    temas TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    modificado REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS progresso (
+    matricula TEXT NOT NULL,
+    lista TEXT NOT NULL,
+    progresso INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'iniciado',
+    PRIMARY KEY (matricula, lista)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS respostas (
+    matricula TEXT NOT NULL,
+    lista TEXT NOT NULL,
+    indice INTEGER NOT NULL,
+    resposta TEXT NOT NULL,
+    PRIMARY KEY (matricula, lista, indice)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS estatisticas_turmas (
+    turma TEXT PRIMARY KEY,
+    dados TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS contribuicoes_estatisticas (
+    turma TEXT NOT NULL,
+    lista TEXT NOT NULL,
+    dados TEXT NOT NULL,
+    PRIMARY KEY (turma, lista)
+) WITHOUT ROWID;
+"""
+
+# Versão dos dados do banco (PRAGMA user_version). Bancos de versões anteriores são atualizados ao abrir a conexão:
+#   1 -> hash do catálogo de listas encadeado linha a linha (auxiliar.hash_linhas); as linhas antigas são refeitas.
+_VERSAO_BANCO = 1
+
+# Correspondência entre as chaves dos exercícios em JSON e as colunas da tabela 'exercicios'.
+_COLUNAS_EXERCICIO = (
+    ("Tema", "tema"),
+    ("Enunciado", "enunciado"),
+    ("Alternativa A", "alternativa_a"),
+    ("Alternativa B", "alternativa_b"),
+    ("Alternativa C", "alternativa_c"),
+    ("RespostaCorreta", "resposta_correta"),
+)
+
+_local = threading.local()  # Guarda a conexão (e o caminho dela) de cada thread.
+
+def _conexao() -> sqlite3.Connection:
+    """
+    Objetivo: Retornar a conexão da thread atual com o banco, abrindo-a (e criando o esquema) se necessário.
+    Uma nova conexão é aberta se auxiliar.SQLITE_DB_PATH mudar ou se o arquivo do banco for removido.
+
+    Returns:
+        sqlite3.Connection: A conexão pronta para uso.
+    """
+    caminho = auxiliar.SQLITE_DB_PATH
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.caminho == caminho and os.path.exists(caminho):
+        return conn
+    fecha_conexao()
+
+    auxiliar._ensure_dir_exists(os.path.dirname(caminho))
+    conn = sqlite3.connect(caminho, timeout=TIMEOUT_TRAVA_S)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")    # Leitores não bloqueiam o escritor (e vice-versa).
+    conn.execute("PRAGMA synchronous=NORMAL")  # Em WAL, durável a cada checkpoint e seguro contra corrupção.
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(_ESQUEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < _VERSAO_BANCO:
+        with conn:
+            # As linhas removidas são recalculadas na próxima consulta ao catálogo (ver catalogo_listas).
+            conn.execute("DELETE FROM catalogo_listas")
+            conn.execute(f"PRAGMA user_version = {_VERSAO_BANCO}")
+    _local.conn = conn
+    _local.caminho = caminho
+    return conn
+
+def fecha_conexao():
+    """
+    Objetivo: Fechar a conexão da thread atual com o banco (se houver).
+
+    Returns:
+        None
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+    _local.caminho = None
+
+def inicializa():
+    """
+    Objetivo: Garantir que o banco de dados e suas tabelas existam.
+
+    Returns:
+        None
+    """
+    os.makedirs(auxiliar.LISTAS_DE_EXERCICIOS_DIR, exist_ok=True)
+    _conexao()
+
+# --- Usuários ---
+
+def _usuario_de_linha(linha: sqlite3.Row) -> dict:
+    """
+    Objetivo: Converter uma linha da tabela 'usuarios' no usuário usado pelo restante do sistema.
+    Campos nulos no banco são omitidos, como nos arquivos.
+
+    Args:
+        linha (sqlite3.Row): A linha lida do banco.
+
+    Returns:
+        Usuario: Os dados do usuário (ver modelos.py), com a matrícula como inteiro (como em usuarios.json).
+    """
+    return Usuario.from_json({
+        'matricula': int(linha["matricula"]),
+        'nome': linha["nome"],
+        'idade': linha["idade"],
+        'tipo': linha["tipo"],
+        'senha': linha["senha"],
+    })
+
+def busca_usuario(matricula_str: str) -> dict:
+    """
+    Objetivo: Buscar um usuário pela matrícula (consulta pela chave primária).
+
+    Args:
+        matricula_str (str): A matrícula do usuário (como string).
+
+    Returns:
+        dict: Os dados do usuário, ou None se a matrícula não existir.
+    """
+    linha = _conexao().execute("SELECT * FROM usuarios WHERE matricula = ?", (str(matricula_str),)).fetchone()
+    return _usuario_de_linha(linha) if linha is not None else None
+
+def busca_usuarios(matriculas: list) -> dict:
+    """
+    Objetivo: Buscar vários usuários de uma vez (ex: os alunos de uma turma).
+
+    Args:
+        matriculas (list): As matrículas procuradas (inteiros ou strings).
+
+    Returns:
+        dict: Matrícula (string) -> dados do usuário, apenas para as matrículas encontradas.
+    """
+    conn = _conexao()
+    encontrados = {}
+    chaves = [str(m) for m in matriculas]
+    # Consulta em blocos para respeitar o limite de parâmetros por comando do SQLite.
+    for inicio in range(0, len(chaves), 500):
+        bloco = chaves[inicio:inicio + 500]
+        marcadores = ",".join("?" * len(bloco))
+        for linha in conn.execute(f"SELECT * FROM usuarios WHERE matricula IN ({marcadores})", bloco):
+            encontrados[linha["matricula"]] = _usuario_de_linha(linha)
+    return encontrados
+
+def insere_usuario(usuario: dict) -> bool:
+    """
+    Objetivo: Cadastrar um novo usuário (inserção de uma única linha).
+
+    Args:
+        usuario (dict): Os dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi cadastrado, False se a matrícula já existia.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO usuarios (matricula, nome, idade, tipo, senha) VALUES (?, ?, ?, ?, ?)",
+            (str(usuario['matricula']), usuario.get('nome'), usuario.get('idade'), usuario.get('tipo'), usuario.get('senha')),
+        )
+    return cursor.rowcount == 1
+
+def insere_usuarios(usuarios: list) -> list:
+    """
+    Objetivo: Cadastrar vários usuários de uma vez (em uma única transação).
+
+    Args:
+        usuarios (list): Os dados de cada usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        list: Para cada usuário, True se foi cadastrado ou False se a matrícula já existia.
+    """
+    conn = _conexao()
+    resultados = []
+    with conn:
+        for usuario in usuarios:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO usuarios (matricula, nome, idade, tipo, senha) VALUES (?, ?, ?, ?, ?)",
+                (str(usuario['matricula']), usuario.get('nome'), usuario.get('idade'), usuario.get('tipo'), usuario.get('senha')),
+            )
+            resultados.append(cursor.rowcount == 1)
+    return resultados
+
+def atualiza_usuario(usuario: dict) -> bool:
+    """
+    Objetivo: Regravar os dados de um usuário existente (ex: a senha convertida para hash).
+
+    Args:
+        usuario (dict): Os novos dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi atualizado, False se a matrícula não existia.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute(
+            "UPDATE usuarios SET nome = ?, idade = ?, tipo = ?, senha = ? WHERE matricula = ?",
+            (usuario.get('nome'), usuario.get('idade'), usuario.get('tipo'), usuario.get('senha'), str(usuario['matricula'])),
+        )
+    return cursor.rowcount == 1
+
+def todos_usuarios() -> dict:
+    """
+    Objetivo: Retornar todos os usuários (para migrações e exportações).
+
+    Returns:
+        dict: Matrícula (string) -> dados do usuário.
+    """
+    return {linha["matricula"]: _usuario_de_linha(linha) for linha in _conexao().execute("SELECT * FROM usuarios")}
+
+# --- Turmas ---
+
+def lista_turmas() -> list:
+    """
+    Objetivo: Listar os nomes de todas as turmas.
+
+    Returns:
+        list: Os nomes das turmas, na ordem de criação.
+    """
+    return [linha["nome"] for linha in _conexao().execute("SELECT nome FROM turmas ORDER BY rowid")]
+
+def busca_turma(nome_turma: str, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Buscar os dados de uma turma ({"alunos": [...], "listas": [...]}).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON; o resultado
+                                          é sempre uma instância nova. Padrão para False.
+
+    Returns:
+        Turma: Os dados da turma (ver modelos.py), ou None se a turma não existir.
+    """
+    conn = _conexao()
+    if conn.execute("SELECT 1 FROM turmas WHERE nome = ?", (nome_turma,)).fetchone() is None:
+        return None
+    alunos = [linha[0] for linha in conn.execute("SELECT matricula FROM matriculas WHERE turma = ? ORDER BY matricula", (nome_turma,))]
+    listas = [linha[0] for linha in conn.execute("SELECT lista FROM turma_listas WHERE turma = ? ORDER BY posicao", (nome_turma,))]
+    return Turma.from_json({"alunos": alunos, "listas": listas})
+
+def cria_turma(nome_turma: str) -> bool:
+    """
+    Objetivo: Criar uma turma vazia.
+
+    Args:
+        nome_turma (str): O nome da turma.
+
+    Returns:
+        bool: True se a turma foi criada, False se já existia.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute("INSERT OR IGNORE INTO turmas (nome) VALUES (?)", (nome_turma,))
+    return cursor.rowcount == 1
+
+def salva_turma(nome_turma: str, dados_turma: dict):
+    """
+    Objetivo: Gravar os dados completos de uma turma, substituindo alunos e listas.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        dados_turma (dict): Os dados da turma ({"alunos": [...], "listas": [...]}).
+
+    Returns:
+        None
+    """
+    conn = _conexao()
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO turmas (nome) VALUES (?)", (nome_turma,))
+        conn.execute("DELETE FROM matriculas WHERE turma = ?", (nome_turma,))
+        conn.execute("DELETE FROM turma_listas WHERE turma = ?", (nome_turma,))
+        conn.executemany("INSERT OR IGNORE INTO matriculas (turma, matricula) VALUES (?, ?)",
+                         [(nome_turma, m) for m in dados_turma.get("alunos", [])])
+        conn.executemany("INSERT OR IGNORE INTO turma_listas (turma, lista, posicao) VALUES (?, ?, ?)",
+                         [(nome_turma, lista, pos) for pos, lista in enumerate(dados_turma.get("listas", []))])
+
+def adiciona_aluno_turma(nome_turma: str, matricula: int) -> bool:
+    """
+    Objetivo: Matricular um aluno em uma turma existente (inserção de uma única linha).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        bool: True se o aluno foi inserido, False se já estava na turma.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute("INSERT OR IGNORE INTO matriculas (turma, matricula) VALUES (?, ?)", (nome_turma, matricula))
+    return cursor.rowcount == 1
+
+def adiciona_alunos_turma(nome_turma: str, matriculas: list) -> list:
+    """
+    Objetivo: Matricular vários alunos em uma turma existente (em uma única transação).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matriculas (list): As matrículas dos alunos.
+
+    Returns:
+        list: Para cada matrícula, True se o aluno foi inserido ou False se já estava na turma.
+    """
+    conn = _conexao()
+    resultados = []
+    with conn:
+        for matricula in matriculas:
+            cursor = conn.execute("INSERT OR IGNORE INTO matriculas (turma, matricula) VALUES (?, ?)", (nome_turma, matricula))
+            resultados.append(cursor.rowcount == 1)
+    return resultados
+
+def remove_aluno_turma(nome_turma: str, matricula: int) -> bool:
+    """
+    Objetivo: Remover um aluno de uma turma existente (remoção de uma única linha).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        bool: True se o aluno foi removido, False se não estava na turma.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute("DELETE FROM matriculas WHERE turma = ? AND matricula = ?", (nome_turma, matricula))
+    return cursor.rowcount == 1
+
+def adiciona_lista_turma(nome_turma: str, nome_lista_json: str) -> bool:
+    """
+    Objetivo: Associar uma lista de exercícios a uma turma existente.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        nome_lista_json (str): O nome da lista de exercícios.
+
+    Returns:
+        bool: True se a lista foi associada, False se já estava associada.
+    """
+    conn = _conexao()
+    with conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO turma_listas (turma, lista, posicao) "
+            "SELECT ?, ?, COALESCE(MAX(posicao) + 1, 0) FROM turma_listas WHERE turma = ?",
+            (nome_turma, nome_lista_json, nome_turma),
+        )
+    return cursor.rowcount == 1
+
+def turmas_do_aluno(matricula: int) -> dict:
+    """
+    Objetivo: Buscar as turmas de um aluno e as listas de cada uma, usando o índice por matrícula.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        dict: Nome da turma -> lista com os nomes das listas de exercícios da turma.
+    """
+    conn = _conexao()
+    aluno_listas_por_turma = {}
+    for linha in conn.execute("SELECT turma FROM matriculas WHERE matricula = ? ORDER BY turma", (matricula,)):
+        aluno_listas_por_turma[linha["turma"]] = [
+            l[0] for l in conn.execute("SELECT lista FROM turma_listas WHERE turma = ? ORDER BY posicao", (linha["turma"],))
+        ]
+    return aluno_listas_por_turma
+
+# --- Listas de Exercícios ---
+
+def lista_existe(nome_lista_json: str) -> bool:
+    """
+    Objetivo: Verificar se uma lista de exercícios existe.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+
+    Returns:
+        bool: True se a lista existir.
+    """
+    return _conexao().execute("SELECT 1 FROM listas WHERE nome = ?", (nome_lista_json,)).fetchone() is not None
+
+def nomes_listas() -> list:
+    """
+    Objetivo: Listar os nomes de todas as listas de exercícios.
+
+    Returns:
+        list: Os nomes das listas, em ordem alfabética.
+    """
+    return [linha["nome"] for linha in _conexao().execute("SELECT nome FROM listas ORDER BY nome")]
+
+def _atualiza_catalogo_lista(conn: sqlite3.Connection, nome_lista_json: str, acrescentados: list = None):
+    """
+    Objetivo: Recalcular a linha do catálogo de uma lista (ver auxiliar.resumo_lista), na transação
+    que acabou de alterar os exercícios dela. O hash é o da forma canônica, como no backend JSON.
+
+    Args:
+        conn (sqlite3.Connection): A conexão com a transação em andamento.
+        nome_lista_json (str): O nome da lista.
+        acrescentados (list, optional): Os exercícios acrescentados pela transação, na forma lida do banco. Se a lista
+                                        já tinha linha no catálogo, ela é apenas estendida com eles
+                                        (auxiliar.estende_resumo_lista), sem ler a lista. Padrão para None.
+
+    Returns:
+        None
+    """
+    linha = conn.execute("SELECT * FROM catalogo_listas WHERE nome = ?", (nome_lista_json,)).fetchone() if acrescentados else None
+    if linha is not None:
+        anterior = {"tamanho": linha["tamanho"], "exercicios": linha["exercicios"], "temas": json.loads(linha["temas"]),
+                    "hash": linha["hash"]}
+        entrada = auxiliar.estende_resumo_lista(anterior, acrescentados, listas_exercicios.linhas(acrescentados))
+    else:
+        exercicios = carrega_lista(nome_lista_json)
+        entrada = auxiliar.resumo_lista(exercicios, listas_exercicios.serializa(exercicios))
+    conn.execute("INSERT OR REPLACE INTO catalogo_listas (nome, tamanho, exercicios, temas, hash, modificado) "
+                 "VALUES (?, ?, ?, ?, ?, ?)",
+                 (nome_lista_json, entrada["tamanho"], entrada["exercicios"],
+                  json.dumps(entrada["temas"], ensure_ascii=False), entrada["hash"], time.time()))
+
+def catalogo_listas(somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Retornar os metadados de todas as listas de exercícios, lidos da tabela 'catalogo_listas'.
+    Listas ainda sem linha no catálogo (ex: bancos criados antes dele) são catalogadas na primeira consulta.
+
+    Args:
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        dict: Nome da lista -> {"tamanho", "exercicios", "temas", "hash", "modificado"}, em ordem alfabética.
+    """
+    conn = _conexao()
+    faltando = [linha["nome"] for linha in conn.execute(
+        "SELECT nome FROM listas WHERE nome NOT IN (SELECT nome FROM catalogo_listas)")]
+    if faltando:
+        with conn:
+            for nome_lista in faltando:
+                _atualiza_catalogo_lista(conn, nome_lista)
+    return {linha["nome"]: {"tamanho": linha["tamanho"], "exercicios": linha["exercicios"], "temas": json.loads(linha["temas"]),
+                            "hash": linha["hash"], "modificado": linha["modificado"]}
+            for linha in conn.execute("SELECT * FROM catalogo_listas ORDER BY nome")}
+
+def _exercicio_de_linha(linha: sqlite3.Row) -> Exercicio:
+    """
+    Objetivo: Converter uma linha da tabela 'exercicios' no exercício usado pelo restante do sistema.
+    Campos nulos no banco (ex: exercício sem 'RespostaCorreta') são omitidos, como nos arquivos.
+
+    Args:
+        linha (sqlite3.Row): A linha lida do banco.
+
+    Returns:
+        Exercicio: O exercício (ver modelos.py).
+    """
+    return Exercicio.from_json({chave: linha[coluna] for chave, coluna in _COLUNAS_EXERCICIO if linha[coluna] is not None})
+
+def carrega_lista(nome_lista_json: str, somente_leitura: bool = False) -> list:
+    """
+    Objetivo: Carregar os exercícios de uma lista, no mesmo formato dos arquivos JSON.
+    Campos nulos no banco (ex: exercício sem 'RespostaCorreta') são omitidos, como nos arquivos.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        list: Os exercícios (Exercicio, ver modelos.py), ou uma lista vazia se a lista não existir.
+    """
+    exercicios = []
+    for linha in _conexao().execute("SELECT * FROM exercicios WHERE lista = ? ORDER BY indice", (nome_lista_json,)):
+        exercicios.append(_exercicio_de_linha(linha))
+    return exercicios
+
+def carrega_lista_versionada(nome_lista_json: str, somente_leitura: bool = False) -> tuple:
+    """
+    Objetivo: Carregar os exercícios de uma lista junto com o hash do catálogo da versão carregada
+    (ver gabaritos.da_lista). Os dois são lidos na mesma transação, então são da mesma versão.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        tuple: (exercícios (Exercicio), hash da lista, ou None se ela ainda não estiver no catálogo).
+    """
+    conn = _conexao()
+    with conn:
+        conn.execute("BEGIN") # Uma única leitura consistente do catálogo e dos exercícios.
+        linha = conn.execute("SELECT hash FROM catalogo_listas WHERE nome = ?", (nome_lista_json,)).fetchone()
+        exercicios = [_exercicio_de_linha(l) for l in conn.execute(
+            "SELECT * FROM exercicios WHERE lista = ? ORDER BY indice", (nome_lista_json,))]
+    return exercicios, (linha["hash"] if linha else None)
+
+def carrega_pagina_lista(nome_lista_json: str, inicio: int, quantidade: int) -> tuple:
+    """
+    Objetivo: Carregar uma página de exercícios de uma lista. Os índices de uma lista são sempre
+    0, 1, 2, ... (ver salva_lista e acrescenta_exercicios), então a página é um intervalo da chave primária.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        inicio (int): O índice do primeiro exercício da página (a partir de 0).
+        quantidade (int): A quantidade máxima de exercícios da página.
+
+    Returns:
+        tuple: (exercícios da página (Exercicio), quantidade total de exercícios da lista).
+    """
+    conn = _conexao()
+    inicio = max(0, inicio)
+    total = conn.execute("SELECT COUNT(*) FROM exercicios WHERE lista = ?", (nome_lista_json,)).fetchone()[0]
+    exercicios = []
+    for linha in conn.execute("SELECT * FROM exercicios WHERE lista = ? AND indice >= ? AND indice < ? ORDER BY indice",
+                              (nome_lista_json, inicio, inicio + max(0, quantidade))):
+        exercicios.append(_exercicio_de_linha(linha))
+    return exercicios, total
+
+def salva_lista(nome_lista_json: str, exercicios: list):
+    """
+    Objetivo: Gravar todos os exercícios de uma lista (criando-a se necessário).
+    Apenas os exercícios novos ou alterados geram escrita; os demais são mantidos.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        exercicios (list): Os exercícios (dicionários).
+
+    Returns:
+        None
+    """
+    auxiliar.valida_nome_lista(nome_lista_json) # Os mesmos nomes aceitos pelo backend JSON (nomes de arquivo).
+    conn = _conexao()
+    colunas = ", ".join(coluna for _, coluna in _COLUNAS_EXERCICIO)
+    marcadores = ", ".join("?" * len(_COLUNAS_EXERCICIO))
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO listas (nome) VALUES (?)", (nome_lista_json,))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO exercicios (lista, indice, {colunas}) VALUES (?, ?, {marcadores})",
+            [(nome_lista_json, i) + tuple(ex.get(chave) for chave, _ in _COLUNAS_EXERCICIO) for i, ex in enumerate(exercicios)],
+        )
+        conn.execute("DELETE FROM exercicios WHERE lista = ? AND indice >= ?", (nome_lista_json, len(exercicios)))
+        _atualiza_catalogo_lista(conn, nome_lista_json)
+
+def acrescenta_exercicio(nome_lista_json: str, exercicio: dict) -> list:
+    """
+    Objetivo: Acrescentar um exercício ao final de uma lista (criando-a se necessário). Ver acrescenta_exercicios.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        exercicio (dict): O exercício a ser acrescentado.
+
+    Returns:
+        list: O exercício acrescentado, como gravado (em uma lista com um elemento).
+    """
+    return acrescenta_exercicios(nome_lista_json, [exercicio])
+
+def acrescenta_exercicios(nome_lista_json: str, exercicios: list) -> list:
+    """
+    Objetivo: Acrescentar vários exercícios ao final de uma lista (criando-a se necessário) em uma única
+    transação. O índice dos novos exercícios é calculado na mesma transação da inserção, então inserções
+    concorrentes não se sobrepõem.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        exercicios (list): Os exercícios a serem acrescentados, na ordem.
+
+    Returns:
+        list: Apenas os exercícios acrescentados, como gravados (Exercicio, ver modelos.py).
+    """
+    auxiliar.valida_nome_lista(nome_lista_json) # Os mesmos nomes aceitos pelo backend JSON (nomes de arquivo).
+    conn = _conexao()
+    colunas = ", ".join(coluna for _, coluna in _COLUNAS_EXERCICIO)
+    marcadores = ", ".join("?" * len(_COLUNAS_EXERCICIO))
+    with conn:
+        conn.execute("BEGIN IMMEDIATE") # Obtém a trava de escrita antes de ler o último índice.
+        conn.execute("INSERT OR IGNORE INTO listas (nome) VALUES (?)", (nome_lista_json,))
+        proximo = conn.execute("SELECT COALESCE(MAX(indice) + 1, 0) FROM exercicios WHERE lista = ?",
+                               (nome_lista_json,)).fetchone()[0]
+        conn.executemany(
+            f"INSERT INTO exercicios (lista, indice, {colunas}) VALUES (?, ?, {marcadores})",
+            [(nome_lista_json, proximo + i) + tuple(ex.get(chave) for chave, _ in _COLUNAS_EXERCICIO)
+             for i, ex in enumerate(exercicios)],
+        )
+        # Os exercícios como serão lidos do banco (só as colunas preenchidas), sem reler a lista.
+        gravados = [Exercicio.from_json({chave: ex.get(chave) for chave, _ in _COLUNAS_EXERCICIO if ex.get(chave) is not None})
+                    for ex in exercicios]
+        _atualiza_catalogo_lista(conn, nome_lista_json, gravados)
+    return gravados
+
+# --- Progresso dos Alunos ---
+
+def carrega_progresso_aluno(matricula: int, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de um aluno, no mesmo formato do backend JSON.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        dict: Nome da lista -> Progresso (ver modelos.py): {'progresso': int, 'respostas': Respostas (índice (str) -> letra),
+              'status': str}.
+    """
+    conn = _conexao()
+    matricula_str = str(matricula)
+    progresso_aluno = {}
+    for linha in conn.execute("SELECT lista, progresso, status FROM progresso WHERE matricula = ?", (matricula_str,)):
+        progresso_aluno[linha["lista"]] = Progresso.from_json({'progresso': linha["progresso"], 'status': linha["status"]})
+    for linha in conn.execute("SELECT lista, indice, resposta FROM respostas WHERE matricula = ? ORDER BY indice", (matricula_str,)):
+        dados_lista = progresso_aluno.get(linha["lista"])
+        if dados_lista is None:
+            dados_lista = progresso_aluno[linha["lista"]] = Progresso.novo()
+        dados_lista.respostas[str(linha["indice"])] = linha["resposta"]
+    return progresso_aluno
+
+def carrega_progresso_alunos(matriculas: list, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de vários alunos.
+
+    Args:
+        matriculas (list): As matrículas dos alunos.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        dict: Matrícula (string) -> nome da lista -> dados do progresso.
+    """
+    return {str(m): carrega_progresso_aluno(m) for m in matriculas}
+
+def _aplica_evento(conn: sqlite3.Connection, matricula: int, nome_lista_json: str, evento: str, campos: dict):
+    """
+    Objetivo: Executar os comandos de um evento de progresso (dentro da transação do chamador).
+
+    Args:
+        conn (sqlite3.Connection): A conexão, com a transação aberta.
+        matricula (int): A matrícula do aluno.
+        nome_lista_json (str): O nome da lista de exercícios.
+        evento (str): O tipo do evento.
+        campos (dict): Os dados do evento (ver progresso.registra_evento).
+
+    Returns:
+        None
+    """
+    chave = (str(matricula), nome_lista_json)
+    conn.execute("INSERT OR IGNORE INTO progresso (matricula, lista) VALUES (?, ?)", chave)
+    if evento == "resposta":
+        conn.execute("INSERT OR REPLACE INTO respostas (matricula, lista, indice, resposta) VALUES (?, ?, ?, ?)",
+                     chave + (int(campos["indice"]), campos["resposta"]))
+        conn.execute("UPDATE progresso SET progresso = ? WHERE matricula = ? AND lista = ?", (campos["progresso"],) + chave)
+    elif evento in ("parar", "voltar"):
+        conn.execute("UPDATE progresso SET progresso = ? WHERE matricula = ? AND lista = ?", (campos["progresso"],) + chave)
+    elif evento == "completo":
+        conn.execute("UPDATE progresso SET status = 'completo' WHERE matricula = ? AND lista = ?", chave)
+    elif evento == "reinicio":
+        conn.execute("DELETE FROM respostas WHERE matricula = ? AND lista = ?", chave)
+        conn.execute("UPDATE progresso SET progresso = 0, status = 'iniciado' WHERE matricula = ? AND lista = ?", chave)
+    elif evento == "envio":
+        conn.execute("DELETE FROM respostas WHERE matricula = ? AND lista = ?", chave)
+        conn.executemany("INSERT INTO respostas (matricula, lista, indice, resposta) VALUES (?, ?, ?, ?)",
+                         [chave + (int(i), r) for i, r in campos["respostas"].items()])
+        conn.execute("UPDATE progresso SET progresso = ?, status = 'completo' WHERE matricula = ? AND lista = ?",
+                     (campos["progresso"],) + chave)
+    else:
+        raise ValueError(f"Evento de progresso desconhecido: {evento}")
+
+def registra_evento(matricula: int, nome_lista_json: str, evento: str, **campos):
+    """
+    Objetivo: Registrar um evento de progresso ('resposta', 'parar', 'voltar', 'completo', 'reinicio' ou 'envio')
+    atualizando apenas as linhas do aluno/lista afetados.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+        nome_lista_json (str): O nome da lista de exercícios.
+        evento (str): O tipo do evento.
+        **campos: 'indice', 'resposta', 'respostas' e 'progresso', conforme o tipo do evento (ver progresso.registra_evento).
+
+    Returns:
+        None
+    """
+    conn = _conexao()
+    with conn:
+        _aplica_evento(conn, matricula, nome_lista_json, evento, campos)
+
+def registra_eventos(eventos: list):
+    """
+    Objetivo: Registrar vários eventos de progresso em uma única transação (ex: envios de uma turma inteira).
+
+    Args:
+        eventos (list): Dicionários com 'matricula', 'lista', 'evento' e os campos do evento.
+
+    Returns:
+        None
+    """
+    conn = _conexao()
+    with conn:
+        for evento in eventos:
+            campos = {chave: valor for chave, valor in evento.items() if chave not in ("matricula", "lista", "evento")}
+            _aplica_evento(conn, evento["matricula"], evento["lista"], evento["evento"], campos)
+
+# --- Estatísticas das Turmas ---
+
+def carrega_estatisticas_turma(nome_turma: str, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar as estatísticas de desempenho de uma turma (ver estatisticas.py), sem as contribuições dos alunos.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        somente_leitura (bool, optional): Aceito por compatibilidade com o backend JSON. Padrão para False.
+
+    Returns:
+        dict: Nome da lista -> estatísticas da lista, ou um dicionário vazio se não houver.
+    """
+    linha = _conexao().execute("SELECT dados FROM estatisticas_turmas WHERE turma = ?", (nome_turma,)).fetchone()
+    return json.loads(linha["dados"]) if linha else {}
+
+def salva_estatisticas_turma(nome_turma: str, estatisticas: dict, contribuicoes: dict = None):
+    """
+    Objetivo: Gravar as estatísticas de desempenho de uma turma e, opcionalmente, as contribuições dos alunos
+    (os documentos são guardados como texto JSON).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        estatisticas (dict): Nome da lista -> estatísticas da lista.
+        contribuicoes (dict, optional): Nome da lista -> documento de contribuições da lista. Padrão para None.
+
+    Returns:
+        None
+    """
+    conn = _conexao()
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO contribuicoes_estatisticas (turma, lista, dados) VALUES (?, ?, ?)",
+                         [(nome_turma, nome, json.dumps(documento, ensure_ascii=False))
+                          for nome, documento in (contribuicoes or {}).items()])
+        conn.execute("INSERT OR REPLACE INTO estatisticas_turmas (turma, dados) VALUES (?, ?)",
+                     (nome_turma, json.dumps(estatisticas, ensure_ascii=False)))
+
+def atualiza_estatisticas_turma(nome_turma: str, funcao, listas: list = ()):
+    """
+    Objetivo: Alterar as estatísticas de uma turma (e as contribuições dos alunos de algumas listas) em uma única
+    transação de escrita, para que atualizações concorrentes (de outras threads ou processos) não se percam.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        funcao (callable): Recebe as estatísticas da turma (nome da lista -> estatísticas) e as contribuições
+                           (nome da lista -> documento, {} se não houver), que podem ser alteradas, e retorna
+                           True se as alterou.
+        listas (list, optional): As listas cujas contribuições são carregadas, ou None para todas as listas
+                                 das estatísticas. Padrão para () (nenhuma).
+
+    Returns:
+        None
+    """
+    conn = _conexao()
+    with conn:
+        conn.execute("BEGIN IMMEDIATE") # Obtém a trava de escrita antes da leitura.
+        linha = conn.execute("SELECT dados FROM estatisticas_turmas WHERE turma = ?", (nome_turma,)).fetchone()
+        estatisticas = json.loads(linha["dados"]) if linha else {}
+        contribuicoes = {}
+        for nome in (list(estatisticas) if listas is None else listas):
+            linha = conn.execute("SELECT dados FROM contribuicoes_estatisticas WHERE turma = ? AND lista = ?",
+                                 (nome_turma, nome)).fetchone()
+            contribuicoes[nome] = json.loads(linha["dados"]) if linha else {}
+        originais = {nome: json.dumps(documento, ensure_ascii=False) for nome, documento in contribuicoes.items()}
+        if funcao(estatisticas, contribuicoes):
+            alteradas = [] # Só as contribuições alteradas são regravadas.
+            for nome, documento in contribuicoes.items():
+                dados = json.dumps(documento, ensure_ascii=False)
+                if dados != originais[nome]:
+                    alteradas.append((nome_turma, nome, dados))
+            conn.executemany("INSERT OR REPLACE INTO contribuicoes_estatisticas (turma, lista, dados) VALUES (?, ?, ?)",
+                             alteradas)
+            conn.execute("INSERT OR REPLACE INTO estatisticas_turmas (turma, dados) VALUES (?, ?)",
+                         (nome_turma, json.dumps(estatisticas, ensure_ascii=False)))
+
+# --- Importação a partir dos Arquivos JSON ---
+
+def importa_json() -> dict:
+    """
+    Objetivo: Copiar para o banco SQLite todos os dados do backend JSON (usuários, turmas, matrículas,
+    listas de exercícios e progresso dos alunos). Registros já existentes no banco são substituídos.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' com as quantidades importadas.
+    """
+    import armazenamento_json  # Importado aqui para não criar dependência entre os backends no uso normal.
+    import progresso
+
+    conn = _conexao()
+    usuarios_data = armazenamento_json.todos_usuarios()
+    turmas_data = {nome: armazenamento_json.busca_turma(nome, somente_leitura=True) for nome in armazenamento_json.lista_turmas()}
+    nomes = armazenamento_json.nomes_listas() if os.path.isdir(auxiliar.LISTAS_DE_EXERCICIOS_DIR) else []
+    progresso_alunos_data = progresso.carrega_progresso(somente_leitura=True)
+
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO usuarios (matricula, nome, idade, tipo, senha) VALUES (?, ?, ?, ?, ?)",
+            [(m, u.get('nome'), u.get('idade'), u.get('tipo'), u.get('senha')) for m, u in usuarios_data.items()],
+        )
+    for nome_turma, dados_turma in turmas_data.items():
+        salva_turma(nome_turma, dados_turma if isinstance(dados_turma, dict) else {})
+    for nome_lista in nomes:
+        salva_lista(nome_lista, armazenamento_json.carrega_lista(nome_lista, somente_leitura=True))
+    with conn:
+        for matricula_str, listas_aluno in progresso_alunos_data.items():
+            for nome_lista, dados in listas_aluno.items():
+                chave = (matricula_str, nome_lista)
+                conn.execute("INSERT OR REPLACE INTO progresso (matricula, lista, progresso, status) VALUES (?, ?, ?, ?)",
+                             chave + (dados.get('progresso', 0), dados.get('status', 'iniciado')))
+                conn.execute("DELETE FROM respostas WHERE matricula = ? AND lista = ?", chave)
+                # Respostas aceita também os dados antigos, com as respostas como lista em vez de dicionário.
+                respostas = Respostas(dados.get('respostas'))
+                conn.executemany("INSERT INTO respostas (matricula, lista, indice, resposta) VALUES (?, ?, ?, ?)",
+                                 [chave + (int(i), r) for i, r in respostas.items()])
+
+    return {"status": "sucesso", "mensagem": (f"Importados {len(usuarios_data)} usuário(s), {len(turmas_data)} turma(s), "
+                                              f"{len(nomes)} lista(s) e o progresso de {len(progresso_alunos_data)} aluno(s).")}
+
+if __name__ == "__main__":
+    # Uso: python armazenamento_sqlite.py importar -> copia os dados dos arquivos JSON para o banco SQLite.
+    if len(sys.argv) > 1 and sys.argv[1] == "importar":
+        print(importa_json()["mensagem"])
+    else:
+        print("Uso: python armazenamento_sqlite.py importar")
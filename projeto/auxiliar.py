@@ -1,5 +1,21 @@
 import json  # Importa o módulo 'json' para lidar com a serialização e desserialização de dados JSON.
 import os    # Importa o módulo 'os' para interagir com o sistema operacional, especialmente para manipulação de caminhos de arquivo e diretórios.
+import pickle     # Usado pelo cache de leitura para guardar uma cópia compacta e rapidamente "clonável" dos documentos.
+import hashlib    # Usado pelo cache para conferir o conteúdo de arquivos modificados muito recentemente.
+import threading  # Protege o cache contra acessos simultâneos de várias threads.
+import time       # Usado para identificar entradas "recentes" (ver _JANELA_RECENTE_NS).
+import zlib       # Usado por calcula_balde para distribuir chaves entre arquivos.
+import tempfile   # Cria o arquivo temporário usado nas gravações atômicas de save_json.
+import atexit     # Garante que gravações agrupadas pendentes sejam feitas quando o programa termina.
+from collections import OrderedDict  # Mantém a ordem de uso das entradas do cache (política LRU).
+from collections.abc import Mapping  # Dicionários e modelos de domínio (ver modelos.py) são aceitos nos mesmos lugares.
+from contextlib import contextmanager  # Usado para definir o contexto de gravação em lote (lote_escrita).
+import metricas   # Instrumentação de E/S (contadores por arquivo); desativada, custa apenas um teste de flag.
+from modelos import para_json  # Os modelos de domínio (ver modelos.py) são gravados pela sua forma em JSON.
+try:
+    import fcntl  # Travas consultivas (lockf) entre processos; disponível apenas em sistemas POSIX.
+except ImportError:
+    fcntl = None  # Sem fcntl (ex: Windows), trava_arquivo protege apenas as threads do próprio processo.
 
 # --- Configuração de Caminhos de Arquivos e Diretórios ---
 # Este módulo centraliza a definição dos caminhos para todos os arquivos JSON usados pelo sistema.
@@ -13,7 +29,9 @@ JSON_BASE_DIR = "json"
 # Ex: 'json/listas_de_exercicios/'
 LISTAS_DE_EXERCICIOS_DIR = os.path.join(JSON_BASE_DIR, "listas_de_exercicios")
 
-# Constrói o caminho completo para o arquivo JSON que armazena os dados das turmas.
+# Constrói o caminho completo para o arquivo JSON (formato antigo) com os dados de todas as turmas.
+# O backend JSON guarda um documento por turma no diretório de mesmo nome ('json/turmas/') e importa este
+# arquivo automaticamente se ele existir (ver armazenamento_json.py).
 # Ex: 'json/turmas.json'
 TURMAS_JSON_PATH = os.path.join(JSON_BASE_DIR, "turmas.json")
 
@@ -25,6 +43,83 @@ USUARIOS_JSON_PATH = os.path.join(JSON_BASE_DIR, "usuarios.json")
 # Ex: 'json/progresso_alunos.json'
 PROGRESO_ALUNOS_JSON_PATH = os.path.join(JSON_BASE_DIR, "progresso_alunos.json")
 
+# Constrói o caminho completo para o banco de dados usado pelo backend SQLite (ver get_backend).
+# Ex: 'json/prog_modular.db'
+SQLITE_DB_PATH = os.path.join(JSON_BASE_DIR, "prog_modular.db")
+
+# --- Configuração do Backend de Armazenamento ---
+# Os módulos de negócio (professor, aluno, cadastro) não acessam os arquivos diretamente: eles usam o
+# backend retornado por get_backend(). Cada backend é um módulo que oferece as mesmas funções:
+#   inicializa()
+#   busca_usuario(matricula_str), busca_usuarios(matriculas), insere_usuario(usuario), insere_usuarios(usuarios),
+#   atualiza_usuario(usuario), todos_usuarios()
+#   lista_turmas(), busca_turma(nome, somente_leitura), cria_turma(nome), salva_turma(nome, dados),
+#   adiciona_aluno_turma(nome, matricula), adiciona_alunos_turma(nome, matriculas), remove_aluno_turma(nome, matricula),
+#   adiciona_lista_turma(nome, lista), turmas_do_aluno(matricula)
+#   lista_existe(nome), nomes_listas(), catalogo_listas(somente_leitura), carrega_lista(nome, somente_leitura),
+#   carrega_lista_versionada(nome, somente_leitura),
+#   carrega_pagina_lista(nome, inicio, quantidade),
+#   salva_lista(nome, exercicios), acrescenta_exercicio(nome, exercicio), acrescenta_exercicios(nome, exercicios)
+#   carrega_progresso_aluno(matricula, somente_leitura), carrega_progresso_alunos(matriculas, somente_leitura),
+#   registra_evento(matricula, lista, evento, **campos), registra_eventos(eventos)
+#   carrega_estatisticas_turma(nome, somente_leitura), salva_estatisticas_turma(nome, estatisticas, contribuicoes),
+#   atualiza_estatisticas_turma(nome, funcao, listas)
+# Backends disponíveis:
+#   "json"   -> armazenamento_json.py (arquivos JSON em JSON_BASE_DIR; é o padrão)
+#   "sqlite" -> armazenamento_sqlite.py (banco SQLite em SQLITE_DB_PATH)
+# O backend pode ser escolhido pela variável de ambiente PROG_MODULAR_BACKEND ou alterando BACKEND_ARMAZENAMENTO.
+BACKEND_ARMAZENAMENTO = os.environ.get("PROG_MODULAR_BACKEND", "json")
+
+# --- Configuração do Cache de Leitura ---
+# load_json mantém em memória os documentos já lidos, evitando re-interpretar o mesmo arquivo a cada chamada.
+# Cada entrada é validada com os.stat (mtime_ns + tamanho + inode) antes de ser usada e o cache
+# é limitado por um orçamento em bytes, descartando primeiro as entradas usadas há mais tempo (LRU).
+
+# Orçamento máximo do cache, em bytes do documento serializado (pickle). Pode ser alterado em tempo de execução.
+CACHE_JSON_MAX_BYTES = 64 * 1024 * 1024
+
+# Arquivos modificados há menos tempo que esta janela não são confiáveis apenas pelo os.stat:
+# alguns sistemas de arquivos têm resolução de mtime grosseira, então duas escritas do mesmo tamanho
+# no mesmo "tique" teriam a mesma assinatura. Nesses casos o conteúdo é conferido por um hash.
+_JANELA_RECENTE_NS = 2_000_000_000
+
+_cache_json = OrderedDict()      # Caminho absoluto -> entrada do cache (dicionário, ver _cache_armazena).
+_cache_json_bytes = 0            # Total de bytes ocupados pelas entradas do cache.
+_cache_lock = threading.RLock()  # Trava que protege _cache_json e _cache_json_bytes.
+
+# --- Configuração das Gravações ---
+# save_json grava em um arquivo temporário no mesmo diretório e o renomeia sobre o destino (os.replace),
+# então uma queda no meio da gravação nunca deixa o arquivo truncado: fica o conteúdo antigo ou o novo.
+
+# Política de fsync das gravações (pode ser definida pela variável de ambiente PROG_MODULAR_FSYNC):
+#   "nenhum"   -> não chama fsync (mais rápido; o conteúdo pode se perder se o sistema operacional cair).
+#   "arquivo"  -> chama fsync no arquivo antes de renomeá-lo (padrão).
+#   "completo" -> também chama fsync no diretório após renomear, tornando a própria renomeação durável.
+POLITICA_FSYNC = os.environ.get("PROG_MODULAR_FSYNC", "arquivo")
+
+# Janela (em segundos) de agrupamento das gravações. Se maior que zero, chamadas a save_json para o mesmo
+# caminho feitas dentro da janela são agrupadas em uma única gravação, feita ao final dela.
+# Com 0 (padrão), cada save_json grava imediatamente, exceto dentro de um bloco 'with lote_escrita():'.
+JANELA_GROUP_COMMIT_S = 0.0
+
+_escritas_pendentes = {}           # Caminho absoluto -> (caminho original, dados) ainda não gravados.
+_escrita_lock = threading.RLock()  # Trava que protege _escritas_pendentes, _nivel_lote e _timer_group_commit.
+_nivel_lote = 0                    # Quantidade de blocos 'lote_escrita' abertos (podem ser aninhados).
+_timer_group_commit = None         # Timer que grava as pendências ao final da janela de agrupamento.
+
+# --- Configuração da Concorrência entre Processos ---
+# Vários processos (ex: o serviço HTTP e o modo em lote) podem usar os mesmos arquivos ao mesmo tempo.
+# Cada arquivo tem uma trava consultiva de 1 byte (fcntl.lockf) no arquivo JSON_BASE_DIR/.travas.lock, usada por
+# trava_arquivo. O byte é escolhido pelo hash do caminho, então arquivos diferentes nunca disputam a mesma trava.
+# As leituras nunca esperam por travas: como as gravações são atômicas, elas sempre veem um arquivo completo.
+
+# Quantidade de tentativas otimistas de atualiza_json antes de refazer a atualização inteira sob a trava.
+TENTATIVAS_OTIMISTAS = 8
+
+_travas_processo = {}            # Caminho protegido -> [RLock, profundidade, threads interessadas, descritor].
+_descritores_travas = {}         # Arquivo de trava -> descritor aberto (mantido aberto: ver trava_arquivo).
+_travas_lock = threading.Lock()  # Trava que protege _travas_processo e _descritores_travas.
+
 # --- Funções Auxiliares para Manipulação de Arquivos ---
 
 def _ensure_dir_exists(path: str):
@@ -45,17 +140,187 @@ def _ensure_dir_exists(path: str):
         # exist_ok=True evita um erro se o diretório já existir.
         os.makedirs(path, exist_ok=True)
 
-def load_json(file_path: str, default_data: any = None) -> any:
+def _assinatura_arquivo(st: os.stat_result) -> tuple:
+    """
+    Objetivo: Montar a "assinatura" de um arquivo a partir do resultado de os.stat.
+    Se qualquer um dos campos mudar, o arquivo foi reescrito e a entrada do cache deixa de valer.
+
+    Args:
+        st (os.stat_result): O resultado de os.stat para o arquivo.
+
+    Returns:
+        tuple: A tupla (mtime_ns, tamanho, inode).
+    """
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+def _cache_remove(chave: str):
+    """
+    Objetivo: Remover uma entrada do cache de leitura (se existir), atualizando o total de bytes ocupados.
+    Deve ser chamada com _cache_lock adquirida.
+
+    Args:
+        chave (str): O caminho absoluto do arquivo.
+
+    Returns:
+        None
+    """
+    global _cache_json_bytes
+    entrada = _cache_json.pop(chave, None)
+    if entrada is not None:
+        _cache_json_bytes -= len(entrada["blob"])
+
+def _cache_armazena(chave: str, st: os.stat_result, dados: any, conteudo: bytes):
+    """
+    Objetivo: Guardar um documento no cache de leitura e descartar as entradas menos usadas
+    caso o orçamento CACHE_JSON_MAX_BYTES seja ultrapassado.
+
+    Args:
+        chave (str): O caminho absoluto do arquivo.
+        st (os.stat_result): O os.stat do arquivo correspondente ao conteúdo guardado.
+        dados (any): O documento já interpretado. Uma cópia serializada (pickle) é guardada,
+                     então alterações posteriores em 'dados' não afetam o cache.
+        conteudo (bytes): Os bytes do arquivo, usados para calcular o hash de conferência.
+
+    Returns:
+        None
+    """
+    global _cache_json_bytes
+    blob = pickle.dumps(dados, protocol=pickle.HIGHEST_PROTOCOL)
+    with _cache_lock:
+        _cache_remove(chave)
+        # Documentos maiores que o orçamento inteiro nunca são guardados.
+        if len(blob) > CACHE_JSON_MAX_BYTES:
+            return
+        _cache_json[chave] = {
+            "assinatura": _assinatura_arquivo(st),
+            "blob": blob,            # Cópia compacta do documento; pickle.loads gera cópias isoladas rapidamente.
+            "objeto": None,          # Instância compartilhada (somente leitura), criada sob demanda.
+            "hash": hashlib.blake2b(conteudo, digest_size=16).digest(),
+            "recente": time.time_ns() - st.st_mtime_ns < _JANELA_RECENTE_NS,
+        }
+        _cache_json_bytes += len(blob)
+        # Descarta as entradas usadas há mais tempo (início do OrderedDict) até caber no orçamento.
+        while _cache_json_bytes > CACHE_JSON_MAX_BYTES and _cache_json:
+            _cache_remove(next(iter(_cache_json)))
+
+def _cache_busca(chave: str, st: os.stat_result, file_path: str):
+    """
+    Objetivo: Procurar no cache uma entrada ainda válida para o arquivo.
+
+    Args:
+        chave (str): O caminho absoluto do arquivo.
+        st (os.stat_result): O os.stat atual do arquivo.
+        file_path (str): O caminho do arquivo, usado para conferir o conteúdo de entradas recentes.
+
+    Returns:
+        dict: A entrada do cache, ou None se não houver entrada válida.
+    """
+    with _cache_lock:
+        entrada = _cache_json.get(chave)
+        if entrada is None:
+            return None
+        if entrada["assinatura"] != _assinatura_arquivo(st):
+            _cache_remove(chave) # O arquivo mudou desde a leitura: a entrada é descartada.
+            return None
+        _cache_json.move_to_end(chave) # Marca a entrada como a mais recentemente usada.
+
+    # Entradas recentes não são confiáveis só pelo os.stat: o conteúdo é relido e conferido pelo hash
+    # (ainda assim evitando interpretar o JSON novamente).
+    if entrada["recente"]:
+        try:
+            with open(file_path, 'rb') as f:
+                conteudo = f.read()
+        except OSError:
+            return None
+        if hashlib.blake2b(conteudo, digest_size=16).digest() != entrada["hash"]:
+            with _cache_lock:
+                _cache_remove(chave)
+            return None
+        # Passada a janela, a assinatura volta a ser suficiente para validar a entrada.
+        if time.time_ns() - st.st_mtime_ns >= _JANELA_RECENTE_NS:
+            entrada["recente"] = False
+    return entrada
+
+def assinatura_json(file_path: str):
+    """
+    Objetivo: Retornar a assinatura (mtime_ns, tamanho, inode) do arquivo como está em disco, para que
+    estruturas derivadas dele (ex: índices) possam verificar se ainda correspondem ao conteúdo atual.
+
+    Args:
+        file_path (str): O caminho do arquivo.
+
+    Returns:
+        list: A assinatura como lista (serializável em JSON), ou None se o arquivo não existir ou tiver
+              uma gravação agrupada pendente (nesse caso o conteúdo em disco ainda vai mudar).
+    """
+    if _busca_pendente(file_path)[0]:
+        return None
+    try:
+        return list(_assinatura_arquivo(os.stat(file_path)))
+    except FileNotFoundError:
+        return None
+
+def versao_json(file_path: str):
+    """
+    Objetivo: Retornar um identificador da versão atual dos dados de um arquivo, incluindo gravações
+    agrupadas ainda pendentes. Serve para validar estruturas mantidas em memória a partir do arquivo.
+
+    Args:
+        file_path (str): O caminho do arquivo.
+
+    Returns:
+        tuple: ("pendente", id dos dados pendentes) se houver gravação agrupada pendente,
+               a assinatura (mtime_ns, tamanho, inode) do arquivo em disco, ou None se ele não existir.
+    """
+    pendente, dados = _busca_pendente(file_path)
+    if pendente:
+        return ("pendente", id(dados)) # Os dados pendentes ficam vivos até serem gravados, então o id é único.
+    assinatura = assinatura_json(file_path)
+    return tuple(assinatura) if assinatura is not None else None
+
+def calcula_balde(chave: str, num_baldes: int) -> str:
+    """
+    Objetivo: Distribuir chaves (ex: matrículas) entre 'num_baldes' grupos de forma estável,
+    usado para dividir arquivos grandes em vários arquivos menores.
+
+    Args:
+        chave (str): A chave a ser distribuída.
+        num_baldes (int): A quantidade de grupos.
+
+    Returns:
+        str: O identificador do grupo em hexadecimal com 2 dígitos (ex: '3f').
+    """
+    return f"{zlib.crc32(chave.encode('utf-8')) % num_baldes:02x}"
+
+def limpa_cache_json():
+    """
+    Objetivo: Esvaziar completamente o cache de leitura de load_json.
+    Útil em testes ou quando os arquivos são alterados por ferramentas externas.
+
+    Returns:
+        None
+    """
+    global _cache_json_bytes
+    with _cache_lock:
+        _cache_json.clear()
+        _cache_json_bytes = 0
+
+def load_json(file_path: str, default_data: any = None, somente_leitura: bool = False) -> any:
     """
     Objetivo: Carregar dados de um arquivo JSON.
     Esta função é robusta: se o arquivo não existir, estiver vazio ou corrompido,
     ela retorna dados padrão, evitando erros no programa principal.
+    Os documentos lidos ficam em um cache em memória e só são interpretados novamente
+    quando o arquivo muda (verificado com os.stat).
 
     Args:
         file_path (str): O caminho completo para o arquivo JSON a ser lido.
         default_data (any, optional): Os dados a serem retornados se o arquivo não puder ser lido.
                                       Se None, um padrão sensato ({} para objetos JSON, [] para listas JSON)
                                       é inferido com base no nome do arquivo. Padrão para None.
+        somente_leitura (bool, optional): Se False (padrão), retorna uma cópia isolada que o chamador pode alterar.
+                                          Se True, retorna a instância compartilhada guardada no cache, que
+                                          NÃO deve ser alterada; evita o custo da cópia em consultas. Padrão para False.
 
     Returns:
         any: O conteúdo do arquivo JSON (como um dicionário ou lista Python),
@@ -75,6 +340,13 @@ def load_json(file_path: str, default_data: any = None) -> any:
             # Padrão genérico caso o nome do arquivo não termine em .json.
             default_data = {}
 
+    # Gravações agrupadas ainda não feitas (ver save_json) têm prioridade sobre o conteúdo do disco.
+    pendente, dados = _busca_pendente(file_path)
+    if pendente:
+        if metricas.ATIVO:
+            metricas.registra_leitura(file_path, "pendentes")
+        return dados if somente_leitura else pickle.loads(pickle.dumps(dados, protocol=pickle.HIGHEST_PROTOCOL))
+
     # Extrai o caminho do diretório do 'file_path'.
     dir_path = os.path.dirname(file_path)
     # Garante que o diretório pai do arquivo exista antes de tentar carregar ou criar o arquivo.
@@ -82,14 +354,38 @@ def load_json(file_path: str, default_data: any = None) -> any:
         _ensure_dir_exists(dir_path)
 
     # Verifica se o arquivo não existe ou se está vazio.
-    # os.stat(file_path).st_size == 0 verifica se o arquivo tem 0 bytes (está vazio).
-    if not os.path.exists(file_path) or os.stat(file_path).st_size == 0:
+    # st.st_size == 0 verifica se o arquivo tem 0 bytes (está vazio).
+    chave = os.path.abspath(file_path)
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        st = None
+    if st is None or st.st_size == 0:
+        with _cache_lock:
+            _cache_remove(chave)
         return default_data # Se não existe ou está vazio, retorna os dados padrão.
 
+    # Tenta atender a leitura pelo cache antes de ir ao disco.
+    entrada = _cache_busca(chave, st, file_path)
+    if entrada is not None:
+        if metricas.ATIVO:
+            metricas.registra_leitura(file_path, "cache")
+        if not somente_leitura:
+            return pickle.loads(entrada["blob"]) # Cópia isolada: alterá-la não afeta o cache.
+        if entrada["objeto"] is None:
+            entrada["objeto"] = pickle.loads(entrada["blob"])
+        return entrada["objeto"]
+
+    medir = metricas.ATIVO # Instrumentação (ver metricas.py): só mede o tempo se estiver ativa.
     try:
-        # Tenta abrir o arquivo em modo de leitura ('r') com codificação UTF-8 para suportar caracteres especiais.
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f) # Carrega e retorna o conteúdo JSON.
+        inicio = time.perf_counter() if medir else 0.0
+        # Tenta abrir o arquivo em modo binário; o conteúdo é decodificado como UTF-8 para suportar caracteres especiais.
+        with open(file_path, 'rb') as f:
+            conteudo = f.read()
+        lido = time.perf_counter() if medir else 0.0
+        dados = json.loads(conteudo.decode('utf-8')) # Interpreta o conteúdo JSON.
+        if medir:
+            metricas.registra_leitura(file_path, "disco", len(conteudo), lido - inicio, time.perf_counter() - lido)
     except json.JSONDecodeError:
         # Captura erros se o arquivo JSON estiver malformado ou corrompido.
         print(f"Erro: Arquivo JSON corrompido ou inválido: {file_path}. Retornando dados padrão.")
@@ -99,17 +395,106 @@ def load_json(file_path: str, default_data: any = None) -> any:
         print(f"Erro ao ler o arquivo {file_path}: {e}")
         return default_data # Em caso de erro de I/O, retorna dados padrão.
 
-def save_json(data: any, file_path: str):
+    # Guarda o documento no cache. O objeto recém-interpretado é entregue ao chamador;
+    # no modo somente leitura ele também passa a ser a instância compartilhada da entrada.
+    _cache_armazena(chave, st, dados, conteudo)
+    if somente_leitura:
+        with _cache_lock:
+            if chave in _cache_json:
+                _cache_json[chave]["objeto"] = dados
+    return dados
+
+def fsync_arquivo(f, file_path: str = None):
     """
-    Objetivo: Salvar dados Python (dicionários, listas) em um arquivo JSON.
-    Esta função garante que o diretório de destino exista antes de tentar salvar.
+    Objetivo: Forçar a gravação em disco de um arquivo aberto, conforme POLITICA_FSYNC.
+    Usada por save_json e pelos módulos que acrescentam registros a arquivos (ex: o diário de progresso).
 
     Args:
-        data (any): Os dados Python a serem salvos (geralmente um dicionário ou lista).
-        file_path (str): O caminho completo para o arquivo JSON onde os dados serão gravados.
+        f: O objeto de arquivo aberto para escrita.
+        file_path (str, optional): O caminho do arquivo, para as métricas. Padrão para None (usa f.name).
 
     Returns:
-        None: A função não retorna valor; ela executa uma ação (salva o arquivo) e imprime mensagens de erro se falhar.
+        None
+    """
+    if POLITICA_FSYNC != "nenhum":
+        f.flush()
+        if not metricas.ATIVO:
+            os.fsync(f.fileno())
+            return
+        inicio = time.perf_counter()
+        os.fsync(f.fileno())
+        metricas.registra_fsync(file_path or str(f.name), time.perf_counter() - inicio)
+
+def _fsync_diretorio(dir_path: str):
+    """
+    Objetivo: Forçar a gravação em disco das entradas de um diretório (ex: o resultado de uma renomeação),
+    quando POLITICA_FSYNC for "completo". Em sistemas sem suporte (ex: Windows), não faz nada.
+
+    Args:
+        dir_path (str): O caminho do diretório.
+
+    Returns:
+        None
+    """
+    if POLITICA_FSYNC != "completo" or not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(dir_path or ".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _grava_atomico(file_path: str, conteudo: bytes):
+    """
+    Objetivo: Gravar 'conteudo' em 'file_path' de forma atômica: o conteúdo vai para um arquivo temporário
+    no mesmo diretório, que depois substitui o destino com os.replace.
+
+    Args:
+        file_path (str): O caminho do arquivo de destino.
+        conteudo (bytes): O conteúdo a ser gravado.
+
+    Returns:
+        None: Erros de I/O são propagados para o chamador.
+    """
+    dir_path = os.path.dirname(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path or ".", prefix="." + os.path.basename(file_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(conteudo)
+            fsync_arquivo(f, file_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Em caso de falha, o destino não foi tocado; apenas o temporário é descartado.
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_diretorio(dir_path)
+
+def serializa_json(data: any) -> bytes:
+    """
+    Objetivo: Serializar dados exatamente como save_json os grava.
+
+    Args:
+        data (any): Os dados Python a serem serializados.
+
+    Returns:
+        bytes: O conteúdo JSON codificado em UTF-8.
+    """
+    # ensure_ascii=False permite que caracteres não-ASCII (como acentos) sejam gravados diretamente.
+    # indent=4 formata o JSON com indentação de 4 espaços, tornando-o legível.
+    # default=para_json grava os modelos de domínio (usuários, turmas, ...) como os dicionários de sempre.
+    return json.dumps(data, ensure_ascii=False, indent=4, default=para_json).encode('utf-8')
+
+def _grava_json(data: any, file_path: str):
+    """
+    Objetivo: Serializar e gravar imediatamente um documento JSON (sem agrupamento).
+
+    Args:
+        data (any): Os dados Python a serem salvos.
+        file_path (str): O caminho completo do arquivo JSON.
+
+    Returns:
+        None: A função imprime mensagens de erro se falhar.
     """
     # Extrai o caminho do diretório do 'file_path'.
     dir_path = os.path.dirname(file_path)
@@ -117,15 +502,308 @@ def save_json(data: any, file_path: str):
     # A função _ensure_dir_exists() já trata o caso de 'dir_path' ser uma string vazia (diretório atual).
     _ensure_dir_exists(dir_path)
     
+    medir = metricas.ATIVO # Instrumentação (ver metricas.py): só mede o tempo se estiver ativa.
+    inicio = time.perf_counter() if medir else 0.0
+    conteudo = serializa_json(data)
     try:
-        # Tenta abrir o arquivo em modo de escrita ('w') com codificação UTF-8.
-        with open(file_path, 'w', encoding='utf-8') as f:
-            # json.dump() escreve os dados no arquivo.
-            # ensure_ascii=False permite que caracteres não-ASCII (como acentos) sejam gravados diretamente.
-            # indent=4 formata o JSON com indentação de 4 espaços, tornando-o legível.
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        serializado = time.perf_counter() if medir else 0.0
+        # Grava de forma atômica: o arquivo nunca fica truncado, mesmo se o programa cair no meio.
+        _grava_atomico(file_path, conteudo)
+        if medir:
+            metricas.registra_gravacao(file_path, len(conteudo), serializado - inicio, time.perf_counter() - serializado)
+        # Descarta a entrada do cache de leitura: a próxima leitura interpreta o conteúdo gravado,
+        # garantindo que o resultado seja exatamente o que um JSON devolve (ex: chaves sempre como string).
+        with _cache_lock:
+            _cache_remove(os.path.abspath(file_path))
         # Uma mensagem de sucesso pode ser adicionada aqui para depuração, mas foi comentada para evitar poluição no console.
         # print(f"Dados salvos com sucesso em: {file_path}")
     except IOError as e:
         # Captura erros de I/O (ex: permissão negada, disco cheio) durante a gravação.
-        print(f"Erro ao salvar o arquivo {file_path}: {e}")
\ No newline at end of file
+        print(f"Erro ao salvar o arquivo {file_path}: {e}")
+
+def save_json(data: any, file_path: str):
+    """
+    Objetivo: Salvar dados Python (dicionários, listas) em um arquivo JSON.
+    A gravação é atômica (arquivo temporário + renomeação) e segue POLITICA_FSYNC.
+    Dentro de um bloco 'with lote_escrita():', ou com JANELA_GROUP_COMMIT_S > 0, a gravação é adiada e
+    várias chamadas para o mesmo caminho resultam em uma única gravação com os dados mais recentes.
+    Enquanto isso, load_json já enxerga os dados pendentes. Os dados não devem ser alterados depois de
+    passados para save_json, a menos que sejam salvos novamente.
+
+    Args:
+        data (any): Os dados Python a serem salvos (geralmente um dicionário ou lista).
+        file_path (str): O caminho completo para o arquivo JSON onde os dados serão gravados.
+
+    Returns:
+        None: A função não retorna valor; ela executa uma ação (salva o arquivo) e imprime mensagens de erro se falhar.
+    """
+    global _timer_group_commit
+    with _escrita_lock:
+        if _nivel_lote > 0 or JANELA_GROUP_COMMIT_S > 0:
+            # Agrupa: guarda apenas a versão mais recente dos dados para este caminho.
+            _escritas_pendentes[os.path.abspath(file_path)] = (file_path, data)
+            if metricas.ATIVO:
+                metricas.registra_gravacao_agrupada(file_path)
+            # Fora de um lote, agenda a gravação para o final da janela de agrupamento.
+            if _nivel_lote == 0 and _timer_group_commit is None:
+                _timer_group_commit = threading.Timer(JANELA_GROUP_COMMIT_S, descarrega_escritas)
+                _timer_group_commit.daemon = True
+                _timer_group_commit.start()
+            return
+    _grava_json(data, file_path)
+
+def _busca_pendente(file_path: str):
+    """
+    Objetivo: Retornar os dados ainda não gravados de um caminho (se houver), para que load_json
+    enxergue as gravações agrupadas antes de elas chegarem ao disco.
+
+    Args:
+        file_path (str): O caminho do arquivo.
+
+    Returns:
+        tuple: (True, dados) se houver gravação pendente, ou (False, None) caso contrário.
+    """
+    if not _escritas_pendentes:
+        return False, None
+    with _escrita_lock:
+        pendente = _escritas_pendentes.get(os.path.abspath(file_path))
+    return (True, pendente[1]) if pendente is not None else (False, None)
+
+def descarrega_escritas(file_path: str = None):
+    """
+    Objetivo: Gravar imediatamente as gravações agrupadas que ainda estão pendentes.
+
+    Args:
+        file_path (str, optional): Se informado, grava apenas a pendência desse caminho. Padrão para None (todas).
+
+    Returns:
+        None
+    """
+    global _timer_group_commit
+    with _escrita_lock:
+        chaves = [os.path.abspath(file_path)] if file_path is not None else list(_escritas_pendentes)
+        # Cada pendência só é retirada depois de gravada, para que uma leitura concorrente nunca
+        # encontre o caminho fora das pendências e ainda não gravado no disco.
+        for chave in chaves:
+            pendente = _escritas_pendentes.get(chave)
+            if pendente is not None:
+                _grava_json(pendente[1], pendente[0])
+                del _escritas_pendentes[chave]
+        if file_path is None and _timer_group_commit is not None:
+            _timer_group_commit.cancel()
+            _timer_group_commit = None
+
+@contextmanager
+def lote_escrita():
+    """
+    Objetivo: Agrupar as chamadas a save_json feitas dentro do bloco 'with lote_escrita():'.
+    Cada caminho é gravado uma única vez, com os dados mais recentes, ao sair do bloco mais externo
+    (mesmo se ocorrer uma exceção). Útil em operações em massa do professor.
+
+    Returns:
+        None: Usado apenas como gerenciador de contexto.
+    """
+    global _nivel_lote
+    with _escrita_lock:
+        _nivel_lote += 1
+    try:
+        yield
+    finally:
+        with _escrita_lock:
+            _nivel_lote -= 1
+            fim_do_lote = _nivel_lote == 0
+        if fim_do_lote:
+            descarrega_escritas()
+
+# Gravações agrupadas ainda pendentes são feitas quando o programa termina normalmente.
+atexit.register(descarrega_escritas)
+
+# --- Concorrência entre Processos ---
+
+@contextmanager
+def trava_arquivo(file_path: str):
+    """
+    Objetivo: Obter acesso exclusivo a 'file_path' entre threads e processos durante o bloco
+    'with trava_arquivo(caminho):'. A trava é reentrante dentro do processo (a mesma thread pode
+    aninhar blocos para o mesmo arquivo) e é liberada ao sair do bloco mais externo, mesmo com exceção.
+    Usada por operações de leitura-alteração-gravação que não podem ser refeitas (ex: acrescentar eventos).
+    Ao aninhar travas de arquivos diferentes, use sempre a mesma ordem para evitar impasses.
+
+    Args:
+        file_path (str): O caminho do arquivo a ser protegido (não precisa existir).
+
+    Returns:
+        None: Usado apenas como gerenciador de contexto.
+    """
+    chave = os.path.abspath(file_path)
+    caminho_trava = os.path.join(JSON_BASE_DIR, ".travas.lock")
+    with _travas_lock:
+        trava = _travas_processo.get(chave)
+        if trava is None:
+            trava = _travas_processo[chave] = [threading.RLock(), 0, 0, None]
+        trava[2] += 1
+    try:
+        # A RLock serializa as threads do processo; apenas a mais externa obtém a trava do sistema (lockf).
+        with trava[0]:
+            if trava[1] == 0 and fcntl is not None:
+                with _travas_lock:
+                    fd = _descritores_travas.get(caminho_trava)
+                    if fd is None:
+                        _ensure_dir_exists(JSON_BASE_DIR)
+                        fd = os.open(caminho_trava, os.O_RDWR | os.O_CREAT, 0o666)
+                        # O descritor nunca é fechado: fechar qualquer descritor do arquivo liberaria
+                        # todas as travas lockf que o processo tem nele.
+                        _descritores_travas[caminho_trava] = fd
+                posicao = int.from_bytes(hashlib.blake2b(chave.encode("utf-8"), digest_size=7).digest(), "big")
+                fcntl.lockf(fd, fcntl.LOCK_EX, 1, posicao)
+                trava[3] = (fd, posicao)
+            trava[1] += 1
+            try:
+                yield
+            finally:
+                trava[1] -= 1
+                if trava[1] == 0 and trava[3] is not None:
+                    fd, posicao = trava[3]
+                    trava[3] = None
+                    fcntl.lockf(fd, fcntl.LOCK_UN, 1, posicao)
+    finally:
+        with _travas_lock:
+            trava[2] -= 1
+            if trava[2] == 0:
+                del _travas_processo[chave]
+
+def atualiza_json(file_path: str, funcao, default_data: any = None) -> any:
+    """
+    Objetivo: Alterar um documento JSON sem perder atualizações feitas por outros processos, com controle
+    de concorrência otimista: os dados são lidos e alterados sem trava; só a gravação é feita sob
+    trava_arquivo, e apenas se a versão do arquivo (versao_json) ainda for a que foi lida.
+    Se outro processo gravou no meio tempo, a alteração é refeita sobre os dados novos. Depois de
+    TENTATIVAS_OTIMISTAS conflitos, a última tentativa é feita inteira sob a trava.
+    Dentro de um bloco 'with lote_escrita():' a gravação é apenas agendada, então a proteção
+    entre processos vale somente para o processo atual.
+
+    Args:
+        file_path (str): O caminho do arquivo JSON.
+        funcao (callable): Recebe os dados (uma cópia que pode ser alterada) e retorna (alterou, resultado).
+                           Pode ser chamada mais de uma vez, então não deve ter outros efeitos colaterais.
+        default_data (any, optional): Os dados usados se o arquivo não existir. Padrão para None.
+
+    Returns:
+        any: O 'resultado' retornado pela chamada de 'funcao' cujos dados foram gravados.
+    """
+    for _ in range(TENTATIVAS_OTIMISTAS):
+        versao = versao_json(file_path)
+        dados = load_json(file_path, default_data)
+        alterou, resultado = funcao(dados)
+        if not alterou:
+            return resultado
+        with trava_arquivo(file_path):
+            if versao_json(file_path) == versao:
+                save_json(dados, file_path)
+                return resultado
+        if metricas.ATIVO:
+            metricas.registra_conflito(file_path)
+    with trava_arquivo(file_path):
+        dados = load_json(file_path, default_data)
+        alterou, resultado = funcao(dados)
+        if alterou:
+            save_json(dados, file_path)
+        return resultado
+
+# --- Catálogo de Listas de Exercícios ---
+
+def valida_nome_lista(nome_lista_json: str) -> str:
+    """
+    Objetivo: Conferir se o nome de uma lista de exercícios pode ser usado como nome de arquivo no diretório
+    de listas: apenas o nome do arquivo (sem diretórios, ex: '../usuarios.json'), terminado em '.json' e
+    sem começar com '.'. Usada pelos backends e pelo serviço antes de qualquer acesso à lista.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+
+    Returns:
+        str: O próprio nome, se for válido.
+
+    Raises:
+        ValueError: Se o nome não for válido.
+    """
+    if (not isinstance(nome_lista_json, str) or os.path.basename(nome_lista_json) != nome_lista_json
+            or "\\" in nome_lista_json or "\0" in nome_lista_json
+            or not nome_lista_json.endswith(".json") or nome_lista_json.startswith(".")):
+        raise ValueError(f"Nome de lista inválido: {nome_lista_json!r} (use apenas o nome do arquivo, terminado em '.json').")
+    return nome_lista_json
+
+def hash_linhas(linhas, hash_anterior: str = None) -> str:
+    """
+    Objetivo: Calcular o hash do conteúdo de uma lista encadeado linha a linha: o hash de cada linha inclui o das
+    anteriores. Assim, ao acrescentar exercícios, o hash da lista é obtido do hash anterior e das linhas novas
+    (ver estende_resumo_lista), com o mesmo resultado de calculá-lo sobre a lista inteira.
+
+    Args:
+        linhas: As linhas (bytes, com a quebra de linha) na forma canônica (ver listas_exercicios.linhas).
+        hash_anterior (str, optional): O hash das linhas anteriores. Padrão para None (início da lista).
+
+    Returns:
+        str: O hash hexadecimal.
+    """
+    estado = bytes.fromhex(hash_anterior) if hash_anterior else b""
+    for linha in linhas:
+        estado = hashlib.blake2b(estado + linha, digest_size=16).digest()
+    return estado.hex()
+
+def _temas(exercicios: list) -> set:
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Obter os temas distintos de uma sequência de exercícios (valores que não são exercícios são ignorados).
+    """
+    return {ex.get("Tema") for ex in exercicios if isinstance(ex, Mapping) and isinstance(ex.get("Tema"), str)}
+
+def resumo_lista(exercicios: list, conteudo: bytes) -> dict:
+    """
+    Objetivo: Montar os metadados de uma lista de exercícios guardados no catálogo de listas
+    (ver catalogo_listas nos backends), para que menus mostrem as listas sem abrir cada uma.
+
+    Args:
+        exercicios (list): Os exercícios da lista.
+        conteudo (bytes): A lista serializada na forma canônica (ver listas_exercicios.serializa).
+
+    Returns:
+        dict: {"tamanho": bytes, "exercicios": quantidade, "temas": temas distintos em ordem alfabética,
+               "hash": hash hexadecimal do conteúdo (ver hash_linhas)}.
+    """
+    return {"tamanho": len(conteudo), "exercicios": len(exercicios), "temas": sorted(_temas(exercicios)),
+            "hash": hash_linhas(conteudo.splitlines(keepends=True))}
+
+def estende_resumo_lista(entrada: dict, exercicios: list, linhas: list) -> dict:
+    """
+    Objetivo: Atualizar os metadados de uma lista (ver resumo_lista) com exercícios acrescentados ao final dela,
+    sem ler a lista: o custo depende apenas da quantidade de exercícios acrescentados.
+
+    Args:
+        entrada (dict): Os metadados da lista antes do acréscimo (não é alterado).
+        exercicios (list): Os exercícios acrescentados.
+        linhas (list): As linhas deles na forma canônica (ver listas_exercicios.linhas).
+
+    Returns:
+        dict: Os novos metadados (cópia de 'entrada' com "tamanho", "exercicios", "temas" e "hash" atualizados).
+    """
+    return dict(entrada, tamanho=entrada["tamanho"] + sum(len(linha) for linha in linhas),
+                exercicios=entrada["exercicios"] + len(exercicios),
+                temas=sorted(set(entrada["temas"]) | _temas(exercicios)),
+                hash=hash_linhas(linhas, entrada["hash"]))
+
+def get_backend():
+    """
+    Objetivo: Retornar o módulo do backend de armazenamento configurado em BACKEND_ARMAZENAMENTO.
+    Os módulos são importados aqui (e não no topo do arquivo) porque eles próprios importam 'auxiliar'.
+
+    Returns:
+        module: O módulo 'armazenamento_json' ou 'armazenamento_sqlite'.
+    """
+    if BACKEND_ARMAZENAMENTO == "sqlite":
+        import armazenamento_sqlite
+        return armazenamento_sqlite
+    if BACKEND_ARMAZENAMENTO == "json":
+        import armazenamento_json
+        return armazenamento_json
+    raise ValueError(f"Backend de armazenamento desconhecido: {BACKEND_ARMAZENAMENTO}")
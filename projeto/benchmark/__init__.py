@@ -0,0 +1,18 @@
+"""
+Pacote: benchmark
+
+Objetivo: Medir como as operações de cadastro, professor e aluno escalam com o tamanho da instituição.
+
+- gerador.py: gera uma árvore 'json/' sintética (usuários, turmas, matrículas, listas e progresso)
+  em escala configurável.
+- executa.py: cronometra as operações principais sobre essa árvore e produz um relatório em JSON
+  (percentis de latência, bytes lidos/gravados e pico de memória por operação).
+- concorrencia.py: executa as mesmas atualizações em N processos simultâneos e verifica que
+  nenhuma se perdeu, relatando a vazão para cada N (python -m benchmark.concorrencia).
+
+Uso (a partir do diretório 'projeto'):
+    python -m benchmark --alunos 2000 --turmas 40 --repeticoes 50 --saida resultado.json
+"""
+
+from benchmark.gerador import gera_instituicao
+from benchmark.executa import executa_benchmark
@@ -0,0 +1,44 @@
+import argparse  # Leitura dos parâmetros de escala pela linha de comando.
+import json
+import sys
+from benchmark.executa import executa_benchmark
+from benchmark.gerador import ESCALA_PADRAO
+
+# Uso (a partir do diretório 'projeto'):
+#   python -m benchmark [--alunos N] [--turmas N] ... [--repeticoes N] [--backend json|sqlite] [--iteracoes-pbkdf2 N]
+#                       [--saida arquivo.json]
+# O relatório em JSON é impresso na saída padrão (ou gravado em --saida).
+
+def main(argv: list = None) -> int:
+    """
+    Objetivo: Ler os parâmetros da linha de comando, executar o benchmark e emitir o relatório em JSON.
+
+    Args:
+        argv (list, optional): Os argumentos (sem o nome do programa). Padrão para None (sys.argv).
+
+    Returns:
+        int: O código de saída do processo.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description="Benchmark das operações do sistema de listas.")
+    for nome, padrao in ESCALA_PADRAO.items():
+        parser.add_argument("--" + nome.replace("_", "-"), dest=nome, type=type(padrao), default=padrao)
+    parser.add_argument("--repeticoes", type=int, default=30, help="Repetições medidas por operação.")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    parser.add_argument("--iteracoes-pbkdf2", dest="iteracoes_pbkdf2", type=int, default=None,
+                        help="Custo do hash das senhas (padrão: senhas.ITERACOES_PBKDF2).")
+    parser.add_argument("--diretorio", default=None, help="Onde gerar os dados (padrão: diretório temporário, removido ao final).")
+    parser.add_argument("--saida", default=None, help="Arquivo onde gravar o relatório JSON (padrão: saída padrão).")
+    args = vars(parser.parse_args(argv))
+
+    saida = args.pop("saida")
+    relatorio = executa_benchmark(**args)
+    texto = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if saida:
+        with open(saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
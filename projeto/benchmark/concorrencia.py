@@ -0,0 +1,262 @@
+import argparse    # Leitura dos parâmetros pela linha de comando.
+import contextlib  # Suprime as mensagens impressas pelas operações dos trabalhadores.
+import io
+import json
+import os
+import shutil
+import subprocess  # Cada trabalhador é um processo Python independente.
+import sys
+import tempfile
+import time
+import auxiliar
+import aluno
+import cadastro
+import estatisticas
+import professor
+import senhas
+from benchmark import gerador
+
+# --- Teste de Carga com Vários Processos ---
+# Mede se atualizações feitas ao mesmo tempo por N processos sobre os mesmos arquivos se perdem.
+# Para cada N, uma instituição nova é criada (uma turma com a lista LISTA_ENVIOS) e N processos
+# trabalhadores são iniciados juntos. Cada um executa 'operacoes' vezes, com matrículas só dele:
+#   cadastra um aluno (cadastro.cria_usuarios)           -> diretório de usuários compartilhado;
+#   matricula o aluno na turma (professor.insere_aluno)  -> o documento da turma e o índice de matrículas;
+#   acrescenta um exercício a LISTA_ACRESCIMOS           -> o mesmo arquivo de lista em todos os processos;
+#   envia as respostas de LISTA_ENVIOS (aluno.envia_respostas) -> progresso e estatísticas da turma.
+# Ao final, conta o que se perdeu: alunos cadastrados, alunos na turma, exercícios na lista, envios
+# gravados e alunos contabilizados nas estatísticas (comparadas também com a reconstrução do zero).
+# Uso (a partir do diretório 'projeto'):
+#   python -m benchmark.concorrencia [--processos 1 2 4 8] [--operacoes N] [--backend json|sqlite] [--saida arquivo.json]
+
+TURMA = "Turma Concorrencia"
+LISTA_ENVIOS = "envios.json"          # Associada à turma; recebe os envios dos alunos.
+LISTA_ACRESCIMOS = "acrescimos.json"  # Recebe os exercícios acrescentados por todos os processos.
+
+def _matriculas(indice: int, operacoes: int) -> list:
+    """
+    Objetivo: Retornar as matrículas usadas por um trabalhador (nenhuma se repete entre trabalhadores).
+
+    Args:
+        indice (int): O número do trabalhador (0, 1, ...).
+        operacoes (int): Quantas matrículas cada trabalhador usa.
+
+    Returns:
+        list: As matrículas do trabalhador.
+    """
+    inicio = gerador.MATRICULA_BASE_ALUNOS + indice * operacoes
+    return list(range(inicio, inicio + operacoes))
+
+def _trabalhador(diretorio: str, backend: str, indice: int, operacoes: int) -> dict:
+    """
+    Objetivo: Executar as operações de um trabalhador (em seu próprio processo) e medir o tempo gasto.
+    Avisa que está pronto com a linha 'pronto' e só começa quando recebe uma linha pela entrada padrão,
+    para que todos os trabalhadores comecem juntos.
+
+    Args:
+        diretorio (str): O diretório da instituição.
+        backend (str): O backend de armazenamento ("json" ou "sqlite").
+        indice (int): O número do trabalhador.
+        operacoes (int): Quantas vezes executar o ciclo de operações.
+
+    Returns:
+        dict: {'segundos', 'operacoes', 'erros': [mensagens]}.
+    """
+    gerador.configura_caminhos(diretorio)
+    auxiliar.BACKEND_ARMAZENAMENTO = backend
+    print("pronto", flush=True)
+    sys.stdin.readline()
+
+    erros = []
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for matricula in _matriculas(indice, operacoes):
+            resultados = (
+                cadastro.cria_usuarios([{"matricula": matricula, "nome": f"Aluno {matricula}", "idade": 20,
+                                         "tipo": "aluno", "senha": gerador.SENHA_PADRAO}]),
+                professor.insere_aluno(TURMA, matricula),
+                professor.cria_exercicio([], f"Tema {matricula}", "1+1?", ["2", "3", "4"], "a", LISTA_ACRESCIMOS),
+                aluno.envia_respostas(matricula, LISTA_ENVIOS, {"0": "a"}),
+            )
+            erros.extend(r["mensagem"] for r in resultados if r["status"] != "sucesso")
+        auxiliar.descarrega_escritas()
+    return {"segundos": time.perf_counter() - inicio, "operacoes": 4 * operacoes, "erros": erros}
+
+def _prepara(diretorio: str):
+    """
+    Objetivo: Criar a instituição inicial: a turma, a lista LISTA_ENVIOS associada a ela e as estatísticas
+    da lista já calculadas (para que os envios atualizem os contadores incrementalmente).
+
+    Args:
+        diretorio (str): O diretório da instituição (criado se não existir).
+
+    Returns:
+        None
+    """
+    auxiliar.get_backend().inicializa()
+    professor.cria_turma(TURMA)
+    professor.cria_exercicio([], "Soma", "1+1?", ["2", "3", "4"], "a", LISTA_ENVIOS)
+    professor.passa_lista(LISTA_ENVIOS, TURMA)
+    professor.visualiza_turma(TURMA)
+    auxiliar.descarrega_escritas()
+
+def _verifica(processos: int, operacoes: int) -> dict:
+    """
+    Objetivo: Contar as atualizações perdidas depois que todos os trabalhadores terminaram.
+
+    Args:
+        processos (int): Quantos trabalhadores foram executados.
+        operacoes (int): Quantas operações de cada tipo cada trabalhador executou.
+
+    Returns:
+        dict: Tipo de atualização -> quantidade perdida (todas devem ser zero).
+    """
+    backend = auxiliar.get_backend()
+    auxiliar.limpa_cache_json()
+    matriculas = [m for indice in range(processos) for m in _matriculas(indice, operacoes)]
+    esperados = len(matriculas)
+    alunos_turma = set(backend.busca_turma(TURMA, somente_leitura=True)["alunos"])
+    progresso_alunos = backend.carrega_progresso_alunos(matriculas, somente_leitura=True)
+    envios = sum(1 for m in matriculas if progresso_alunos.get(str(m), {}).get(LISTA_ENVIOS, {}).get("status") == "completo")
+    incremental = backend.carrega_estatisticas_turma(TURMA).get(LISTA_ENVIOS, {})
+    estatisticas.reconstroi_estatisticas(TURMA)
+    reconstruida = backend.carrega_estatisticas_turma(TURMA).get(LISTA_ENVIOS, {})
+    return {
+        "usuarios": esperados - len(backend.busca_usuarios(matriculas)),
+        "matriculas": esperados - len(alunos_turma.intersection(matriculas)),
+        "exercicios": esperados - len(backend.carrega_lista(LISTA_ACRESCIMOS, somente_leitura=True)),
+        "envios": esperados - envios,
+        "estatisticas": abs(esperados - incremental.get("alunos_contribuintes", 0)) + (incremental != reconstruida),
+    }
+
+def _executa_rodada(diretorio: str, backend: str, processos: int, operacoes: int, iteracoes_pbkdf2: int) -> dict:
+    """
+    Objetivo: Executar uma rodada com 'processos' trabalhadores simultâneos e verificar o resultado.
+
+    Args:
+        diretorio (str): O diretório (novo) da instituição desta rodada.
+        backend (str): O backend de armazenamento.
+        processos (int): Quantos trabalhadores executar ao mesmo tempo.
+        operacoes (int): Quantos ciclos de operações cada trabalhador executa.
+        iteracoes_pbkdf2 (int): Custo do hash das senhas nos trabalhadores.
+
+    Returns:
+        dict: O resultado da rodada (tempo, vazão, erros e atualizações perdidas).
+    """
+    anteriores = gerador.configura_caminhos(diretorio)
+    backend_anterior = auxiliar.BACKEND_ARMAZENAMENTO
+    auxiliar.BACKEND_ARMAZENAMENTO = backend
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _prepara(diretorio)
+
+        pasta_projeto = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        trabalhadores = [subprocess.Popen([sys.executable, "-m", "benchmark.concorrencia", "--trabalhador", str(indice),
+                                           "--diretorio", os.path.abspath(diretorio), "--backend", backend,
+                                           "--operacoes", str(operacoes), "--iteracoes-pbkdf2", str(iteracoes_pbkdf2)],
+                                          cwd=pasta_projeto, text=True,
+                                          stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+                         for indice in range(processos)]
+        for trabalhador in trabalhadores:
+            trabalhador.stdout.readline() # Espera todos ficarem prontos (importações e configuração fora da medida).
+        inicio = time.perf_counter()
+        for trabalhador in trabalhadores: # Libera todos antes de esperar o primeiro terminar.
+            trabalhador.stdin.write("\n")
+            trabalhador.stdin.close()
+        saidas = [trabalhador.stdout.read() for trabalhador in trabalhadores]
+        for trabalhador in trabalhadores:
+            trabalhador.wait()
+        segundos = time.perf_counter() - inicio
+
+        resultados = [json.loads(saida) if trabalhador.returncode == 0
+                      else {"operacoes": 0, "erros": [f"Trabalhador terminou com o código {trabalhador.returncode}."]}
+                      for trabalhador, saida in zip(trabalhadores, saidas)]
+        total = sum(r["operacoes"] for r in resultados)
+        erros = [erro for r in resultados for erro in r["erros"]]
+        perdidas = _verifica(processos, operacoes)
+        if backend == "sqlite":
+            import armazenamento_sqlite
+            armazenamento_sqlite.fecha_conexao()
+    finally:
+        auxiliar.BACKEND_ARMAZENAMENTO = backend_anterior
+        gerador.restaura_caminhos(anteriores)
+
+    return {
+        "processos": processos,
+        "operacoes": total,
+        "segundos": round(segundos, 3),
+        "operacoes_por_segundo": round(total / segundos, 1) if segundos > 0 else None,
+        "erros": len(erros),
+        "primeiros_erros": erros[:5],
+        "atualizacoes_perdidas": perdidas,
+        "sem_perdas": not erros and not any(perdidas.values()),
+    }
+
+def executa_concorrencia(processos: list = (1, 2, 4, 8), operacoes: int = 50, backend: str = "json",
+                         diretorio: str = None, iteracoes_pbkdf2: int = 1000) -> dict:
+    """
+    Objetivo: Executar o teste de carga para cada quantidade de processos e montar o relatório.
+
+    Args:
+        processos (list, optional): As quantidades de processos simultâneos. Padrão para (1, 2, 4, 8).
+        operacoes (int, optional): Ciclos de operações por processo. Padrão para 50.
+        backend (str, optional): Backend de armazenamento ("json" ou "sqlite"). Padrão para "json".
+        diretorio (str, optional): Onde criar as instituições. Padrão para None (temporário, removido ao final).
+        iteracoes_pbkdf2 (int, optional): Custo do hash das senhas. Padrão para 1000 (o cadastro não é o foco).
+
+    Returns:
+        dict: O relatório ({'parametros', 'rodadas', 'sem_perdas'}), serializável em JSON.
+    """
+    temporario = diretorio is None
+    if temporario:
+        diretorio = tempfile.mkdtemp(prefix="prog_modular_conc_")
+    try:
+        rodadas = [_executa_rodada(os.path.join(diretorio, f"{n}_processos"), backend, n, operacoes, iteracoes_pbkdf2)
+                   for n in processos]
+    finally:
+        if temporario:
+            shutil.rmtree(diretorio, ignore_errors=True)
+    return {
+        "parametros": {"processos": list(processos), "operacoes": operacoes, "backend": backend,
+                       "iteracoes_pbkdf2": iteracoes_pbkdf2, "cpus": os.cpu_count()},
+        "rodadas": rodadas,
+        "sem_perdas": all(rodada["sem_perdas"] for rodada in rodadas),
+    }
+
+def main(argv: list = None) -> int:
+    """
+    Objetivo: Ler os parâmetros da linha de comando e executar o teste de carga (ou um trabalhador).
+
+    Args:
+        argv (list, optional): Os argumentos (sem o nome do programa). Padrão para None (sys.argv).
+
+    Returns:
+        int: O código de saída do processo (1 se alguma atualização se perdeu).
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmark.concorrencia",
+                                     description="Teste de carga com vários processos sobre os mesmos arquivos.")
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--operacoes", type=int, default=50, help="Ciclos de operações por processo.")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="json")
+    parser.add_argument("--iteracoes-pbkdf2", dest="iteracoes_pbkdf2", type=int, default=1000)
+    parser.add_argument("--diretorio", default=None, help="Onde criar os dados (padrão: diretório temporário, removido ao final).")
+    parser.add_argument("--saida", default=None, help="Arquivo onde gravar o relatório JSON (padrão: saída padrão).")
+    parser.add_argument("--trabalhador", type=int, default=None, help=argparse.SUPPRESS) # Uso interno (_executa_rodada).
+    args = parser.parse_args(argv)
+
+    if args.trabalhador is not None:
+        senhas.ITERACOES_PBKDF2 = args.iteracoes_pbkdf2
+        print(json.dumps(_trabalhador(args.diretorio, args.backend, args.trabalhador, args.operacoes)), flush=True)
+        return 0
+
+    relatorio = executa_concorrencia(args.processos, args.operacoes, args.backend, args.diretorio, args.iteracoes_pbkdf2)
+    texto = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+    return 0 if relatorio["sem_perdas"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+import builtins    # input() é substituído por respostas roteirizadas na sessão de responder_lista.
+import contextlib  # Suprime as mensagens impressas pelas operações durante as medições.
+import io
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc  # Pico de memória alocada durante cada operação.
+import auxiliar
+import aluno
+import cadastro
+import professor
+import senhas
+from benchmark import gerador
+
+# --- Execução do Benchmark ---
+# Cada operação é executada 'repeticoes' vezes sobre a instituição gerada, com alvos sorteados
+# (aluno, turma, lista). Para cada operação são medidos:
+#   - latência (ms): percentis p50/p90/p99, média, máximo e a primeira execução (cache frio);
+#   - bytes lidos/gravados: soma de todas as repetições, pelos contadores do processo (/proc/self/io, no Linux);
+#   - pico de memória: maior pico do tracemalloc em algumas repetições extras (medidas à parte,
+#     pois o tracemalloc deixa as operações mais lentas).
+# A preparação de cada repetição (sorteio dos alvos, roteiro de respostas) fica fora da medição.
+# O custo da autenticação é resumido em logins por segundo por núcleo (login completo, com o cache de
+# verificações de senha esvaziado antes de cada repetição), para o custo do PBKDF2 em uso.
+
+# Quantidade de repetições extras usadas para medir o pico de memória de cada operação.
+REPETICOES_MEMORIA = 3
+
+def _contadores_io():
+    """
+    Objetivo: Ler os bytes lidos e gravados pelo processo até agora.
+
+    Returns:
+        tuple: (bytes lidos, bytes gravados), ou None se o sistema não oferecer /proc/self/io.
+    """
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            campos = dict(linha.split(":", 1) for linha in f.read().splitlines() if ":" in linha)
+        return int(campos["rchar"]), int(campos["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def _percentil(valores_ordenados: list, fracao: float) -> float:
+    """
+    Objetivo: Calcular um percentil pelo método do posto mais próximo.
+
+    Args:
+        valores_ordenados (list): Os valores, em ordem crescente (não vazia).
+        fracao (float): O percentil desejado, entre 0 e 1 (ex: 0.99).
+
+    Returns:
+        float: O valor do percentil.
+    """
+    posto = max(1, int(round(fracao * len(valores_ordenados) + 0.5)))
+    return valores_ordenados[min(posto, len(valores_ordenados)) - 1]
+
+@contextlib.contextmanager
+def _respostas_roteirizadas(roteiro: list):
+    """
+    Objetivo: Substituir input() por uma função que devolve, em ordem, as entradas do roteiro.
+
+    Args:
+        roteiro (list): As entradas a serem "digitadas".
+    """
+    entradas = iter(roteiro)
+    input_original = builtins.input
+    builtins.input = lambda prompt="": next(entradas)
+    try:
+        yield
+    finally:
+        builtins.input = input_original
+
+def _mede_operacao(operacao, prepara, repeticoes: int) -> dict:
+    """
+    Objetivo: Medir uma operação ao longo de várias repetições.
+
+    Args:
+        operacao (callable): Recebe os argumentos preparados e executa a operação medida.
+        prepara (callable): Recebe o número da repetição e retorna a tupla de argumentos da operação,
+                            ou None se não houver alvo disponível (a repetição é pulada).
+        repeticoes (int): Quantidade de repetições medidas.
+
+    Returns:
+        dict: As medidas da operação.
+    """
+    latencias = []
+    lidos = gravados = 0
+    io_disponivel = _contadores_io() is not None
+    # A própria leitura de /proc/self/io conta como bytes lidos: desconta esse custo de cada medição.
+    custo_leitura_io = 0
+    if io_disponivel:
+        antes = _contadores_io()
+        custo_leitura_io = _contadores_io()[0] - antes[0]
+    for i in range(repeticoes):
+        argumentos = prepara(i)
+        if argumentos is None:
+            continue
+        io_antes = _contadores_io()
+        inicio = time.perf_counter()
+        operacao(*argumentos)
+        latencias.append((time.perf_counter() - inicio) * 1000)
+        io_depois = _contadores_io()
+        if io_disponivel:
+            lidos += max(0, io_depois[0] - io_antes[0] - custo_leitura_io)
+            gravados += io_depois[1] - io_antes[1]
+
+    pico_memoria = 0
+    for i in range(REPETICOES_MEMORIA):
+        argumentos = prepara(repeticoes + i)
+        if argumentos is None:
+            continue
+        tracemalloc.start()
+        try:
+            operacao(*argumentos)
+            pico_memoria = max(pico_memoria, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    if not latencias:
+        return {"repeticoes": 0}
+    ordenadas = sorted(latencias)
+    return {
+        "repeticoes": len(latencias),
+        "latencia_ms": {
+            "primeira": round(latencias[0], 4),
+            "p50": round(_percentil(ordenadas, 0.50), 4),
+            "p90": round(_percentil(ordenadas, 0.90), 4),
+            "p99": round(_percentil(ordenadas, 0.99), 4),
+            "media": round(sum(latencias) / len(latencias), 4),
+            "maximo": round(ordenadas[-1], 4),
+        },
+        "bytes_lidos": lidos if io_disponivel else None,
+        "bytes_gravados": gravados if io_disponivel else None,
+        "pico_memoria_bytes": pico_memoria,
+    }
+
+def _sessao_responder_lista(matricula: int, nome_lista: str, roteiro: list):
+    """
+    Objetivo: Executar uma sessão roteirizada de aluno: abrir a lista e respondê-la até o fim.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+        nome_lista (str): A lista a responder.
+        roteiro (list): As entradas da sessão (ver _roteiro_responder_lista).
+
+    Returns:
+        None
+    """
+    exercicios, hash_lista = auxiliar.get_backend().carrega_lista_versionada(nome_lista)
+    with _respostas_roteirizadas(roteiro):
+        aluno.responder_lista(matricula, nome_lista, exercicios, hash_lista=hash_lista)
+
+def _roteiro_responder_lista(matricula: int, nome_lista: str) -> list:
+    """
+    Objetivo: Montar as entradas de uma sessão que responde a lista até o fim, a partir do progresso atual
+    (refazendo a lista, se ela já estiver completa).
+
+    Args:
+        matricula (int): A matrícula do aluno.
+        nome_lista (str): A lista a responder.
+
+    Returns:
+        list: As entradas da sessão.
+    """
+    backend = auxiliar.get_backend()
+    num_exercicios = len(backend.carrega_lista(nome_lista, somente_leitura=True))
+    progresso_lista = backend.carrega_progresso_aluno(matricula, somente_leitura=True).get(nome_lista, {})
+    roteiro = []
+    inicio = progresso_lista.get("progresso", 0)
+    if progresso_lista.get("status") == "completo":
+        roteiro.append("s") # Refazer a lista.
+        inicio = 0
+    roteiro.extend("abc"[i % 3] for i in range(inicio, num_exercicios))
+    roteiro.append("") # "Pressione Enter para continuar..." ao final dos resultados.
+    return roteiro
+
+def _mede_operacoes(escala: dict, repeticoes: int) -> dict:
+    """
+    Objetivo: Medir todas as operações sobre a instituição configurada em 'auxiliar'.
+
+    Args:
+        escala (dict): A escala da instituição gerada.
+        repeticoes (int): Quantidade de repetições por operação.
+
+    Returns:
+        dict: Nome da operação -> medidas.
+    """
+    backend = auxiliar.get_backend()
+    rng = random.Random(escala["semente"] + 1)
+    alunos = gerador.matriculas_alunos(escala)
+    turmas = backend.lista_turmas()
+    listas = backend.nomes_listas()
+
+    def prepara_insere_aluno(_):
+        for _tentativa in range(100):
+            nome_turma, matricula = rng.choice(turmas), rng.choice(alunos)
+            if matricula not in backend.busca_turma(nome_turma, somente_leitura=True)["alunos"]:
+                return (nome_turma, matricula)
+        return None
+
+    def prepara_passa_lista(_):
+        for _tentativa in range(100):
+            nome_turma, nome_lista = rng.choice(turmas), rng.choice(listas)
+            if nome_lista not in backend.busca_turma(nome_turma, somente_leitura=True)["listas"]:
+                return (nome_lista, nome_turma)
+        return None
+
+    def prepara_responder_lista(_):
+        for _tentativa in range(100):
+            matricula = rng.choice(alunos)
+            listas_aluno = [l for ls in backend.turmas_do_aluno(matricula).values() for l in ls]
+            if listas_aluno:
+                nome_lista = rng.choice(listas_aluno)
+                return (matricula, nome_lista, _roteiro_responder_lista(matricula, nome_lista))
+        return None
+
+    def prepara_entra_conta_sem_cache(_):
+        senhas.limpa_cache()
+        return (str(rng.choice(alunos)), gerador.SENHA_PADRAO)
+
+    def prepara_valida_sessao(_):
+        return (senhas.emite_token(rng.choice(alunos)),)
+
+    operacoes = [
+        ("entra_conta", cadastro.entra_conta,
+         lambda _: (str(rng.choice(alunos)), gerador.SENHA_PADRAO)),
+        ("entra_conta_sem_cache", cadastro.entra_conta, prepara_entra_conta_sem_cache),
+        ("usuario_da_sessao", cadastro.usuario_da_sessao, prepara_valida_sessao),
+        ("_get_aluno_turmas_e_listas", aluno._get_aluno_turmas_e_listas,
+         lambda _: (rng.choice(alunos),)),
+        ("visualiza_turma", professor.visualiza_turma,
+         lambda _: (rng.choice(turmas),)),
+        ("insere_aluno", professor.insere_aluno, prepara_insere_aluno),
+        ("passa_lista", professor.passa_lista, prepara_passa_lista),
+        ("responder_lista", _sessao_responder_lista, prepara_responder_lista),
+    ]
+    resultados = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for nome, operacao, prepara in operacoes:
+            resultados[nome] = _mede_operacao(operacao, prepara, repeticoes)
+    return resultados
+
+def executa_benchmark(diretorio: str = None, repeticoes: int = 30, backend: str = "json", iteracoes_pbkdf2: int = None,
+                      **escala) -> dict:
+    """
+    Objetivo: Gerar uma instituição sintética e medir as operações principais sobre ela.
+
+    Args:
+        diretorio (str, optional): Onde gerar a instituição. Padrão para None (diretório temporário, removido ao final).
+        repeticoes (int, optional): Quantidade de repetições por operação. Padrão para 30.
+        backend (str, optional): Backend de armazenamento medido ("json" ou "sqlite"). Padrão para "json".
+        iteracoes_pbkdf2 (int, optional): Custo do hash das senhas. Padrão para None (senhas.ITERACOES_PBKDF2).
+        **escala: Parâmetros de escala da instituição (ver gerador.ESCALA_PADRAO).
+
+    Returns:
+        dict: O relatório do benchmark (parâmetros, ambiente, geração e medidas por operação), serializável em JSON.
+    """
+    temporario = diretorio is None
+    if temporario:
+        diretorio = tempfile.mkdtemp(prefix="prog_modular_bench_")
+    iteracoes_anteriores = senhas.ITERACOES_PBKDF2
+    senhas.ITERACOES_PBKDF2 = iteracoes_pbkdf2 or iteracoes_anteriores
+    try:
+        return _executa(diretorio, repeticoes, backend, escala)
+    finally:
+        senhas.ITERACOES_PBKDF2 = iteracoes_anteriores
+        if temporario:
+            shutil.rmtree(diretorio, ignore_errors=True)
+
+def _executa(diretorio: str, repeticoes: int, backend: str, escala: dict) -> dict:
+    """
+    Objetivo: Gerar a instituição em 'diretorio' e medir as operações (ver executa_benchmark).
+
+    Args:
+        diretorio (str): Onde gerar a instituição.
+        repeticoes (int): Quantidade de repetições por operação.
+        backend (str): Backend de armazenamento medido.
+        escala (dict): Parâmetros de escala da instituição.
+
+    Returns:
+        dict: O relatório do benchmark.
+    """
+    inicio = time.perf_counter()
+    geracao = gerador.gera_instituicao(diretorio, **escala)
+    geracao["segundos"] = round(time.perf_counter() - inicio, 3)
+
+    anteriores = gerador.configura_caminhos(diretorio)
+    backend_anterior = auxiliar.BACKEND_ARMAZENAMENTO
+    auxiliar.BACKEND_ARMAZENAMENTO = backend
+    try:
+        if backend == "sqlite":
+            import armazenamento_sqlite
+            armazenamento_sqlite.importa_json()
+        auxiliar.get_backend().inicializa()
+        operacoes = _mede_operacoes(geracao["escala"], repeticoes)
+        auxiliar.descarrega_escritas()
+    finally:
+        if backend == "sqlite":
+            import armazenamento_sqlite
+            armazenamento_sqlite.fecha_conexao()
+        auxiliar.BACKEND_ARMAZENAMENTO = backend_anterior
+        gerador.restaura_caminhos(anteriores)
+
+    login = operacoes["entra_conta_sem_cache"]
+    return {
+        "parametros": {"repeticoes": repeticoes, "backend": backend, "escala": geracao.pop("escala")},
+        "ambiente": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "politica_fsync": auxiliar.POLITICA_FSYNC,
+            "cpus": os.cpu_count(),
+        },
+        "geracao": geracao,
+        "autenticacao": {
+            "iteracoes_pbkdf2": senhas.ITERACOES_PBKDF2,
+            # Um login ocupa um núcleo do início ao fim, então logins/s por núcleo = 1 / latência média.
+            "logins_por_segundo_por_nucleo": (round(1000 / login["latencia_ms"]["media"], 1)
+                                              if login.get("repeticoes") else None),
+        },
+        "operacoes": operacoes,
+    }
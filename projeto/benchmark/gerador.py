@@ -0,0 +1,190 @@
+import os      # Manipulação dos caminhos da árvore gerada.
+import random  # Geração pseudoaleatória (reprodutível pela semente) dos dados sintéticos.
+import auxiliar   # Caminhos dos arquivos (alterados durante a geração) e save_json.
+import progresso  # A árvore de progresso é gerada no formato antigo e migrada para as partições por aluno.
+import armazenamento_json  # As turmas são geradas em um único arquivo e divididas em um documento por turma.
+import senhas     # Hash da senha dos usuários gerados.
+
+# --- Gerador de Instituições Sintéticas ---
+# Gera, em um diretório próprio, a mesma árvore que o sistema usa em 'json/':
+#   usuarios.json, turmas/ (um documento por turma), listas_de_exercicios/*.json e o progresso dos alunos (partições por aluno).
+# Os arquivos são montados em memória e gravados de uma vez (e não pelas funções de cadastro/professor),
+# para que gerar uma instituição grande não custe mais do que o próprio benchmark.
+
+# Escala padrão da instituição gerada (pode ser alterada por parâmetro em gera_instituicao).
+ESCALA_PADRAO = {
+    "alunos": 1000,                # Quantidade de alunos.
+    "professores": 10,             # Quantidade de professores.
+    "turmas": 20,                  # Quantidade de turmas.
+    "matriculas_por_aluno": 2,     # Em quantas turmas cada aluno está matriculado.
+    "listas": 10,                  # Quantidade de listas de exercícios.
+    "exercicios_por_lista": 10,    # Quantidade de exercícios em cada lista.
+    "listas_por_turma": 3,         # Quantas listas são associadas a cada turma.
+    "fracao_respondida": 0.5,      # Fração das listas (de cada aluno) que já foram iniciadas ou completadas.
+    "semente": 42,                 # Semente do gerador pseudoaleatório (mesma semente -> mesma instituição).
+}
+
+# Primeiras matrículas de alunos e professores gerados.
+MATRICULA_BASE_ALUNOS = 1_000_000
+MATRICULA_BASE_PROFESSORES = 9_000_000
+
+# Senha de todos os usuários gerados (usada pelo benchmark de entra_conta).
+SENHA_PADRAO = "senha"
+
+def configura_caminhos(diretorio: str) -> dict:
+    """
+    Objetivo: Apontar os caminhos de 'auxiliar' para uma árvore de dados em 'diretorio'.
+
+    Args:
+        diretorio (str): O diretório base da árvore (equivalente a 'json/').
+
+    Returns:
+        dict: Os valores anteriores dos caminhos alterados (para restaurar_caminhos).
+    """
+    novos = {
+        "JSON_BASE_DIR": diretorio,
+        "LISTAS_DE_EXERCICIOS_DIR": os.path.join(diretorio, "listas_de_exercicios"),
+        "TURMAS_JSON_PATH": os.path.join(diretorio, "turmas.json"),
+        "USUARIOS_JSON_PATH": os.path.join(diretorio, "usuarios.json"),
+        "PROGRESO_ALUNOS_JSON_PATH": os.path.join(diretorio, "progresso_alunos.json"),
+        "SQLITE_DB_PATH": os.path.join(diretorio, "prog_modular.db"),
+    }
+    anteriores = {nome: getattr(auxiliar, nome) for nome in novos}
+    for nome, valor in novos.items():
+        setattr(auxiliar, nome, valor)
+    return anteriores
+
+def restaura_caminhos(anteriores: dict):
+    """
+    Objetivo: Restaurar os caminhos de 'auxiliar' alterados por configura_caminhos.
+
+    Args:
+        anteriores (dict): O retorno de configura_caminhos.
+
+    Returns:
+        None
+    """
+    for nome, valor in anteriores.items():
+        setattr(auxiliar, nome, valor)
+
+def matriculas_alunos(escala: dict) -> list:
+    """
+    Objetivo: Retornar as matrículas dos alunos gerados para uma escala.
+
+    Args:
+        escala (dict): A escala da instituição (ver ESCALA_PADRAO).
+
+    Returns:
+        list: As matrículas (int) dos alunos.
+    """
+    return list(range(MATRICULA_BASE_ALUNOS, MATRICULA_BASE_ALUNOS + escala["alunos"]))
+
+def _gera_progresso_lista(rng: random.Random, gabarito: list) -> dict:
+    """
+    Objetivo: Gerar o progresso de um aluno em uma lista: completa (todas as questões) ou parcial.
+
+    Args:
+        rng (random.Random): O gerador pseudoaleatório.
+        gabarito (list): As respostas corretas da lista (usadas para que parte das respostas esteja certa).
+
+    Returns:
+        dict: O progresso ({'progresso', 'respostas', 'status'}).
+    """
+    completa = rng.random() < 0.5
+    respondidas = len(gabarito) if completa else rng.randint(1, max(1, len(gabarito) - 1))
+    respostas = {str(i): (gabarito[i] if rng.random() < 0.6 else rng.choice("abc")) for i in range(respondidas)}
+    return {"progresso": respondidas, "respostas": respostas, "status": "completo" if completa else "iniciado"}
+
+def gera_instituicao(diretorio: str, **escala) -> dict:
+    """
+    Objetivo: Gerar uma instituição sintética completa em 'diretorio'.
+    Os caminhos de 'auxiliar' são apontados para 'diretorio' apenas durante a geração.
+
+    Args:
+        diretorio (str): O diretório onde a árvore será gerada (não deve conter dados reais).
+        **escala: Parâmetros de escala (ver ESCALA_PADRAO); os omitidos usam o valor padrão.
+
+    Returns:
+        dict: A escala usada, o total de bytes gerados e as quantidades de cada tipo de dado.
+    """
+    escala = dict(ESCALA_PADRAO, **escala)
+    rng = random.Random(escala["semente"])
+    anteriores = configura_caminhos(diretorio)
+    politica_anterior = auxiliar.POLITICA_FSYNC
+    auxiliar.POLITICA_FSYNC = "nenhum" # Dados descartáveis: não vale a pena esperar o disco a cada arquivo.
+    try:
+        os.makedirs(auxiliar.LISTAS_DE_EXERCICIOS_DIR, exist_ok=True)
+
+        # Usuários: alunos e professores. Todos recebem o mesmo hash (com o mesmo sal): calcular um hash por
+        # usuário custaria ITERACOES_PBKDF2 rodadas cada, e o custo de verificação é o mesmo.
+        senha_hash = senhas.gera_hash(SENHA_PADRAO)
+        usuarios = {}
+        alunos = matriculas_alunos(escala)
+        for matricula in alunos:
+            usuarios[str(matricula)] = {"matricula": matricula, "nome": f"Aluno {matricula}", "idade": rng.randint(17, 40),
+                                        "tipo": "aluno", "senha": senha_hash}
+        for i in range(escala["professores"]):
+            matricula = MATRICULA_BASE_PROFESSORES + i
+            usuarios[str(matricula)] = {"matricula": matricula, "nome": f"Professor {matricula}", "idade": rng.randint(25, 70),
+                                        "tipo": "professor", "senha": senha_hash}
+        auxiliar.save_json(usuarios, auxiliar.USUARIOS_JSON_PATH)
+
+        # Listas de exercícios.
+        gabaritos = {}
+        for i in range(escala["listas"]):
+            nome_lista = f"lista_{i + 1:04d}.json"
+            exercicios = []
+            for j in range(escala["exercicios_por_lista"]):
+                a, b = rng.randint(1, 99), rng.randint(1, 99)
+                alternativas = [str(a + b), str(a + b + 1), str(a + b - 1)]
+                rng.shuffle(alternativas)
+                exercicios.append({
+                    "Tema": "Soma",
+                    "Enunciado": f"Quanto é {a}+{b}?",
+                    "Alternativa A": alternativas[0],
+                    "Alternativa B": alternativas[1],
+                    "Alternativa C": alternativas[2],
+                    "RespostaCorreta": "abc"[alternativas.index(str(a + b))],
+                })
+            gabaritos[nome_lista] = [ex["RespostaCorreta"] for ex in exercicios]
+            auxiliar.save_json(exercicios, os.path.join(auxiliar.LISTAS_DE_EXERCICIOS_DIR, nome_lista))
+
+        # Turmas, com as listas associadas e os alunos matriculados.
+        nomes_listas = sorted(gabaritos)
+        turmas = {}
+        for i in range(escala["turmas"]):
+            listas_turma = rng.sample(nomes_listas, min(escala["listas_por_turma"], len(nomes_listas)))
+            turmas[f"Turma {i + 1:04d}"] = {"alunos": [], "listas": listas_turma}
+        nomes_turmas = sorted(turmas)
+        for matricula in alunos:
+            for nome_turma in rng.sample(nomes_turmas, min(escala["matriculas_por_aluno"], len(nomes_turmas))):
+                turmas[nome_turma]["alunos"].append(matricula)
+        auxiliar.save_json(turmas, auxiliar.TURMAS_JSON_PATH)
+        armazenamento_json.migra_turmas_monolitico() # Um documento por turma (ver armazenamento_json.py).
+
+        # Progresso: gerado no formato antigo (um único arquivo) e dividido em partições pela migração.
+        progresso_alunos = {}
+        for nome_turma in nomes_turmas:
+            for matricula in turmas[nome_turma]["alunos"]:
+                for nome_lista in turmas[nome_turma]["listas"]:
+                    if rng.random() < escala["fracao_respondida"]:
+                        progresso_alunos.setdefault(str(matricula), {})[nome_lista] = _gera_progresso_lista(rng, gabaritos[nome_lista])
+        auxiliar.save_json(progresso_alunos, auxiliar.PROGRESO_ALUNOS_JSON_PATH)
+        progresso.migra_progresso_monolitico()
+        auxiliar.descarrega_escritas()
+    finally:
+        auxiliar.POLITICA_FSYNC = politica_anterior
+        restaura_caminhos(anteriores)
+
+    total_bytes = 0
+    for raiz, _, arquivos in os.walk(diretorio):
+        total_bytes += sum(os.path.getsize(os.path.join(raiz, nome)) for nome in arquivos)
+    return {
+        "escala": escala,
+        "bytes": total_bytes,
+        "usuarios": len(usuarios),
+        "turmas": len(turmas),
+        "matriculas": sum(len(dados["alunos"]) for dados in turmas.values()),
+        "listas": len(gabaritos),
+        "alunos_com_progresso": len(progresso_alunos),
+    }
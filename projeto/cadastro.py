@@ -1,5 +1,7 @@
 import os  # Importa o módulo 'os' para interagir com o sistema operacional, embora não seja diretamente usado aqui, é comum em projetos que lidam com arquivos.
-from auxiliar import load_json, save_json, USUARIOS_JSON_PATH # Importa funções e variáveis do módulo auxiliar para lidar com arquivos JSON.
+from auxiliar import get_backend # Backend de armazenamento configurado, usado para consultar e gravar os usuários.
+import senhas  # Hash das senhas (PBKDF2) e tokens de sessão.
+# Os usuários são consultados e gravados um a um pelo backend de armazenamento configurado (get_backend()).
 
 def cria_usuario() -> dict:
     """
@@ -13,9 +15,7 @@ def cria_usuario() -> dict:
         dict: O dicionário contendo os dados do usuário recém-criado,
               ou None se a criação da conta falhar (por exemplo, matrícula já existente).
     """
-    # Carrega todos os dados de usuários existentes do arquivo JSON.
-    # Se o arquivo não existir ou estiver vazio, retorna um dicionário vazio como padrão.
-    usuarios_data = load_json(USUARIOS_JSON_PATH, {})
+    backend = get_backend()
 
     # Solicita o nome do usuário. Não há validação específica para o nome.
     nome = input("Digite seu nome: ")
@@ -32,9 +32,9 @@ def cria_usuario() -> dict:
     while not matr.isdigit() or not (1000000 <= int(matr) <= 9999999):
         matr = input("Matrícula inválida. Digite novamente (7 dígitos numéricos): ")
 
-    # Verifica se a matrícula inserida já existe nos dados dos usuários carregados.
+    # Verifica se a matrícula inserida já existe (consulta pontual pela matrícula).
     # Se sim, informa o usuário e retorna None, impedindo a criação de uma conta duplicada.
-    if matr in usuarios_data:
+    if backend.busca_usuario(matr) is not None:
         print(f"Uma conta com a matrícula {matr} já existe. Por favor, escolha outra ou entre com a existente.")
         return None
 
@@ -55,29 +55,135 @@ def cria_usuario() -> dict:
 
     # Cria um dicionário com os dados do novo usuário.
     # A matrícula é armazenada como um inteiro dentro do dicionário para uso posterior (ex: aluno_menu).
+    # A senha é gravada apenas como hash (ver senhas.py).
     novo_usuario = {
         'matricula': int(matr),
         'nome': nome,
         'idade': int(idade),
         'tipo': tipo,
-        'senha': pasw
+        'senha': senhas.gera_hash(pasw)
     }
     
-    # Adiciona o novo usuário ao dicionário de todos os usuários, usando a matrícula (como string) como chave.
-    usuarios_data[matr] = novo_usuario
-    # Salva os dados de todos os usuários (incluindo o novo) de volta no arquivo JSON.
-    save_json(usuarios_data, USUARIOS_JSON_PATH)
+    # Grava apenas o novo usuário, usando a matrícula (como string) como chave.
+    # Se outra conta com a mesma matrícula tiver sido criada enquanto os dados eram digitados, a gravação é recusada.
+    if not backend.insere_usuario(novo_usuario):
+        print(f"Uma conta com a matrícula {matr} já existe. Por favor, escolha outra ou entre com a existente.")
+        return None
     # Informa o usuário sobre o sucesso da criação da conta.
     print("Conta criada com sucesso!")
     # Retorna o dicionário do novo usuário.
     return novo_usuario
 
+def _valida_registro_usuario(registro: dict) -> tuple:
+    """
+    Função que valida um registro de usuário da importação em lote, com as mesmas regras de cria_usuario.
+
+    Args:
+        registro (dict): Os campos do usuário: 'matricula', 'nome', 'idade', 'tipo' e 'senha'
+                         (ou 'senha_hash', com uma senha já no formato de senhas.gera_hash).
+
+    Returns:
+        tuple: (usuário normalizado, None) se o registro for válido, ou (None, mensagem de erro).
+    """
+    matr = str(registro.get('matricula', '')).strip()
+    if not matr.isdigit() or not (1000000 <= int(matr) <= 9999999):
+        return None, f"Matrícula '{matr}' inválida (7 dígitos numéricos)."
+    nome = str(registro.get('nome') or '').strip()
+    if not nome:
+        return None, "Nome não informado."
+    tipo = str(registro.get('tipo') or '').strip().lower()
+    if tipo not in ["aluno", "professor"]:
+        return None, f"Tipo '{tipo}' não reconhecido (aluno ou professor)."
+    idade = str(registro.get('idade', '')).strip()
+    if not idade.isdigit() or int(idade) <= 0:
+        return None, f"Idade '{idade}' inválida."
+    senha_hash = registro.get('senha_hash')
+    senha = registro.get('senha')
+    if senha_hash:
+        if not senhas.eh_hash(senha_hash):
+            return None, "Campo 'senha_hash' não está no formato pbkdf2_sha256."
+    elif senha is None or str(senha) == '':
+        return None, "Senha não informada."
+    usuario = {'matricula': int(matr), 'nome': nome, 'idade': int(idade), 'tipo': tipo,
+               'senha': senha_hash or str(senha)}
+    return usuario, None
+
+def cria_usuarios(registros: list) -> dict:
+    """
+    Função que cria várias contas de uma vez, sem interação (ex: importação do semestre a partir de um arquivo).
+
+    Todos os registros são validados antes; os válidos são gravados juntos (uma única gravação no armazenamento)
+    e os inválidos são relatados um a um, sem interromper os demais. As senhas são gravadas apenas como hash.
+
+    Args:
+        registros (list): Os dicionários com os campos de cada usuário (ver _valida_registro_usuario).
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação ("sucesso", "aviso" se parte dos registros falhou, ou "erro"),
+              uma 'mensagem' descritiva, a quantidade de 'criados' e os 'erros' ([{'registro': posição (1, 2, ...)
+              na lista de registros, 'mensagem'}]).
+    """
+    backend = get_backend()
+    erros = []
+    validos = [] # (posição, usuário)
+    vistas = set()
+    for posicao, registro in enumerate(registros, start=1):
+        usuario, mensagem = _valida_registro_usuario(registro if isinstance(registro, dict) else {})
+        if usuario is not None and usuario['matricula'] in vistas:
+            usuario, mensagem = None, f"Matrícula {usuario['matricula']} repetida na entrada."
+        if usuario is None:
+            erros.append({"registro": posicao, "mensagem": mensagem})
+            continue
+        vistas.add(usuario['matricula'])
+        validos.append((posicao, usuario))
+
+    # Matrículas já cadastradas são descartadas antes do hash das senhas (a parte cara da importação).
+    existentes = backend.busca_usuarios([usuario['matricula'] for _, usuario in validos])
+    novos = []
+    for posicao, usuario in validos:
+        if str(usuario['matricula']) in existentes:
+            erros.append({"registro": posicao, "mensagem": f"Uma conta com a matrícula {usuario['matricula']} já existe."})
+        else:
+            novos.append((posicao, usuario))
+    a_calcular = [usuario for _, usuario in novos if not senhas.eh_hash(usuario['senha'])]
+    for usuario, senha_hash in zip(a_calcular, senhas.gera_hashes([usuario['senha'] for usuario in a_calcular])):
+        usuario['senha'] = senha_hash
+
+    criados = 0
+    resultados = backend.insere_usuarios([usuario for _, usuario in novos]) if novos else []
+    for (posicao, usuario), inserido in zip(novos, resultados):
+        if inserido:
+            criados += 1
+        else: # Criada por outro caminho entre a verificação e a gravação.
+            erros.append({"registro": posicao, "mensagem": f"Uma conta com a matrícula {usuario['matricula']} já existe."})
+
+    erros.sort(key=lambda erro: erro["registro"])
+    status = "sucesso" if not erros else ("aviso" if criados else "erro")
+    return {"status": status, "mensagem": f"{criados} conta(s) criada(s), {len(erros)} erro(s).",
+            "criados": criados, "erros": erros}
+
+def _atualiza_hash_senha(usuario: dict, senha_digitada: str):
+    """
+    Função que regrava a senha de um usuário recém-autenticado se ela ainda estiver em texto puro
+    ou com um hash de custo diferente do atual (migração gradual, ver senhas.py).
+
+    Args:
+        usuario (dict): Os dados do usuário (o campo 'senha' é alterado no lugar).
+        senha_digitada (str): A senha digitada, já verificada.
+
+    Returns:
+        None
+    """
+    if senhas.precisa_atualizar(usuario.get('senha')):
+        usuario['senha'] = senhas.gera_hash(senha_digitada)
+        get_backend().atualiza_usuario(usuario)
+
 def entra_conta(matricula_str: str, senha_digitada: str) -> dict:
     """
     Função para fazer login.
 
     Esta função tenta autenticar um usuário verificando a matrícula e a senha fornecidas.
-    Ela carrega os dados de usuários e compara as credenciais.
+    Ela busca apenas o usuário da matrícula informada e compara as credenciais.
 
     Args:
         matricula_str (str): A matrícula digitada pelo usuário (como string).
@@ -87,25 +193,66 @@ def entra_conta(matricula_str: str, senha_digitada: str) -> dict:
         dict: O dicionário contendo os dados do usuário logado,
               ou None se a matrícula não for encontrada ou a senha estiver incorreta.
     """
-    # Carrega todos os dados de usuários existentes do arquivo JSON.
-    usuarios_data = load_json(USUARIOS_JSON_PATH, {})
+    # Busca o usuário pela matrícula (consulta pontual).
+    usuario = get_backend().busca_usuario(matricula_str)
     
-    # Verifica se a matrícula fornecida existe como uma chave no dicionário de usuários.
-    # Se não existir, informa e retorna None.
-    if matricula_str not in usuarios_data:
+    # Verifica se a matrícula fornecida existe. Se não existir, informa e retorna None.
+    if usuario is None:
         print("Matrícula não encontrada.")
         return None
 
-    # Recupera o dicionário de dados do usuário correspondente à matrícula.
-    usuario = usuarios_data[matricula_str]
-
-    # Compara a senha digitada com a senha armazenada para o usuário.
+    # Verifica a senha digitada contra o hash armazenado (ou a senha antiga em texto puro).
     # Se as senhas não coincidirem, informa e retorna None.
-    if usuario['senha'] != senha_digitada:
+    if not senhas.verifica(senha_digitada, usuario.get('senha')):
         print("Senha incorreta.")
         return None
+
+    # Senhas antigas em texto puro (ou com hash de custo diferente do atual) são regravadas com o hash atual.
+    _atualiza_hash_senha(usuario, senha_digitada)
     
     # Se a matrícula e a senha estiverem corretas, informa o sucesso do login.
     print(f"Você entrou com sucesso, {usuario['nome']}!")
     # Retorna o dicionário de dados do usuário logado.
+    return usuario
+
+def inicia_sessao(matricula_str: str, senha_digitada: str) -> dict:
+    """
+    Função para fazer login e obter um token de sessão.
+
+    A senha é verificada uma única vez (como em entra_conta); as ações seguintes da sessão
+    apresentam o token, validado por usuario_da_sessao sem repetir a verificação da senha.
+
+    Args:
+        matricula_str (str): A matrícula digitada pelo usuário (como string).
+        senha_digitada (str): A senha digitada pelo usuário.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva; em caso de sucesso,
+              também o 'token' da sessão e o 'usuario' (sem o campo 'senha').
+    """
+    usuario = get_backend().busca_usuario(matricula_str)
+    if usuario is None or not senhas.verifica(senha_digitada, usuario.get('senha')):
+        return {"status": "erro", "mensagem": "Erro: Matrícula ou senha incorreta."}
+    _atualiza_hash_senha(usuario, senha_digitada)
+    usuario.pop('senha', None)
+    return {"status": "sucesso", "mensagem": f"Você entrou com sucesso, {usuario['nome']}!",
+            "token": senhas.emite_token(usuario['matricula']), "usuario": usuario}
+
+def usuario_da_sessao(token: str) -> dict:
+    """
+    Função que identifica o usuário de uma sessão a partir do token emitido por inicia_sessao.
+
+    Args:
+        token (str): O token da sessão.
+
+    Returns:
+        dict: Os dados do usuário (sem o campo 'senha'), ou None se o token for inválido, tiver expirado
+              ou o usuário não existir mais.
+    """
+    matricula_str = senhas.valida_token(token)
+    if matricula_str is None:
+        return None
+    usuario = get_backend().busca_usuario(matricula_str)
+    if usuario is not None:
+        usuario.pop('senha', None)
     return usuario
\ No newline at end of file
@@ -0,0 +1,273 @@
+from array import array  # Vetores compactos de inteiros pequenos (usados quando o NumPy não está instalado).
+from respostas import Respostas  # Respostas de um aluno já guardadas com um byte por questão (mesmo código daqui).
+from modelos import Exercicio    # Exercícios com a resposta correta já normalizada na leitura.
+try:
+    import numpy as np  # Opcional: se instalado, a correção de uma turma inteira é feita com operações vetorizadas.
+except ImportError:
+    np = None
+
+# --- Motor de Correção das Listas de Exercícios ---
+# Toda a correção (resultado final em aluno.responder_lista, revisão em aluno.revisar_lista e estatísticas
+# da turma em professor.visualiza_turma / estatisticas.py) passa por este módulo, com as mesmas regras:
+#   - cada letra é codificada como um inteiro pequeno ('a' -> 1, 'b' -> 2, ...; 0 = vazio);
+#   - uma questão é ACERTO se a resposta é igual à resposta correta e esta está definida;
+#   - é ERRO se foi respondida e não acertou (inclusive quando a questão não tem resposta correta);
+#   - é NAO_RESPONDIDA se não há resposta.
+# O gabarito é um vetor (questões) e as respostas de uma turma uma matriz (alunos x questões), ambos com
+# inteiros de 8 bits. Com NumPy, a matriz é corrigida de uma vez só; sem ele, o mesmo cálculo é feito
+# linha a linha sobre vetores 'array' do Python, com o mesmo resultado.
+
+# Situação de uma questão para um aluno.
+NAO_RESPONDIDA = 0
+ERRO = 1
+ACERTO = 2
+
+# Códigos especiais: resposta preenchida que não é uma letra, e resposta correta definida que não é uma letra.
+_RESPOSTA_INVALIDA = -1
+_GABARITO_INVALIDO = -2
+
+def _codifica(letra, codigo_invalido: int) -> int:
+    """
+    Objetivo: Converter uma letra de resposta ('a', 'B', ...) em um inteiro pequeno.
+
+    Args:
+        letra: A letra (ou None / "" se vazia).
+        codigo_invalido (int): O código usado se o valor não for uma única letra.
+
+    Returns:
+        int: 0 se vazia, 1 a 26 para as letras 'a' a 'z', ou codigo_invalido.
+    """
+    if not letra:
+        return 0
+    letra = str(letra).lower()
+    if len(letra) == 1 and "a" <= letra <= "z":
+        return ord(letra) - ord("a") + 1
+    return codigo_invalido
+
+def gabarito(exercicios: list) -> list:
+    """
+    Objetivo: Extrair as respostas corretas (letras em minúsculo) de uma lista de exercícios.
+
+    Args:
+        exercicios (list): A lista de exercícios (Exercicio ou dicionários).
+
+    Returns:
+        list: A resposta correta de cada questão, ou "" se a questão não tiver resposta correta definida.
+    """
+    # Em um Exercicio (ver modelos.py) a resposta correta em minúsculo já foi calculada na leitura.
+    return [ex.resposta if isinstance(ex, Exercicio) else str(ex.get('RespostaCorreta', '')).lower() for ex in exercicios]
+
+def codifica_gabarito(gabarito_lista: list):
+    """
+    Objetivo: Codificar o gabarito de uma lista (ver gabarito()) como um vetor de inteiros.
+
+    Args:
+        gabarito_lista (list): A resposta correta (letra) de cada questão, ou um GabaritoCompilado.
+
+    Returns:
+        O vetor do gabarito (numpy.ndarray int8, ou array('b')); 0 = sem resposta correta definida.
+    """
+    if isinstance(gabarito_lista, GabaritoCompilado):
+        return gabarito_lista.codigos # Já codificado na compilação.
+    codigos = [_codifica(letra, _GABARITO_INVALIDO) for letra in gabarito_lista]
+    return np.array(codigos, dtype=np.int8) if np is not None else array('b', codigos)
+
+def codifica_respostas(respostas, num_questoes: int) -> array:
+    """
+    Objetivo: Codificar as respostas de um aluno como um vetor de inteiros (uma posição por questão).
+
+    Args:
+        respostas (Respostas | dict | list): Índice da questão (str) -> letra respondida (ou, em dados antigos,
+                                             uma lista de letras).
+        num_questoes (int): A quantidade de questões da lista.
+
+    Returns:
+        array: O vetor array('b') das respostas; 0 = não respondida.
+    """
+    if isinstance(respostas, Respostas):
+        # Os códigos já estão prontos (ver respostas.py): só as respostas fora do formato são codificadas aqui.
+        vetor = array('b', respostas.codigos(num_questoes))
+        itens = respostas.extras().items()
+    else:
+        vetor = array('b', bytes(num_questoes))
+        itens = respostas.items() if isinstance(respostas, dict) else enumerate(respostas or [])
+    for indice, letra in itens:
+        indice = int(indice)
+        if 0 <= indice < num_questoes:
+            vetor[indice] = _codifica(letra, _RESPOSTA_INVALIDA)
+    return vetor
+
+def situacao_questoes(gabarito_cod, respostas_cod) -> list:
+    """
+    Objetivo: Classificar cada questão de um aluno como ACERTO, ERRO ou NAO_RESPONDIDA.
+
+    Args:
+        gabarito_cod: O vetor do gabarito (ver codifica_gabarito).
+        respostas_cod: O vetor das respostas do aluno (ver codifica_respostas).
+
+    Returns:
+        list: A situação de cada questão.
+    """
+    return [NAO_RESPONDIDA if resp == 0 else ACERTO if (gab != 0 and resp == gab) else ERRO
+            for gab, resp in zip(gabarito_cod, respostas_cod)]
+
+def corrige_aluno(exercicios: list, respostas) -> dict:
+    """
+    Objetivo: Corrigir as respostas de um aluno em uma lista de exercícios.
+
+    Args:
+        exercicios (list): A lista de exercícios, ou o gabarito compilado dela (ver compila), que dispensa os exercícios.
+        respostas (dict | list): As respostas do aluno (ver codifica_respostas).
+
+    Returns:
+        dict: {'situacoes': [situação de cada questão], 'acertos': int, 'erros': int, 'nao_respondidas': int}.
+    """
+    gabarito_cod = codifica_gabarito(exercicios if isinstance(exercicios, GabaritoCompilado) else gabarito(exercicios))
+    situacoes = situacao_questoes(gabarito_cod, codifica_respostas(respostas, len(exercicios)))
+    return {
+        "situacoes": situacoes,
+        "acertos": situacoes.count(ACERTO),
+        "erros": situacoes.count(ERRO),
+        "nao_respondidas": situacoes.count(NAO_RESPONDIDA),
+    }
+
+# --- Gabarito Compilado ---
+# Para corrigir uma questão isolada (ex: a correção imediata de aluno.responder_lista) sem reler a lista nem
+# recalcular o gabarito, cada lista é compilada uma vez em um GabaritoCompilado: um vetor com o código da resposta
+# correta de cada questão (posição da alternativa + 1; 0 = não definida) e um vetor com a máscara das alternativas
+# válidas (bit 0 = 'a', bit 1 = 'b', ...). Corrigir ou validar uma resposta é uma consulta a esses vetores.
+# O gabarito compilado continua sendo uma lista com as letras do gabarito (ver gabarito()), então pode ser usado
+# em qualquer lugar que recebe 'gabarito_lista' (ex: estatisticas.py). O cache dos gabaritos compilados, por
+# hash do conteúdo da lista, fica em gabaritos.py.
+
+class GabaritoCompilado(list):
+    """
+    Objetivo: O gabarito de uma lista pronto para a correção (ver o comentário acima). Não deve ser alterado.
+    """
+    __slots__ = ("codigos", "mascaras", "hash")
+
+    def __init__(self, letras: list, codigos: array, mascaras: bytes, hash_lista: str = None):
+        """
+        Objetivo: Criar o gabarito compilado a partir dos vetores já calculados (ver compila).
+
+        Args:
+            letras (list): A resposta correta (letra em minúsculo) de cada questão, como em gabarito().
+            codigos (array): O código da resposta correta de cada questão (array('b'); ver _codifica).
+            mascaras (bytes): A máscara das alternativas válidas de cada questão.
+            hash_lista (str, optional): O hash do conteúdo da lista compilada (ver auxiliar.resumo_lista).
+        """
+        super().__init__(letras)
+        self.codigos = codigos
+        self.mascaras = mascaras
+        self.hash = hash_lista
+
+    def corrige(self, indice: int, letra) -> int:
+        """
+        Objetivo: Corrigir a resposta de uma única questão (consulta direta ao vetor do gabarito).
+
+        Args:
+            indice (int): O índice da questão (a partir de 0).
+            letra: A resposta do aluno (ou None / "" se não respondida).
+
+        Returns:
+            int: NAO_RESPONDIDA, ERRO ou ACERTO, com as mesmas regras de situacao_questoes.
+        """
+        resposta = _codifica(letra, _RESPOSTA_INVALIDA)
+        if resposta == 0:
+            return NAO_RESPONDIDA
+        correta = self.codigos[indice]
+        return ACERTO if (correta != 0 and resposta == correta) else ERRO
+
+    def opcao_valida(self, indice: int, letra: str) -> bool:
+        """
+        Objetivo: Verificar se uma letra é uma alternativa preenchida de uma questão (pela máscara).
+
+        Args:
+            indice (int): O índice da questão (a partir de 0).
+            letra (str): A letra em minúsculo.
+
+        Returns:
+            bool: True se a alternativa existe.
+        """
+        return (isinstance(letra, str) and len(letra) == 1 and "a" <= letra <= "h"
+                and bool(self.mascaras[indice] >> (ord(letra) - ord("a")) & 1))
+
+    def __reduce__(self):
+        # Permite copiar e serializar com pickle (list não guarda os atributos dos __slots__).
+        return (GabaritoCompilado, (list(self), self.codigos, self.mascaras, self.hash))
+
+def compila(exercicios: list, hash_lista: str = None) -> GabaritoCompilado:
+    """
+    Objetivo: Compilar o gabarito de uma lista de exercícios (ver o comentário do gabarito compilado).
+
+    Args:
+        exercicios (list): A lista de exercícios (Exercicio ou dicionários).
+        hash_lista (str, optional): O hash do conteúdo da lista. Padrão para None.
+
+    Returns:
+        GabaritoCompilado: O gabarito compilado.
+    """
+    letras = gabarito(exercicios)
+    codigos = array('b', [_codifica(letra, _GABARITO_INVALIDO) for letra in letras])
+    mascaras = bytearray(len(letras))
+    for i, ex in enumerate(exercicios):
+        for letra in Exercicio.de(ex).opcoes:
+            mascaras[i] |= 1 << (ord(letra) - ord("a"))
+    return GabaritoCompilado(letras, codigos, bytes(mascaras), hash_lista)
+
+def corrige_turma(gabarito_cod, linhas: list) -> dict:
+    """
+    Objetivo: Corrigir de uma vez as respostas de vários alunos em uma lista de exercícios.
+
+    Args:
+        gabarito_cod: O vetor do gabarito (ver codifica_gabarito).
+        linhas (list): Um vetor de respostas por aluno (ver codifica_respostas), todos do tamanho do gabarito.
+
+    Returns:
+        dict: {
+            'acertos_por_aluno', 'erros_por_aluno', 'nao_respondidas_por_aluno': [int por aluno],
+            'respondidas_por_questao', 'acertos_por_questao': [int por questão],
+            'acertos': total de acertos, 'respondidas': total de respostas dadas
+        }
+    """
+    num_questoes = len(gabarito_cod)
+    if np is not None:
+        matriz = np.array([np.frombuffer(linha, dtype=np.int8) for linha in linhas], dtype=np.int8).reshape(len(linhas), num_questoes)
+        gabarito_np = np.asarray(gabarito_cod, dtype=np.int8)
+        respondida = matriz != 0
+        acerto = (matriz == gabarito_np) & (gabarito_np != 0)
+        acertos_por_aluno = acerto.sum(axis=1)
+        respondidas_por_aluno = respondida.sum(axis=1)
+        return {
+            "acertos_por_aluno": acertos_por_aluno.tolist(),
+            "erros_por_aluno": (respondidas_por_aluno - acertos_por_aluno).tolist(),
+            "nao_respondidas_por_aluno": (num_questoes - respondidas_por_aluno).tolist(),
+            "respondidas_por_questao": respondida.sum(axis=0).tolist(),
+            "acertos_por_questao": acerto.sum(axis=0).tolist(),
+            "acertos": int(acertos_por_aluno.sum()),
+            "respondidas": int(respondidas_por_aluno.sum()),
+        }
+
+    # Sem NumPy: mesmo cálculo, aluno a aluno.
+    resultado = {
+        "acertos_por_aluno": [], "erros_por_aluno": [], "nao_respondidas_por_aluno": [],
+        "respondidas_por_questao": [0] * num_questoes, "acertos_por_questao": [0] * num_questoes,
+        "acertos": 0, "respondidas": 0,
+    }
+    respondidas_por_questao = resultado["respondidas_por_questao"]
+    acertos_por_questao = resultado["acertos_por_questao"]
+    for linha in linhas:
+        acertos = respondidas = 0
+        for idx, (gab, resp) in enumerate(zip(gabarito_cod, linha)):
+            if resp != 0:
+                respondidas += 1
+                respondidas_por_questao[idx] += 1
+                if gab != 0 and resp == gab:
+                    acertos += 1
+                    acertos_por_questao[idx] += 1
+        resultado["acertos_por_aluno"].append(acertos)
+        resultado["erros_por_aluno"].append(respondidas - acertos)
+        resultado["nao_respondidas_por_aluno"].append(num_questoes - respondidas)
+        resultado["acertos"] += acertos
+        resultado["respondidas"] += respondidas
+    return resultado
@@ -0,0 +1,573 @@
+import hashlib  # Hash de 64 bits das matrículas, usado para posicionar cada usuário no índice.
+import json     # Os registros do log de usuários são linhas JSON.
+import os       # Importa o módulo 'os' para manipular os caminhos e arquivos do diretório.
+import struct   # O índice é um arquivo binário de tamanho fixo (cabeçalho + posições).
+import sys      # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python diretorio_usuarios.py compactar').
+import time     # Mede a duração das leituras e gravações (quando a instrumentação está ativa).
+import metricas  # Instrumentação de E/S (ver metricas.py).
+import auxiliar  # Os caminhos são lidos de 'auxiliar' no momento da chamada (ver progresso.py).
+from modelos import Usuario, para_json  # Os usuários lidos são objetos com __slots__ (ver modelos.py).
+
+# --- Diretório de Usuários Indexado ---
+# Para que o login (e o cadastro) não leia nem reescreva 'usuarios.json' inteiro, os usuários ficam em
+# dois arquivos ao lado dele:
+#   usuarios.log -> log somente de acréscimo: uma linha JSON {"matricula": "...", "usuario": {...}} por registro.
+#                   Se uma matrícula aparece mais de uma vez, vale o último registro.
+#   usuarios.idx -> índice de hash de tamanho fixo: um cabeçalho seguido de 'capacidade' posições de
+#                   16 bytes (hash da matrícula, deslocamento do registro no log + 1; 0 = posição vazia).
+#                   Colisões são resolvidas por sondagem linear.
+# Buscar um usuário lê o cabeçalho, uma (raramente algumas) posição do índice e uma linha do log: o custo
+# não depende da quantidade de usuários. Inserir acrescenta uma linha ao log e grava uma posição do índice.
+# Quando o índice passa de CARGA_MAXIMA de ocupação, ele é refeito com o dobro da capacidade.
+#
+# 'usuarios.json' continua sendo a base do diretório: o cabeçalho guarda a assinatura dele. Se ele for
+# alterado por outro caminho (ex: editado à mão ou gerado pelo benchmark), o diretório é reconstruído na
+# próxima consulta: os usuários de 'usuarios.json' mais os registros gravados pelo sistema desde a última
+# reconstrução (estes prevalecem, por serem mais recentes). O comando 'python diretorio_usuarios.py compactar'
+# grava em 'usuarios.json' todos os usuários do diretório e descarta do log os registros substituídos.
+# Os usuários lidos são retornados como objetos Usuario (ver modelos.py), que se comportam como dicionários.
+
+# Identificação do formato do índice.
+MAGICO = b"PMUSRIX1"
+
+# Capacidade mínima (quantidade de posições) do índice.
+CAPACIDADE_INICIAL = 1024
+
+# Fração máxima de posições ocupadas antes de o índice ser refeito com o dobro da capacidade.
+CARGA_MAXIMA = 0.7
+
+# Cabeçalho: mágico, capacidade, ocupadas, tamanho da base no log, tamanho do log indexado, inode do log
+# e assinatura (mtime_ns, tamanho, inode) de 'usuarios.json' quando o diretório foi construído.
+_CABECALHO = struct.Struct("<8sQQQQQqqQ")
+# Posição do índice: hash da matrícula e deslocamento do registro no log + 1.
+_POSICAO = struct.Struct("<QQ")
+
+def _trava():
+    """
+    Objetivo: Retornar a trava do diretório (a do log, ver auxiliar.trava_arquivo), que serializa inserções,
+    atualizações e reconstruções entre threads e processos. As buscas não usam a trava.
+
+    Returns:
+        contextmanager: A trava, para uso em 'with _trava():'.
+    """
+    return auxiliar.trava_arquivo(_log_path())
+
+def _log_path() -> str:
+    """
+    Objetivo: Retornar o caminho do log de usuários, derivado de 'usuarios.json' (ex: 'json/usuarios.log').
+
+    Returns:
+        str: O caminho do log.
+    """
+    return os.path.splitext(auxiliar.USUARIOS_JSON_PATH)[0] + ".log"
+
+def _indice_path() -> str:
+    """
+    Objetivo: Retornar o caminho do índice de usuários, derivado de 'usuarios.json' (ex: 'json/usuarios.idx').
+
+    Returns:
+        str: O caminho do índice.
+    """
+    return os.path.splitext(auxiliar.USUARIOS_JSON_PATH)[0] + ".idx"
+
+def _hash(chave: str) -> int:
+    """
+    Objetivo: Calcular o hash de 64 bits de uma matrícula (estável entre execuções, ao contrário de hash()).
+
+    Args:
+        chave (str): A matrícula (como string).
+
+    Returns:
+        int: O hash.
+    """
+    return int.from_bytes(hashlib.blake2b(chave.encode("utf-8"), digest_size=8).digest(), "little")
+
+def _assinatura_base() -> tuple:
+    """
+    Objetivo: Retornar a assinatura atual de 'usuarios.json', gravando antes uma gravação agrupada pendente.
+
+    Returns:
+        tuple: (mtime_ns, tamanho, inode), ou (0, 0, 0) se o arquivo não existir.
+    """
+    assinatura = auxiliar.assinatura_json(auxiliar.USUARIOS_JSON_PATH)
+    if assinatura is None and auxiliar._busca_pendente(auxiliar.USUARIOS_JSON_PATH)[0]:
+        auxiliar.descarrega_escritas(auxiliar.USUARIOS_JSON_PATH)
+        assinatura = auxiliar.assinatura_json(auxiliar.USUARIOS_JSON_PATH)
+    return tuple(assinatura) if assinatura is not None else (0, 0, 0)
+
+def _le_cabecalho(f) -> dict:
+    """
+    Objetivo: Ler o cabeçalho de um índice aberto.
+
+    Args:
+        f: O arquivo do índice, aberto em modo binário.
+
+    Returns:
+        dict: Os campos do cabeçalho, ou None se o arquivo não for um índice válido.
+    """
+    f.seek(0)
+    dados = f.read(_CABECALHO.size)
+    if len(dados) < _CABECALHO.size:
+        return None
+    magico, capacidade, ocupadas, tamanho_base, tamanho_log, inode_log, *assinatura = _CABECALHO.unpack(dados)
+    if magico != MAGICO or capacidade == 0:
+        return None
+    return {"capacidade": capacidade, "ocupadas": ocupadas, "tamanho_base": tamanho_base,
+            "tamanho_log": tamanho_log, "inode_log": inode_log, "assinatura_base": tuple(assinatura)}
+
+def _empacota_cabecalho(cabecalho: dict) -> bytes:
+    """
+    Objetivo: Converter os campos do cabeçalho nos bytes gravados no início do índice.
+
+    Args:
+        cabecalho (dict): Os campos do cabeçalho (ver _le_cabecalho).
+
+    Returns:
+        bytes: O cabeçalho empacotado.
+    """
+    return _CABECALHO.pack(MAGICO, cabecalho["capacidade"], cabecalho["ocupadas"], cabecalho["tamanho_base"],
+                           cabecalho["tamanho_log"], cabecalho["inode_log"], *cabecalho["assinatura_base"])
+
+def _estado() -> tuple:
+    """
+    Objetivo: Ler o cabeçalho do índice e verificar se ele ainda corresponde ao log e a 'usuarios.json'.
+
+    Returns:
+        tuple: (cabeçalho ou None, situação), onde a situação é "valido", "log_maior" (há registros no fim
+               do log ainda não indexados, ex: após uma falha) ou "invalido".
+    """
+    try:
+        with open(_indice_path(), 'rb') as f:
+            cabecalho = _le_cabecalho(f)
+        st_log = os.stat(_log_path())
+    except FileNotFoundError:
+        return None, "invalido"
+    if cabecalho is None or cabecalho["inode_log"] != st_log.st_ino:
+        return None, "invalido"
+    if cabecalho["assinatura_base"] != _assinatura_base():
+        return cabecalho, "invalido"
+    if cabecalho["tamanho_log"] != st_log.st_size:
+        return cabecalho, "log_maior"
+    return cabecalho, "valido"
+
+def _varre_log(inicio: int = 0) -> dict:
+    """
+    Objetivo: Ler o log a partir de um deslocamento e retornar o último registro de cada matrícula.
+    Linhas incompletas ou corrompidas (ex: gravação interrompida) são ignoradas.
+
+    Args:
+        inicio (int, optional): O deslocamento a partir do qual ler. Padrão para 0 (o log inteiro).
+
+    Returns:
+        dict: Matrícula (string) -> (deslocamento do registro, dados do usuário), na ordem de primeira aparição.
+    """
+    registros = {}
+    try:
+        with open(_log_path(), 'rb') as f:
+            f.seek(inicio)
+            deslocamento = inicio
+            for linha in f:
+                try:
+                    registro = json.loads(linha)
+                    registros[str(registro["matricula"])] = (deslocamento, registro["usuario"])
+                except (ValueError, KeyError, TypeError):
+                    pass
+                deslocamento += len(linha)
+    except FileNotFoundError:
+        pass
+    return registros
+
+def _linha_registro(chave: str, usuario: dict) -> bytes:
+    """
+    Objetivo: Serializar um registro do log.
+
+    Args:
+        chave (str): A matrícula (como string).
+        usuario (dict): Os dados do usuário.
+
+    Returns:
+        bytes: A linha JSON, terminada em '\\n'.
+    """
+    return (json.dumps({"matricula": chave, "usuario": usuario}, ensure_ascii=False, default=para_json) + "\n").encode("utf-8")
+
+def _preenche_posicao(tabela: bytearray, capacidade: int, chave: str, deslocamento: int):
+    """
+    Objetivo: Registrar uma matrícula na primeira posição livre (sondagem linear) de uma tabela em memória.
+
+    Args:
+        tabela (bytearray): As posições do índice (sem o cabeçalho), alteradas no lugar.
+        capacidade (int): A quantidade de posições da tabela.
+        chave (str): A matrícula (como string), que não pode estar na tabela.
+        deslocamento (int): O deslocamento do registro no log.
+
+    Returns:
+        None
+    """
+    h = _hash(chave)
+    posicao = h % capacidade
+    while _POSICAO.unpack_from(tabela, posicao * _POSICAO.size)[1] != 0:
+        posicao = (posicao + 1) % capacidade
+    _POSICAO.pack_into(tabela, posicao * _POSICAO.size, h, deslocamento + 1)
+
+def _grava_indice(posicoes: dict, cabecalho: dict):
+    """
+    Objetivo: Gravar (de forma atômica) um índice novo com as posições dadas.
+    A capacidade é a de 'cabecalho', aumentada se necessário para respeitar CARGA_MAXIMA.
+
+    Args:
+        posicoes (dict): Matrícula (string) -> deslocamento do registro no log.
+        cabecalho (dict): Os demais campos do cabeçalho (capacidade mínima, tamanhos, inode, assinatura).
+
+    Returns:
+        None
+    """
+    capacidade = max(CAPACIDADE_INICIAL, cabecalho["capacidade"])
+    while len(posicoes) >= capacidade * CARGA_MAXIMA:
+        capacidade *= 2
+    tabela = bytearray(capacidade * _POSICAO.size)
+    for chave, deslocamento in posicoes.items():
+        _preenche_posicao(tabela, capacidade, chave, deslocamento)
+    cabecalho = dict(cabecalho, capacidade=capacidade, ocupadas=len(posicoes))
+    auxiliar._grava_atomico(_indice_path(), _empacota_cabecalho(cabecalho) + bytes(tabela))
+
+def _reconstroi(reaplica: bool = True):
+    """
+    Objetivo: Reconstruir o log e o índice a partir de 'usuarios.json', reaplicando por cima os registros
+    gravados pelo sistema desde a última reconstrução. Deve ser chamada com _trava().
+
+    Args:
+        reaplica (bool, optional): Se False, o log passa a conter apenas 'usuarios.json'. Padrão para True.
+
+    Returns:
+        None
+    """
+    recentes = {}
+    if reaplica:
+        cabecalho, _ = _estado()
+        # Sem um cabeçalho confiável, não há como separar a base dos registros novos: o log inteiro é reaplicado.
+        recentes = _varre_log(cabecalho["tamanho_base"] if cabecalho is not None else 0)
+    # load_json cria 'usuarios.json' se ele não existir, então a assinatura é lida depois.
+    base = auxiliar.load_json(auxiliar.USUARIOS_JSON_PATH, {}, somente_leitura=True)
+    assinatura = _assinatura_base()
+
+    conteudo = bytearray()
+    posicoes = {}
+    for chave, usuario in base.items():
+        if chave not in recentes:
+            posicoes[chave] = len(conteudo)
+            conteudo += _linha_registro(chave, usuario)
+    tamanho_base = len(conteudo)
+    for chave, (_, usuario) in recentes.items():
+        posicoes[chave] = len(conteudo)
+        conteudo += _linha_registro(chave, usuario)
+
+    auxiliar._ensure_dir_exists(os.path.dirname(_log_path()))
+    auxiliar._grava_atomico(_log_path(), bytes(conteudo))
+    _grava_indice(posicoes, {"capacidade": CAPACIDADE_INICIAL, "tamanho_base": tamanho_base, "tamanho_log": len(conteudo),
+                             "inode_log": os.stat(_log_path()).st_ino, "assinatura_base": assinatura})
+
+def _reindexa(cabecalho: dict, capacidade: int = 0):
+    """
+    Objetivo: Refazer o índice a partir do log atual (ex: para aumentar a capacidade ou indexar registros
+    acrescentados ao log sem que o índice fosse atualizado). Deve ser chamada com _trava().
+
+    Args:
+        cabecalho (dict): O cabeçalho atual.
+        capacidade (int, optional): A capacidade mínima do novo índice. Padrão para 0 (a atual).
+
+    Returns:
+        None
+    """
+    posicoes = {chave: deslocamento for chave, (deslocamento, _) in _varre_log().items()}
+    st_log = os.stat(_log_path())
+    _grava_indice(posicoes, dict(cabecalho, capacidade=max(capacidade, cabecalho["capacidade"]), tamanho_log=st_log.st_size))
+
+def _garante_diretorio():
+    """
+    Objetivo: Garantir que o índice corresponda ao log e a 'usuarios.json', reconstruindo-o se necessário.
+
+    Returns:
+        None
+    """
+    if _estado()[1] == "valido":
+        return
+    with _trava():
+        cabecalho, situacao = _estado()
+        if situacao == "log_maior":
+            _reindexa(cabecalho)
+        elif situacao == "invalido":
+            _reconstroi()
+
+def _le_registro(f_log, deslocamento: int) -> dict:
+    """
+    Objetivo: Ler um registro do log.
+
+    Args:
+        f_log: O log, aberto em modo binário.
+        deslocamento (int): O deslocamento do registro.
+
+    Returns:
+        dict: O registro ({'matricula', 'usuario'}), ou None se a linha não puder ser lida.
+    """
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    f_log.seek(deslocamento)
+    linha = f_log.readline()
+    if metricas.ATIVO:
+        metricas.registra_leitura(_log_path(), "disco", len(linha), time.perf_counter() - inicio)
+    try:
+        return json.loads(linha)
+    except ValueError:
+        return None
+
+def _procura(f_indice, f_log, cabecalho: dict, chave: str) -> tuple:
+    """
+    Objetivo: Procurar uma matrícula no índice.
+
+    Args:
+        f_indice: O índice, aberto em modo binário.
+        f_log: O log, aberto em modo binário.
+        cabecalho (dict): O cabeçalho do índice.
+        chave (str): A matrícula (como string).
+
+    Returns:
+        tuple: (número da posição, dados do usuário). Se a matrícula não existir, os dados são None e a
+               posição é a primeira vazia encontrada (onde ela seria inserida).
+    """
+    h = _hash(chave)
+    capacidade = cabecalho["capacidade"]
+    posicao = h % capacidade
+    for _ in range(capacidade):
+        f_indice.seek(_CABECALHO.size + posicao * _POSICAO.size)
+        h_posicao, deslocamento = _POSICAO.unpack(f_indice.read(_POSICAO.size))
+        if deslocamento == 0:
+            return posicao, None
+        if h_posicao == h:
+            registro = _le_registro(f_log, deslocamento - 1)
+            if registro is not None and registro.get("matricula") == chave:
+                return posicao, registro["usuario"]
+        posicao = (posicao + 1) % capacidade
+    return None, None
+
+def busca_varios(matriculas: list) -> dict:
+    """
+    Objetivo: Buscar usuários pela matrícula, lendo apenas os registros procurados.
+
+    Args:
+        matriculas (list): As matrículas procuradas (inteiros ou strings).
+
+    Returns:
+        dict: Matrícula (string) -> usuário (Usuario, ver modelos.py), apenas para as matrículas encontradas.
+    """
+    _garante_diretorio()
+    encontrados = {}
+    # O índice é lido sem buffer: cada posição custa uma leitura de 16 bytes, e não de um bloco inteiro.
+    with open(_indice_path(), 'rb', buffering=0) as f_indice, open(_log_path(), 'rb') as f_log:
+        cabecalho = _le_cabecalho(f_indice)
+        for matricula in matriculas:
+            usuario = _procura(f_indice, f_log, cabecalho, str(matricula))[1]
+            if usuario is not None:
+                encontrados[str(matricula)] = Usuario.from_json(usuario)
+    return encontrados
+
+def busca(matricula_str: str) -> dict:
+    """
+    Objetivo: Buscar um usuário pela matrícula, lendo apenas o registro dele.
+
+    Args:
+        matricula_str (str): A matrícula do usuário (como string).
+
+    Returns:
+        dict: Os dados do usuário, ou None se a matrícula não existir.
+    """
+    return busca_varios([matricula_str]).get(str(matricula_str))
+
+def _acrescenta(registros: list) -> list:
+    """
+    Objetivo: Acrescentar registros ao fim do log, com uma única escrita. Deve ser chamada com _trava().
+
+    Args:
+        registros (list): Tuplas (matrícula como string, dados do usuário).
+
+    Returns:
+        list: O deslocamento de cada registro no log.
+    """
+    linhas = [_linha_registro(chave, usuario) for chave, usuario in registros]
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    with open(_log_path(), 'ab') as f:
+        f.seek(0, os.SEEK_END)
+        deslocamento = f.tell()
+        if deslocamento > 0:
+            # Se uma gravação anterior foi interrompida no meio da linha, começa o registro em uma linha nova.
+            with open(_log_path(), 'rb') as f_leitura:
+                f_leitura.seek(deslocamento - 1)
+                if f_leitura.read(1) != b"\n":
+                    f.write(b"\n")
+                    deslocamento += 1
+        deslocamentos = []
+        for linha in linhas:
+            deslocamentos.append(deslocamento)
+            deslocamento += len(linha)
+        f.write(b"".join(linhas))
+        auxiliar.fsync_arquivo(f, _log_path())
+    if metricas.ATIVO:
+        metricas.registra_gravacao(_log_path(), sum(map(len, linhas)), 0.0, time.perf_counter() - inicio)
+    return deslocamentos
+
+def _grava_posicao(cabecalho: dict, posicao: int, chave: str, deslocamento: int):
+    """
+    Objetivo: Gravar uma posição do índice e o cabeçalho, depois de o registro ter sido acrescentado ao log.
+    O log é gravado antes do índice: se o programa for interrompido entre os dois, o registro continua
+    no log e é indexado na próxima consulta (o tamanho do log não confere com o cabeçalho).
+    Deve ser chamada com _trava().
+
+    Args:
+        cabecalho (dict): O cabeçalho atual (o tamanho do log é atualizado aqui).
+        posicao (int): O número da posição.
+        chave (str): A matrícula (como string).
+        deslocamento (int): O deslocamento do registro no log.
+
+    Returns:
+        None
+    """
+    cabecalho["tamanho_log"] = os.stat(_log_path()).st_size
+    with open(_indice_path(), 'r+b') as f_indice:
+        f_indice.seek(_CABECALHO.size + posicao * _POSICAO.size)
+        f_indice.write(_POSICAO.pack(_hash(chave), deslocamento + 1))
+        f_indice.seek(0)
+        f_indice.write(_empacota_cabecalho(cabecalho))
+        auxiliar.fsync_arquivo(f_indice, _indice_path())
+
+def insere(usuario: dict) -> bool:
+    """
+    Objetivo: Cadastrar um novo usuário: acrescenta o registro ao log e grava sua posição no índice.
+
+    Args:
+        usuario (dict): Os dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi cadastrado, False se a matrícula já existia.
+    """
+    chave = str(usuario['matricula'])
+    with _trava():
+        _garante_diretorio()
+        with open(_indice_path(), 'r+b') as f_indice, open(_log_path(), 'rb') as f_log:
+            cabecalho = _le_cabecalho(f_indice)
+            posicao, existente = _procura(f_indice, f_log, cabecalho, chave)
+        if existente is not None:
+            return False
+        if posicao is None or cabecalho["ocupadas"] + 1 >= cabecalho["capacidade"] * CARGA_MAXIMA:
+            _reindexa(cabecalho, cabecalho["capacidade"] * 2)
+            with open(_indice_path(), 'rb') as f_indice, open(_log_path(), 'rb') as f_log:
+                cabecalho = _le_cabecalho(f_indice)
+                posicao = _procura(f_indice, f_log, cabecalho, chave)[0]
+
+        deslocamento = _acrescenta([(chave, usuario)])[0]
+        cabecalho["ocupadas"] += 1
+        _grava_posicao(cabecalho, posicao, chave, deslocamento)
+    return True
+
+def insere_varios(usuarios: list) -> list:
+    """
+    Objetivo: Cadastrar vários usuários de uma vez: os registros novos são acrescentados ao log com uma
+    única escrita e o índice é regravado uma única vez.
+
+    Args:
+        usuarios (list): Os dados de cada usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        list: Para cada usuário, True se foi cadastrado ou False se a matrícula já existia
+              (no diretório ou antes, na própria lista).
+    """
+    resultados = []
+    novos = {}
+    with _trava():
+        _garante_diretorio()
+        with open(_indice_path(), 'rb') as f_indice, open(_log_path(), 'rb') as f_log:
+            cabecalho = _le_cabecalho(f_indice)
+            for usuario in usuarios:
+                chave = str(usuario['matricula'])
+                novo = chave not in novos and _procura(f_indice, f_log, cabecalho, chave)[1] is None
+                if novo:
+                    novos[chave] = usuario
+                resultados.append(novo)
+        if not novos:
+            return resultados
+
+        deslocamentos = _acrescenta(list(novos.items()))
+        cabecalho["ocupadas"] += len(novos)
+        cabecalho["tamanho_log"] = os.stat(_log_path()).st_size
+        if cabecalho["ocupadas"] >= cabecalho["capacidade"] * CARGA_MAXIMA:
+            _reindexa(cabecalho) # _grava_indice escolhe a capacidade necessária.
+            return resultados
+        # Há espaço: as novas posições são preenchidas em memória e o índice é regravado de uma vez.
+        with open(_indice_path(), 'rb') as f_indice:
+            f_indice.seek(_CABECALHO.size)
+            tabela = bytearray(f_indice.read())
+        for chave, deslocamento in zip(novos, deslocamentos):
+            _preenche_posicao(tabela, cabecalho["capacidade"], chave, deslocamento)
+        auxiliar._grava_atomico(_indice_path(), _empacota_cabecalho(cabecalho) + bytes(tabela))
+    return resultados
+
+def atualiza(usuario: dict) -> bool:
+    """
+    Objetivo: Regravar os dados de um usuário existente: acrescenta o novo registro ao log e aponta
+    a posição do índice para ele (o registro anterior fica no log até a próxima compactação).
+
+    Args:
+        usuario (dict): Os novos dados do usuário; a chave 'matricula' identifica o registro.
+
+    Returns:
+        bool: True se o usuário foi atualizado, False se a matrícula não existia.
+    """
+    chave = str(usuario['matricula'])
+    with _trava():
+        _garante_diretorio()
+        with open(_indice_path(), 'rb') as f_indice, open(_log_path(), 'rb') as f_log:
+            cabecalho = _le_cabecalho(f_indice)
+            posicao, existente = _procura(f_indice, f_log, cabecalho, chave)
+        if existente is None:
+            return False
+        deslocamento = _acrescenta([(chave, usuario)])[0]
+        _grava_posicao(cabecalho, posicao, chave, deslocamento)
+    return True
+
+def todos() -> dict:
+    """
+    Objetivo: Retornar todos os usuários do diretório (lê o log inteiro; para exportação e importação).
+
+    Returns:
+        dict: Matrícula (string) -> usuário (Usuario, ver modelos.py).
+    """
+    _garante_diretorio()
+    return {chave: Usuario.from_json(usuario) for chave, (_, usuario) in _varre_log().items()}
+
+def inicializa():
+    """
+    Objetivo: Construir o diretório, se ainda não existir ou não corresponder a 'usuarios.json'.
+
+    Returns:
+        None
+    """
+    _garante_diretorio()
+
+def compacta() -> dict:
+    """
+    Objetivo: Gravar em 'usuarios.json' todos os usuários do diretório e reconstruir o log sem os
+    registros substituídos.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva.
+    """
+    with _trava():
+        usuarios_data = todos()
+        auxiliar.save_json(usuarios_data, auxiliar.USUARIOS_JSON_PATH)
+        auxiliar.descarrega_escritas(auxiliar.USUARIOS_JSON_PATH)
+        _reconstroi(reaplica=False)
+    return {"status": "sucesso", "mensagem": f"Diretório compactado: {len(usuarios_data)} usuário(s) gravados em usuarios.json."}
+
+if __name__ == "__main__":
+    # Uso: python diretorio_usuarios.py compactar -> grava todos os usuários em usuarios.json e reconstrói o log.
+    if len(sys.argv) > 1 and sys.argv[1] == "compactar":
+        print(compacta()["mensagem"])
+    else:
+        print("Uso: python diretorio_usuarios.py compactar")
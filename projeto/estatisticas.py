@@ -0,0 +1,464 @@
+import sys   # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python estatisticas.py reconstruir').
+import copy  # Cópia das estatísticas de uma lista guardada junto com as contribuições dos alunos.
+import auxiliar  # O backend de armazenamento é obtido no momento da chamada (auxiliar.get_backend()).
+import correcao  # Motor de correção (codificação das respostas e contagem de acertos).
+import gabaritos  # Gabarito compilado de cada lista, guardado por hash do conteúdo (ver gabaritos.py).
+from collections.abc import Mapping  # Turmas podem ser dicionários (cache do backend JSON) ou objetos Turma (ver modelos.py).
+
+# --- Estatísticas de Desempenho das Turmas, Mantidas Incrementalmente ---
+# Para que visualizar uma turma não percorra todos os alunos e todas as questões de cada lista, cada turma
+# guarda, para cada lista associada, contadores que são atualizados a cada evento de progresso:
+#   {
+#     "hash": str,                        # Hash da versão da lista (ver gabaritos.py), ou None se fora do catálogo.
+#     "gabarito": ["a", "", "c", ...],    # Respostas corretas usadas nas contagens ("" = sem resposta definida).
+#     "questoes_com_gabarito": int,       # Quantidade de questões com resposta correta definida.
+#     "alunos_contribuintes": int,        # Alunos que iniciaram (progresso > 0) ou completaram a lista.
+#     "acertos": int,                     # Total de acertos desses alunos.
+#     "questoes": [{"respondidas": int, "acertos": int}, ...],  # Contadores por questão.
+#     "formato": 2                        # Contadores com as contribuições guardadas à parte (ver abaixo).
+#   }
+# A contribuição contabilizada de cada aluno (ver contribuicao()) fica em um documento separado por turma e lista,
+# que visualizar a turma não lê (assim a leitura não cresce com a quantidade de alunos):
+#   {"entrada": {cópia das estatísticas acima}, "alunos": {matrícula: "0212..."}}
+# Ele só é lido pelas atualizações, pelos recálculos e pela entrada e saída de alunos. A cópia das estatísticas
+# indica a que versão dos contadores as contribuições correspondem: se não conferir (ex: uma gravação interrompida
+# entre os dois documentos), os contadores são descartados e recalculados.
+# Os contadores (e as contribuições) são atualizados por:
+#   - atualiza_aluno / atualiza_alunos: quando o aluno para ou completa a lista (aluno.responder_lista) ou envia
+#     as respostas (aluno.envia_respostas/envia_respostas_lote), uma vez por sessão e não a cada resposta;
+#   - aluno_inserido / alunos_inseridos / aluno_removido: quando alunos entram ou saem da turma
+#     (professor.insere_aluno/insere_alunos/remove_aluno).
+# Como a contribuição de cada aluno fica guardada, uma atualização substitui a contribuição anterior em vez de
+# somar uma diferença: repeti-la (ex: um evento que o recálculo já leu do progresso) não conta nada duas vezes.
+# Se a lista for alterada (o gabarito não confere) ou ainda não houver contadores para ela, eles são recalculados
+# a partir do progresso dos alunos na próxima consulta. Eventos que chegam antes disso ficam em uma entrada
+# "parcial" (só com as contribuições), que prevalece sobre o progresso lido pelo recálculo, por ser mais recente.
+# Enquanto o hash da lista não muda, a consulta não precisa carregar a lista nem o gabarito.
+# O comando 'python estatisticas.py reconstruir [turma]'
+# recalcula tudo, para recuperação após edições externas dos arquivos.
+# As alterações dos contadores são feitas com backend.atualiza_estatisticas_turma, sempre sobre a versão mais
+# recente das estatísticas e das contribuições, para que eventos registrados ao mesmo tempo por vários processos
+# não se percam.
+
+# Versão do formato das estatísticas de uma lista (sem o campo: contadores sem as contribuições dos alunos).
+_FORMATO_ENTRADA = 2
+
+def contribuicao(progresso_lista: dict, gabarito_lista: list) -> list:
+    """
+    Objetivo: Calcular a contribuição de um aluno para as estatísticas de uma lista.
+    Só contribuem os alunos que iniciaram (progresso > 0) ou completaram a lista.
+
+    Args:
+        progresso_lista (dict): O progresso do aluno nesta lista ({'progresso', 'respostas', 'status'}), ou None.
+        gabarito_lista (list): O gabarito da lista (ver correcao.gabarito()), ou o gabarito compilado (já codificado).
+
+    Returns:
+        list: A situação de cada questão (correcao.NAO_RESPONDIDA, ERRO ou ACERTO), ou None se o aluno não contribui.
+    """
+    if not progresso_lista:
+        return None
+    if not (progresso_lista.get('status') == 'completo' or progresso_lista.get('progresso', 0) > 0):
+        return None
+    return correcao.situacao_questoes(correcao.codifica_gabarito(gabarito_lista),
+                                      correcao.codifica_respostas(progresso_lista.get('respostas', {}), len(gabarito_lista)))
+
+def _entrada_vazia(gabarito_lista: list) -> dict:
+    """
+    Objetivo: Criar as estatísticas zeradas de uma lista.
+
+    Args:
+        gabarito_lista (list): O gabarito da lista.
+
+    Returns:
+        dict: As estatísticas da lista, sem nenhum aluno contabilizado.
+    """
+    return {
+        "hash": getattr(gabarito_lista, "hash", None),
+        "gabarito": list(gabarito_lista),
+        "questoes_com_gabarito": sum(1 for resp in gabarito_lista if resp),
+        "alunos_contribuintes": 0,
+        "acertos": 0,
+        "questoes": [{"respondidas": 0, "acertos": 0} for _ in gabarito_lista],
+        "formato": _FORMATO_ENTRADA,
+    }
+
+def _codifica_contribuicao(codigos: list) -> str:
+    """
+    Objetivo: Converter a contribuição de um aluno para a forma guardada nas estatísticas (um dígito por questão).
+
+    Args:
+        codigos (list): A contribuição (ver contribuicao()), ou None.
+
+    Returns:
+        str: Os códigos como texto ("" se o aluno não contribui).
+    """
+    return "".join(map(str, codigos)) if codigos is not None else ""
+
+def _decodifica_contribuicao(texto: str) -> list:
+    """
+    Objetivo: Converter uma contribuição guardada (ver _codifica_contribuicao) de volta para a lista de códigos.
+
+    Args:
+        texto (str): A contribuição guardada.
+
+    Returns:
+        list: Os códigos, ou None se o aluno não contribui.
+    """
+    return [int(codigo) for codigo in texto] if texto else None
+
+def _aplica_contribuicao(entrada: dict, codigos: list, sinal: int):
+    """
+    Objetivo: Somar (sinal = 1) ou subtrair (sinal = -1) a contribuição de um aluno das estatísticas de uma lista.
+
+    Args:
+        entrada (dict): As estatísticas da lista (alteradas no lugar).
+        codigos (list): A contribuição do aluno (ver contribuicao()), ou None.
+        sinal (int): 1 para somar, -1 para subtrair.
+
+    Returns:
+        None
+    """
+    if codigos is None:
+        return
+    entrada["alunos_contribuintes"] += sinal
+    for contadores, codigo in zip(entrada["questoes"], codigos):
+        if codigo != correcao.NAO_RESPONDIDA:
+            contadores["respondidas"] += sinal
+        if codigo == correcao.ACERTO:
+            contadores["acertos"] += sinal
+            entrada["acertos"] += sinal
+
+def _substitui_contribuicao(entrada: dict, alunos: dict, matricula: str, codigos: list):
+    """
+    Objetivo: Trocar a contribuição guardada de um aluno pela nova, ajustando os contadores.
+    Aplicar a mesma contribuição de novo não altera nada.
+
+    Args:
+        entrada (dict): As estatísticas da lista (alteradas no lugar).
+        alunos (dict): As contribuições guardadas dos alunos (matrícula -> texto), alteradas no lugar.
+        matricula (str): A matrícula do aluno, como string.
+        codigos (list): A nova contribuição (ver contribuicao()), ou None se o aluno não contribui (mais).
+
+    Returns:
+        None
+    """
+    anterior = alunos.pop(matricula, None)
+    if anterior is not None:
+        _aplica_contribuicao(entrada, _decodifica_contribuicao(anterior), -1)
+    _aplica_contribuicao(entrada, codigos, 1)
+    if codigos is not None or entrada.get("parcial"):
+        # Na entrada parcial, "não contribui" também é guardado, para prevalecer sobre o recálculo.
+        alunos[matricula] = _codifica_contribuicao(codigos)
+
+def _completa(entrada: dict) -> bool:
+    """
+    Objetivo: Indicar se as estatísticas gravadas de uma lista podem ser usadas sem recálculo.
+
+    Args:
+        entrada (dict): As estatísticas da lista, ou None.
+
+    Returns:
+        bool: False se não existirem, forem parciais ou de um formato sem as contribuições dos alunos.
+    """
+    return entrada is not None and entrada.get("formato") == _FORMATO_ENTRADA and not entrada.get("parcial")
+
+def _contribuicoes_da_entrada(entrada: dict, documento: dict) -> dict:
+    """
+    Objetivo: Obter as contribuições guardadas dos alunos que correspondem às estatísticas gravadas de uma lista.
+
+    Args:
+        entrada (dict): As estatísticas da lista, ou None.
+        documento (dict): O documento de contribuições da lista ({} se não houver).
+
+    Returns:
+        dict: Matrícula -> contribuição guardada, ou None se o documento não for destas estatísticas
+              (ou elas forem de um formato sem as contribuições).
+    """
+    if entrada is None or entrada.get("formato") != _FORMATO_ENTRADA or documento.get("entrada") != entrada:
+        return None
+    return documento["alunos"]
+
+def _documento(entrada: dict, alunos: dict) -> dict:
+    """
+    Objetivo: Montar o documento de contribuições de uma lista, com a cópia das estatísticas a que ele corresponde.
+
+    Args:
+        entrada (dict): As estatísticas da lista.
+        alunos (dict): Matrícula -> contribuição guardada.
+
+    Returns:
+        dict: O documento ({"entrada", "alunos"}).
+    """
+    return {"entrada": copy.deepcopy(entrada), "alunos": alunos}
+
+def _calcula_entrada(nome_turma: str, nome_lista_json: str, gabarito_lista: list) -> tuple:
+    """
+    Objetivo: Calcular do zero as estatísticas de uma lista em uma turma, a partir do progresso dos alunos.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        nome_lista_json (str): O nome da lista de exercícios.
+        gabarito_lista (list): O gabarito atual da lista.
+
+    Returns:
+        tuple: (estatísticas da lista, contribuições dos alunos (matrícula -> contribuição guardada)).
+    """
+    backend = auxiliar.get_backend()
+    dados_turma = backend.busca_turma(nome_turma, somente_leitura=True) or {}
+    alunos = dados_turma.get("alunos", []) if isinstance(dados_turma, Mapping) else []
+    progresso_alunos_data = backend.carrega_progresso_alunos(alunos, somente_leitura=True)
+    # Monta a matriz (alunos contribuintes x questões) e corrige todos de uma vez (ver correcao.py).
+    linhas = []
+    contribuicoes = {}
+    for matricula in alunos:
+        progresso_lista = progresso_alunos_data.get(str(matricula), {}).get(nome_lista_json)
+        codigos = contribuicao(progresso_lista, gabarito_lista)
+        if codigos is not None:
+            linhas.append(correcao.codifica_respostas(progresso_lista.get('respostas', {}), len(gabarito_lista)))
+            contribuicoes[str(matricula)] = _codifica_contribuicao(codigos)
+    resultado = correcao.corrige_turma(correcao.codifica_gabarito(gabarito_lista), linhas)
+    entrada = _entrada_vazia(gabarito_lista)
+    entrada["alunos_contribuintes"] = len(linhas)
+    entrada["acertos"] = resultado["acertos"]
+    entrada["questoes"] = [{"respondidas": respondidas, "acertos": acertos}
+                           for respondidas, acertos in zip(resultado["respondidas_por_questao"], resultado["acertos_por_questao"])]
+    return entrada, contribuicoes
+
+def estatisticas_lista(nome_turma: str, nome_lista_json: str) -> dict:
+    """
+    Objetivo: Retornar as estatísticas de uma lista em uma turma, recalculando-as (e gravando) apenas se
+    ainda não existirem ou se a lista tiver sido alterada desde o último cálculo.
+    Se o hash da lista no catálogo for o das estatísticas, nem a lista nem o gabarito são carregados.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        nome_lista_json (str): O nome da lista de exercícios.
+
+    Returns:
+        dict: As estatísticas da lista (não alterar).
+    """
+    backend = auxiliar.get_backend()
+    entrada = backend.carrega_estatisticas_turma(nome_turma, somente_leitura=True).get(nome_lista_json)
+    catalogada = backend.catalogo_listas(somente_leitura=True).get(nome_lista_json)
+    hash_lista = catalogada.get("hash") if catalogada else None
+    if _completa(entrada) and hash_lista is not None and entrada.get("hash") == hash_lista:
+        return entrada
+
+    gabarito_lista = gabaritos.da_lista(nome_lista_json)
+    if _completa(entrada) and entrada.get("gabarito") == gabarito_lista:
+        # A lista mudou sem mudar o gabarito (ex: só o enunciado): os contadores continuam valendo.
+        def marca(estatisticas_turma, contribuicoes):
+            atual = estatisticas_turma.get(nome_lista_json)
+            if not _completa(atual) or atual.get("gabarito") != gabarito_lista or atual.get("hash") == gabarito_lista.hash:
+                return False
+            alunos = _contribuicoes_da_entrada(atual, contribuicoes[nome_lista_json])
+            if alunos is None:
+                del estatisticas_turma[nome_lista_json] # Contribuições que não conferem: recalcula na próxima consulta.
+                return True
+            atual["hash"] = gabarito_lista.hash
+            contribuicoes[nome_lista_json] = _documento(atual, alunos)
+            return True
+        backend.atualiza_estatisticas_turma(nome_turma, marca, [nome_lista_json])
+        return dict(entrada, hash=gabarito_lista.hash)
+    entrada, alunos = _calcula_entrada(nome_turma, nome_lista_json, gabarito_lista)
+
+    def grava(estatisticas_turma, contribuicoes):
+        atual = estatisticas_turma.get(nome_lista_json)
+        gravados = _contribuicoes_da_entrada(atual, contribuicoes[nome_lista_json])
+        if gravados is not None and atual.get("gabarito") == entrada["gabarito"]:
+            # Contribuições gravadas durante o recálculo (eventos ou outro recálculo) são pelo menos tão recentes
+            # quanto o progresso lido por ele. A substituição é idempotente, então a função pode ser refeita.
+            for matricula, codigos in gravados.items():
+                _substitui_contribuicao(entrada, alunos, matricula, _decodifica_contribuicao(codigos))
+        estatisticas_turma[nome_lista_json] = entrada
+        contribuicoes[nome_lista_json] = _documento(entrada, alunos)
+        return True
+    backend.atualiza_estatisticas_turma(nome_turma, grava, [nome_lista_json])
+    return entrada
+
+def atualiza_aluno(matricula: int, nome_lista_json: str, gabarito_lista: list, anterior: list, progresso_lista: dict) -> list:
+    """
+    Objetivo: Atualizar as estatísticas de todas as turmas do aluno que têm a lista, após um evento de progresso.
+    Deve ser chamada depois de o evento ser registrado no backend.
+
+    Args:
+        matricula (int): A matrícula do aluno.
+        nome_lista_json (str): O nome da lista de exercícios.
+        gabarito_lista (list): O gabarito da lista usado para calcular as contribuições.
+        anterior (list): A contribuição do aluno antes do evento (ver contribuicao()).
+        progresso_lista (dict): O progresso do aluno nesta lista depois do evento.
+
+    Returns:
+        list: A nova contribuição do aluno (a ser passada como 'anterior' no próximo evento).
+              'anterior' só serve para evitar a gravação quando a contribuição não mudou.
+    """
+    return atualiza_alunos(nome_lista_json, gabarito_lista, [(matricula, anterior, progresso_lista)])[0]
+
+def atualiza_alunos(nome_lista_json: str, gabarito_lista: list, mudancas: list) -> list:
+    """
+    Objetivo: Atualizar as estatísticas após eventos de progresso de vários alunos na mesma lista
+    (ex: envio das respostas de uma turma inteira). As estatísticas de cada turma são lidas e gravadas uma única vez.
+
+    Args:
+        nome_lista_json (str): O nome da lista de exercícios.
+        gabarito_lista (list): O gabarito da lista usado para calcular as contribuições.
+        mudancas (list): Tuplas (matricula, anterior, progresso_lista), como em atualiza_aluno().
+
+    Returns:
+        list: A nova contribuição de cada aluno, na mesma ordem de 'mudancas'.
+    """
+    backend = auxiliar.get_backend()
+    novas = []
+    por_turma = {} # Nome da turma -> [(matrícula, nova contribuição)].
+    for matricula, anterior, progresso_lista in mudancas:
+        nova = contribuicao(progresso_lista, gabarito_lista)
+        novas.append(nova)
+        if nova == anterior:
+            continue
+        for nome_turma, listas in backend.turmas_do_aluno(matricula).items():
+            if nome_lista_json in listas:
+                por_turma.setdefault(nome_turma, []).append((str(matricula), nova))
+
+    for nome_turma, pares in por_turma.items():
+        # A alteração é aplicada sobre a versão mais recente das estatísticas (ver atualiza_estatisticas_turma),
+        # para não desfazer as de outros processos; como substitui contribuições, ela pode ser refeita.
+        def altera(estatisticas_turma, contribuicoes, pares=pares):
+            entrada = estatisticas_turma.get(nome_lista_json)
+            alunos = _contribuicoes_da_entrada(entrada, contribuicoes[nome_lista_json])
+            if entrada is not None and (alunos is None or entrada.get("gabarito") != gabarito_lista):
+                # A lista mudou (ou as contribuições não conferem): recalcula na próxima consulta.
+                del estatisticas_turma[nome_lista_json]
+                entrada = None
+            if entrada is None:
+                # Guarda só as contribuições, que prevalecem sobre o progresso lido pelo recálculo (ver estatisticas_lista).
+                entrada = estatisticas_turma[nome_lista_json] = dict(_entrada_vazia(gabarito_lista), parcial=True)
+                alunos = {}
+            for matricula, nova in pares:
+                _substitui_contribuicao(entrada, alunos, matricula, nova)
+            contribuicoes[nome_lista_json] = _documento(entrada, alunos)
+            return True
+        backend.atualiza_estatisticas_turma(nome_turma, altera, [nome_lista_json])
+    return novas
+
+def _altera_membros(nome_turma: str, matriculas: list, sinal: int):
+    """
+    Objetivo: Incluir ou retirar das estatísticas da turma a contribuição de alunos em todas as listas.
+    Um aluno já contabilizado (ex: pelo recálculo ou por um evento) não é incluído de novo, e um aluno
+    não contabilizado não é retirado.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matriculas (list): As matrículas dos alunos.
+        sinal (int): 1 quando os alunos entram na turma, -1 quando saem.
+
+    Returns:
+        None
+    """
+    backend = auxiliar.get_backend()
+    if not matriculas or not backend.carrega_estatisticas_turma(nome_turma, somente_leitura=True):
+        return
+    # Só a entrada precisa do progresso: a saída retira a contribuição guardada.
+    progresso_alunos_data = backend.carrega_progresso_alunos(matriculas, somente_leitura=True) if sinal > 0 else {}
+
+    def altera(estatisticas_turma, contribuicoes):
+        alterou = False
+        for nome_lista_json, entrada in list(estatisticas_turma.items()):
+            alunos = _contribuicoes_da_entrada(entrada, contribuicoes[nome_lista_json])
+            if alunos is None:
+                # Formato antigo (ou contribuições que não conferem): é recalculada na próxima consulta.
+                del estatisticas_turma[nome_lista_json]
+                alterou = True
+                continue
+            mudou = False
+            for matricula in map(str, matriculas):
+                if sinal > 0 and matricula not in alunos:
+                    codigos = contribuicao(progresso_alunos_data.get(matricula, {}).get(nome_lista_json), entrada["gabarito"])
+                    if codigos is not None:
+                        _substitui_contribuicao(entrada, alunos, matricula, codigos)
+                        mudou = True
+                elif sinal < 0 and matricula in alunos:
+                    _substitui_contribuicao(entrada, alunos, matricula, None)
+                    alunos.pop(matricula, None)
+                    mudou = True
+            if mudou:
+                contribuicoes[nome_lista_json] = _documento(entrada, alunos)
+                alterou = True
+        return alterou
+    backend.atualiza_estatisticas_turma(nome_turma, altera, None) # Contribuições de todas as listas da turma.
+
+def aluno_inserido(nome_turma: str, matricula: int):
+    """
+    Objetivo: Incluir nas estatísticas da turma o progresso de um aluno recém-matriculado.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        None
+    """
+    _altera_membros(nome_turma, [matricula], 1)
+
+def alunos_inseridos(nome_turma: str, matriculas: list):
+    """
+    Objetivo: Incluir nas estatísticas da turma o progresso de vários alunos recém-matriculados
+    (as estatísticas são lidas e gravadas uma única vez).
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matriculas (list): As matrículas dos alunos.
+
+    Returns:
+        None
+    """
+    _altera_membros(nome_turma, matriculas, 1)
+
+def aluno_removido(nome_turma: str, matricula: int):
+    """
+    Objetivo: Retirar das estatísticas da turma o progresso de um aluno que saiu dela.
+
+    Args:
+        nome_turma (str): O nome da turma.
+        matricula (int): A matrícula do aluno.
+
+    Returns:
+        None
+    """
+    _altera_membros(nome_turma, [matricula], -1)
+
+def reconstroi_estatisticas(nome_turma: str = None) -> dict:
+    """
+    Objetivo: Recalcular do zero as estatísticas de uma turma (ou de todas), a partir do progresso dos alunos.
+
+    Args:
+        nome_turma (str, optional): A turma a recalcular. Padrão para None (todas as turmas).
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva.
+    """
+    backend = auxiliar.get_backend()
+    nomes_turmas = [nome_turma] if nome_turma is not None else backend.lista_turmas()
+    total_listas = 0
+    for nome in nomes_turmas:
+        dados_turma = backend.busca_turma(nome, somente_leitura=True)
+        if dados_turma is None:
+            return {"status": "erro", "mensagem": f"Erro: Turma '{nome}' não encontrada."}
+        estatisticas_turma = {}
+        contribuicoes = {}
+        listas = dados_turma.get("listas", []) if isinstance(dados_turma, Mapping) else []
+        for nome_lista_json in listas:
+            # O gabarito vem da memória ou do disco; a lista só é carregada se ele ainda precisar ser compilado.
+            entrada, alunos = _calcula_entrada(nome, nome_lista_json, gabaritos.da_lista(nome_lista_json))
+            estatisticas_turma[nome_lista_json] = entrada
+            contribuicoes[nome_lista_json] = _documento(entrada, alunos)
+            total_listas += 1
+        backend.salva_estatisticas_turma(nome, estatisticas_turma, contribuicoes)
+    return {"status": "sucesso",
+            "mensagem": f"Estatísticas recalculadas para {len(nomes_turmas)} turma(s) e {total_listas} lista(s)."}
+
+if __name__ == "__main__":
+    # Uso: python estatisticas.py reconstruir [turma] -> recalcula as estatísticas de uma turma (ou de todas).
+    if len(sys.argv) > 1 and sys.argv[1] == "reconstruir":
+        print(reconstroi_estatisticas(sys.argv[2] if len(sys.argv) > 2 else None)["mensagem"])
+    else:
+        print("Uso: python estatisticas.py reconstruir [turma]")
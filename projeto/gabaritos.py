@@ -0,0 +1,183 @@
+import json       # Respostas corretas fora do formato (ex: "ab") guardadas no final do arquivo do gabarito.
+import os         # Manipulação dos caminhos dos arquivos dos gabaritos.
+import struct     # Cabeçalho binário dos arquivos dos gabaritos compilados.
+import threading  # Protege o cache de gabaritos contra acessos simultâneos de várias threads.
+from array import array  # Vetor dos códigos das respostas corretas (um byte por questão).
+from collections import OrderedDict  # Mantém a ordem de uso das entradas do cache (política LRU).
+import auxiliar   # Backend de armazenamento, gravação atômica e caminhos (lidos no momento da chamada).
+import correcao   # Compilação do gabarito (correcao.compila) e regras de correção.
+
+# --- Cache de Gabaritos Compilados ---
+# O gabarito compilado de uma lista (ver correcao.GabaritoCompilado) é identificado pelo hash do conteúdo da lista,
+# o mesmo do catálogo de listas (ver auxiliar.resumo_lista): enquanto a lista não muda, o gabarito é compilado uma
+# única vez e reaproveitado da memória ou do disco; qualquer alteração da lista muda o hash e gera um novo gabarito.
+# Os gabaritos gravados ficam ao lado do diretório das listas, um arquivo por hash:
+#   '<diretório das listas>_gabaritos/<hash>.gab' -> cabeçalho (_CABECALHO) + códigos + máscaras + extras (JSON)
+# Como o nome é o próprio hash, um arquivo nunca precisa ser invalidado; os de versões antigas das listas são
+# apenas ignorados (e podem ser apagados a qualquer momento). Falhas de gravação também são ignoradas: o gabarito
+# é só um cache e é recompilado a partir da lista quando necessário.
+# Os exercícios compilados trazem o hash da versão de onde foram carregados (ver backend.carrega_lista_versionada,
+# que o obtém do catálogo sem reserializar a lista); se ele não for o da versão catalogada (ex: a lista mudou depois
+# de ser carregada), o gabarito é usado sem ser guardado, para que um hash nunca aponte para o gabarito de outro
+# conteúdo.
+
+# Quantidade máxima de gabaritos mantidos em memória (os usados há mais tempo são descartados).
+CACHE_GABARITOS_MAX = 512
+
+# Identificação e cabeçalho dos arquivos: mágica, versão e quantidade de questões.
+_MAGICA = b"GABC"
+_VERSAO = 1
+_CABECALHO = struct.Struct("<4sBI")
+
+_cache = OrderedDict()          # Hash da lista -> GabaritoCompilado.
+_cache_lock = threading.Lock()  # Trava que protege o cache.
+
+def _gabarito_path(hash_lista: str) -> str:
+    """
+    Objetivo: Montar o caminho do arquivo do gabarito compilado de uma versão de uma lista.
+
+    Args:
+        hash_lista (str): O hash do conteúdo da lista.
+
+    Returns:
+        str: O caminho do arquivo.
+    """
+    return os.path.join(os.path.normpath(auxiliar.LISTAS_DE_EXERCICIOS_DIR) + "_gabaritos", hash_lista + ".gab")
+
+def _serializa(gabarito: correcao.GabaritoCompilado) -> bytes:
+    """
+    Objetivo: Serializar um gabarito compilado no formato do arquivo.
+    As letras do gabarito são reconstruídas dos códigos na leitura; só as respostas corretas que não são
+    uma letra (código inválido) são gravadas à parte, como texto.
+
+    Args:
+        gabarito (GabaritoCompilado): O gabarito.
+
+    Returns:
+        bytes: O conteúdo do arquivo.
+    """
+    extras = {str(i): letra for i, (letra, codigo) in enumerate(zip(gabarito, gabarito.codigos)) if codigo < 0}
+    return (_CABECALHO.pack(_MAGICA, _VERSAO, len(gabarito)) + gabarito.codigos.tobytes() + gabarito.mascaras
+            + json.dumps(extras, ensure_ascii=False).encode("utf-8"))
+
+def _interpreta(conteudo: bytes, hash_lista: str) -> correcao.GabaritoCompilado:
+    """
+    Objetivo: Interpretar o conteúdo de um arquivo de gabarito compilado.
+
+    Args:
+        conteudo (bytes): O conteúdo do arquivo.
+        hash_lista (str): O hash da lista (o nome do arquivo).
+
+    Returns:
+        GabaritoCompilado: O gabarito, ou None se o arquivo for de outro formato ou estiver incompleto.
+    """
+    if len(conteudo) < _CABECALHO.size:
+        return None
+    magica, versao, quantidade = _CABECALHO.unpack_from(conteudo)
+    inicio_extras = _CABECALHO.size + 2 * quantidade
+    if magica != _MAGICA or versao != _VERSAO or len(conteudo) <= inicio_extras:
+        return None
+    try:
+        extras = json.loads(conteudo[inicio_extras:].decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None # Gravação interrompida: o gabarito é recompilado.
+    codigos = array('b')
+    codigos.frombytes(conteudo[_CABECALHO.size:_CABECALHO.size + quantidade])
+    mascaras = conteudo[_CABECALHO.size + quantidade:inicio_extras]
+    letras = [chr(ord("a") - 1 + codigo) if codigo > 0 else extras.get(str(i), "") for i, codigo in enumerate(codigos)]
+    return correcao.GabaritoCompilado(letras, codigos, mascaras, hash_lista)
+
+def _le_arquivo(hash_lista: str) -> correcao.GabaritoCompilado:
+    """
+    Objetivo: Ler o gabarito compilado gravado de uma versão de uma lista.
+
+    Args:
+        hash_lista (str): O hash do conteúdo da lista.
+
+    Returns:
+        GabaritoCompilado: O gabarito, ou None se ele não estiver gravado (ou for inválido).
+    """
+    try:
+        with open(_gabarito_path(hash_lista), 'rb') as f:
+            return _interpreta(f.read(), hash_lista)
+    except OSError:
+        return None
+
+def _grava_arquivo(gabarito: correcao.GabaritoCompilado):
+    """
+    Objetivo: Gravar o gabarito compilado de uma lista (de forma atômica). Falhas são ignoradas.
+
+    Args:
+        gabarito (GabaritoCompilado): O gabarito, com o hash da lista.
+
+    Returns:
+        None
+    """
+    caminho = _gabarito_path(gabarito.hash)
+    try:
+        auxiliar._ensure_dir_exists(os.path.dirname(caminho))
+        auxiliar._grava_atomico(caminho, _serializa(gabarito))
+    except OSError:
+        pass
+
+def _cache_guarda(gabarito: correcao.GabaritoCompilado):
+    """
+    Objetivo: Guardar um gabarito no cache em memória, descartando os usados há mais tempo se necessário.
+
+    Args:
+        gabarito (GabaritoCompilado): O gabarito, com o hash da lista.
+
+    Returns:
+        None
+    """
+    with _cache_lock:
+        _cache[gabarito.hash] = gabarito
+        _cache.move_to_end(gabarito.hash)
+        while len(_cache) > CACHE_GABARITOS_MAX:
+            _cache.popitem(last=False)
+
+def da_lista(nome_lista_json: str, exercicios: list = None, hash_exercicios: str = None) -> correcao.GabaritoCompilado:
+    """
+    Objetivo: Obter o gabarito compilado da versão atual de uma lista: da memória, do disco ou compilando-o
+    (e guardando-o nos dois) se ele ainda não existir. Ver o comentário no início do módulo.
+
+    Args:
+        nome_lista_json (str): O nome da lista.
+        exercicios (list, optional): Os exercícios da lista, se o chamador já os tiver carregado. Padrão para None
+                                     (a lista é carregada só se o gabarito precisar ser compilado).
+        hash_exercicios (str, optional): O hash da versão dos exercícios, como retornado por
+                                         backend.carrega_lista_versionada. O gabarito guardado só é usado para os
+                                         exercícios do chamador se ele for o da versão catalogada; caso contrário
+                                         (ex: a lista mudou depois de ser carregada, ou o hash não foi informado),
+                                         eles são compilados sem guardar o resultado. Padrão para None.
+
+    Returns:
+        GabaritoCompilado: O gabarito (não alterar). Uma lista inexistente resulta em um gabarito vazio.
+    """
+    backend = auxiliar.get_backend()
+    entrada = backend.catalogo_listas(somente_leitura=True).get(nome_lista_json)
+    hash_lista = entrada.get("hash") if entrada else None
+    if hash_lista is None:
+        # Lista fora do catálogo (ex: inexistente): é compilada sem ser guardada.
+        if exercicios is None:
+            exercicios = backend.carrega_lista(nome_lista_json, somente_leitura=True)
+        return correcao.compila(exercicios)
+
+    if exercicios is not None and hash_exercicios != hash_lista:
+        # Os exercícios do chamador não são (comprovadamente) a versão catalogada: o gabarito dela não vale para eles.
+        return correcao.compila(exercicios)
+    with _cache_lock:
+        gabarito = _cache.get(hash_lista)
+        if gabarito is not None:
+            _cache.move_to_end(hash_lista)
+    if gabarito is None:
+        gabarito = _le_arquivo(hash_lista)
+    if gabarito is None:
+        if exercicios is None:
+            exercicios, hash_exercicios = backend.carrega_lista_versionada(nome_lista_json, somente_leitura=True)
+            if hash_exercicios != hash_lista:
+                return correcao.compila(exercicios) # Não é a versão catalogada: não é guardado.
+        gabarito = correcao.compila(exercicios, hash_lista)
+        _grava_arquivo(gabarito)
+    _cache_guarda(gabarito)
+    return gabarito
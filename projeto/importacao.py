@@ -0,0 +1,128 @@
+import csv   # Leitura dos arquivos de importação em CSV (com cabeçalho).
+import json  # Leitura dos arquivos de importação em JSONL (um objeto JSON por linha).
+import sys   # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python importacao.py usuarios alunos.csv').
+import cadastro   # Criação de contas em lote (cadastro.cria_usuarios).
+import professor  # Matrícula de alunos em lote (professor.insere_alunos).
+
+# --- Importação em Lote de Usuários e Matrículas ---
+# Prepara um semestre inteiro sem digitar conta por conta: cada comando lê um arquivo CSV (com cabeçalho)
+# ou JSONL (um objeto por linha), valida todas as linhas, grava as válidas de uma vez e relata os erros
+# linha a linha, sem interromper a importação.
+#   python importacao.py usuarios <arquivo>    -> colunas: matricula, nome, idade, tipo, senha (ou senha_hash)
+#   python importacao.py matriculas <arquivo>  -> colunas: turma, matricula
+# O formato é escolhido pela extensão do arquivo ('.csv' ou '.jsonl').
+
+def le_registros(caminho: str) -> tuple:
+    """
+    Objetivo: Ler os registros de um arquivo CSV ou JSONL.
+
+    Args:
+        caminho (str): O caminho do arquivo ('.csv' ou '.jsonl').
+
+    Returns:
+        tuple: (registros, linhas, erros), onde 'registros' são os dicionários lidos, 'linhas' o número da linha
+               do arquivo de cada registro e 'erros' as linhas que não puderam ser lidas ([{'linha', 'mensagem'}]).
+    """
+    registros, linhas, erros = [], [], []
+    with open(caminho, encoding="utf-8", newline="") as f:
+        if caminho.lower().endswith(".csv"):
+            leitor = csv.DictReader(f)
+            for registro in leitor:
+                registros.append({chave.strip(): valor for chave, valor in registro.items() if chave is not None})
+                linhas.append(leitor.line_num)
+        else:
+            for numero, linha in enumerate(f, start=1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except ValueError as e:
+                    erros.append({"linha": numero, "mensagem": f"JSON inválido: {e}"})
+                    continue
+                if not isinstance(registro, dict):
+                    erros.append({"linha": numero, "mensagem": "A linha não contém um objeto JSON."})
+                    continue
+                registros.append(registro)
+                linhas.append(numero)
+    return registros, linhas, erros
+
+def _erros_por_linha(erros_lote: list, linhas: list) -> list:
+    """
+    Objetivo: Converter os erros de uma operação em lote (com a posição do registro) em erros com a linha do arquivo.
+
+    Args:
+        erros_lote (list): Os erros retornados pela operação ([{'registro', 'mensagem', ...}]).
+        linhas (list): O número da linha do arquivo de cada registro enviado à operação.
+
+    Returns:
+        list: Os erros como [{'linha', 'mensagem'}].
+    """
+    return [{"linha": linhas[erro["registro"] - 1], "mensagem": erro["mensagem"]} for erro in erros_lote]
+
+def importa_usuarios(caminho: str) -> dict:
+    """
+    Objetivo: Criar as contas listadas em um arquivo CSV ou JSONL.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação, uma 'mensagem' descritiva, a quantidade de 'criados'
+              e os 'erros' por linha do arquivo ([{'linha', 'mensagem'}]).
+    """
+    registros, linhas, erros = le_registros(caminho)
+    resultado = cadastro.cria_usuarios(registros)
+    erros = sorted(erros + _erros_por_linha(resultado["erros"], linhas), key=lambda erro: erro["linha"])
+    status = "sucesso" if not erros else ("aviso" if resultado["criados"] else "erro")
+    return {"status": status, "mensagem": f"{resultado['criados']} conta(s) criada(s), {len(erros)} erro(s).",
+            "criados": resultado["criados"], "erros": erros}
+
+def importa_matriculas(caminho: str) -> dict:
+    """
+    Objetivo: Matricular nas turmas os alunos listados em um arquivo CSV ou JSONL (colunas 'turma' e 'matricula').
+    As linhas são agrupadas por turma e cada turma é gravada uma única vez.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação, uma 'mensagem' descritiva, a quantidade de 'inseridos'
+              e os 'erros' por linha do arquivo ([{'linha', 'mensagem'}]).
+    """
+    registros, linhas, erros = le_registros(caminho)
+    por_turma = {} # Nome da turma -> ([matrículas], [linhas]).
+    for registro, linha in zip(registros, linhas):
+        nome_turma = str(registro.get("turma") or "").strip()
+        if not nome_turma:
+            erros.append({"linha": linha, "mensagem": "Turma não informada."})
+            continue
+        matriculas_turma, linhas_turma = por_turma.setdefault(nome_turma, ([], []))
+        matriculas_turma.append(registro.get("matricula", ""))
+        linhas_turma.append(linha)
+
+    inseridos = 0
+    for nome_turma, (matriculas_turma, linhas_turma) in por_turma.items():
+        resultado = professor.insere_alunos(nome_turma, matriculas_turma)
+        inseridos += resultado["inseridos"]
+        if resultado["status"] == "erro" and not resultado["erros"]:
+            # Erro da turma inteira (ex: turma inexistente): vale para todas as linhas dela.
+            erros.extend({"linha": linha, "mensagem": resultado["mensagem"]} for linha in linhas_turma)
+        else:
+            erros.extend(_erros_por_linha(resultado["erros"], linhas_turma))
+
+    erros.sort(key=lambda erro: erro["linha"])
+    status = "sucesso" if not erros else ("aviso" if inseridos else "erro")
+    return {"status": status, "mensagem": f"{inseridos} matrícula(s) feita(s) em {len(por_turma)} turma(s), {len(erros)} erro(s).",
+            "inseridos": inseridos, "erros": erros}
+
+if __name__ == "__main__":
+    # Uso: python importacao.py [usuarios|matriculas] <arquivo.csv|arquivo.jsonl>
+    comandos = {"usuarios": importa_usuarios, "matriculas": importa_matriculas}
+    if len(sys.argv) != 3 or sys.argv[1] not in comandos:
+        print("Uso: python importacao.py [usuarios|matriculas] <arquivo.csv|arquivo.jsonl>")
+        sys.exit(2)
+    resultado = comandos[sys.argv[1]](sys.argv[2])
+    for erro in resultado["erros"]:
+        print(f"Linha {erro['linha']}: {erro['mensagem']}")
+    print(resultado["mensagem"])
+    sys.exit(0 if resultado["status"] != "erro" else 1)
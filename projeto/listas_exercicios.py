@@ -0,0 +1,611 @@
+import json       # Serializa e interpreta os exercícios (uma linha JSON por exercício).
+import os         # Manipulação dos caminhos e arquivos das listas.
+import struct     # Cabeçalho binário dos arquivos de índice de posições (ver _CABECALHO_INDICE).
+import sys        # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python listas_exercicios.py converter').
+import threading  # Protege o cache de listas contra acessos simultâneos de várias threads.
+import time       # Mede a duração das leituras e gravações (quando a instrumentação está ativa).
+from array import array  # Posições das linhas dos exercícios (8 bytes por exercício, sem um objeto por posição).
+from collections import OrderedDict  # Mantém a ordem de uso das entradas do cache (política LRU).
+import metricas   # Instrumentação de E/S (ver metricas.py).
+import auxiliar   # Gravação atômica, travas entre processos e caminhos (lidos no momento da chamada).
+from modelos import Exercicio, para_json  # Exercícios em cache como objetos com __slots__ (ver modelos.py).
+
+# --- Formato dos Arquivos de Listas de Exercícios ---
+# Cada lista continua em LISTAS_DE_EXERCICIOS_DIR com o nome de sempre (ex: 'matematica.json'), mas é gravada
+# em formato de acréscimo (JSONL): uma linha de cabeçalho seguida de um exercício por linha.
+#   {"formato": "lista_jsonl", "versao": 1}
+#   {"Tema": "Soma", "Enunciado": "Quanto é 2+2?", ...}
+#   {"Tema": "Soma", "Enunciado": "Quanto é 1+1?", ...}
+# Acrescentar exercícios grava apenas as linhas novas no final do arquivo, sem reescrever a lista.
+# As listas no formato antigo (um vetor JSON) continuam sendo lidas normalmente; a primeira gravação de
+# acréscimo as converte, e o comando 'python listas_exercicios.py converter' converte todas de uma vez.
+# Uma última linha sem quebra de linha (gravação interrompida por uma queda) é ignorada na leitura e
+# descartada antes do próximo acréscimo. Acréscimos e regravações são feitos sob a trava da lista
+# (auxiliar.trava_arquivo); as leituras não usam a trava.
+#
+# As listas lidas ficam em um cache próprio (load_json não interpreta JSONL). Se o arquivo só cresceu desde a
+# última leitura (mesmo inode, mesmo final do trecho já lido), apenas as linhas novas são interpretadas.
+# No cache, cada exercício é um objeto Exercicio (ver modelos.py), com as opções válidas e a resposta correta
+# já calculadas; carrega(somente_leitura=True) retorna esses objetos e carrega() retorna dicionários novos.
+
+# --- Leitura Paginada ---
+# Para mostrar um exercício ou uma página de exercícios sem interpretar a lista inteira, cada lista no formato de
+# acréscimo tem um índice de posições: a posição (em bytes) da linha de cada exercício válido. O índice é construído
+# na primeira abertura e gravado em um arquivo ao lado, no diretório '<diretório das listas>_indices/':
+#   <nome da lista>.idx -> cabeçalho (_CABECALHO_INDICE) + final do trecho indexado + posições (array 'Q')
+# Nas aberturas seguintes o índice só é conferido (inode e final do trecho indexado) e estendido com as linhas
+# acrescentadas desde então; buscar uma página lê e interpreta apenas as linhas dela (ver pagina e exercicio).
+# O índice é só um cache: se não puder ser gravado ou não corresponder mais à lista, ele é refeito.
+# Listas no formato antigo não têm índice e são lidas inteiras (o comando 'converter' as torna pagináveis).
+
+# Cabeçalho que identifica uma lista no formato de acréscimo.
+CABECALHO = {"formato": "lista_jsonl", "versao": 1}
+
+# Quantidade máxima de listas mantidas no cache de leitura (as usadas há mais tempo são descartadas).
+CACHE_LISTAS_MAX = 512
+
+# Quantidade de bytes do final do trecho já lido que são conferidos antes de uma leitura incremental.
+_TAMANHO_CAUDA = 64
+
+# Identificação e cabeçalho dos arquivos de índice de posições:
+# mágica, versão, inode da lista, bytes indexados, quantidade de posições e tamanho do final guardado.
+_MAGICA_INDICE = b"LIDX"
+_VERSAO_INDICE = 1
+_CABECALHO_INDICE = struct.Struct("<4sBQQQB")
+
+_cache = OrderedDict()          # Caminho absoluto -> entrada (ver _le).
+_cache_lock = threading.Lock()  # Trava que protege o cache.
+_indices = OrderedDict()        # Caminho absoluto -> índice de posições (ver _indice).
+
+def _linha(exercicio: dict) -> bytes:
+    """
+    Objetivo: Serializar um exercício como uma linha do arquivo (JSON compacto terminado em quebra de linha).
+
+    Args:
+        exercicio (dict | Exercicio): O exercício.
+
+    Returns:
+        bytes: A linha codificada em UTF-8.
+    """
+    return (json.dumps(exercicio, ensure_ascii=False, separators=(",", ":"), default=para_json) + "\n").encode("utf-8")
+
+def linhas(exercicios: list) -> list:
+    """
+    Objetivo: Serializar exercícios como linhas do arquivo, na forma canônica (a mesma de serializa).
+
+    Args:
+        exercicios (list): Os exercícios.
+
+    Returns:
+        list: Uma linha (bytes) por exercício.
+    """
+    return [_linha(exercicio) for exercicio in exercicios]
+
+def serializa(exercicios: list) -> bytes:
+    """
+    Objetivo: Serializar uma lista inteira no formato de acréscimo (cabeçalho + um exercício por linha).
+    É também a forma canônica usada para calcular o hash do conteúdo no catálogo de listas.
+
+    Args:
+        exercicios (list): Os exercícios.
+
+    Returns:
+        bytes: O conteúdo do arquivo.
+    """
+    return _linha(CABECALHO) + b"".join(linhas(exercicios))
+
+def _interpreta_linhas(conteudo: bytes, exercicios: list) -> int:
+    """
+    Objetivo: Interpretar linhas completas de exercícios, acrescentando-as a 'exercicios'.
+    Linhas inválidas são ignoradas; uma última linha sem quebra de linha não é consumida.
+
+    Args:
+        conteudo (bytes): O trecho do arquivo a ser interpretado (começando no início de uma linha).
+        exercicios (list): A lista que recebe os exercícios interpretados.
+
+    Returns:
+        int: A quantidade de bytes consumidos (até a última quebra de linha).
+    """
+    consumido = conteudo.rfind(b"\n") + 1
+    for linha in conteudo[:consumido].splitlines():
+        if not linha.strip():
+            continue
+        try:
+            exercicios.append(json.loads(linha.decode("utf-8")))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue # Registro corrompido: é descartado.
+    return consumido
+
+def interpreta(conteudo: bytes) -> tuple:
+    """
+    Objetivo: Interpretar o conteúdo de um arquivo de lista, em qualquer um dos dois formatos.
+
+    Args:
+        conteudo (bytes): O conteúdo do arquivo.
+
+    Returns:
+        tuple: (exercícios, bytes consumidos, True se o arquivo está no formato de acréscimo).
+               Um arquivo corrompido no formato antigo resulta em uma lista vazia.
+    """
+    if conteudo.lstrip()[:1] != b"{":
+        # Formato antigo: um único vetor JSON.
+        try:
+            exercicios = json.loads(conteudo.decode("utf-8")) if conteudo.strip() else []
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            exercicios = [] # Lista corrompida: é tratada como vazia, como em load_json.
+        return (exercicios if isinstance(exercicios, list) else []), len(conteudo), False
+    fim_cabecalho = conteudo.find(b"\n") + 1
+    if fim_cabecalho == 0:
+        return [], 0, False # Nem o cabeçalho está completo: a próxima gravação refaz o arquivo inteiro.
+    exercicios = []
+    return exercicios, fim_cabecalho + _interpreta_linhas(conteudo[fim_cabecalho:], exercicios), True
+
+def _modelos(exercicios: list) -> list:
+    """
+    Objetivo: Converter exercícios em novos objetos Exercicio (ver modelos.py): os recém-interpretados ou cópias
+    dos compartilhados (do cache ou de uma gravação pendente). Valores que não são exercícios (dados inválidos)
+    são mantidos como estão.
+
+    Args:
+        exercicios (list): Os exercícios (dicionários ou Exercicio).
+
+    Returns:
+        list: Os exercícios convertidos.
+    """
+    return [Exercicio.from_json(ex) if isinstance(ex, (dict, Exercicio)) else ex for ex in exercicios]
+
+def _cache_guarda(chave: str, entrada: dict, cache: OrderedDict = _cache):
+    """
+    Objetivo: Guardar a entrada de uma lista no cache, descartando as usadas há mais tempo se necessário.
+    Deve ser chamada com _cache_lock obtida.
+
+    Args:
+        chave (str): O caminho absoluto da lista.
+        entrada (dict): A entrada do cache.
+        cache (OrderedDict, optional): O cache (o de exercícios ou o de índices). Padrão para o de exercícios.
+
+    Returns:
+        None
+    """
+    cache[chave] = entrada
+    cache.move_to_end(chave)
+    while len(cache) > CACHE_LISTAS_MAX:
+        cache.popitem(last=False)
+
+def _le(caminho: str) -> dict:
+    """
+    Objetivo: Obter a entrada atualizada de uma lista: do cache, lendo só o trecho acrescentado ou lendo o arquivo inteiro.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        dict: {"exercicios", "inode", "tamanho" (do arquivo), "mtime_ns", "consumido", "cauda", "jsonl"},
+              ou None se o arquivo não existir.
+    """
+    chave = os.path.abspath(caminho)
+    try:
+        st = os.stat(caminho)
+    except FileNotFoundError:
+        with _cache_lock:
+            _cache.pop(chave, None)
+        return None
+    with _cache_lock:
+        entrada = _cache.get(chave)
+        if entrada is not None:
+            _cache.move_to_end(chave)
+    if (entrada is not None and entrada["inode"] == st.st_ino and entrada["tamanho"] == st.st_size
+            and entrada["mtime_ns"] == st.st_mtime_ns
+            and time.time_ns() - st.st_mtime_ns >= auxiliar._JANELA_RECENTE_NS):
+        # Arquivos alterados muito recentemente podem ter sido trocados sem mudar a assinatura: são relidos.
+        if metricas.ATIVO:
+            metricas.registra_leitura(caminho, "cache")
+        return entrada
+
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    incremental = (entrada is not None and entrada["jsonl"] and entrada["inode"] == st.st_ino
+                   and st.st_size >= entrada["consumido"])
+    with open(caminho, 'rb') as f:
+        if incremental:
+            # Só as linhas acrescentadas são lidas, desde que o final do trecho já lido continue igual.
+            f.seek(entrada["consumido"] - len(entrada["cauda"]))
+            conteudo = f.read()
+            incremental = conteudo.startswith(entrada["cauda"])
+        if incremental:
+            novo = conteudo[len(entrada["cauda"]):]
+            acrescentados = []
+            consumido = entrada["consumido"] + _interpreta_linhas(novo, acrescentados)
+            exercicios = entrada["exercicios"] + _modelos(acrescentados)
+            jsonl = True
+        else:
+            f.seek(0)
+            conteudo = f.read()
+            exercicios, consumido, jsonl = interpreta(conteudo)
+            exercicios = _modelos(exercicios)
+            novo = conteudo
+    if metricas.ATIVO:
+        metricas.registra_leitura(caminho, "disco", len(novo), 0.0, time.perf_counter() - inicio)
+
+    if incremental:
+        cauda = (entrada["cauda"] + novo[:consumido - entrada["consumido"]])[-_TAMANHO_CAUDA:]
+    else:
+        cauda = conteudo[max(0, consumido - _TAMANHO_CAUDA):consumido]
+    entrada = {"exercicios": exercicios, "inode": st.st_ino, "tamanho": st.st_size, "mtime_ns": st.st_mtime_ns,
+               "consumido": consumido, "cauda": cauda, "jsonl": jsonl}
+    with _cache_lock:
+        _cache_guarda(chave, entrada)
+    return entrada
+
+def carrega(caminho: str, somente_leitura: bool = False) -> list:
+    """
+    Objetivo: Carregar os exercícios de uma lista (em qualquer um dos dois formatos).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        somente_leitura (bool, optional): Se True, retorna a instância compartilhada do cache (com os
+                                          exercícios como Exercicio), que não deve ser alterada. Padrão para False.
+
+    Returns:
+        list: Os exercícios (dicionários novos), ou uma lista vazia se a lista não existir.
+    """
+    return carrega_com_assinatura(caminho, somente_leitura)[0]
+
+def carrega_com_assinatura(caminho: str, somente_leitura: bool = False) -> tuple:
+    """
+    Objetivo: Carregar os exercícios de uma lista junto com a assinatura do arquivo de onde eles foram lidos
+    (a mesma do catálogo de listas), para identificar a versão carregada sem reler nem recalcular o hash.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        somente_leitura (bool, optional): Como em carrega(). Padrão para False.
+
+    Returns:
+        tuple: (exercícios, assinatura (mtime_ns, tamanho, inode)); a assinatura é None se a lista não existir
+               ou estiver pendente em um bloco 'lote_escrita'.
+    """
+    # Gravações agrupadas (save_json dentro de 'lote_escrita') ainda não feitas têm prioridade sobre o disco.
+    pendente, dados = auxiliar._busca_pendente(caminho)
+    assinatura = None
+    if pendente:
+        exercicios = dados if isinstance(dados, list) else []
+    else:
+        entrada = _le(caminho)
+        exercicios = entrada["exercicios"] if entrada is not None else []
+        if entrada is not None:
+            assinatura = (entrada["mtime_ns"], entrada["tamanho"], entrada["inode"])
+    if somente_leitura:
+        return exercicios, assinatura
+    return [exercicio.to_json() if isinstance(exercicio, Exercicio) else
+            dict(exercicio) if isinstance(exercicio, dict) else exercicio for exercicio in exercicios], assinatura
+
+# --- Leitura Paginada ---
+
+def _indice_path(caminho: str) -> str:
+    """
+    Objetivo: Montar o caminho do arquivo de índice de posições de uma lista (ver o comentário no início do módulo).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        str: O caminho do arquivo de índice.
+    """
+    diretorio, nome = os.path.split(os.path.abspath(caminho))
+    return os.path.join(diretorio + "_indices", nome + ".idx")
+
+def _le_arquivo_indice(caminho: str) -> dict:
+    """
+    Objetivo: Ler o arquivo de índice de posições de uma lista.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        dict: {"inode", "consumido", "cauda", "posicoes"}, ou None se o índice não existir ou for inválido.
+    """
+    try:
+        with open(_indice_path(caminho), 'rb') as f:
+            conteudo = f.read()
+    except OSError:
+        return None
+    tamanho_cabecalho = _CABECALHO_INDICE.size + _TAMANHO_CAUDA
+    if len(conteudo) < tamanho_cabecalho:
+        return None
+    magica, versao, inode, consumido, quantidade, tamanho_cauda = _CABECALHO_INDICE.unpack_from(conteudo)
+    posicoes = array('Q')
+    if (magica != _MAGICA_INDICE or versao != _VERSAO_INDICE or tamanho_cauda > _TAMANHO_CAUDA
+            or len(conteudo) != tamanho_cabecalho + quantidade * posicoes.itemsize):
+        return None # Outro formato ou arquivo incompleto: o índice é refeito.
+    posicoes.frombytes(conteudo[tamanho_cabecalho:])
+    cauda = conteudo[_CABECALHO_INDICE.size:_CABECALHO_INDICE.size + tamanho_cauda]
+    return {"inode": inode, "consumido": consumido, "cauda": cauda, "posicoes": posicoes}
+
+def _grava_arquivo_indice(caminho: str, indice: dict):
+    """
+    Objetivo: Gravar o arquivo de índice de posições de uma lista (de forma atômica).
+    Falhas são ignoradas: o índice é apenas um cache e será refeito na próxima abertura.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        indice (dict): O índice (ver _indice).
+
+    Returns:
+        None
+    """
+    cabecalho = _CABECALHO_INDICE.pack(_MAGICA_INDICE, _VERSAO_INDICE, indice["inode"], indice["consumido"],
+                                       len(indice["posicoes"]), len(indice["cauda"]))
+    conteudo = cabecalho + indice["cauda"].ljust(_TAMANHO_CAUDA, b"\0") + indice["posicoes"].tobytes()
+    caminho_indice = _indice_path(caminho)
+    try:
+        auxiliar._ensure_dir_exists(os.path.dirname(caminho_indice))
+        auxiliar._grava_atomico(caminho_indice, conteudo)
+    except OSError:
+        pass
+
+def _indexa_linhas(conteudo: bytes, base: int, posicoes: array) -> int:
+    """
+    Objetivo: Acrescentar a 'posicoes' a posição de cada linha de exercício válida de um trecho do arquivo.
+    Cada linha é conferida uma única vez (aqui) com as mesmas regras de _interpreta_linhas, para que os
+    índices dos exercícios sejam os mesmos de carrega.
+
+    Args:
+        conteudo (bytes): O trecho do arquivo (começando no início de uma linha).
+        base (int): A posição do trecho no arquivo.
+        posicoes (array): As posições já indexadas, que recebem as novas.
+
+    Returns:
+        int: A quantidade de bytes consumidos (até a última quebra de linha).
+    """
+    consumido = conteudo.rfind(b"\n") + 1
+    inicio_linha = 0
+    while inicio_linha < consumido:
+        fim_linha = conteudo.index(b"\n", inicio_linha) + 1
+        linha = conteudo[inicio_linha:fim_linha]
+        if linha.strip():
+            try:
+                json.loads(linha.decode("utf-8"))
+                posicoes.append(base + inicio_linha)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                pass # Registro corrompido: também é descartado por carrega.
+        inicio_linha = fim_linha
+    return consumido
+
+def _indice(caminho: str, f, st: os.stat_result) -> dict:
+    """
+    Objetivo: Obter o índice de posições atualizado de uma lista aberta: do cache, do arquivo de índice
+    (estendido com as linhas acrescentadas) ou construído lendo a lista.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        f: O arquivo da lista, aberto em modo binário.
+        st (os.stat_result): O os.fstat do arquivo aberto.
+
+    Returns:
+        dict: {"inode", "tamanho", "mtime_ns", "consumido", "cauda", "posicoes", "jsonl"}.
+    """
+    chave = os.path.abspath(caminho)
+    with _cache_lock:
+        indice = _indices.get(chave)
+        if indice is not None:
+            _indices.move_to_end(chave)
+    if (indice is not None and indice["inode"] == st.st_ino and indice["tamanho"] == st.st_size
+            and indice["mtime_ns"] == st.st_mtime_ns
+            and time.time_ns() - st.st_mtime_ns >= auxiliar._JANELA_RECENTE_NS):
+        return indice
+    if indice is None or not indice["jsonl"]:
+        indice = _le_arquivo_indice(caminho)
+
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    incremental = (indice is not None and indice["inode"] == st.st_ino and st.st_size >= indice["consumido"])
+    if incremental:
+        # Conferência em tempo constante: o final do trecho já indexado continua o mesmo.
+        f.seek(indice["consumido"] - len(indice["cauda"]))
+        incremental = f.read(len(indice["cauda"])) == indice["cauda"]
+    if incremental:
+        novo = f.read()
+        posicoes = indice["posicoes"]
+        consumido = indice["consumido"]
+        if len(novo) > 0:
+            posicoes = array('Q', posicoes) # Outras threads podem estar usando o índice anterior.
+            consumido += _indexa_linhas(novo, consumido, posicoes)
+        alterado = consumido != indice["consumido"]
+        cauda = (indice["cauda"] + novo[:consumido - indice["consumido"]])[-_TAMANHO_CAUDA:]
+        jsonl = True
+    else:
+        f.seek(0)
+        novo = f.read()
+        posicoes = array('Q')
+        fim_cabecalho = novo.find(b"\n") + 1
+        jsonl = novo.lstrip()[:1] == b"{" and fim_cabecalho > 0
+        consumido = fim_cabecalho + _indexa_linhas(novo[fim_cabecalho:], fim_cabecalho, posicoes) if jsonl else 0
+        alterado = jsonl
+        cauda = novo[max(0, consumido - _TAMANHO_CAUDA):consumido]
+    if metricas.ATIVO:
+        metricas.registra_leitura(caminho, "disco", len(novo), 0.0, time.perf_counter() - inicio)
+
+    indice = {"inode": st.st_ino, "tamanho": st.st_size, "mtime_ns": st.st_mtime_ns, "consumido": consumido,
+              "cauda": cauda, "posicoes": posicoes, "jsonl": jsonl}
+    if alterado:
+        _grava_arquivo_indice(caminho, indice)
+    with _cache_lock:
+        _cache_guarda(chave, indice, _indices)
+    return indice
+
+def pagina(caminho: str, inicio: int, quantidade: int) -> tuple:
+    """
+    Objetivo: Carregar uma página de exercícios de uma lista, interpretando apenas as linhas da página
+    (ver o comentário da leitura paginada no início do módulo).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        inicio (int): O índice do primeiro exercício da página (a partir de 0).
+        quantidade (int): A quantidade máxima de exercícios da página.
+
+    Returns:
+        tuple: (exercícios da página (novos objetos Exercicio), quantidade total de exercícios da lista).
+    """
+    inicio = max(0, inicio)
+    pendente, dados = auxiliar._busca_pendente(caminho)
+    if pendente:
+        exercicios = dados if isinstance(dados, list) else []
+        return _modelos(exercicios[inicio:inicio + quantidade]), len(exercicios)
+    try:
+        with open(caminho, 'rb') as f:
+            # O índice e as linhas são lidos do mesmo arquivo aberto: uma regravação atômica feita no meio
+            # da leitura não mistura posições de um arquivo com o conteúdo de outro.
+            indice = _indice(caminho, f, os.fstat(f.fileno()))
+            if indice["jsonl"]:
+                posicoes = indice["posicoes"]
+                exercicios = []
+                for posicao in posicoes[inicio:inicio + quantidade]:
+                    f.seek(posicao)
+                    exercicios.append(json.loads(f.readline().decode("utf-8")))
+                return _modelos(exercicios), len(posicoes)
+    except FileNotFoundError:
+        return [], 0
+    # Formato antigo: sem índice de posições, a lista é lida inteira.
+    exercicios = carrega(caminho, somente_leitura=True)
+    return _modelos(exercicios[inicio:inicio + quantidade]), len(exercicios)
+
+def exercicio(caminho: str, indice: int) -> dict:
+    """
+    Objetivo: Carregar um único exercício de uma lista pela sua posição, sem interpretar os demais.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        indice (int): O índice do exercício (a partir de 0).
+
+    Returns:
+        Exercicio: O exercício, ou None se o índice estiver fora da lista.
+    """
+    if indice < 0:
+        return None
+    exercicios, _ = pagina(caminho, indice, 1)
+    return exercicios[0] if exercicios else None
+
+def quantidade(caminho: str) -> int:
+    """
+    Objetivo: Obter a quantidade de exercícios de uma lista sem interpretá-los (pelo índice de posições).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        int: A quantidade de exercícios (0 se a lista não existir).
+    """
+    return pagina(caminho, 0, 0)[1]
+
+def _grava_conteudo(caminho: str, conteudo: bytes):
+    """
+    Objetivo: Substituir o arquivo de uma lista de forma atômica, registrando a gravação nas métricas.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        conteudo (bytes): O conteúdo completo.
+
+    Returns:
+        None
+    """
+    auxiliar._ensure_dir_exists(os.path.dirname(caminho))
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    auxiliar._grava_atomico(caminho, conteudo)
+    if metricas.ATIVO:
+        metricas.registra_gravacao(caminho, len(conteudo), 0.0, time.perf_counter() - inicio)
+
+def grava(caminho: str, exercicios: list):
+    """
+    Objetivo: Gravar uma lista inteira no formato de acréscimo (substituindo o arquivo de forma atômica).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        exercicios (list): Os exercícios.
+
+    Returns:
+        None
+    """
+    with auxiliar.trava_arquivo(caminho):
+        auxiliar.descarrega_escritas(caminho) # Uma gravação agrupada pendente não pode sobrescrever esta depois.
+        try:
+            _grava_conteudo(caminho, serializa(exercicios))
+        except IOError as e:
+            print(f"Erro ao salvar o arquivo {caminho}: {e}")
+
+def acrescenta(caminho: str, exercicios: list) -> list:
+    """
+    Objetivo: Acrescentar exercícios ao final de uma lista (criando-a se necessário), gravando apenas as
+    linhas novas. Uma lista no formato antigo é convertida (regravada uma única vez) antes do acréscimo.
+    O restante da lista não é relido nem copiado: o custo depende só dos exercícios acrescentados
+    (a leitura feita aqui para achar o final da lista é incremental; ver _le).
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+        exercicios (list): Os exercícios a serem acrescentados.
+
+    Returns:
+        list: Apenas os exercícios acrescentados, como gravados (dicionários novos).
+    """
+    novas = linhas(exercicios)
+    conteudo_novo = b"".join(novas)
+    with auxiliar.trava_arquivo(caminho):
+        auxiliar.descarrega_escritas(caminho)
+        entrada = _le(caminho)
+        try:
+            if entrada is None or not entrada["jsonl"]:
+                atuais = entrada["exercicios"] if entrada is not None else []
+                _grava_conteudo(caminho, serializa(atuais) + conteudo_novo)
+            else:
+                inicio = time.perf_counter() if metricas.ATIVO else 0.0
+                with open(caminho, 'r+b') as f:
+                    # Descarta uma última linha incompleta (gravação interrompida) para não emendá-la na nova.
+                    f.truncate(entrada["consumido"])
+                    f.seek(entrada["consumido"])
+                    f.write(conteudo_novo)
+                    auxiliar.fsync_arquivo(f, caminho) # Segue a mesma política de durabilidade de save_json.
+                if metricas.ATIVO:
+                    metricas.registra_gravacao(caminho, len(conteudo_novo), 0.0, time.perf_counter() - inicio)
+        except IOError as e:
+            print(f"Erro ao salvar o arquivo {caminho}: {e}")
+            return []
+        return [json.loads(linha.decode("utf-8")) for linha in novas]
+
+def converte(caminho: str) -> bool:
+    """
+    Objetivo: Converter uma lista do formato antigo (vetor JSON) para o formato de acréscimo.
+
+    Args:
+        caminho (str): O caminho do arquivo da lista.
+
+    Returns:
+        bool: True se a lista foi convertida, False se ela não existe ou já estava no formato de acréscimo.
+    """
+    with auxiliar.trava_arquivo(caminho):
+        auxiliar.descarrega_escritas(caminho)
+        entrada = _le(caminho)
+        if entrada is None or entrada["jsonl"]:
+            return False
+        _grava_conteudo(caminho, serializa(entrada["exercicios"]))
+        return True
+
+def converte_listas() -> dict:
+    """
+    Objetivo: Converter para o formato de acréscimo todas as listas do formato antigo em LISTAS_DE_EXERCICIOS_DIR.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação, uma 'mensagem' descritiva e a quantidade de listas 'convertidas'.
+    """
+    diretorio = auxiliar.LISTAS_DE_EXERCICIOS_DIR
+    if not os.path.isdir(diretorio):
+        return {"status": "aviso", "mensagem": f"Diretório de listas '{diretorio}' não encontrado.", "convertidas": 0}
+    convertidas = sum(1 for nome in sorted(os.listdir(diretorio))
+                      if nome.endswith(".json") and converte(os.path.join(diretorio, nome)))
+    if convertidas == 0:
+        return {"status": "aviso", "mensagem": "Nenhuma lista no formato antigo para converter.", "convertidas": 0}
+    return {"status": "sucesso", "mensagem": f"{convertidas} lista(s) convertida(s) para o formato de acréscimo.",
+            "convertidas": convertidas}
+
+if __name__ == "__main__":
+    # Uso: python listas_exercicios.py converter -> converte todas as listas do formato antigo.
+    if len(sys.argv) > 1 and sys.argv[1] == "converter":
+        print(converte_listas()["mensagem"])
+    else:
+        print("Uso: python listas_exercicios.py converter")
@@ -1,5 +1,8 @@
 import os  # Importa o módulo 'os' para interagir com o sistema operacional (e.g., criar diretórios).
 import sys # Importa o módulo 'sys' para funções relacionadas ao sistema, como 'sys.exit()' para encerrar o programa.
+import argparse  # Leitura das opções da linha de comando (ex: '--batch comandos.jsonl').
+import json      # Impressão dos relatórios do modo em lote.
+import time      # Medição da vazão (comandos por segundo) do modo em lote.
 
 # Importa todas as funções e variáveis diretamente dos módulos auxiliares.
 # Este é o padrão de organização para encapsulamento sem classes no fluxo principal:
@@ -8,6 +11,9 @@ import auxiliar
 import cadastro
 import professor
 import aluno
+import metricas  # Cronômetros das ações dos menus (ver metricas.py); sem custo quando desativados.
+import importacao  # Leitura do arquivo de comandos do modo em lote (JSONL, com erros por linha).
+from modelos import para_json  # Modelos de domínio nos relatórios do modo em lote.
 
 def setup_initial_environment():
     """
@@ -22,13 +28,11 @@ def setup_initial_environment():
     # mas garantir a pasta de listas_de_exercicios explicitamente é bom.
     os.makedirs(auxiliar.LISTAS_DE_EXERCICIOS_DIR, exist_ok=True)
     
-    # Carrega (ou cria se não existirem) os arquivos JSON principais, inicializando-os vazios.
-    # Isso garante que as funções subsequentes não encontrem erros ao tentar acessá-los.
-    auxiliar.load_json(auxiliar.TURMAS_JSON_PATH, {})       # Garante que 'turmas.json' exista e seja um objeto vazio se novo.
-    auxiliar.load_json(auxiliar.USUARIOS_JSON_PATH, {})     # Garante que 'usuarios.json' exista e seja um objeto vazio se novo.
-    auxiliar.load_json(auxiliar.PROGRESO_ALUNOS_JSON_PATH, {}) # Garante que 'progresso_alunos.json' exista e seja um objeto vazio se novo.
+    # Inicializa o backend de armazenamento configurado (arquivos JSON ou banco SQLite).
+    # Isso garante que as funções subsequentes não encontrem erros ao tentar acessar os dados.
+    auxiliar.get_backend().inicializa()
     
-    print("Ambiente de arquivos JSON configurado.")
+    print(f"Ambiente de armazenamento ({auxiliar.BACKEND_ARMAZENAMENTO}) configurado.")
 
 def professor_menu(logged_in_user: dict):
     """
@@ -54,10 +58,14 @@ def professor_menu(logged_in_user: dict):
 
         if choice == '1': # Opção para criar um novo exercício.
             nome_lista = input("Nome do arquivo da lista onde o exercício será adicionado (ex: matematica.json): ")
-            # Constrói o caminho completo para a lista de exercícios.
-            lista_path = os.path.join(auxiliar.LISTAS_DE_EXERCICIOS_DIR, nome_lista)
-            # Carrega a lista existente ou inicializa uma nova lista vazia se o arquivo não existir.
-            exercicios_existente = auxiliar.load_json(lista_path, []) 
+            try:
+                auxiliar.valida_nome_lista(nome_lista)
+            except ValueError as e:
+                print(f"Erro: {e}")
+                continue
+            # Carrega a lista existente ou inicializa uma nova lista vazia se ela não existir.
+            with metricas.cronometro("professor_menu.carrega_lista"):
+                exercicios_existente = auxiliar.get_backend().carrega_lista(nome_lista)
             
             while True: # Loop para permitir adicionar múltiplos exercícios à mesma lista.
                 tema = input("Tema do exercício (ou digite 'sair' para finalizar): ")
@@ -84,7 +92,8 @@ def professor_menu(logged_in_user: dict):
 
                 # Chama a função de criação de exercício do módulo 'professor', passando todos os dados coletados.
                 # Esta função retorna um dicionário de status e mensagem.
-                resultado = professor.cria_exercicio(exercicios_existente, tema, enunciado, alternativas, resposta_correta_letra, nome_lista)
+                with metricas.cronometro("professor_menu.cria_exercicio"):
+                    resultado = professor.cria_exercicio(exercicios_existente, tema, enunciado, alternativas, resposta_correta_letra, nome_lista)
                 
                 # Verifica o status retornado e imprime a mensagem apropriada para o usuário.
                 if resultado["status"] == "sucesso":
@@ -101,7 +110,8 @@ def professor_menu(logged_in_user: dict):
         elif choice == '2': # Opção para criar uma nova turma.
             nome_turma = input("Nome da nova turma: ")
             # Chama a função de criação de turma do módulo 'professor' e imprime o resultado.
-            resultado = professor.cria_turma(nome_turma)
+            with metricas.cronometro("professor_menu.cria_turma"):
+                resultado = professor.cria_turma(nome_turma)
             print(resultado["mensagem"])
 
         elif choice == '3': # Opção para inserir um aluno em uma turma.
@@ -110,7 +120,8 @@ def professor_menu(logged_in_user: dict):
             if matricula_aluno_str.isdigit(): # Valida se a matrícula é numérica.
                 matricula_aluno = int(matricula_aluno_str)
                 # Chama a função de inserção de aluno do módulo 'professor' e imprime o resultado.
-                resultado = professor.insere_aluno(nome_turma, matricula_aluno)
+                with metricas.cronometro("professor_menu.insere_aluno"):
+                    resultado = professor.insere_aluno(nome_turma, matricula_aluno)
                 print(resultado["mensagem"])
             else:
                 print("Matrícula inválida. Por favor, digite apenas números.")
@@ -121,14 +132,16 @@ def professor_menu(logged_in_user: dict):
             if matricula_aluno_str.isdigit(): # Valida se a matrícula é numérica.
                 matricula_aluno = int(matricula_aluno_str)
                 # Chama a função de remoção de aluno do módulo 'professor' e imprime o resultado.
-                resultado = professor.remove_aluno(nome_turma, matricula_aluno)
+                with metricas.cronometro("professor_menu.remove_aluno"):
+                    resultado = professor.remove_aluno(nome_turma, matricula_aluno)
                 print(resultado["mensagem"])
             else:
                 print("Matrícula inválida. Por favor, digite apenas números.")
 
         elif choice == '5': # Opção para visualizar detalhes de uma turma e desempenho.
             # Obtém e exibe as turmas existentes para sugerir ao professor.
-            turmas_existentes = professor.get_turmas_existentes()
+            with metricas.cronometro("professor_menu.get_turmas_existentes"):
+                turmas_existentes = professor.get_turmas_existentes()
             print("\n--- Turmas Existentes ---")
             if turmas_existentes:
                 for nome_turma_existente in turmas_existentes:
@@ -139,7 +152,8 @@ def professor_menu(logged_in_user: dict):
             nome_turma = input("Digite o nome da turma que deseja visualizar: ")
             # Chama a função de visualização de turma do módulo 'professor'.
             # Esta função retorna um dicionário com os detalhes da turma ou uma mensagem de erro.
-            resultado = professor.visualiza_turma(nome_turma)
+            with metricas.cronometro("professor_menu.visualiza_turma"):
+                resultado = professor.visualiza_turma(nome_turma)
             
             # Formata e imprime os detalhes da turma com base no resultado.
             if resultado["status"] == "sucesso":
@@ -157,6 +171,10 @@ def professor_menu(logged_in_user: dict):
                         print(f"\nLista: {lista_detalhe['nome_lista']}")
                         print(f"  Índice de Acerto da Turma: {lista_detalhe['indice_acerto']}")
                         print(f"  {lista_detalhe['msg_acerto']}") # Mensagem detalhada sobre os acertos.
+                        # Acertos por questão, entre os alunos que responderam cada uma.
+                        for questao in lista_detalhe.get("questoes", []):
+                            if questao["respondidas"] > 0:
+                                print(f"  Questão {questao['questao']}: {questao['acertos']} acerto(s) em {questao['respondidas']} resposta(s).")
                 else:
                     print("Nenhuma lista de exercícios associada a esta turma.")
                 print("-" * (len(nome_turma) + 20)) # Linha decorativa.
@@ -165,7 +183,8 @@ def professor_menu(logged_in_user: dict):
 
         elif choice == '6': # Opção para associar uma lista de exercícios a uma turma.
             # Obtém e exibe as turmas existentes para sugestão.
-            turmas_existentes = professor.get_turmas_existentes()
+            with metricas.cronometro("professor_menu.get_turmas_existentes"):
+                turmas_existentes = professor.get_turmas_existentes()
             print("\n--- Turmas Existentes ---")
             if turmas_existentes:
                 for nome_turma_existente in turmas_existentes:
@@ -176,18 +195,22 @@ def professor_menu(logged_in_user: dict):
             nome_turma = input("Nome da turma para associar a lista: ")
 
             # Obtém e exibe as listas de exercícios existentes para sugestão.
-            listas_existentes = professor.get_listas_existentes()
+            # O catálogo traz os metadados de cada lista sem que os arquivos das listas sejam abertos.
+            with metricas.cronometro("professor_menu.get_catalogo_listas"):
+                listas_existentes = professor.get_catalogo_listas()
             print("\n--- Listas de Exercícios Existentes ---")
             if listas_existentes:
-                for lista_nome in listas_existentes:
-                    print(f"- {lista_nome}")
+                for lista_nome, dados_lista in listas_existentes.items():
+                    temas = ", ".join(dados_lista["temas"]) or "sem tema"
+                    print(f"- {lista_nome} ({dados_lista['exercicios']} exercício(s); temas: {temas})")
             else:
                 print("Nenhuma lista de exercícios encontrada. Crie exercícios primeiro.")
 
             nome_lista = input("Nome do arquivo da lista de exercícios (ex: matematica_basica.json): ")
             
             # Chama a função de associar lista do módulo 'professor' e imprime o resultado.
-            resultado = professor.passa_lista(nome_lista, nome_turma)
+            with metricas.cronometro("professor_menu.passa_lista"):
+                resultado = professor.passa_lista(nome_lista, nome_turma)
             print(resultado["mensagem"])
 
         elif choice == '7': # Opção para sair do menu do professor.
@@ -216,10 +239,12 @@ def aluno_menu(logged_in_user: dict):
 
         if choice == '1': # Opção para abrir ou responder uma lista de exercícios.
             # Chama a função 'abrir_lista' do módulo 'aluno', passando a matrícula do aluno logado.
-            aluno.abrir_lista(logged_in_user['matricula'])
+            with metricas.cronometro("aluno_menu.abrir_lista"): # Ação interativa: inclui o tempo de resposta do aluno.
+                aluno.abrir_lista(logged_in_user['matricula'])
         elif choice == '2': # Opção para revisar listas respondidas.
             # Chama a função 'revisar_lista' do módulo 'aluno', passando a matrícula do aluno logado.
-            aluno.revisar_lista(logged_in_user['matricula'])
+            with metricas.cronometro("aluno_menu.revisar_lista"): # Ação interativa: inclui o tempo de resposta do aluno.
+                aluno.revisar_lista(logged_in_user['matricula'])
         elif choice == '3': # Opção para sair do menu do aluno.
             print("Saindo do menu do aluno.")
             break # Sai do loop do menu do aluno.
@@ -256,7 +281,8 @@ def main():
         elif entra == "entrar": # Se o usuário escolheu entrar em uma conta existente.
             matri = input("Digite sua matrícula: ")
             passw = input("Digite sua senha: ")
-            logged_in_user = cadastro.entra_conta(matri, passw) # Tenta logar o usuário.
+            with metricas.cronometro("cadastro.entra_conta"):
+                logged_in_user = cadastro.entra_conta(matri, passw) # Tenta logar o usuário.
         
     # Após o login bem-sucedido, verifica o tipo de usuário e direciona para o menu correspondente.
     if logged_in_user: # Verifica se logged_in_user não é None.
@@ -268,7 +294,137 @@ def main():
             print("Tipo de usuário desconhecido. Encerrando.")
             sys.exit(1) # Encerra o programa com um código de erro.
 
+# --- Modo em Lote (não interativo) ---
+# python main.py --batch comandos.jsonl [--commit-a-cada N]
+# Executa, sem menus, um comando por linha (JSON) diretamente nas funções de negócio, no mesmo processo
+# (o cache de leitura é aproveitado entre os comandos). Cada linha tem a chave 'comando' e os campos dele:
+#   create_user      {"matricula", "nome", "idade", "tipo", "senha" (ou "senha_hash")} -> cadastro.cria_usuarios
+#   create_turma     {"nome"}                                        -> professor.cria_turma
+#   enroll           {"turma", "matricula"} ou {"turma", "matriculas"} -> professor.insere_aluno / insere_alunos
+#   create_exercise  {"lista", "tema", "enunciado", "alternativas", "resposta_correta"} -> professor.cria_exercicio
+#   create_exercises {"lista", "exercicios": [{"tema", "enunciado", "alternativas", "resposta_correta"}, ...]}
+#                                                                    -> professor.cria_exercicios
+#   assign_list      {"turma", "lista"}                              -> professor.passa_lista
+#   submit_answers   {"matricula", "lista", "respostas"}             -> aluno.envia_respostas
+#   report           {"turma"}                                       -> professor.visualiza_turma (impresso em JSON)
+# As gravações dos documentos JSON são agrupadas (auxiliar.lote_escrita) e feitas uma única vez ao final,
+# ou a cada N comandos com --commit-a-cada N. Um comando com erro é relatado e não interrompe o lote.
+# No backend SQLite cada comando continua gravando em sua própria transação.
+
+def _comando_create_exercise(campos: dict) -> dict:
+    """
+    Objetivo: Executar o comando 'create_exercise' (acrescenta um exercício à lista, criando-a se necessário).
+
+    Args:
+        campos (dict): Os campos do comando.
+
+    Returns:
+        dict: O resultado de professor.cria_exercicio (sem a lista atualizada).
+    """
+    # A lista não é carregada: o exercício é só acrescentado ao final dela (ver professor.cria_exercicio).
+    resultado = professor.cria_exercicio([], str(campos["tema"]), str(campos["enunciado"]), list(campos["alternativas"]),
+                                         str(campos["resposta_correta"]), str(campos["lista"]))
+    resultado.pop("lista_atualizada", None)
+    return resultado
+
+# Comandos aceitos pelo modo em lote: nome -> função que recebe os campos e retorna {'status', 'mensagem', ...}.
+COMANDOS_LOTE = {
+    "create_user": lambda campos: cadastro.cria_usuarios([campos]),
+    "create_turma": lambda campos: professor.cria_turma(str(campos["nome"])),
+    "enroll": lambda campos: (professor.insere_alunos(str(campos["turma"]), list(campos["matriculas"])) if "matriculas" in campos
+                              else professor.insere_aluno(str(campos["turma"]), int(campos["matricula"]))),
+    "create_exercise": _comando_create_exercise,
+    "create_exercises": lambda campos: professor.cria_exercicios(str(campos["lista"]), list(campos["exercicios"])),
+    "assign_list": lambda campos: professor.passa_lista(str(campos["lista"]), str(campos["turma"])),
+    "submit_answers": lambda campos: aluno.envia_respostas(int(campos["matricula"]), str(campos["lista"]), campos["respostas"]),
+    "report": lambda campos: professor.visualiza_turma(str(campos["turma"])),
+}
+
+def executa_lote(caminho: str, commit_a_cada: int = 0) -> dict:
+    """
+    Objetivo: Executar os comandos de um arquivo JSONL (modo em lote), sem interação com o usuário.
+
+    Args:
+        caminho (str): O caminho do arquivo de comandos (um objeto JSON por linha).
+        commit_a_cada (int, optional): Se maior que zero, grava as alterações pendentes a cada 'commit_a_cada'
+                                       comandos; com 0 (padrão), uma única vez ao final.
+
+    Returns:
+        dict: Um dicionário com o 'status' ('sucesso', 'aviso' se algum comando falhou, 'erro' se nenhum foi
+              executado), uma 'mensagem', a quantidade de comandos 'executados', os 'erros' ([{'linha', 'mensagem'}]),
+              os 'relatorios' dos comandos 'report' ([{'linha', 'turma', 'resultado'}]), os 'segundos' gastos e
+              os 'comandos_por_segundo'.
+    """
+    comandos, linhas, erros = importacao.le_registros(caminho)
+    relatorios = []
+    executados = 0
+    usuarios_pendentes = [] # (linha, campos) de comandos 'create_user' seguidos, criados juntos.
+
+    def cria_usuarios_pendentes():
+        # Comandos 'create_user' consecutivos viram uma única chamada a cadastro.cria_usuarios:
+        # os hashes das senhas são calculados em paralelo e as contas gravadas de uma vez.
+        nonlocal executados
+        if not usuarios_pendentes:
+            return
+        with metricas.cronometro("lote.create_user"):
+            resultado = cadastro.cria_usuarios([campos for _, campos in usuarios_pendentes])
+        executados += len(usuarios_pendentes)
+        erros.extend({"linha": usuarios_pendentes[erro["registro"] - 1][0], "mensagem": erro["mensagem"]}
+                     for erro in resultado["erros"])
+        usuarios_pendentes.clear()
+
+    inicio = time.perf_counter()
+    with auxiliar.lote_escrita(): # Gravações agrupadas até o final do lote (ou até cada descarrega_escritas).
+        for posicao, (campos, linha) in enumerate(zip(comandos, linhas), start=1):
+            nome = campos.get("comando")
+            if nome == "create_user":
+                usuarios_pendentes.append((linha, campos))
+            else:
+                cria_usuarios_pendentes()
+            if nome not in COMANDOS_LOTE:
+                erros.append({"linha": linha, "mensagem": f"Comando desconhecido: {nome}"})
+            elif nome != "create_user":
+                try:
+                    with metricas.cronometro(f"lote.{nome}"):
+                        resultado = COMANDOS_LOTE[nome](campos)
+                    executados += 1
+                    if resultado.get("status") == "erro":
+                        erros.append({"linha": linha, "mensagem": resultado.get("mensagem", "")})
+                    elif nome == "report":
+                        relatorios.append({"linha": linha, "turma": campos["turma"], "resultado": resultado})
+                except (KeyError, TypeError, ValueError) as e:
+                    erros.append({"linha": linha, "mensagem": f"Campo ausente ou inválido em '{nome}': {e}"})
+            if commit_a_cada > 0 and posicao % commit_a_cada == 0:
+                cria_usuarios_pendentes()
+                auxiliar.descarrega_escritas() # Grava as alterações acumuladas até aqui.
+        cria_usuarios_pendentes()
+    segundos = time.perf_counter() - inicio
+
+    erros.sort(key=lambda erro: erro["linha"])
+    vazao = len(comandos) / segundos if segundos > 0 else 0.0
+    status = "sucesso" if not erros else ("aviso" if executados else "erro")
+    return {"status": status,
+            "mensagem": f"{len(comandos)} comando(s) em {segundos:.2f} s ({vazao:.1f} comandos/s), {len(erros)} erro(s).",
+            "executados": executados, "erros": erros, "relatorios": relatorios,
+            "segundos": segundos, "comandos_por_segundo": vazao}
+
 if __name__ == "__main__":
     # Garante que a função 'main()' seja executada apenas quando o script for rodado diretamente,
     # e não quando for importado como um módulo em outro script (e.g., em testes).
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(prog="python main.py", description="Sistema Educacional de listas de exercícios.")
+    parser.add_argument("--batch", metavar="COMANDOS.jsonl", default=None,
+                        help="Executa os comandos do arquivo (um JSON por linha) sem os menus interativos.")
+    parser.add_argument("--commit-a-cada", dest="commit_a_cada", type=int, default=0,
+                        help="No modo em lote, grava as alterações a cada N comandos (padrão: só ao final).")
+    args = parser.parse_args()
+    if args.batch is None:
+        main()
+    else:
+        setup_initial_environment()
+        resultado = executa_lote(args.batch, args.commit_a_cada)
+        for relatorio in resultado["relatorios"]:
+            print(json.dumps(relatorio, ensure_ascii=False, default=para_json))
+        for erro in resultado["erros"]:
+            print(f"Linha {erro['linha']}: {erro['mensagem']}", file=sys.stderr)
+        print(resultado["mensagem"])
+        sys.exit(0 if resultado["status"] != "erro" else 1)
\ No newline at end of file
@@ -0,0 +1,302 @@
+import atexit     # Grava as métricas em arquivo ao encerrar o programa (se configurado).
+import json
+import os
+import threading  # Os contadores podem ser atualizados por várias threads (ex: gravações agrupadas).
+import time
+from contextlib import contextmanager, nullcontext
+
+# --- Instrumentação de E/S e Latência ---
+# Contadores em memória, consultados por instantaneo() e exportados em JSON ou no formato de texto do Prometheus:
+#   - por arquivo: leituras (do disco, do cache de load_json ou de gravações pendentes), bytes lidos, tempo de
+#     leitura e de interpretação (parse); gravações, gravações agrupadas, bytes gravados, tempo de serialização,
+#     de gravação e de fsync; conflitos de gravações otimistas (auxiliar.atualiza_json);
+#   - por operação (ex: cada ação dos menus em main.py): chamadas, erros, tempo total e máximo.
+# Desativada (padrão), cada ponto instrumentado custa apenas a leitura de metricas.ATIVO.
+# Para ativar: variável de ambiente PROG_MODULAR_METRICAS=1 ou metricas.ativa().
+# Com PROG_MODULAR_METRICAS_ARQUIVO definido, as métricas são gravadas nesse arquivo ao encerrar o programa
+# (formato Prometheus se o nome terminar em '.prom', JSON caso contrário).
+
+ATIVO = os.environ.get("PROG_MODULAR_METRICAS", "") not in ("", "0")
+ARQUIVO_SAIDA = os.environ.get("PROG_MODULAR_METRICAS_ARQUIVO", "")
+
+# Contadores de cada arquivo e seus valores iniciais.
+_CONTADORES_ARQUIVO = {
+    "leituras_disco": 0, "leituras_cache": 0, "leituras_pendentes": 0, "bytes_lidos": 0,
+    "segundos_leitura": 0.0, "segundos_parse": 0.0,
+    "gravacoes": 0, "gravacoes_agrupadas": 0, "bytes_gravados": 0,
+    "segundos_serializacao": 0.0, "segundos_gravacao": 0.0, "fsyncs": 0, "segundos_fsync": 0.0,
+    "conflitos": 0,
+}
+
+_arquivos = {}    # Caminho do arquivo -> contadores (ver _CONTADORES_ARQUIVO).
+_operacoes = {}   # Nome da operação -> {"chamadas", "erros", "segundos_total", "segundos_max"}.
+_lock = threading.Lock()
+_NULO = nullcontext()  # Cronômetro usado quando a instrumentação está desativada (não faz nada).
+
+def ativa():
+    """
+    Objetivo: Ativar a coleta de métricas.
+
+    Returns:
+        None
+    """
+    global ATIVO
+    ATIVO = True
+
+def desativa():
+    """
+    Objetivo: Desativar a coleta de métricas (os contadores já coletados são mantidos).
+
+    Returns:
+        None
+    """
+    global ATIVO
+    ATIVO = False
+
+def zera():
+    """
+    Objetivo: Descartar todos os contadores coletados.
+
+    Returns:
+        None
+    """
+    with _lock:
+        _arquivos.clear()
+        _operacoes.clear()
+
+def _contadores(caminho: str) -> dict:
+    """
+    Objetivo: Retornar os contadores de um arquivo, criando-os se necessário. Deve ser chamada com _lock.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+
+    Returns:
+        dict: Os contadores do arquivo.
+    """
+    contadores = _arquivos.get(caminho)
+    if contadores is None:
+        contadores = _arquivos[caminho] = dict(_CONTADORES_ARQUIVO)
+    return contadores
+
+def registra_leitura(caminho: str, origem: str, bytes_lidos: int = 0, segundos_leitura: float = 0.0, segundos_parse: float = 0.0):
+    """
+    Objetivo: Registrar uma leitura de arquivo.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+        origem (str): "disco", "cache" (cache de load_json) ou "pendentes" (gravação agrupada ainda não feita).
+        bytes_lidos (int, optional): Bytes lidos do disco. Padrão para 0.
+        segundos_leitura (float, optional): Tempo gasto lendo o arquivo. Padrão para 0.0.
+        segundos_parse (float, optional): Tempo gasto interpretando o conteúdo. Padrão para 0.0.
+
+    Returns:
+        None
+    """
+    with _lock:
+        contadores = _contadores(caminho)
+        contadores["leituras_" + origem] += 1
+        contadores["bytes_lidos"] += bytes_lidos
+        contadores["segundos_leitura"] += segundos_leitura
+        contadores["segundos_parse"] += segundos_parse
+
+def registra_gravacao(caminho: str, bytes_gravados: int, segundos_serializacao: float, segundos_gravacao: float):
+    """
+    Objetivo: Registrar uma gravação de arquivo (o tempo de fsync é registrado à parte, por registra_fsync).
+
+    Args:
+        caminho (str): O caminho do arquivo.
+        bytes_gravados (int): Bytes gravados.
+        segundos_serializacao (float): Tempo gasto serializando os dados.
+        segundos_gravacao (float): Tempo gasto gravando (incluindo o fsync, se houver).
+
+    Returns:
+        None
+    """
+    with _lock:
+        contadores = _contadores(caminho)
+        contadores["gravacoes"] += 1
+        contadores["bytes_gravados"] += bytes_gravados
+        contadores["segundos_serializacao"] += segundos_serializacao
+        contadores["segundos_gravacao"] += segundos_gravacao
+
+def registra_gravacao_agrupada(caminho: str):
+    """
+    Objetivo: Registrar uma chamada a save_json que foi agrupada (adiada) em vez de gravada na hora.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+
+    Returns:
+        None
+    """
+    with _lock:
+        _contadores(caminho)["gravacoes_agrupadas"] += 1
+
+def registra_conflito(caminho: str):
+    """
+    Objetivo: Registrar uma gravação otimista descartada porque outro processo alterou o arquivo antes.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+
+    Returns:
+        None
+    """
+    with _lock:
+        _contadores(caminho)["conflitos"] += 1
+
+def registra_fsync(caminho: str, segundos: float):
+    """
+    Objetivo: Registrar uma chamada a fsync.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+        segundos (float): Tempo gasto no fsync.
+
+    Returns:
+        None
+    """
+    with _lock:
+        contadores = _contadores(caminho)
+        contadores["fsyncs"] += 1
+        contadores["segundos_fsync"] += segundos
+
+def registra_operacao(nome: str, segundos: float, erro: bool = False):
+    """
+    Objetivo: Registrar uma execução de uma operação.
+
+    Args:
+        nome (str): O nome da operação (ex: "professor.cria_turma").
+        segundos (float): A duração da execução.
+        erro (bool, optional): Se a execução terminou com exceção. Padrão para False.
+
+    Returns:
+        None
+    """
+    with _lock:
+        operacao = _operacoes.get(nome)
+        if operacao is None:
+            operacao = _operacoes[nome] = {"chamadas": 0, "erros": 0, "segundos_total": 0.0, "segundos_max": 0.0}
+        operacao["chamadas"] += 1
+        operacao["erros"] += 1 if erro else 0
+        operacao["segundos_total"] += segundos
+        operacao["segundos_max"] = max(operacao["segundos_max"], segundos)
+
+@contextmanager
+def _cronometro_ativo(nome: str):
+    """
+    Objetivo: Medir a duração do bloco 'with' e registrá-la como uma execução da operação 'nome'.
+
+    Args:
+        nome (str): O nome da operação.
+    """
+    inicio = time.perf_counter()
+    erro = True
+    try:
+        yield
+        erro = False
+    finally:
+        registra_operacao(nome, time.perf_counter() - inicio, erro)
+
+def cronometro(nome: str):
+    """
+    Objetivo: Retornar um gerenciador de contexto que mede o bloco 'with' como a operação 'nome'.
+    Com a instrumentação desativada, retorna um gerenciador que não faz nada.
+    Ex: with metricas.cronometro("professor.cria_turma"): resultado = professor.cria_turma(nome)
+
+    Args:
+        nome (str): O nome da operação.
+
+    Returns:
+        O gerenciador de contexto.
+    """
+    return _cronometro_ativo(nome) if ATIVO else _NULO
+
+def instantaneo() -> dict:
+    """
+    Objetivo: Retornar uma cópia de todos os contadores coletados.
+
+    Returns:
+        dict: {"ativo": bool, "arquivos": {caminho: contadores}, "operacoes": {nome: contadores}}.
+    """
+    with _lock:
+        return {
+            "ativo": ATIVO,
+            "arquivos": {caminho: dict(contadores) for caminho, contadores in _arquivos.items()},
+            "operacoes": {nome: dict(contadores) for nome, contadores in _operacoes.items()},
+        }
+
+def formata_json() -> str:
+    """
+    Objetivo: Exportar as métricas como texto JSON.
+
+    Returns:
+        str: O documento JSON.
+    """
+    return json.dumps(instantaneo(), ensure_ascii=False, indent=2)
+
+def _rotulo(valor: str) -> str:
+    """
+    Objetivo: Escapar o valor de um rótulo no formato de texto do Prometheus.
+
+    Args:
+        valor (str): O valor do rótulo.
+
+    Returns:
+        str: O valor escapado.
+    """
+    return valor.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def formata_prometheus() -> str:
+    """
+    Objetivo: Exportar as métricas no formato de texto do Prometheus (uma família de métricas por contador).
+
+    Returns:
+        str: O texto no formato de exposição do Prometheus.
+    """
+    dados = instantaneo()
+    linhas = []
+    for contador in _CONTADORES_ARQUIVO:
+        nome = f"prog_modular_arquivo_{contador}_total"
+        linhas.append(f"# TYPE {nome} counter")
+        for caminho, contadores in sorted(dados["arquivos"].items()):
+            linhas.append(f'{nome}{{arquivo="{_rotulo(caminho)}"}} {contadores[contador]}')
+    for contador, tipo in (("chamadas", "counter"), ("erros", "counter"), ("segundos_total", "counter"), ("segundos_max", "gauge")):
+        nome = f"prog_modular_operacao_{contador}" + ("_total" if tipo == "counter" and not contador.endswith("_total") else "")
+        linhas.append(f"# TYPE {nome} {tipo}")
+        for operacao, contadores in sorted(dados["operacoes"].items()):
+            linhas.append(f'{nome}{{operacao="{_rotulo(operacao)}"}} {contadores[contador]}')
+    return "\n".join(linhas) + "\n"
+
+def grava(caminho: str, formato: str = None):
+    """
+    Objetivo: Gravar as métricas em um arquivo local.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+        formato (str, optional): "json" ou "prometheus". Padrão para None (Prometheus se o nome terminar em '.prom').
+
+    Returns:
+        None
+    """
+    if formato is None:
+        formato = "prometheus" if caminho.endswith(".prom") else "json"
+    texto = formata_prometheus() if formato == "prometheus" else formata_json() + "\n"
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(texto)
+
+def _grava_ao_encerrar():
+    """
+    Objetivo: Gravar as métricas em ARQUIVO_SAIDA ao encerrar o programa, se configurado.
+
+    Returns:
+        None
+    """
+    if ARQUIVO_SAIDA and (_arquivos or _operacoes):
+        grava(ARQUIVO_SAIDA)
+
+atexit.register(_grava_ao_encerrar)
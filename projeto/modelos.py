@@ -0,0 +1,334 @@
+from collections.abc import Mapping, MutableMapping  # Os modelos continuam sendo usados como dicionários.
+import sys  # sys.intern: as tuplas de opções válidas são compartilhadas entre os exercícios.
+from respostas import Respostas  # Respostas do progresso com um byte por questão.
+
+# --- Modelos de Domínio ---
+# Os dados lidos do armazenamento (usuários, turmas, exercícios e progresso) são guardados em objetos com
+# __slots__ em vez de dicionários: cada objeto ocupa só os seus atributos (sem a tabela de um dict por registro)
+# e os valores derivados de um exercício (letras das alternativas válidas, resposta correta normalizada e
+# posição dela) são calculados uma única vez, na leitura, em vez de a cada exibição ou correção.
+#
+# Cada modelo também implementa a interface de dicionário com as chaves do JSON de sempre
+# (ex: exercicio['Alternativa A'], usuario['tipo'], turma['alunos']), então o código existente, a comparação
+# com dicionários e a gravação continuam funcionando. from_json cria o modelo a partir do dicionário lido do
+# disco e to_json faz o caminho inverso; chaves desconhecidas são guardadas à parte e gravadas de volta.
+# Um atributo None significa chave ausente (um valor null no JSON não é preservado).
+#
+# Os valores derivados são recalculados quando o modelo é alterado pela interface de dicionário
+# (ex: exercicio['RespostaCorreta'] = 'b'); atribuir diretamente aos atributos não os recalcula.
+
+# Letras das alternativas de um exercício, na ordem das chaves 'Alternativa A', 'Alternativa B', ...
+LETRAS_ALTERNATIVAS = ("a", "b", "c")
+
+# Texto de uma alternativa não preenchida (como nas telas do aluno).
+SEM_ALTERNATIVA = "N/A"
+
+_opcoes_compartilhadas = {} # Tupla de opções válidas -> a mesma tupla (só existem 8 combinações possíveis).
+
+class _Modelo(MutableMapping):
+    """
+    Objetivo: Base dos modelos: interface de dicionário sobre os atributos declarados em _CAMPOS.
+    """
+    __slots__ = ("_extras",)
+
+    # Pares (chave no JSON, atributo), na ordem em que as chaves são gravadas.
+    _CAMPOS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ATRIBUTOS = dict(cls._CAMPOS) # Chave no JSON -> atributo.
+
+    @classmethod
+    def from_json(cls, dados: Mapping):
+        """
+        Objetivo: Criar o modelo a partir do dicionário lido do armazenamento.
+
+        Args:
+            dados (Mapping): O dicionário (ou outro modelo, que é copiado).
+
+        Returns:
+            O modelo.
+        """
+        modelo = cls.__new__(cls)
+        get = dados.get
+        for chave, atributo in cls._CAMPOS:
+            setattr(modelo, atributo, get(chave))
+        modelo._extras = cls._separa_extras(dados)
+        modelo._prepara()
+        return modelo
+
+    @classmethod
+    def de(cls, dados):
+        """
+        Objetivo: Obter o modelo de um registro que pode já ser um modelo (sem copiá-lo) ou um dicionário.
+
+        Args:
+            dados: O modelo ou o dicionário.
+
+        Returns:
+            O próprio modelo, ou um novo criado com from_json.
+        """
+        return dados if isinstance(dados, cls) else cls.from_json(dados)
+
+    @classmethod
+    def _separa_extras(cls, dados: Mapping) -> dict:
+        """
+        Função auxiliar interna (indicado pelo '_').
+        Objetivo: Separar as chaves que não são campos do modelo.
+
+        Args:
+            dados (Mapping): O dicionário lido.
+
+        Returns:
+            dict: Chave -> valor das chaves desconhecidas, ou None se não houver.
+        """
+        atributos = cls._ATRIBUTOS
+        if isinstance(dados, _Modelo):
+            return dict(dados._extras) if dados._extras else None
+        if all(chave in atributos for chave in dados):
+            return None
+        return {chave: valor for chave, valor in dados.items() if chave not in atributos}
+
+    def _prepara(self):
+        """
+        Função auxiliar interna (indicado pelo '_').
+        Objetivo: Calcular os valores derivados dos campos (nada na base).
+        """
+
+    def to_json(self) -> dict:
+        """
+        Objetivo: Obter o dicionário gravado no armazenamento (sem as chaves ausentes).
+
+        Returns:
+            dict: O dicionário com as chaves do JSON.
+        """
+        dados = {}
+        for chave, atributo in self._CAMPOS:
+            valor = getattr(self, atributo)
+            if valor is not None:
+                dados[chave] = valor
+        if self._extras:
+            dados.update(self._extras)
+        return dados
+
+    def __getitem__(self, chave):
+        atributo = self._ATRIBUTOS.get(chave)
+        if atributo is not None:
+            valor = getattr(self, atributo)
+            if valor is not None:
+                return valor
+        elif self._extras and chave in self._extras:
+            return self._extras[chave]
+        raise KeyError(chave)
+
+    def __setitem__(self, chave, valor):
+        atributo = self._ATRIBUTOS.get(chave)
+        if atributo is None:
+            if self._extras is None:
+                self._extras = {}
+            self._extras[chave] = valor
+            return
+        setattr(self, atributo, valor)
+        self._prepara()
+
+    def __delitem__(self, chave):
+        if chave not in self:
+            raise KeyError(chave)
+        atributo = self._ATRIBUTOS.get(chave)
+        if atributo is None:
+            del self._extras[chave]
+            return
+        setattr(self, atributo, None)
+        self._prepara()
+
+    def __iter__(self):
+        for chave, atributo in self._CAMPOS:
+            if getattr(self, atributo) is not None:
+                yield chave
+        if self._extras:
+            yield from list(self._extras)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, chave) -> bool:
+        atributo = self._ATRIBUTOS.get(chave)
+        if atributo is not None:
+            return getattr(self, atributo) is not None
+        return bool(self._extras) and chave in self._extras
+
+    __hash__ = None # Mutável, como um dicionário.
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+    def __reduce__(self):
+        # Permite copiar e serializar com pickle (ex: no cache de load_json) pela forma gravada.
+        return (type(self).from_json, (self.to_json(),))
+
+    def copy(self):
+        """
+        Objetivo: Copiar o modelo (como dict.copy).
+
+        Returns:
+            Um novo modelo com os mesmos dados.
+        """
+        return type(self).from_json(self)
+
+class Exercicio(_Modelo):
+    """
+    Objetivo: Um exercício de uma lista. Além dos campos do JSON, guarda (calculados na leitura):
+      - opcoes: as letras das alternativas preenchidas, em minúsculo (ex: ('a', 'b', 'c'));
+      - resposta: a resposta correta em minúsculo ("" se não definida), como em correcao.gabarito;
+      - indice_resposta: a posição da resposta correta em LETRAS_ALTERNATIVAS, ou None se ela não for
+        uma alternativa preenchida.
+    """
+    __slots__ = ("tema", "enunciado", "alternativa_a", "alternativa_b", "alternativa_c", "resposta_correta",
+                 "opcoes", "resposta", "indice_resposta")
+
+    _CAMPOS = (
+        ("Tema", "tema"),
+        ("Enunciado", "enunciado"),
+        ("Alternativa A", "alternativa_a"),
+        ("Alternativa B", "alternativa_b"),
+        ("Alternativa C", "alternativa_c"),
+        ("RespostaCorreta", "resposta_correta"),
+    )
+
+    @classmethod
+    def from_json(cls, dados: Mapping) -> "Exercicio":
+        # Versão sem laço de from_json: é chamada para cada exercício de cada lista lida.
+        ex = cls.__new__(cls)
+        get = dados.get
+        ex.tema = get("Tema")
+        ex.enunciado = get("Enunciado")
+        ex.alternativa_a = get("Alternativa A")
+        ex.alternativa_b = get("Alternativa B")
+        ex.alternativa_c = get("Alternativa C")
+        ex.resposta_correta = get("RespostaCorreta")
+        ex._extras = cls._separa_extras(dados)
+        ex._prepara()
+        return ex
+
+    def _prepara(self):
+        textos = (self.alternativa_a, self.alternativa_b, self.alternativa_c)
+        opcoes = tuple(letra for letra, texto in zip(LETRAS_ALTERNATIVAS, textos)
+                       if texto is not None and texto != SEM_ALTERNATIVA)
+        self.opcoes = _opcoes_compartilhadas.setdefault(opcoes, opcoes)
+        resposta = "" if self.resposta_correta is None else str(self.resposta_correta).lower()
+        self.resposta = sys.intern(resposta) if len(resposta) == 1 else resposta
+        self.indice_resposta = LETRAS_ALTERNATIVAS.index(resposta) if resposta in self.opcoes else None
+
+    @property
+    def alternativas(self) -> tuple:
+        """
+        Objetivo: Os textos das alternativas A, B e C, com SEM_ALTERNATIVA nas ausentes (como exibidos).
+
+        Returns:
+            tuple: Os três textos.
+        """
+        return tuple(SEM_ALTERNATIVA if texto is None else texto
+                     for texto in (self.alternativa_a, self.alternativa_b, self.alternativa_c))
+
+    def texto_opcao(self, letra: str):
+        """
+        Objetivo: Obter o texto da alternativa de uma letra.
+
+        Args:
+            letra (str): A letra em minúsculo ('a', 'b' ou 'c').
+
+        Returns:
+            str: O texto da alternativa, ou None se a letra não for uma alternativa preenchida.
+        """
+        if letra not in self.opcoes:
+            return None
+        return (self.alternativa_a, self.alternativa_b, self.alternativa_c)[LETRAS_ALTERNATIVAS.index(letra)]
+
+class Usuario(_Modelo):
+    """
+    Objetivo: Um usuário (aluno ou professor), com os campos de usuarios.json.
+    """
+    __slots__ = ("matricula", "nome", "idade", "tipo", "senha")
+
+    _CAMPOS = (
+        ("matricula", "matricula"),
+        ("nome", "nome"),
+        ("idade", "idade"),
+        ("tipo", "tipo"),
+        ("senha", "senha"),
+    )
+
+class Turma(_Modelo):
+    """
+    Objetivo: Uma turma: as matrículas dos alunos e os nomes das listas associadas.
+    """
+    __slots__ = ("alunos", "listas")
+
+    _CAMPOS = (
+        ("alunos", "alunos"),
+        ("listas", "listas"),
+    )
+
+class Progresso(_Modelo):
+    """
+    Objetivo: O progresso de um aluno em uma lista. 'respostas' é sempre uma instância de Respostas;
+    to_json a grava na forma compacta (ver respostas.py).
+    """
+    __slots__ = ("progresso", "respostas", "status")
+
+    _CAMPOS = (
+        ("progresso", "progresso"),
+        ("respostas", "respostas"),
+        ("status", "status"),
+    )
+
+    @classmethod
+    def novo(cls) -> "Progresso":
+        """
+        Objetivo: Criar o progresso de uma lista ainda não iniciada.
+
+        Returns:
+            Progresso: progresso 0, sem respostas e status 'iniciado'.
+        """
+        modelo = cls.__new__(cls)
+        modelo.progresso = 0            # Índice do próximo exercício a ser respondido.
+        modelo.respostas = Respostas()  # Índice do exercício (str) -> letra respondida.
+        modelo.status = 'iniciado'      # 'iniciado' ou 'completo'.
+        modelo._extras = None
+        return modelo
+
+    @classmethod
+    def from_json(cls, dados: Mapping) -> "Progresso":
+        modelo = super().from_json(dados)
+        if modelo.respostas is dados.get("respostas"):
+            modelo.respostas = modelo.respostas.copy() # Já era Respostas: a cópia não compartilha o vetor.
+        return modelo
+
+    def _prepara(self):
+        if not isinstance(self.respostas, Respostas):
+            self.respostas = Respostas(self.respostas) # Dicionário, texto compacto ou ausente (sem respostas).
+
+    def to_json(self) -> dict:
+        dados = super().to_json()
+        dados["respostas"] = self.respostas.serializa()
+        return dados
+
+def para_json(obj):
+    """
+    Objetivo: Converter objetos que o módulo json não conhece (parâmetro 'default' de json.dumps):
+    os modelos pela sua forma gravada e outros mapeamentos (ex: Respostas) como dicionários.
+
+    Args:
+        obj: O objeto a ser convertido.
+
+    Returns:
+        dict: A forma serializável do objeto.
+
+    Raises:
+        TypeError: Se o objeto não for um modelo nem um mapeamento (como no json.dumps padrão).
+    """
+    if isinstance(obj, _Modelo):
+        return obj.to_json()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -1,6 +1,42 @@
-import os  # Importa o módulo 'os' para interagir com o sistema operacional, especialmente para manipulação de caminhos de arquivo.
-from auxiliar import load_json, save_json, TURMAS_JSON_PATH, LISTAS_DE_EXERCICIOS_DIR, USUARIOS_JSON_PATH, PROGRESO_ALUNOS_JSON_PATH
+from auxiliar import get_backend, valida_nome_lista, LISTAS_DE_EXERCICIOS_DIR
 # Importa funções auxiliares e variáveis de caminho de outros módulos para gerenciar dados.
+# Os dados são lidos e gravados pelo backend de armazenamento configurado (get_backend()), com
+# consultas e atualizações pontuais em vez de carregar e regravar todos os dados a cada operação.
+import estatisticas  # Estatísticas de desempenho das turmas, mantidas incrementalmente (ver estatisticas.py).
+from collections.abc import Mapping  # Turmas podem ser dicionários (cache do backend JSON) ou objetos Turma (ver modelos.py).
+
+def _monta_exercicio(tema: str, enunciado: str, alternativas: list, resposta_correta_letra: str) -> tuple:
+    """
+    Objetivo: Validar os dados de um exercício e montar o dicionário gravado na lista.
+
+    Args:
+        tema (str): O tema do exercício.
+        enunciado (str): O enunciado do exercício.
+        alternativas (list): As alternativas (pelo menos 3; são usadas as 3 primeiras).
+        resposta_correta_letra (str): A letra (maiuscula ou minuscula) da alternativa correta.
+
+    Returns:
+        tuple: (exercício, None) se os dados forem válidos, ou (None, mensagem de erro).
+    """
+    # Valida se há pelo menos 3 alternativas fornecidas, conforme a regra de negócio.
+    if len(alternativas) < 3:
+        return None, "São necessárias pelo menos 3 alternativas."
+
+    # Valida se a letra da resposta correta é uma das opções válidas ('A', 'B', 'C').
+    if resposta_correta_letra.upper() not in ('A', 'B', 'C'):
+        return None, "Letra da alternativa correta inválida. Digite A, B ou C."
+
+    # Cria um novo dicionário representando o exercício, com todas as informações fornecidas.
+    return {
+        'Tema': tema,
+        'Enunciado': enunciado,
+        'Alternativa A': alternativas[0],
+        'Alternativa B': alternativas[1],
+        'Alternativa C': alternativas[2],
+        # Salva a letra em minúsculo ('a', 'b', 'c') para garantir consistência na comparação
+        # posterior com as respostas dos alunos (que são salvas em minúsculo).
+        'RespostaCorreta': resposta_correta_letra.lower()
+    }, None
 
 def cria_exercicio(exercicios_lista: list, tema: str, enunciado: str, alternativas: list, resposta_correta_letra: str, nome_lista_json: str) -> dict:
     """
@@ -10,7 +46,10 @@ def cria_exercicio(exercicios_lista: list, tema: str, enunciado: str, alternativ
 
     Args:
         exercicios_lista (list): A lista de dicionários de exercícios à qual o novo exercício será adicionado.
-                                 Esta lista é normalmente carregada do arquivo JSON existente pelo 'main.py'.
+                                 Esta lista é normalmente carregada do arquivo JSON existente pelo 'main.py'
+                                 (ou vazia, se o chamador não precisar dela) e recebe o exercício como gravado.
+                                 A lista gravada não é relida: exercícios acrescentados por outros processos
+                                 não aparecem nela.
         tema (str): O tema do exercício (ex: "Matemática", "História").
         enunciado (str): O enunciado completo do exercício.
         alternativas (list): Uma lista contendo as strings das alternativas disponíveis (ex: ["Opção A", "Opção B", "Opção C"]).
@@ -24,40 +63,70 @@ def cria_exercicio(exercicios_lista: list, tema: str, enunciado: str, alternativ
         dict: Um dicionário contendo o 'status' da operação ("sucesso" ou "erro"),
               uma 'mensagem' descritiva do resultado, e opcionalmente a 'lista_atualizada'.
     """
-    # Valida se há pelo menos 3 alternativas fornecidas, conforme a regra de negócio.
-    if len(alternativas) < 3:
-        return {"status": "erro", "mensagem": "São necessárias pelo menos 3 alternativas."}
+    # O nome da lista vira um nome de arquivo: nomes com diretórios (ex: '../usuarios.json') são recusados.
+    try:
+        valida_nome_lista(nome_lista_json)
+    except ValueError as e:
+        return {"status": "erro", "mensagem": str(e)}
 
-    # Valida se a letra da resposta correta é uma das opções válidas ('A', 'B', 'C').
-    if resposta_correta_letra.upper() not in ('A', 'B', 'C'):
-        return {"status": "erro", "mensagem": "Letra da alternativa correta inválida. Digite A, B ou C."}
+    novo_exercicio, erro = _monta_exercicio(tema, enunciado, alternativas, resposta_correta_letra)
+    if erro is not None:
+        return {"status": "erro", "mensagem": erro}
 
-    # Transforma a letra da resposta correta para minúsculo para garantir consistência
-    # na comparação posterior com as respostas dos alunos (que são salvas em minúsculo).
-    resposta_correta_para_salvar = resposta_correta_letra.lower()
-    
-    # Cria um novo dicionário representando o exercício, com todas as informações fornecidas.
-    novo_exercicio = {
-        'Tema': tema,
-        'Enunciado': enunciado,
-        'Alternativa A': alternativas[0],
-        'Alternativa B': alternativas[1],
-        'Alternativa C': alternativas[2],
-        'RespostaCorreta': resposta_correta_para_salvar # Salva a letra ('a', 'b', 'c') como resposta correta.
-    }
-    
-    # Adiciona o novo exercício à lista de exercícios que foi passada (que pode estar vazia ou já ter exercícios).
-    exercicios_lista.append(novo_exercicio)
+    # Acrescenta o novo exercício à lista gravada no backend de armazenamento (no backend JSON, uma linha
+    # no final do arquivo em LISTAS_DE_EXERCICIOS_DIR, sem regravar a lista). O exercício é acrescentado à
+    # versão mais recente da lista, então exercícios criados ao mesmo tempo por outro processo não são perdidos.
+    acrescentados = get_backend().acrescenta_exercicio(nome_lista_json, novo_exercicio)
 
-    # Constrói o caminho completo do arquivo JSON onde a lista de exercícios será salva/atualizada.
-    output_path = os.path.join(LISTAS_DE_EXERCICIOS_DIR, nome_lista_json)
-    
-    # Salva a lista de exercícios atualizada no arquivo JSON.
-    save_json(exercicios_lista, output_path)
+    # Acrescenta o exercício gravado à lista que foi passada (sem copiar a lista inteira).
+    exercicios_lista.extend(acrescentados)
 
     # Retorna um dicionário de sucesso, indicando que a operação foi bem-sucedida.
     return {"status": "sucesso", "mensagem": f"Exercício '{tema}' adicionado e lista '{nome_lista_json}' atualizada.", "lista_atualizada": exercicios_lista}
 
+def cria_exercicios(nome_lista_json: str, exercicios: list) -> dict:
+    """
+    Objetivo: Criar vários exercícios em uma lista de uma só vez (ex: um banco de questões preparado em arquivo).
+    Todos os exercícios são validados antes; os válidos são acrescentados juntos, com uma única gravação
+    (no backend JSON, apenas as linhas novas no final da lista), e os inválidos são relatados um a um.
+
+    Args:
+        nome_lista_json (str): O nome do arquivo da lista (criada se ainda não existir).
+        exercicios (list): Dicionários com 'tema', 'enunciado', 'alternativas' e 'resposta_correta' (a letra).
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação ("sucesso", "aviso" se parte dos exercícios falhou, ou "erro"),
+              uma 'mensagem' descritiva, a quantidade de 'criados', o 'total' de exercícios da lista e os 'erros'
+              ([{'registro': posição (1, 2, ...) na entrada, 'mensagem'}]).
+    """
+    try:
+        valida_nome_lista(nome_lista_json) # Ver cria_exercicio.
+    except ValueError as e:
+        return {"status": "erro", "mensagem": str(e), "criados": 0, "total": 0, "erros": []}
+
+    erros = []
+    validos = []
+    for posicao, dados in enumerate(exercicios, start=1):
+        try:
+            novo_exercicio, erro = _monta_exercicio(str(dados["tema"]), str(dados["enunciado"]),
+                                                    list(dados["alternativas"]), str(dados["resposta_correta"]))
+        except (KeyError, TypeError) as e:
+            novo_exercicio, erro = None, f"Exercício incompleto ou malformado: {e}"
+        if erro is not None:
+            erros.append({"registro": posicao, "mensagem": erro})
+        else:
+            validos.append(novo_exercicio)
+
+    backend = get_backend()
+    if validos:
+        backend.acrescenta_exercicios(nome_lista_json, validos)
+    # Total pelo índice de posições da lista (sem interpretar os exercícios; ver carrega_pagina_lista).
+    total = backend.carrega_pagina_lista(nome_lista_json, 0, 0)[1] if validos else 0
+    status = "sucesso" if not erros else ("aviso" if validos else "erro")
+    return {"status": status,
+            "mensagem": f"{len(validos)} exercício(s) adicionado(s) à lista '{nome_lista_json}', {len(erros)} erro(s).",
+            "criados": len(validos), "total": total, "erros": erros}
+
 def cria_turma(nome_turma: str) -> dict:
     """
     Objetivo: Criar uma nova turma no sistema.
@@ -70,20 +139,11 @@ def cria_turma(nome_turma: str) -> dict:
         dict: Um dicionário com o 'status' da operação ("sucesso" ou "erro")
               e uma 'mensagem' descritiva do resultado.
     """
-    # Carrega os dados de todas as turmas existentes.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
-    
-    # Verifica se o nome da turma já existe no sistema.
-    if nome_turma in turmas_data:
+    # Tenta criar a turma, inicializada com listas vazias para alunos e listas de exercícios.
+    # O backend informa se o nome da turma já existia no sistema.
+    if not get_backend().cria_turma(nome_turma):
         return {"status": "erro", "mensagem": f"A turma '{nome_turma}' já existe."}
     else:
-        # Se a turma não existe, cria uma nova entrada no dicionário de turmas.
-        # Inicializa a turma com listas vazias para alunos e listas de exercícios.
-        turmas_data[nome_turma] = {"alunos": [], "listas": []}
-        
-        # Salva o dicionário de turmas atualizado de volta no arquivo JSON.
-        save_json(turmas_data, TURMAS_JSON_PATH)
-        
         # Retorna um dicionário de sucesso.
         return {"status": "sucesso", "mensagem": f"Turma '{nome_turma}' criada com sucesso."}
 
@@ -100,37 +160,95 @@ def insere_aluno(nome_turma: str, matricula: int) -> dict:
         dict: Um dicionário com o 'status' da operação ("sucesso", "erro" ou "aviso")
               e uma 'mensagem' descritiva do resultado.
     """
-    # Carrega os dados de todas as turmas e de todos os usuários.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
-    usuarios_data = load_json(USUARIOS_JSON_PATH, {})
+    backend = get_backend()
+    # Busca a turma e o usuário pela chave, sem carregar as demais turmas e usuários.
+    dados_turma = backend.busca_turma(nome_turma, somente_leitura=True)
 
     # Verifica se a turma especificada existe.
-    if nome_turma not in turmas_data:
+    if dados_turma is None:
         return {"status": "erro", "mensagem": f"Turma '{nome_turma}' não encontrada."}
     
     # Valida se a matrícula corresponde a um usuário existente e se esse usuário é do tipo 'aluno'.
-    matricula_str = str(matricula) # Matrículas são chaves como strings no USUARIOS_JSON_PATH.
-    if matricula_str not in usuarios_data or usuarios_data[matricula_str].get('tipo') != 'aluno':
+    usuario = backend.busca_usuario(str(matricula)) # Matrículas são chaves como strings no armazenamento de usuários.
+    if usuario is None or usuario.get('tipo') != 'aluno':
         return {"status": "erro", "mensagem": f"Matrícula {matricula} não encontrada ou não corresponde a um aluno cadastrado."}
     
     # Garante que a estrutura da turma é válida (dicionário com chaves 'alunos' e 'listas').
     # Isso lida com possíveis inconsistências em dados antigos ou malformados, tentando corrigi-los.
-    if not isinstance(turmas_data[nome_turma], dict) or "alunos" not in turmas_data[nome_turma]:
-        turmas_data[nome_turma] = {"alunos": [], "listas": []}
-        save_json(turmas_data, TURMAS_JSON_PATH) # Salva a correção na estrutura da turma.
+    if not isinstance(dados_turma, Mapping) or "alunos" not in dados_turma:
+        backend.salva_turma(nome_turma, {"alunos": [], "listas": []}) # Salva a correção na estrutura da turma.
         return {"status": "aviso", "mensagem": f"Aviso: Estrutura da turma '{nome_turma}' inválida. Tentando corrigir e inserir aluno."}
 
-    # Verifica se o aluno já está matriculado na turma.
-    if matricula in turmas_data[nome_turma]["alunos"]:
+    # Adiciona a matrícula do aluno à turma; o backend informa se o aluno já estava matriculado.
+    if not backend.adiciona_aluno_turma(nome_turma, matricula):
         return {"status": "erro", "mensagem": f"Matrícula {matricula} já existe na turma '{nome_turma}'."}
     else:
-        # Adiciona a matrícula do aluno à lista de alunos da turma.
-        turmas_data[nome_turma]["alunos"].append(matricula)
-        # Salva os dados de turmas atualizados.
-        save_json(turmas_data, TURMAS_JSON_PATH)
+        # Inclui nas estatísticas da turma o progresso que o aluno já tenha nas listas dela.
+        estatisticas.aluno_inserido(nome_turma, matricula)
         # Retorna um dicionário de sucesso.
         return {"status": "sucesso", "mensagem": f"Aluno com matrícula {matricula} inserido na turma '{nome_turma}'."}
 
+def insere_alunos(nome_turma: str, matriculas: list) -> dict:
+    """
+    Objetivo: Inserir vários alunos em uma turma de uma só vez (ex: matrícula do semestre a partir de um arquivo).
+    Todas as matrículas são validadas antes; as válidas são gravadas juntas e as inválidas são relatadas
+    uma a uma, sem interromper as demais.
+
+    Args:
+        nome_turma (str): O nome da turma onde os alunos serão inseridos.
+        matriculas (list): As matrículas dos alunos (inteiros ou strings numéricas).
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação ("sucesso", "aviso" se parte das matrículas falhou, ou "erro"),
+              uma 'mensagem' descritiva, a quantidade de 'inseridos' e os 'erros' ([{'registro': posição (1, 2, ...)
+              na lista de matrículas, 'matricula', 'mensagem'}]).
+    """
+    backend = get_backend()
+    dados_turma = backend.busca_turma(nome_turma, somente_leitura=True)
+    if dados_turma is None or not isinstance(dados_turma, Mapping) or "alunos" not in dados_turma:
+        return {"status": "erro", "mensagem": f"Turma '{nome_turma}' não encontrada.", "inseridos": 0, "erros": []}
+
+    # Validação: matrícula numérica, de um aluno cadastrado (usuários buscados de uma vez) e não repetida na entrada.
+    erros = []
+    validas = [] # (posição, matrícula)
+    numericas = {}
+    for posicao, matricula in enumerate(matriculas, start=1):
+        if str(matricula).strip().isdigit():
+            numericas[posicao] = int(str(matricula).strip())
+        else:
+            erros.append({"registro": posicao, "matricula": matricula, "mensagem": f"Matrícula '{matricula}' inválida."})
+    usuarios = backend.busca_usuarios(list(numericas.values()))
+    vistas = set()
+    for posicao, matricula in numericas.items():
+        usuario = usuarios.get(str(matricula))
+        if usuario is None or usuario.get('tipo') != 'aluno':
+            mensagem = f"Matrícula {matricula} não encontrada ou não corresponde a um aluno cadastrado."
+        elif matricula in vistas:
+            mensagem = f"Matrícula {matricula} repetida na entrada."
+        else:
+            vistas.add(matricula)
+            validas.append((posicao, matricula))
+            continue
+        erros.append({"registro": posicao, "matricula": matricula, "mensagem": mensagem})
+
+    # Aplicação: uma única gravação da turma; o backend informa quem já estava matriculado.
+    inseridos = []
+    resultados = backend.adiciona_alunos_turma(nome_turma, [matricula for _, matricula in validas]) if validas else []
+    for (posicao, matricula), inserido in zip(validas, resultados):
+        if inserido:
+            inseridos.append(matricula)
+        else:
+            erros.append({"registro": posicao, "matricula": matricula,
+                          "mensagem": f"Matrícula {matricula} já existe na turma '{nome_turma}'."})
+    # Inclui nas estatísticas da turma o progresso que os alunos já tenham nas listas dela.
+    estatisticas.alunos_inseridos(nome_turma, inseridos)
+
+    erros.sort(key=lambda erro: erro["registro"])
+    status = "sucesso" if not erros else ("aviso" if inseridos else "erro")
+    return {"status": status,
+            "mensagem": f"{len(inseridos)} aluno(s) inserido(s) na turma '{nome_turma}', {len(erros)} erro(s).",
+            "inseridos": len(inseridos), "erros": erros}
+
 def remove_aluno(nome_turma: str, matricula: int) -> dict:
     """
     Objetivo: Remover um aluno de uma turma específica.
@@ -144,25 +262,24 @@ def remove_aluno(nome_turma: str, matricula: int) -> dict:
         dict: Um dicionário com o 'status' da operação ("sucesso" ou "erro")
               e uma 'mensagem' descritiva do resultado.
     """
-    # Carrega os dados de todas as turmas.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
+    backend = get_backend()
+    # Busca apenas a turma afetada.
+    dados_turma = backend.busca_turma(nome_turma, somente_leitura=True)
 
     # Verifica se a turma especificada existe.
-    if nome_turma not in turmas_data:
+    if dados_turma is None:
         return {"status": "erro", "mensagem": f"Turma '{nome_turma}' não encontrada."}
     
     # Garante que a estrutura da turma é válida para permitir a remoção de alunos.
-    if not isinstance(turmas_data[nome_turma], dict) or "alunos" not in turmas_data[nome_turma]:
+    if not isinstance(dados_turma, Mapping) or "alunos" not in dados_turma:
         return {"status": "erro", "mensagem": f"Aviso: Estrutura da turma '{nome_turma}' inválida. Alunos não podem ser removidos."}
 
-    # Verifica se o aluno está realmente na turma.
-    if matricula not in turmas_data[nome_turma]["alunos"]:
+    # Remove a matrícula do aluno da turma; o backend informa se o aluno não estava na turma.
+    if not backend.remove_aluno_turma(nome_turma, matricula):
         return {"status": "erro", "mensagem": f"A matrícula {matricula} não está na turma '{nome_turma}'."}
     else:
-        # Remove a matrícula do aluno da lista de alunos da turma.
-        turmas_data[nome_turma]["alunos"].remove(matricula)
-        # Salva os dados de turmas atualizados.
-        save_json(turmas_data, TURMAS_JSON_PATH)
+        # Retira das estatísticas da turma a contribuição do aluno removido.
+        estatisticas.aluno_removido(nome_turma, matricula)
         # Retorna um dicionário de sucesso.
         return {"status": "sucesso", "mensagem": f"Aluno com matrícula {matricula} removido da turma '{nome_turma}'."}
 
@@ -174,9 +291,8 @@ def get_turmas_existentes() -> list:
     Returns:
         list: Uma lista de strings, onde cada string é o nome de uma turma existente.
     """
-    # Carrega os dados de todas as turmas e retorna as chaves (nomes das turmas) como uma lista.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
-    return list(turmas_data.keys())
+    # Retorna os nomes das turmas registradas no backend de armazenamento.
+    return get_backend().lista_turmas()
 
 def get_listas_existentes() -> list:
     """
@@ -186,9 +302,20 @@ def get_listas_existentes() -> list:
     Returns:
         list: Uma lista de strings, onde cada string é o nome de um arquivo JSON de lista de exercícios.
     """
-    # Lista todos os arquivos no diretório de listas de exercícios e filtra os que terminam com '.json'.
-    # Isso assume que todos os JSONs neste diretório são listas de exercícios válidas.
-    return [f for f in os.listdir(LISTAS_DE_EXERCICIOS_DIR) if f.endswith(".json")]
+    # Retorna os nomes das listas registradas no backend de armazenamento
+    # (no backend JSON, os arquivos '.json' do diretório de listas de exercícios).
+    return get_backend().nomes_listas()
+
+def get_catalogo_listas() -> dict:
+    """
+    Objetivo: Fornecer os metadados de todas as listas de exercícios (quantidade de exercícios, temas,
+    tamanho e hash do conteúdo), lidos do catálogo de listas do backend, sem abrir cada lista.
+    Usada pelos menus que mostram as listas para escolha.
+
+    Returns:
+        dict: Nome da lista -> {"tamanho", "exercicios", "temas", "hash", "modificado", ...}.
+    """
+    return get_backend().catalogo_listas(somente_leitura=True)
 
 def visualiza_turma(nome_turma: str) -> dict:
     """
@@ -204,20 +331,19 @@ def visualiza_turma(nome_turma: str) -> dict:
               e os detalhes da turma (nome, lista de alunos, e lista de listas com estatísticas de acerto),
               ou uma mensagem de erro se a turma não for encontrada.
     """
-    # Carrega os dados de turmas, usuários (para nomes de alunos) e progresso de alunos.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
-    usuarios_data = load_json(USUARIOS_JSON_PATH, {})
-    progresso_alunos_data = load_json(PROGRESO_ALUNOS_JSON_PATH, {})
+    backend = get_backend()
+    # Busca apenas a turma consultada. Esta função apenas consulta os dados (sem cópia).
+    dados_turma = backend.busca_turma(nome_turma, somente_leitura=True)
 
     # Verifica se a turma especificada existe.
-    if nome_turma not in turmas_data:
+    if dados_turma is None:
         return {"status": "erro", "mensagem": f"Erro: Turma '{nome_turma}' não encontrada."}
 
-    dados_turma = turmas_data[nome_turma]
-    
     # --- Detalhes dos Alunos na Turma ---
     alunos_na_turma_detalhes = []
     alunos_na_turma_ids = dados_turma.get("alunos", []) # Obtém a lista de matrículas de alunos na turma.
+    # Carrega apenas os usuários desta turma (para nomes de alunos).
+    usuarios_data = backend.busca_usuarios(alunos_na_turma_ids)
     if alunos_na_turma_ids:
         for matricula in alunos_na_turma_ids:
             # Para cada matrícula, busca o nome do aluno no USUARIOS_JSON_PATH.
@@ -230,44 +356,30 @@ def visualiza_turma(nome_turma: str) -> dict:
     listas_da_turma_nomes = dados_turma.get("listas", []) # Obtém os nomes dos arquivos das listas associadas à turma.
     
     if listas_da_turma_nomes:
+        # O catálogo informa a quantidade de exercícios de cada lista sem abrir os arquivos das listas.
+        catalogo = backend.catalogo_listas(somente_leitura=True)
         for nome_lista in listas_da_turma_nomes:
             # Inicializa um dicionário para os detalhes de cada lista.
-            lista_detalhe = {"nome_lista": nome_lista, "indice_acerto": "N/A", "msg_acerto": "", "num_alunos_contribuintes": 0}
-            
-            # Carrega os exercícios da lista específica para obter as respostas corretas.
-            lista_full_path = os.path.join(LISTAS_DE_EXERCICIOS_DIR, nome_lista)
-            exercicios_da_lista = load_json(lista_full_path, [])
+            lista_detalhe = {"nome_lista": nome_lista, "indice_acerto": "N/A", "msg_acerto": "", "num_alunos_contribuintes": 0, "questoes": []}
             
             # Se a lista de exercícios estiver vazia, adiciona uma mensagem e continua para a próxima lista.
-            if not exercicios_da_lista:
+            if not catalogo.get(nome_lista, {}).get("exercicios"):
                 lista_detalhe["msg_acerto"] = "(Lista vazia ou não carregada)"
                 listas_associadas_detalhes.append(lista_detalhe)
                 continue
 
-            total_acertos_geral = 0 # Contador para o total de acertos em todas as respostas da turma para esta lista.
-            total_respostas_contabilizadas_geral = 0 # Contador para o total de respostas válidas (questões com resp. correta definida) dadas.
-            total_alunos_que_responderam = 0 # Contador de alunos que contribuíram com respostas.
-
-            # Itera sobre cada aluno na turma para somar seus acertos na lista.
-            for matricula_aluno in alunos_na_turma_ids:
-                matricula_str = str(matricula_aluno)
-                # Obtém o progresso específico do aluno para esta lista.
-                aluno_progresso = progresso_alunos_data.get(matricula_str, {}).get(nome_lista, {})
-                
-                # Considera apenas os alunos que iniciaram ou completaram a lista.
-                if aluno_progresso.get('status') == 'completo' or aluno_progresso.get('progresso', 0) > 0:
-                    total_alunos_que_responderam += 1
-                    respostas_dadas_aluno = aluno_progresso.get('respostas', {})
-                    
-                    # Itera sobre cada exercício da lista para comparar com as respostas do aluno.
-                    for idx_ex, ex_data in enumerate(exercicios_da_lista):
-                        resp_correta = ex_data.get('RespostaCorreta', '').lower()
-                        # Só contabiliza se a questão tiver uma resposta correta definida no JSON.
-                        if resp_correta:
-                            total_respostas_contabilizadas_geral += 1
-                            resp_dada = respostas_dadas_aluno.get(str(idx_ex), '').lower() # Resposta do aluno para esta questão.
-                            if resp_dada == resp_correta: # Compara a resposta do aluno (letra) com a correta (letra).
-                                total_acertos_geral += 1
+            # Os contadores de acertos são mantidos incrementalmente a cada resposta dos alunos (ver estatisticas.py)
+            # e identificados pelo hash da lista, então não é preciso carregar a lista nem percorrer os alunos da turma.
+            estatisticas_da_lista = estatisticas.estatisticas_lista(nome_turma, nome_lista)
+            total_acertos_geral = estatisticas_da_lista["acertos"] # Total de acertos da turma nesta lista.
+            total_alunos_que_responderam = estatisticas_da_lista["alunos_contribuintes"] # Alunos que contribuíram com respostas.
+            # Cada aluno contribuinte conta uma resposta válida por questão com resposta correta definida.
+            total_respostas_contabilizadas_geral = total_alunos_que_responderam * estatisticas_da_lista["questoes_com_gabarito"]
+            # Acertos por questão (número da questão, respostas dadas e acertos).
+            lista_detalhe["questoes"] = [
+                {"questao": idx_ex + 1, "respondidas": contadores["respondidas"], "acertos": contadores["acertos"]}
+                for idx_ex, contadores in enumerate(estatisticas_da_lista["questoes"])
+            ]
 
             # Calcula o índice de acerto da turma para esta lista, se houver respostas contabilizadas.
             if total_respostas_contabilizadas_geral > 0:
@@ -303,31 +415,31 @@ def passa_lista(nome_lista_json: str, turma: str) -> dict:
         dict: Um dicionário com o 'status' da operação ("sucesso", "erro" ou "aviso")
               e uma 'mensagem' descritiva do resultado.
     """
-    # Carrega os dados de todas as turmas.
-    turmas_data = load_json(TURMAS_JSON_PATH, {})
+    try:
+        valida_nome_lista(nome_lista_json) # Ver cria_exercicio.
+    except ValueError as e:
+        return {"status": "erro", "mensagem": str(e)}
+
+    backend = get_backend()
+    # Busca apenas a turma afetada.
+    dados_turma = backend.busca_turma(turma, somente_leitura=True)
 
     # Verifica se a turma especificada existe.
-    if turma not in turmas_data:
+    if dados_turma is None:
         return {"status": "erro", "mensagem": f"Turma '{turma}' não encontrada."}
 
-    # Constrói o caminho completo para o arquivo da lista e verifica se ele existe no diretório.
-    lista_full_path = os.path.join(LISTAS_DE_EXERCICIOS_DIR, nome_lista_json)
-    if not os.path.exists(lista_full_path):
+    # Verifica se a lista de exercícios existe no backend (no backend JSON, o arquivo no diretório de listas).
+    if not backend.lista_existe(nome_lista_json):
         return {"status": "erro", "mensagem": f"O arquivo de lista de exercícios '{nome_lista_json}' não foi encontrado no diretório '{LISTAS_DE_EXERCICIOS_DIR}'."}
 
     # Garante que a estrutura da turma é válida para associar listas.
-    if not isinstance(turmas_data[turma], dict) or "listas" not in turmas_data[turma]:
-        turmas_data[turma] = {"alunos": [], "listas": []}
-        save_json(turmas_data, TURMAS_JSON_PATH) # Salva a correção na estrutura da turma.
+    if not isinstance(dados_turma, Mapping) or "listas" not in dados_turma:
+        backend.salva_turma(turma, {"alunos": [], "listas": []}) # Salva a correção na estrutura da turma.
         return {"status": "aviso", "mensagem": f"Aviso: Estrutura da turma '{turma}' inválida. Tentando corrigir e associar lista."}
 
-    # Verifica se a lista já está associada à turma.
-    if nome_lista_json in turmas_data[turma]["listas"]:
+    # Associa a lista à turma; o backend informa se a lista já estava associada.
+    if not backend.adiciona_lista_turma(turma, nome_lista_json):
         return {"status": "erro", "mensagem": f"A lista '{nome_lista_json}' já está associada à turma '{turma}'."}
     else:
-        # Adiciona o nome da lista à lista de listas da turma.
-        turmas_data[turma]["listas"].append(nome_lista_json)
-        # Salva os dados de turmas atualizados.
-        save_json(turmas_data, TURMAS_JSON_PATH)
         # Retorna um dicionário de sucesso.
         return {"status": "sucesso", "mensagem": f"Lista '{nome_lista_json}' associada com sucesso à turma '{turma}'."}
\ No newline at end of file
@@ -0,0 +1,457 @@
+import json  # Importa o módulo 'json' para serializar os registros do diário (journal) de progresso.
+import os    # Importa o módulo 'os' para manipular os caminhos e arquivos do diário.
+import sys   # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python progresso.py migrar').
+import time  # Mede a duração das gravações no diário (quando a instrumentação está ativa).
+import metricas  # Instrumentação de E/S (ver metricas.py).
+from respostas import Respostas  # Respostas com um byte por questão em memória e um caractere no disco.
+from modelos import Progresso   # Progresso de um aluno em uma lista (objeto com __slots__; ver modelos.py).
+import auxiliar  # Os caminhos são lidos de 'auxiliar' no momento da chamada (e não copiados na importação),
+                 # para que alterações em auxiliar.PROGRESO_ALUNOS_JSON_PATH (ex: nos testes) sejam respeitadas.
+
+# --- Armazenamento do Progresso dos Alunos, Particionado por Aluno ---
+# O progresso de cada aluno fica em seus próprios arquivos, agrupados em "baldes" por hash da matrícula:
+#   json/progresso_alunos/<balde>/<matricula>.json   -> snapshot (nome da lista -> dados do progresso)
+#   json/progresso_alunos/<balde>/<matricula>.jsonl  -> diário com os eventos ainda não compactados
+# Ler ou gravar o progresso de um aluno custa proporcionalmente aos dados desse aluno, e não da escola inteira.
+#
+# Cada resposta, parada, volta, conclusão ou reinício é acrescentado ao diário do aluno como uma linha JSON.
+# Ao carregar, o diário é reaplicado sobre o snapshot; quando ele passa de JOURNAL_MAX_BYTES,
+# é compactado no snapshot. Os eventos apenas atribuem valores (nunca acumulam), então reaplicar
+# um evento já contido no snapshot (ex: após uma falha durante a compactação) não altera o resultado.
+# Gravações e compactações do diário de um aluno são feitas sob a trava dele (auxiliar.trava_arquivo),
+# então vários processos podem registrar eventos ao mesmo tempo; as leituras não usam a trava.
+#
+# O arquivo monolítico antigo 'progresso_alunos.json' (com seu diário 'progresso_alunos.jsonl') ainda é lido
+# para alunos que não têm partição própria. O comando 'python progresso.py migrar' divide-o nas partições.
+#
+# Os dados de cada lista são carregados como um objeto Progresso (ver modelos.py) e as respostas como um objeto
+# Respostas (ver respostas.py); ambos se comportam como os dicionários de sempre (respostas: índice -> letra).
+# As respostas são gravadas nos snapshots na forma compacta (ex: "respostas": "ba.c").
+# Snapshots e diários com as respostas no formato de dicionário continuam sendo lidos normalmente.
+
+# Tamanho (em bytes) a partir do qual o diário de um aluno é compactado automaticamente no snapshot dele.
+JOURNAL_MAX_BYTES = 16 * 1024
+
+# Quantidade de baldes (subdiretórios) usados para distribuir os arquivos dos alunos.
+NUM_BALDES = 256
+
+# Eventos aceitos pelo diário.
+EVENTOS_VALIDOS = ("resposta", "parar", "voltar", "completo", "reinicio", "envio")
+
+def _progresso_dir() -> str:
+    """
+    Objetivo: Retornar o diretório das partições de progresso, derivado do caminho do arquivo monolítico.
+    Ex: 'json/progresso_alunos.json' -> 'json/progresso_alunos/'.
+
+    Returns:
+        str: O caminho do diretório das partições.
+    """
+    return os.path.splitext(auxiliar.PROGRESO_ALUNOS_JSON_PATH)[0]
+
+def _shard_path(matricula_str: str) -> str:
+    """
+    Objetivo: Retornar o caminho do snapshot de progresso de um aluno.
+
+    Args:
+        matricula_str (str): A matrícula do aluno (como string).
+
+    Returns:
+        str: O caminho do arquivo, ex: 'json/progresso_alunos/3f/1234567.json'.
+    """
+    balde = auxiliar.calcula_balde(matricula_str, NUM_BALDES)
+    return os.path.join(_progresso_dir(), balde, matricula_str + ".json")
+
+def _journal_path(snapshot_path: str) -> str:
+    """
+    Objetivo: Retornar o caminho do diário correspondente a um snapshot ('.json' -> '.jsonl').
+
+    Args:
+        snapshot_path (str): O caminho do snapshot.
+
+    Returns:
+        str: O caminho do arquivo de diário.
+    """
+    return os.path.splitext(snapshot_path)[0] + ".jsonl"
+
+def _compactando_path(snapshot_path: str) -> str:
+    """
+    Objetivo: Retornar o caminho para onde o diário é movido durante uma compactação.
+    Se o programa for interrompido no meio da compactação, este arquivo ainda é reaplicado na leitura.
+
+    Args:
+        snapshot_path (str): O caminho do snapshot.
+
+    Returns:
+        str: O caminho do diário em compactação.
+    """
+    return _journal_path(snapshot_path) + ".compactando"
+
+def _decodifica(progresso_aluno: dict) -> dict:
+    """
+    Objetivo: Converter os dados de cada lista do progresso de um aluno para Progresso (ver modelos.py),
+    com as respostas como Respostas (ver respostas.py).
+
+    Args:
+        progresso_aluno (dict): O progresso do aluno (nome da lista -> dados), como lido do disco.
+
+    Returns:
+        dict: Um novo dicionário de progresso (o original não é alterado; as respostas são copiadas).
+    """
+    return {nome_lista: Progresso.from_json(dados) for nome_lista, dados in progresso_aluno.items()}
+
+def _codifica(progresso_aluno: dict) -> dict:
+    """
+    Objetivo: Preparar o progresso de um aluno para ser gravado, com as respostas na forma compacta.
+
+    Args:
+        progresso_aluno (dict): O progresso do aluno (nome da lista -> dados).
+
+    Returns:
+        dict: Um novo dicionário de progresso, pronto para save_json.
+    """
+    return {nome_lista: Progresso.de(dados).to_json() for nome_lista, dados in progresso_aluno.items()}
+
+def _respostas(dados_lista: dict) -> Respostas:
+    """
+    Objetivo: Obter as respostas de uma lista do progresso como Respostas, convertendo-as no lugar se necessário.
+
+    Args:
+        dados_lista (dict): Os dados do progresso do aluno em uma lista.
+
+    Returns:
+        Respostas: As respostas (a mesma instância guardada em 'dados_lista').
+    """
+    respostas = dados_lista.get('respostas')
+    if not isinstance(respostas, Respostas):
+        respostas = dados_lista['respostas'] = Respostas(respostas)
+    return respostas
+
+def _aplica_evento(progresso_aluno: dict, evento: dict):
+    """
+    Objetivo: Aplicar um único evento do diário sobre o progresso de um aluno (alterando-o no lugar).
+
+    Args:
+        progresso_aluno (dict): O progresso do aluno (nome da lista -> dados).
+        evento (dict): O registro do diário, com as chaves 'matricula', 'lista', 'evento' e,
+                       conforme o tipo, 'indice', 'resposta', 'respostas' e 'progresso'.
+
+    Returns:
+        None: A função altera 'progresso_aluno' diretamente.
+    """
+    # Inicializa a estrutura da lista do mesmo jeito que aluno.responder_lista faz.
+    dados_lista = progresso_aluno.get(evento["lista"])
+    if dados_lista is None:
+        dados_lista = progresso_aluno[evento["lista"]] = Progresso.novo()
+
+    tipo = evento["evento"]
+    if tipo == "resposta":
+        _respostas(dados_lista)[str(evento["indice"])] = evento["resposta"]
+        dados_lista['progresso'] = evento["progresso"]
+    elif tipo in ("parar", "voltar"):
+        dados_lista['progresso'] = evento["progresso"]
+    elif tipo == "completo":
+        dados_lista['status'] = 'completo'
+    elif tipo == "reinicio":
+        dados_lista['progresso'] = 0
+        dados_lista['respostas'] = Respostas()
+        dados_lista['status'] = 'iniciado'
+    elif tipo == "envio":
+        # Lista inteira enviada de uma vez (ver aluno.envia_respostas): substitui as respostas e conclui a lista.
+        # No diário, as respostas do envio podem estar na forma compacta ou como dicionário.
+        dados_lista['respostas'] = Respostas(evento["respostas"])
+        dados_lista['progresso'] = evento["progresso"]
+        dados_lista['status'] = 'completo'
+
+def _le_diario(caminho: str) -> list:
+    """
+    Objetivo: Ler os eventos de um arquivo de diário.
+    Linhas inválidas (ex: a última linha cortada por uma queda do programa) são ignoradas.
+
+    Args:
+        caminho (str): O caminho do arquivo de diário.
+
+    Returns:
+        list: A lista de eventos (dicionários), na ordem em que foram gravados.
+    """
+    if not os.path.exists(caminho):
+        return []
+    eventos = []
+    inicio = time.perf_counter() if metricas.ATIVO else 0.0
+    with open(caminho, 'r', encoding='utf-8') as f:
+        for linha in f:
+            try:
+                eventos.append(json.loads(linha))
+            except json.JSONDecodeError:
+                continue # Registro incompleto: é descartado.
+        if metricas.ATIVO:
+            metricas.registra_leitura(caminho, "disco", f.tell(), 0.0, time.perf_counter() - inicio)
+    return eventos
+
+def _diarios_pendentes(snapshot_path: str) -> list:
+    """
+    Objetivo: Listar os diários com eventos ainda não compactados para um snapshot, na ordem de reaplicação.
+
+    Args:
+        snapshot_path (str): O caminho do snapshot.
+
+    Returns:
+        list: Os caminhos dos diários não vazios (primeiro o que está em compactação, depois o atual).
+    """
+    candidatos = (_compactando_path(snapshot_path), _journal_path(snapshot_path))
+    return [p for p in candidatos if os.path.exists(p) and os.path.getsize(p) > 0]
+
+# --- Arquivo Monolítico Antigo ---
+
+def _carrega_monolitico() -> dict:
+    """
+    Objetivo: Carregar o progresso do formato antigo (um único 'progresso_alunos.json' + seu diário).
+
+    Returns:
+        dict: O progresso no formato matrícula -> nome da lista -> dados.
+    """
+    snapshot_path = auxiliar.PROGRESO_ALUNOS_JSON_PATH
+    diarios = _diarios_pendentes(snapshot_path)
+    if not diarios:
+        return auxiliar.load_json(snapshot_path, {}, somente_leitura=True)
+
+    progresso_alunos_data = auxiliar.load_json(snapshot_path, {})
+    for caminho in diarios:
+        for evento in _le_diario(caminho):
+            _aplica_evento(progresso_alunos_data.setdefault(evento["matricula"], {}), evento)
+    return progresso_alunos_data
+
+def _tem_particao(matricula_str: str) -> bool:
+    """
+    Objetivo: Verificar se o aluno já tem snapshot ou diário no formato particionado.
+
+    Args:
+        matricula_str (str): A matrícula do aluno (como string).
+
+    Returns:
+        bool: True se existir algum arquivo de progresso particionado para o aluno.
+    """
+    snapshot_path = _shard_path(matricula_str)
+    return os.path.exists(snapshot_path) or bool(_diarios_pendentes(snapshot_path))
+
+# --- Leitura e Gravação do Progresso ---
+
+def carrega_progresso_aluno(matricula_aluno: int, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de um único aluno (snapshot + eventos do diário dele).
+
+    Args:
+        matricula_aluno (int): A matrícula do aluno.
+        somente_leitura (bool, optional): Se True, pode retornar a instância compartilhada do cache de
+                                          load_json, que não deve ser alterada. Padrão para False.
+
+    Returns:
+        dict: O progresso do aluno no formato nome da lista -> dados do progresso ({} se não houver).
+    """
+    matricula_str = str(matricula_aluno)
+    # Alunos ainda não migrados continuam sendo lidos do arquivo monolítico.
+    if not _tem_particao(matricula_str):
+        return _decodifica(_carrega_monolitico().get(matricula_str, {}))
+
+    snapshot_path = _shard_path(matricula_str)
+    while True:
+        versao = auxiliar.versao_json(snapshot_path)
+        diarios = _diarios_pendentes(snapshot_path)
+        # O snapshot do cache não é alterado: _decodifica monta um novo dicionário com as respostas convertidas,
+        # sobre o qual os eventos pendentes (se houver) são reaplicados.
+        progresso_aluno = _decodifica(auxiliar.load_json(snapshot_path, {}, somente_leitura=True))
+        for caminho in diarios:
+            for evento in _le_diario(caminho):
+                _aplica_evento(progresso_aluno, evento)
+        # A leitura não espera pela trava do aluno: se outro processo compactou o diário no meio dela
+        # (o snapshot mudou), alguns eventos podem ter sido lidos de nenhum dos lugares, então ela é refeita.
+        if auxiliar.versao_json(snapshot_path) == versao:
+            return progresso_aluno
+
+def carrega_progresso_alunos(matriculas: list, somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de um conjunto de alunos (ex: os alunos de uma turma).
+
+    Args:
+        matriculas (list): As matrículas dos alunos.
+        somente_leitura (bool, optional): Repassado para carrega_progresso_aluno. Padrão para False.
+
+    Returns:
+        dict: O progresso no formato matrícula (string) -> nome da lista -> dados.
+    """
+    return {str(m): carrega_progresso_aluno(m, somente_leitura=somente_leitura) for m in matriculas}
+
+def carrega_progresso(somente_leitura: bool = False) -> dict:
+    """
+    Objetivo: Carregar o progresso de TODOS os alunos (partições + arquivo monolítico antigo).
+    Custa proporcionalmente ao tamanho da escola; prefira carrega_progresso_aluno/carrega_progresso_alunos.
+
+    Args:
+        somente_leitura (bool, optional): Repassado para as leituras individuais. Padrão para False.
+
+    Returns:
+        dict: O progresso no formato matrícula (string) -> nome da lista -> dados.
+    """
+    matriculas = set(_carrega_monolitico().keys())
+    base = _progresso_dir()
+    if os.path.isdir(base):
+        for balde in os.listdir(base):
+            for nome_arquivo in os.listdir(os.path.join(base, balde)):
+                if nome_arquivo.endswith((".json", ".jsonl")):
+                    matriculas.add(nome_arquivo.split(".", 1)[0])
+    return carrega_progresso_alunos(sorted(matriculas), somente_leitura=somente_leitura)
+
+def _garante_particao(matricula_str: str):
+    """
+    Objetivo: Criar a partição de um aluno que ainda só tem progresso no arquivo monolítico,
+    copiando os dados dele. Sem isso, o primeiro evento gravado na partição esconderia o progresso antigo.
+
+    Args:
+        matricula_str (str): A matrícula do aluno (como string).
+
+    Returns:
+        None
+    """
+    if _tem_particao(matricula_str):
+        return
+    # Chamada sob a trava do aluno (ver registra_evento), então apenas um processo cria a partição.
+    progresso_antigo = _carrega_monolitico().get(matricula_str)
+    if progresso_antigo:
+        # A partição precisa estar em disco antes do primeiro evento ser acrescentado ao diário dela.
+        auxiliar.save_json(_codifica(progresso_antigo), _shard_path(matricula_str))
+        auxiliar.descarrega_escritas(_shard_path(matricula_str))
+
+def registra_evento(matricula_aluno: int, nome_lista_json: str, evento: str, **campos):
+    """
+    Objetivo: Acrescentar um evento de progresso ao diário do aluno (uma linha JSON), sem reescrever snapshots.
+    Se o diário do aluno ultrapassar JOURNAL_MAX_BYTES, ele é compactado em seguida.
+
+    Args:
+        matricula_aluno (int): A matrícula do aluno.
+        nome_lista_json (str): O nome do arquivo da lista de exercícios.
+        evento (str): O tipo do evento ('resposta', 'parar', 'voltar', 'completo', 'reinicio' ou 'envio').
+        **campos: Os dados do evento: 'indice' e 'resposta' (para 'resposta'), 'respostas' (para 'envio')
+                  e 'progresso' (para 'resposta', 'parar', 'voltar' e 'envio').
+
+    Returns:
+        None
+    """
+    if evento not in EVENTOS_VALIDOS:
+        raise ValueError(f"Evento de progresso desconhecido: {evento}")
+
+    matricula_str = str(matricula_aluno)
+    registro = {"matricula": matricula_str, "lista": nome_lista_json, "evento": evento}
+    registro.update(campos)
+    if "respostas" in registro:
+        registro["respostas"] = Respostas(registro["respostas"]).serializa() # Envio: um caractere por questão.
+    # Cada evento é gravado com uma única escrita em modo de acréscimo ('a'), então o custo
+    # não depende da quantidade de alunos nem do tamanho do snapshot.
+    linha = json.dumps(registro, ensure_ascii=False) + "\n"
+    snapshot_path = _shard_path(matricula_str)
+    caminho = _journal_path(snapshot_path)
+
+    # A trava do aluno impede que outro processo renomeie o diário (compactação) entre a abertura e a escrita,
+    # o que faria o evento cair em um diário já incorporado ao snapshot. Outros alunos não são bloqueados.
+    with auxiliar.trava_arquivo(snapshot_path):
+        _garante_particao(matricula_str)
+        auxiliar._ensure_dir_exists(os.path.dirname(caminho))
+        inicio = time.perf_counter() if metricas.ATIVO else 0.0
+        try:
+            with open(caminho, 'a', encoding='utf-8') as f:
+                f.write(linha)
+                auxiliar.fsync_arquivo(f) # Segue a mesma política de durabilidade de save_json.
+                tamanho = f.tell()
+            if metricas.ATIVO:
+                metricas.registra_gravacao(caminho, len(linha.encode('utf-8')), 0.0, time.perf_counter() - inicio)
+        except IOError as e:
+            print(f"Erro ao salvar o progresso em {caminho}: {e}")
+            return
+
+        if tamanho >= JOURNAL_MAX_BYTES:
+            compacta_progresso(matricula_aluno)
+
+def compacta_progresso(matricula_aluno: int = None):
+    """
+    Objetivo: Incorporar os eventos do diário ao snapshot de um aluno e descartar o diário.
+    O diário é primeiro renomeado, para que novos eventos passem a ser gravados em um diário novo
+    enquanto a compactação acontece.
+
+    Args:
+        matricula_aluno (int, optional): A matrícula do aluno. Se None, compacta todos os alunos.
+
+    Returns:
+        None
+    """
+    if matricula_aluno is None:
+        for matricula_str in carrega_progresso(somente_leitura=True):
+            if _tem_particao(matricula_str):
+                compacta_progresso(matricula_str)
+        return
+
+    snapshot_path = _shard_path(str(matricula_aluno))
+    diario = _journal_path(snapshot_path)
+    compactando = _compactando_path(snapshot_path)
+    # A compactação é feita sob a trava do aluno (a mesma de registra_evento); as leituras não esperam por ela.
+    with auxiliar.trava_arquivo(snapshot_path):
+        # Se uma compactação anterior foi interrompida, seu arquivo ainda está pendente e é reaproveitado.
+        if os.path.exists(diario) and not os.path.exists(compactando):
+            os.replace(diario, compactando)
+        if not os.path.exists(compactando):
+            return # Nada a compactar.
+
+        progresso_aluno = _decodifica(auxiliar.load_json(snapshot_path, {}, somente_leitura=True))
+        for evento in _le_diario(compactando):
+            _aplica_evento(progresso_aluno, evento)
+        auxiliar.save_json(_codifica(progresso_aluno), snapshot_path)
+        # O snapshot precisa estar em disco (mesmo com gravações agrupadas) antes de o diário ser descartado.
+        auxiliar.descarrega_escritas(snapshot_path)
+        os.remove(compactando)
+
+def migra_progresso_monolitico() -> dict:
+    """
+    Objetivo: Dividir o arquivo monolítico 'progresso_alunos.json' (e seu diário) em partições por aluno.
+    Para alunos que já têm partição, apenas as listas ausentes nela são copiadas (a partição é mais recente).
+    Ao final, o arquivo antigo é renomeado para '<nome>.migrado' e o diário antigo é removido.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva do resultado.
+    """
+    snapshot_path = auxiliar.PROGRESO_ALUNOS_JSON_PATH
+    progresso_alunos_data = _carrega_monolitico()
+    if not progresso_alunos_data:
+        return {"status": "aviso", "mensagem": "Nenhum progresso no formato antigo para migrar."}
+
+    for matricula_str, progresso_antigo in progresso_alunos_data.items():
+        shard_path = _shard_path(matricula_str)
+        # Sob a trava do aluno (a mesma de registra_evento e compacta_progresso), para que um evento registrado
+        # ao mesmo tempo (que pode criar a partição) não se perca entre a leitura e a gravação da partição.
+        with auxiliar.trava_arquivo(shard_path):
+            if _tem_particao(matricula_str):
+                compacta_progresso(matricula_str)
+                progresso_aluno = auxiliar.load_json(shard_path, {})
+                for nome_lista, dados in progresso_antigo.items():
+                    progresso_aluno.setdefault(nome_lista, dados)
+            else:
+                progresso_aluno = progresso_antigo
+            auxiliar.save_json(_codifica(progresso_aluno), shard_path)
+            # A partição precisa estar em disco antes de a trava ser liberada e antes de o arquivo antigo sair do lugar.
+            auxiliar.descarrega_escritas(shard_path)
+
+    # O arquivo antigo é preservado (renomeado) como cópia de segurança; o diário antigo já foi incorporado.
+    if os.path.exists(snapshot_path):
+        os.replace(snapshot_path, snapshot_path + ".migrado")
+    for caminho in (_compactando_path(snapshot_path), _journal_path(snapshot_path)):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    return {"status": "sucesso", "mensagem": f"Progresso de {len(progresso_alunos_data)} aluno(s) migrado para '{_progresso_dir()}'."}
+
+if __name__ == "__main__":
+    # Uso: python progresso.py migrar   -> divide o progresso_alunos.json em partições por aluno.
+    #      python progresso.py compactar -> incorpora todos os diários aos snapshots.
+    comando = sys.argv[1] if len(sys.argv) > 1 else ""
+    if comando == "migrar":
+        print(migra_progresso_monolitico()["mensagem"])
+    elif comando == "compactar":
+        compacta_progresso()
+        print("Diários de progresso compactados.")
+    else:
+        print("Uso: python progresso.py [migrar|compactar]")
@@ -0,0 +1,205 @@
+from collections.abc import Mapping, MutableMapping  # Interface de dicionário implementada por Respostas.
+
+# --- Representação Compacta das Respostas de um Aluno ---
+# As respostas de um aluno em uma lista continuam sendo acessadas como um dicionário
+# (índice do exercício como string -> letra, ex: respostas["0"] == "b"), mas são guardadas em um bytearray
+# com um byte por questão, no mesmo código do motor de correção ('a' -> 1, 'b' -> 2, ...; 0 = não respondida).
+# Assim uma lista longa ocupa um byte por questão em memória, em vez de uma chave e um valor (objetos str)
+# por resposta, e a correção (correcao.codifica_respostas) usa os bytes diretamente.
+#
+# No disco (snapshots de progresso; ver progresso.py) as respostas são gravadas como um texto com um caractere
+# por questão, com NAO_RESPONDIDA nas questões sem resposta:
+#   {"progresso": 4, "respostas": "ba.c", "status": "iniciado"}  (antes: {"0": "b", "1": "a", "3": "c"})
+# Valores que não cabem no formato (ex: dados antigos com uma letra maiúscula ou um texto qualquer como
+# resposta) são mantidos à parte, sem perda, e nesse caso as respostas são gravadas no formato de dicionário.
+
+# Caractere das questões não respondidas no formato serializado.
+NAO_RESPONDIDA = "."
+
+# Quantidade máxima de questões guardadas no vetor; índices maiores (dados inválidos) ficam à parte.
+MAX_QUESTOES = 1 << 20
+
+_LETRAS = "abcdefghijklmnopqrstuvwxyz"
+
+# Tabelas de conversão entre o vetor de códigos e o texto serializado (feitas com bytes.translate).
+_CARACTERES = (NAO_RESPONDIDA + _LETRAS).encode("ascii")
+_PARA_TEXTO = bytes.maketrans(bytes(range(len(_CARACTERES))), _CARACTERES)
+_PARA_CODIGOS = bytes.maketrans(_CARACTERES, bytes(range(len(_CARACTERES))))
+
+def _posicao(chave) -> int:
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Obter a posição no vetor correspondente a uma chave ('0', '1', ...).
+
+    Args:
+        chave: A chave (índice do exercício como string).
+
+    Returns:
+        int: A posição, ou None se a chave não for um índice na forma canônica (ex: '01', 'x' ou 0).
+    """
+    if (isinstance(chave, str) and chave.isascii() and chave.isdigit()
+            and (len(chave) == 1 or chave[0] != "0") and len(chave) <= 7):
+        posicao = int(chave)
+        return posicao if posicao < MAX_QUESTOES else None
+    return None
+
+def _codigo(letra) -> int:
+    """
+    Função auxiliar interna (indicado pelo '_').
+    Objetivo: Obter o código de uma letra de resposta ('a' -> 1, ..., 'z' -> 26).
+
+    Args:
+        letra: A resposta.
+
+    Returns:
+        int: O código, ou 0 se a resposta não for uma única letra minúscula (e precisar ficar à parte).
+    """
+    if isinstance(letra, str) and len(letra) == 1 and "a" <= letra <= "z":
+        return ord(letra) - 96
+    return 0
+
+class Respostas(MutableMapping):
+    """
+    Objetivo: Guardar as respostas de um aluno em uma lista (índice do exercício como string -> letra)
+    com um byte por questão. Ver o comentário no início do módulo.
+    """
+    __slots__ = ("_codigos", "_extras")
+
+    def __init__(self, dados=None):
+        """
+        Objetivo: Criar as respostas a partir de outro conjunto de respostas.
+
+        Args:
+            dados (optional): O texto serializado (ver serializa), um dicionário índice -> letra, uma lista de
+                              letras (formato antigo) ou outra instância de Respostas (que é copiada).
+
+        Raises:
+            ValueError: Se o texto serializado tiver caracteres que não são letras minúsculas ou NAO_RESPONDIDA.
+        """
+        self._codigos = bytearray() # Código da resposta de cada questão (0 = não respondida).
+        self._extras = None         # Respostas que não cabem no vetor (chave -> valor), ou None se não houver.
+        if dados is None:
+            return
+        if isinstance(dados, Respostas):
+            self._codigos = bytearray(dados._codigos)
+            self._extras = dict(dados._extras) if dados._extras else None
+        elif isinstance(dados, str):
+            texto = dados.encode("ascii", errors="replace")
+            if texto.translate(None, _CARACTERES):
+                raise ValueError(f"Respostas serializadas inválidas: {dados!r}")
+            self._codigos = bytearray(texto.translate(_PARA_CODIGOS))
+        else:
+            itens = dados.items() if isinstance(dados, Mapping) else ((str(i), letra) for i, letra in enumerate(dados))
+            for chave, letra in itens:
+                self[chave] = letra
+
+    def __getitem__(self, chave):
+        posicao = _posicao(chave)
+        if posicao is not None and posicao < len(self._codigos) and self._codigos[posicao]:
+            return _LETRAS[self._codigos[posicao] - 1]
+        if self._extras and chave in self._extras:
+            return self._extras[chave]
+        raise KeyError(chave)
+
+    def __setitem__(self, chave, letra):
+        posicao = _posicao(chave)
+        codigo = _codigo(letra)
+        if posicao is not None and codigo:
+            if posicao >= len(self._codigos):
+                self._codigos.extend(bytes(posicao + 1 - len(self._codigos)))
+            self._codigos[posicao] = codigo
+            if self._extras:
+                self._extras.pop(chave, None)
+            return
+        # Valor fora do formato: fica à parte (e some do vetor, se a questão estava lá).
+        if posicao is not None and posicao < len(self._codigos):
+            self._codigos[posicao] = 0
+        if self._extras is None:
+            self._extras = {}
+        self._extras[chave] = letra
+
+    def __delitem__(self, chave):
+        posicao = _posicao(chave)
+        if posicao is not None and posicao < len(self._codigos) and self._codigos[posicao]:
+            self._codigos[posicao] = 0
+        elif self._extras and chave in self._extras:
+            del self._extras[chave]
+        else:
+            raise KeyError(chave)
+
+    def __iter__(self):
+        for posicao, codigo in enumerate(self._codigos):
+            if codigo:
+                yield str(posicao)
+        if self._extras:
+            yield from list(self._extras)
+
+    def __len__(self) -> int:
+        return len(self._codigos) - self._codigos.count(0) + (len(self._extras) if self._extras else 0)
+
+    def __contains__(self, chave) -> bool:
+        posicao = _posicao(chave)
+        if posicao is not None and posicao < len(self._codigos) and self._codigos[posicao]:
+            return True
+        return bool(self._extras) and chave in self._extras
+
+    def __eq__(self, outro):
+        if isinstance(outro, Respostas):
+            return (self._codigos.rstrip(b"\0") == outro._codigos.rstrip(b"\0")
+                    and (self._extras or {}) == (outro._extras or {}))
+        return super().__eq__(outro)
+
+    __hash__ = None # Mutável, como um dicionário.
+
+    def __repr__(self) -> str:
+        return f"Respostas({dict(self)!r})"
+
+    def __reduce__(self):
+        # Permite copiar e serializar com pickle (ex: no cache de load_json) pela forma serializada.
+        return (Respostas, (self.serializa(),))
+
+    def clear(self):
+        self._codigos = bytearray()
+        self._extras = None
+
+    def copy(self) -> "Respostas":
+        """
+        Objetivo: Copiar as respostas (como dict.copy).
+
+        Returns:
+            Respostas: Uma nova instância com as mesmas respostas.
+        """
+        return Respostas(self)
+
+    def codigos(self, num_questoes: int) -> bytes:
+        """
+        Objetivo: Obter os códigos das respostas das primeiras 'num_questoes' questões (0 = não respondida),
+        no formato usado pelo motor de correção. As respostas fora do formato não estão incluídas (ver extras).
+
+        Args:
+            num_questoes (int): A quantidade de questões da lista.
+
+        Returns:
+            bytes: Um byte por questão.
+        """
+        return bytes(self._codigos[:num_questoes]).ljust(num_questoes, b"\0")
+
+    def extras(self) -> dict:
+        """
+        Objetivo: Obter as respostas que não cabem no vetor (ver o comentário no início do módulo).
+
+        Returns:
+            dict: Chave -> valor (normalmente vazio). Não deve ser alterado.
+        """
+        return self._extras or {}
+
+    def serializa(self):
+        """
+        Objetivo: Obter a forma gravada no disco: um caractere por questão (ver o comentário no início do módulo).
+
+        Returns:
+            str | dict: O texto, ou um dicionário comum se houver respostas fora do formato.
+        """
+        if self._extras:
+            return dict(self)
+        return bytes(self._codigos.rstrip(b"\0")).translate(_PARA_TEXTO).decode("ascii")
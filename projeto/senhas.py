@@ -0,0 +1,255 @@
+import base64   # O sal e o hash são gravados em base64 no campo 'senha'.
+import concurrent.futures  # Hashes de muitas senhas (importação em lote) são calculados em paralelo, em vários processos.
+import hashlib  # PBKDF2-HMAC-SHA256 (hashlib.pbkdf2_hmac).
+import hmac     # Comparações em tempo constante e assinatura dos tokens de sessão.
+import os       # Geração de sais e chaves aleatórias; variáveis de ambiente de configuração.
+import sys      # Importa o módulo 'sys' para ler os argumentos da linha de comando (ex: 'python senhas.py migrar').
+import threading  # O cache de verificações pode ser usado por várias threads (ex: o serviço HTTP).
+import time     # Validade dos tokens de sessão.
+from collections import OrderedDict  # Cache de verificações com descarte do item usado há mais tempo (LRU).
+import auxiliar  # O backend de armazenamento é obtido no momento da chamada (auxiliar.get_backend()).
+
+# --- Senhas e Sessões ---
+# As senhas são gravadas no campo 'senha' dos usuários como "pbkdf2_sha256$<iterações>$<sal>$<hash>",
+# com sal aleatório por usuário. O custo (ITERACOES_PBKDF2) pode ser ajustado pela variável de ambiente
+# PROG_MODULAR_PBKDF2_ITERACOES; hashes gravados com outro custo continuam válidos e são regravados
+# com o custo atual no próximo login.
+#
+# Migração: usuários antigos têm a senha em texto puro. No próximo login bem-sucedido a senha é trocada
+# pelo hash (ver cadastro.entra_conta); o comando 'python senhas.py migrar' converte todos de uma vez.
+#
+# Como cada verificação custa ITERACOES_PBKDF2 rodadas de SHA-256 de propósito, há duas formas de não repeti-la:
+#   - um cache limitado (CACHE_VERIFICACOES_MAX) das últimas verificações bem-sucedidas, guardando apenas um
+#     HMAC da senha com uma chave aleatória do processo (a senha em si nunca fica em memória);
+#   - tokens de sessão "matricula.expiracao.assinatura", assinados com HMAC-SHA256, que identificam o usuário
+#     nas ações seguintes da mesma sessão sem nova verificação da senha (ver emite_token / valida_token).
+# A chave dos tokens é aleatória por processo, a menos que PROG_MODULAR_CHAVE_SESSAO seja definida
+# (necessário para que vários processos aceitem os mesmos tokens).
+
+# Identificação do algoritmo no campo 'senha'.
+ALGORITMO = "pbkdf2_sha256"
+
+# Quantidade de iterações do PBKDF2 para novos hashes.
+ITERACOES_PBKDF2 = int(os.environ.get("PROG_MODULAR_PBKDF2_ITERACOES", "600000"))
+
+# Tamanho do sal aleatório, em bytes.
+TAMANHO_SAL = 16
+
+# Quantidade máxima de verificações bem-sucedidas lembradas pelo cache.
+CACHE_VERIFICACOES_MAX = 4096
+
+# A partir de quantas senhas gera_hashes distribui o cálculo entre processos.
+LIMIAR_HASH_PARALELO = 64
+
+# Validade (em segundos) dos tokens de sessão.
+VALIDADE_SESSAO_S = 4 * 60 * 60
+
+_CHAVE_CACHE = os.urandom(32)
+_chave_sessao = os.environ.get("PROG_MODULAR_CHAVE_SESSAO", "").encode("utf-8") or os.urandom(32)
+_cache_verificacoes = OrderedDict()  # Hash armazenado -> HMAC da senha que o confirmou.
+_cache_lock = threading.Lock()
+
+def _b64(dados: bytes) -> str:
+    """
+    Objetivo: Codificar bytes em base64 (sem '=' no final), para gravação em texto.
+
+    Args:
+        dados (bytes): Os bytes a codificar.
+
+    Returns:
+        str: O texto em base64.
+    """
+    return base64.urlsafe_b64encode(dados).decode("ascii").rstrip("=")
+
+def _de_b64(texto: str) -> bytes:
+    """
+    Objetivo: Decodificar um texto gerado por _b64.
+
+    Args:
+        texto (str): O texto em base64.
+
+    Returns:
+        bytes: Os bytes decodificados.
+    """
+    return base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+
+def gera_hash(senha: str, iteracoes: int = None) -> str:
+    """
+    Objetivo: Gerar o hash de uma senha, no formato gravado no campo 'senha' dos usuários.
+
+    Args:
+        senha (str): A senha em texto puro.
+        iteracoes (int, optional): O custo do PBKDF2. Padrão para None (ITERACOES_PBKDF2).
+
+    Returns:
+        str: "pbkdf2_sha256$<iterações>$<sal>$<hash>".
+    """
+    iteracoes = iteracoes or ITERACOES_PBKDF2
+    sal = os.urandom(TAMANHO_SAL)
+    derivada = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), sal, iteracoes)
+    return f"{ALGORITMO}${iteracoes}${_b64(sal)}${_b64(derivada)}"
+
+def gera_hashes(senhas_lista: list, iteracoes: int = None) -> list:
+    """
+    Objetivo: Gerar o hash de várias senhas (ex: importação de usuários em lote). Com muitas senhas, o cálculo
+    é distribuído entre os núcleos da máquina, já que cada hash custa 'iteracoes' rodadas de propósito.
+
+    Args:
+        senhas_lista (list): As senhas em texto puro.
+        iteracoes (int, optional): O custo do PBKDF2. Padrão para None (ITERACOES_PBKDF2).
+
+    Returns:
+        list: O hash de cada senha, na mesma ordem.
+    """
+    iteracoes = iteracoes or ITERACOES_PBKDF2
+    processos = os.cpu_count() or 1
+    if len(senhas_lista) < LIMIAR_HASH_PARALELO or processos == 1:
+        return [gera_hash(senha, iteracoes) for senha in senhas_lista]
+    with concurrent.futures.ProcessPoolExecutor(processos) as executor:
+        return list(executor.map(gera_hash, senhas_lista, [iteracoes] * len(senhas_lista),
+                                 chunksize=max(1, len(senhas_lista) // (processos * 4))))
+
+def eh_hash(armazenada) -> bool:
+    """
+    Objetivo: Verificar se o campo 'senha' de um usuário já está no formato de hash.
+
+    Args:
+        armazenada: O valor do campo 'senha'.
+
+    Returns:
+        bool: True se for um hash gerado por gera_hash, False se for uma senha antiga em texto puro.
+    """
+    return isinstance(armazenada, str) and armazenada.startswith(ALGORITMO + "$")
+
+def precisa_atualizar(armazenada) -> bool:
+    """
+    Objetivo: Verificar se o campo 'senha' deve ser regravado (texto puro ou custo diferente do atual).
+
+    Args:
+        armazenada: O valor do campo 'senha'.
+
+    Returns:
+        bool: True se a senha deve ser regravada com gera_hash após um login bem-sucedido.
+    """
+    if not eh_hash(armazenada):
+        return True
+    return armazenada.split("$")[1] != str(ITERACOES_PBKDF2)
+
+def verifica(senha: str, armazenada, usar_cache: bool = True) -> bool:
+    """
+    Objetivo: Verificar uma senha digitada contra o valor armazenado (hash ou texto puro antigo).
+
+    Args:
+        senha (str): A senha digitada.
+        armazenada: O valor do campo 'senha' do usuário.
+        usar_cache (bool, optional): Se True (padrão), consulta e alimenta o cache de verificações.
+
+    Returns:
+        bool: True se a senha confere.
+    """
+    if not eh_hash(armazenada):
+        return armazenada is not None and hmac.compare_digest(str(armazenada).encode("utf-8"), senha.encode("utf-8"))
+
+    marca = hmac.new(_CHAVE_CACHE, senha.encode("utf-8"), hashlib.sha256).digest()
+    if usar_cache:
+        with _cache_lock:
+            lembrada = _cache_verificacoes.get(armazenada)
+            if lembrada is not None and hmac.compare_digest(lembrada, marca):
+                _cache_verificacoes.move_to_end(armazenada)
+                return True
+
+    try:
+        _, iteracoes, sal, esperada = armazenada.split("$")
+        derivada = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), _de_b64(sal), int(iteracoes))
+    except ValueError:
+        return False # Campo 'senha' malformado: nenhuma senha confere.
+    if not hmac.compare_digest(derivada, _de_b64(esperada)):
+        return False
+
+    if usar_cache:
+        with _cache_lock:
+            _cache_verificacoes[armazenada] = marca
+            _cache_verificacoes.move_to_end(armazenada)
+            while len(_cache_verificacoes) > CACHE_VERIFICACOES_MAX:
+                _cache_verificacoes.popitem(last=False)
+    return True
+
+def limpa_cache():
+    """
+    Objetivo: Esvaziar o cache de verificações (ex: em testes ou no benchmark do custo do PBKDF2).
+
+    Returns:
+        None
+    """
+    with _cache_lock:
+        _cache_verificacoes.clear()
+
+def _assina(conteudo: str) -> str:
+    """
+    Objetivo: Calcular a assinatura HMAC-SHA256 do conteúdo de um token de sessão.
+
+    Args:
+        conteudo (str): "matricula.expiracao".
+
+    Returns:
+        str: A assinatura em base64.
+    """
+    return _b64(hmac.new(_chave_sessao, conteudo.encode("utf-8"), hashlib.sha256).digest())
+
+def emite_token(matricula, validade_s: int = None) -> str:
+    """
+    Objetivo: Emitir um token de sessão para um usuário já autenticado.
+
+    Args:
+        matricula: A matrícula do usuário (int ou str).
+        validade_s (int, optional): Validade em segundos. Padrão para None (VALIDADE_SESSAO_S).
+
+    Returns:
+        str: O token "matricula.expiracao.assinatura".
+    """
+    expiracao = int(time.time()) + (validade_s if validade_s is not None else VALIDADE_SESSAO_S)
+    conteudo = f"{matricula}.{expiracao}"
+    return f"{conteudo}.{_assina(conteudo)}"
+
+def valida_token(token: str) -> str:
+    """
+    Objetivo: Validar um token de sessão (assinatura e expiração), sem consultar o armazenamento.
+
+    Args:
+        token (str): O token emitido por emite_token.
+
+    Returns:
+        str: A matrícula (como string) do usuário da sessão, ou None se o token for inválido ou tiver expirado.
+    """
+    try:
+        matricula_str, expiracao, assinatura = str(token).split(".")
+        if not hmac.compare_digest(assinatura, _assina(f"{matricula_str}.{expiracao}")):
+            return None
+        if int(expiracao) < time.time():
+            return None
+    except ValueError:
+        return None
+    return matricula_str
+
+def migra_senhas() -> dict:
+    """
+    Objetivo: Substituir pelo hash todas as senhas ainda gravadas em texto puro.
+
+    Returns:
+        dict: Um dicionário com o 'status' da operação e uma 'mensagem' descritiva.
+    """
+    backend = auxiliar.get_backend()
+    convertidos = 0
+    for usuario in backend.todos_usuarios().values():
+        if not eh_hash(usuario.get("senha")) and usuario.get("senha") is not None:
+            usuario["senha"] = gera_hash(str(usuario["senha"]))
+            backend.atualiza_usuario(usuario)
+            convertidos += 1
+    return {"status": "sucesso", "mensagem": f"{convertidos} senha(s) em texto puro convertida(s) para hash."}
+
+if __name__ == "__main__":
+    # Uso: python senhas.py migrar -> converte para hash todas as senhas gravadas em texto puro.
+    if len(sys.argv) > 1 and sys.argv[1] == "migrar":
+        print(migra_senhas()["mensagem"])
+    else:
+        print("Uso: python senhas.py migrar")
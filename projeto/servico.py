@@ -0,0 +1,459 @@
+import argparse  # Leitura dos parâmetros do serviço pela linha de comando.
+import asyncio   # Servidor assíncrono: uma única thread atende todas as conexões.
+import concurrent.futures  # As chamadas de armazenamento (bloqueantes) rodam em um conjunto de threads.
+import json      # Corpo das requisições e respostas.
+import os        # Variáveis de ambiente de configuração e remoção do socket Unix antigo.
+import re        # Padrões dos caminhos das rotas.
+import sys       # Saída de erros e código de saída do processo.
+import urllib.parse  # Decodificação dos nomes de turmas e listas nos caminhos (ex: 'Turma%20A').
+import auxiliar  # Backend de armazenamento e cache de leitura compartilhado pelas requisições.
+import cadastro  # Login (inicia_sessao) e identificação do usuário de cada requisição (usuario_da_sessao).
+import professor
+import aluno
+import metricas  # Cronômetro de cada rota (ver metricas.py); sem custo quando desativado.
+from modelos import para_json  # Modelos de domínio (ex: o usuário do login) nas respostas em JSON.
+
+# --- Serviço HTTP/JSON ---
+# Um único processo de longa duração atende todos os usuários, no lugar de um main.py interativo por usuário:
+# os documentos lidos ficam no cache de load_json (compartilhado entre as requisições) e cada chamada às
+# funções de negócio roda em um conjunto de threads, sem bloquear o laço de eventos.
+#   python servico.py [--host 127.0.0.1] [--porta 8080] [--unix caminho.sock] [--trabalhadores N]
+#
+# Autenticação: POST /sessao com {"matricula", "senha"} retorna um 'token'; as demais rotas exigem o
+# cabeçalho "Authorization: Bearer <token>" de um usuário do tipo indicado.
+#   POST   /sessao                                -> cadastro.inicia_sessao
+#   GET    /turmas                     professor  -> professor.get_turmas_existentes
+#   POST   /turmas                     professor  -> professor.cria_turma ({"nome"})
+#   GET    /turmas/<turma>             professor  -> professor.visualiza_turma
+#   POST   /turmas/<turma>/alunos      professor  -> professor.insere_aluno ({"matricula"}) ou insere_alunos ({"matriculas"})
+#   DELETE /turmas/<turma>/alunos/<m>  professor  -> professor.remove_aluno
+#   POST   /turmas/<turma>/listas      professor  -> professor.passa_lista ({"lista"})
+#   GET    /listas                     professor  -> professor.get_catalogo_listas
+#   POST   /listas/<lista>/exercicios  professor  -> professor.cria_exercicio ({"tema", "enunciado", "alternativas", "resposta_correta"})
+#                                                    ou cria_exercicios ({"exercicios": [...]})
+#   POST   /envios                     professor  -> aluno.envia_respostas_lote ({"envios"})
+#   GET    /aluno/listas               aluno      -> listas das turmas do aluno, com o status de cada uma
+#   GET    /aluno/listas/<lista>       aluno      -> exercícios da lista (sem a resposta correta) e o progresso
+#   POST   /aluno/listas/<lista>/respostas aluno  -> aluno.envia_respostas ({"respostas"})
+# A resposta é o dicionário {'status', 'mensagem', ...} da função de negócio, com código HTTP 200
+# ('sucesso' ou 'aviso') ou 400 ('erro'; 401 no login).
+# Nomes de lista no caminho que não são um nome de arquivo de lista (ver auxiliar.valida_nome_lista) resultam em 400.
+#
+# Gravações: antes de executar uma rota que grava, o serviço adquire as travas dos recursos que ela altera
+# ('turmas', 'turma:<nome>', 'lista:<nome>', 'aluno:<matrícula>'), sempre em ordem alfabética para não haver
+# impasse. Gravações em recursos diferentes (ex: alunos enviando respostas) seguem em paralelo; leituras
+# não esperam por travas.
+
+# Endereço padrão do serviço (pode ser alterado pelas variáveis de ambiente ou pela linha de comando).
+HOST_PADRAO = os.environ.get("PROG_MODULAR_SERVICO_HOST", "127.0.0.1")
+PORTA_PADRAO = int(os.environ.get("PROG_MODULAR_SERVICO_PORTA", "8080"))
+
+# Quantidade de threads que executam as chamadas de armazenamento.
+TRABALHADORES_PADRAO = min(32, (os.cpu_count() or 1) + 4)
+
+# Tamanho máximo aceito para o corpo de uma requisição, em bytes.
+TAMANHO_MAXIMO_CORPO = 4 * 1024 * 1024
+
+# Tempo (em segundos) que uma conexão pode ficar ociosa entre requisições antes de ser fechada.
+TEMPO_OCIOSO_MAXIMO_S = 60
+
+_MOTIVOS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+_executor = None  # Conjunto de threads das chamadas de armazenamento (criado por cria_servidor).
+_travas = {}      # Recurso -> asyncio.Lock que serializa as gravações nele.
+_conexoes = set() # Tarefas das conexões em atendimento (canceladas por fecha_servidor).
+
+# --- Rotas ---
+
+def _lista_turmas(usuario: dict, params: dict, corpo: dict) -> dict:
+    """Objetivo: Retorna os nomes das turmas existentes."""
+    turmas = professor.get_turmas_existentes()
+    return {"status": "sucesso", "mensagem": f"{len(turmas)} turma(s).", "turmas": turmas}
+
+def _lista_listas(usuario: dict, params: dict, corpo: dict) -> dict:
+    """Objetivo: Retorna os nomes das listas de exercícios existentes e o catálogo com os metadados de cada uma."""
+    catalogo = professor.get_catalogo_listas()
+    return {"status": "sucesso", "mensagem": f"{len(catalogo)} lista(s).", "listas": list(catalogo),
+            "catalogo": {nome: {chave: dados[chave] for chave in ("tamanho", "exercicios", "temas", "hash", "modificado")}
+                         for nome, dados in catalogo.items()}}
+
+def _insere_alunos(usuario: dict, params: dict, corpo: dict) -> dict:
+    """Objetivo: Matricula um aluno ({'matricula'}) ou vários ({'matriculas'}) na turma."""
+    if "matriculas" in corpo:
+        return professor.insere_alunos(params["turma"], list(corpo["matriculas"]))
+    return professor.insere_aluno(params["turma"], int(corpo["matricula"]))
+
+def _cria_exercicio(usuario: dict, params: dict, corpo: dict) -> dict:
+    """Objetivo: Acrescenta um exercício ({'tema', ...}) ou vários ({'exercicios'}) à lista (criando-a se não existir)."""
+    if "exercicios" in corpo:
+        return professor.cria_exercicios(params["lista"], list(corpo["exercicios"]))
+    # A lista não é carregada: o exercício é só acrescentado ao final dela (ver professor.cria_exercicio).
+    resultado = professor.cria_exercicio([], str(corpo["tema"]), str(corpo["enunciado"]), list(corpo["alternativas"]),
+                                         str(corpo["resposta_correta"]), params["lista"])
+    resultado.pop("lista_atualizada", None)
+    return resultado
+
+def _listas_do_aluno(usuario: dict, params: dict, corpo: dict) -> dict:
+    """Objetivo: Retorna as listas das turmas do aluno, com o progresso e o status de cada uma."""
+    progresso_aluno = auxiliar.get_backend().carrega_progresso_aluno(usuario["matricula"], somente_leitura=True)
+    turmas = {}
+    for nome_turma, listas in aluno._get_aluno_turmas_e_listas(usuario["matricula"]).items():
+        turmas[nome_turma] = [{"lista": nome_lista, "progresso": progresso_aluno.get(nome_lista, {}).get("progresso", 0),
+                               "status": progresso_aluno.get(nome_lista, {}).get("status", "nao_iniciado")}
+                              for nome_lista in listas]
+    return {"status": "sucesso", "mensagem": f"{len(turmas)} turma(s).", "turmas": turmas}
+
+def _abre_lista(usuario: dict, params: dict, corpo: dict) -> dict:
+    """
+    Objetivo: Retorna os exercícios de uma lista das turmas do aluno (sem a resposta correta) e o progresso dele.
+    Com '?inicio=N&quantidade=M' na URL, retorna apenas essa página de exercícios (e o 'total' da lista).
+    """
+    backend = auxiliar.get_backend()
+    nome_lista = params["lista"]
+    if not any(nome_lista in listas for listas in aluno._get_aluno_turmas_e_listas(usuario["matricula"]).values()):
+        return {"status": "erro", "mensagem": f"A lista '{nome_lista}' não está disponível para você."}
+    if "quantidade" in params:
+        inicio = int(params.get("inicio", 0))
+        pagina, total = backend.carrega_pagina_lista(nome_lista, inicio, int(params["quantidade"]))
+    else:
+        inicio = 0
+        pagina = backend.carrega_lista(nome_lista, somente_leitura=True)
+        total = len(pagina)
+    exercicios = [{chave: valor for chave, valor in ex.items() if chave != "RespostaCorreta"} for ex in pagina]
+    dados_lista = backend.carrega_progresso_aluno(usuario["matricula"], somente_leitura=True).get(nome_lista)
+    if dados_lista is not None:
+        # Na resposta, as respostas vão como o dicionário índice -> letra de sempre (ver respostas.py).
+        dados_lista = dict(dados_lista, respostas=dict(dados_lista.get("respostas", {})))
+    return {"status": "sucesso", "mensagem": f"Lista '{nome_lista}' com {total} exercício(s).",
+            "exercicios": exercicios, "inicio": inicio, "total": total, "progresso": dados_lista}
+
+def _recursos_envio(matricula, nome_lista: str) -> list:
+    """Objetivo: Recursos alterados por um envio de respostas: o progresso do aluno e as estatísticas das turmas com a lista."""
+    turmas = auxiliar.get_backend().turmas_do_aluno(int(matricula))
+    return [f"aluno:{int(matricula)}"] + [f"turma:{nome_turma}" for nome_turma, listas in turmas.items() if nome_lista in listas]
+
+def _recursos_envios(usuario: dict, params: dict, corpo: dict) -> list:
+    """Objetivo: Recursos alterados por um lote de envios."""
+    recursos = []
+    for envio in corpo["envios"]:
+        try:
+            recursos.extend(_recursos_envio(envio["matricula"], str(envio["lista"])))
+        except (KeyError, TypeError, ValueError):
+            continue # Envio inválido: será recusado (sem gravar) por envia_respostas_lote.
+    return recursos
+
+# Tabela de rotas: (método, padrão do caminho, tipo de usuário exigido, função, recursos gravados).
+# A função recebe (usuario, params, corpo) e retorna o dicionário de resposta; 'recursos' recebe os mesmos
+# argumentos e retorna as travas a adquirir (None para rotas que só leem).
+_ROTAS = [
+    ("POST", r"/sessao", None,
+     lambda u, p, c: cadastro.inicia_sessao(str(c["matricula"]), str(c["senha"])), None),
+    ("GET", r"/turmas", "professor", _lista_turmas, None),
+    ("POST", r"/turmas", "professor",
+     lambda u, p, c: professor.cria_turma(str(c["nome"])), lambda u, p, c: ["turmas"]),
+    ("GET", r"/turmas/(?P<turma>[^/]+)", "professor",
+     lambda u, p, c: professor.visualiza_turma(p["turma"]), None),
+    ("POST", r"/turmas/(?P<turma>[^/]+)/alunos", "professor",
+     _insere_alunos, lambda u, p, c: ["turmas", f"turma:{p['turma']}"]),
+    ("DELETE", r"/turmas/(?P<turma>[^/]+)/alunos/(?P<matricula>\d+)", "professor",
+     lambda u, p, c: professor.remove_aluno(p["turma"], int(p["matricula"])), lambda u, p, c: ["turmas", f"turma:{p['turma']}"]),
+    ("POST", r"/turmas/(?P<turma>[^/]+)/listas", "professor",
+     lambda u, p, c: professor.passa_lista(str(c["lista"]), p["turma"]), lambda u, p, c: ["turmas", f"turma:{p['turma']}"]),
+    ("GET", r"/listas", "professor", _lista_listas, None),
+    ("POST", r"/listas/(?P<lista>[^/]+)/exercicios", "professor",
+     _cria_exercicio, lambda u, p, c: [f"lista:{p['lista']}"]),
+    ("POST", r"/envios", "professor",
+     lambda u, p, c: aluno.envia_respostas_lote(list(c["envios"])), _recursos_envios),
+    ("GET", r"/aluno/listas", "aluno", _listas_do_aluno, None),
+    ("GET", r"/aluno/listas/(?P<lista>[^/]+)", "aluno", _abre_lista, None),
+    ("POST", r"/aluno/listas/(?P<lista>[^/]+)/respostas", "aluno",
+     lambda u, p, c: aluno.envia_respostas(u["matricula"], p["lista"], c["respostas"]),
+     lambda u, p, c: _recursos_envio(u["matricula"], p["lista"])),
+]
+_ROTAS_COMPILADAS = [(metodo, re.compile(padrao + r"/?"), tipo, funcao, recursos) for metodo, padrao, tipo, funcao, recursos in _ROTAS]
+
+def _encontra_rota(metodo: str, caminho: str) -> tuple:
+    """
+    Objetivo: Encontrar a rota de uma requisição.
+
+    Args:
+        metodo (str): O método HTTP.
+        caminho (str): O caminho da URL (sem a query string).
+
+    Returns:
+        tuple: (rota, params) se encontrada; (None, 404) se o caminho não existe; (None, 405) se existe com outro método.
+    """
+    codigo = 404
+    for rota in _ROTAS_COMPILADAS:
+        encontrado = rota[1].fullmatch(caminho)
+        if encontrado is None:
+            continue
+        if rota[0] != metodo:
+            codigo = 405
+            continue
+        return rota, {chave: urllib.parse.unquote(valor) for chave, valor in encontrado.groupdict().items()}
+    return None, codigo
+
+def _executa(nome: str, funcao, usuario: dict, params: dict, corpo: dict) -> dict:
+    """
+    Objetivo: Executar a função de uma rota (em uma thread do conjunto), medindo-a com metricas.cronometro.
+
+    Args:
+        nome (str): O nome da operação nas métricas.
+        funcao: A função da rota.
+        usuario (dict): O usuário da sessão (ou None).
+        params (dict): Os parâmetros do caminho.
+        corpo (dict): O corpo JSON da requisição.
+
+    Returns:
+        dict: O dicionário de resposta da função de negócio.
+    """
+    with metricas.cronometro(nome):
+        return funcao(usuario, params, corpo)
+
+async def _despacha(metodo: str, alvo: str, cabecalhos: dict, corpo_bytes: bytes) -> tuple:
+    """
+    Objetivo: Autenticar, adquirir as travas e executar a rota de uma requisição.
+
+    Args:
+        metodo (str): O método HTTP.
+        alvo (str): O alvo da requisição (caminho e query string).
+        cabecalhos (dict): Os cabeçalhos (nomes em minúsculo).
+        corpo_bytes (bytes): O corpo da requisição.
+
+    Returns:
+        tuple: (código HTTP, dicionário de resposta).
+    """
+    partes = urllib.parse.urlsplit(alvo)
+    rota, params = _encontra_rota(metodo, partes.path)
+    if rota is None:
+        return params, {"status": "erro", "mensagem": "Rota não encontrada." if params == 404 else "Método não permitido."}
+    # Parâmetros da query string (ex: paginação) ficam junto dos do caminho, que têm prioridade.
+    params = dict(urllib.parse.parse_qsl(partes.query), **params)
+    _, padrao, tipo, funcao, recursos = rota
+    if "lista" in params:
+        # O nome já decodificado (ex: '..%2Fusuarios.json') nunca chega ao backend se não for um nome de lista.
+        try:
+            auxiliar.valida_nome_lista(params["lista"])
+        except ValueError as e:
+            return 400, {"status": "erro", "mensagem": str(e)}
+    try:
+        corpo = json.loads(corpo_bytes) if corpo_bytes.strip() else {}
+    except ValueError:
+        return 400, {"status": "erro", "mensagem": "O corpo da requisição não é um JSON válido."}
+    if not isinstance(corpo, dict):
+        return 400, {"status": "erro", "mensagem": "O corpo da requisição deve ser um objeto JSON."}
+
+    loop = asyncio.get_running_loop()
+    usuario = None
+    if tipo is not None:
+        autorizacao = cabecalhos.get("authorization", "")
+        token = autorizacao[7:].strip() if autorizacao.lower().startswith("bearer ") else ""
+        usuario = await loop.run_in_executor(_executor, cadastro.usuario_da_sessao, token) if token else None
+        if usuario is None:
+            return 401, {"status": "erro", "mensagem": "Sessão inválida ou expirada."}
+        if usuario.get("tipo") != tipo:
+            return 403, {"status": "erro", "mensagem": f"Operação permitida apenas para o tipo '{tipo}'."}
+
+    nome = f"servico.{metodo} {padrao.pattern[:-2]}"
+    travas = []
+    try:
+        if recursos is not None:
+            nomes_recursos = await loop.run_in_executor(_executor, recursos, usuario, params, corpo)
+            travas = [_travas.setdefault(recurso, asyncio.Lock()) for recurso in sorted(set(nomes_recursos))]
+        for adquiridas, trava in enumerate(travas):
+            try:
+                await trava.acquire()
+            except BaseException:
+                travas = travas[:adquiridas] # Cancelada: libera apenas as travas já adquiridas.
+                raise
+        resultado = await loop.run_in_executor(_executor, _executa, nome, funcao, usuario, params, corpo)
+    except (KeyError, TypeError, ValueError) as e:
+        return 400, {"status": "erro", "mensagem": f"Requisição inválida: campo ausente ou com tipo incorreto ({e})."}
+    except Exception as e:
+        print(f"Erro em {nome}: {type(e).__name__}: {e}", file=sys.stderr)
+        return 500, {"status": "erro", "mensagem": "Erro interno do serviço."}
+    finally:
+        for trava in reversed(travas):
+            trava.release()
+
+    if resultado.get("status") != "erro":
+        return 200, resultado
+    return (401 if padrao.pattern.startswith("/sessao") else 400), resultado
+
+def _resposta(codigo: int, dados: dict, manter_conexao: bool) -> bytes:
+    """
+    Objetivo: Montar a resposta HTTP com o corpo JSON.
+
+    Args:
+        codigo (int): O código HTTP.
+        dados (dict): O corpo da resposta.
+        manter_conexao (bool): Se False, pede ao cliente que feche a conexão.
+
+    Returns:
+        bytes: A resposta completa (linha de status, cabeçalhos e corpo).
+    """
+    corpo = json.dumps(dados, ensure_ascii=False, default=para_json).encode("utf-8")
+    cabecalho = (f"HTTP/1.1 {codigo} {_MOTIVOS.get(codigo, '')}\r\n"
+                 "Content-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(corpo)}\r\n"
+                 f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n\r\n")
+    return cabecalho.encode("ascii") + corpo
+
+async def _atende_conexao(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Objetivo: Atender as requisições de uma conexão (HTTP/1.1 com keep-alive), uma de cada vez.
+
+    Args:
+        reader (asyncio.StreamReader): O fluxo de leitura da conexão.
+        writer (asyncio.StreamWriter): O fluxo de escrita da conexão.
+
+    Returns:
+        None
+    """
+    tarefa = asyncio.current_task()
+    _conexoes.add(tarefa)
+    try:
+        while True:
+            linha = await asyncio.wait_for(reader.readline(), TEMPO_OCIOSO_MAXIMO_S)
+            if not linha:
+                break # O cliente fechou a conexão.
+            partes = linha.decode("latin-1").split()
+            cabecalhos = {}
+            while True:
+                linha_cabecalho = await reader.readline()
+                if linha_cabecalho in (b"\r\n", b"\n", b""):
+                    break
+                nome, _, valor = linha_cabecalho.decode("latin-1").partition(":")
+                cabecalhos[nome.strip().lower()] = valor.strip()
+            if len(partes) != 3 or not partes[2].startswith("HTTP/1."):
+                writer.write(_resposta(400, {"status": "erro", "mensagem": "Requisição HTTP malformada."}, False))
+                break
+            try:
+                tamanho = int(cabecalhos.get("content-length", "0"))
+            except ValueError:
+                tamanho = -1
+            if not 0 <= tamanho <= TAMANHO_MAXIMO_CORPO:
+                writer.write(_resposta(413, {"status": "erro", "mensagem": "Corpo da requisição ausente ou grande demais."}, False))
+                break
+            corpo_bytes = await reader.readexactly(tamanho)
+
+            codigo, dados = await _despacha(partes[0].upper(), partes[1], cabecalhos, corpo_bytes)
+            manter_conexao = cabecalhos.get("connection", "").lower() != "close" and partes[2] == "HTTP/1.1"
+            writer.write(_resposta(codigo, dados, manter_conexao))
+            await writer.drain()
+            if not manter_conexao:
+                break
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass # Conexão ociosa, interrompida ou fechada pelo cliente.
+    finally:
+        _conexoes.discard(tarefa)
+        writer.close()
+
+def _aquece_cache():
+    """
+    Objetivo: Carregar no cache de leitura as turmas e as listas de exercícios, antes da primeira requisição.
+
+    Returns:
+        None
+    """
+    backend = auxiliar.get_backend()
+    for nome_turma in backend.lista_turmas():
+        backend.busca_turma(nome_turma, somente_leitura=True)
+    for nome_lista in backend.nomes_listas():
+        backend.carrega_lista(nome_lista, somente_leitura=True)
+
+async def cria_servidor(host: str = None, porta: int = None, caminho_unix: str = None, trabalhadores: int = None):
+    """
+    Objetivo: Inicializar o armazenamento e abrir o servidor (TCP ou socket Unix), sem bloquear.
+
+    Args:
+        host (str, optional): O endereço TCP. Padrão para None (HOST_PADRAO).
+        porta (int, optional): A porta TCP (0 escolhe uma porta livre). Padrão para None (PORTA_PADRAO).
+        caminho_unix (str, optional): Se informado, atende em um socket Unix neste caminho em vez de TCP.
+        trabalhadores (int, optional): Quantidade de threads de armazenamento. Padrão para None (TRABALHADORES_PADRAO).
+
+    Returns:
+        asyncio.Server: O servidor já aceitando conexões.
+    """
+    global _executor
+    _executor = concurrent.futures.ThreadPoolExecutor(trabalhadores or TRABALHADORES_PADRAO, thread_name_prefix="servico")
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_executor, auxiliar.get_backend().inicializa)
+    await loop.run_in_executor(_executor, _aquece_cache)
+    if caminho_unix:
+        if os.path.exists(caminho_unix):
+            os.remove(caminho_unix) # Socket deixado por uma execução anterior.
+        return await asyncio.start_unix_server(_atende_conexao, path=caminho_unix)
+    return await asyncio.start_server(_atende_conexao, host or HOST_PADRAO, PORTA_PADRAO if porta is None else porta)
+
+async def fecha_servidor(servidor: asyncio.AbstractServer):
+    """
+    Objetivo: Parar de aceitar conexões e encerrar as que ainda estão abertas (ex: clientes em keep-alive),
+    esperando o fim das suas tarefas, para que nenhuma fique pendente quando o laço de eventos for fechado.
+
+    Args:
+        servidor (asyncio.AbstractServer): O servidor retornado por cria_servidor.
+
+    Returns:
+        None
+    """
+    servidor.close()
+    tarefas = list(_conexoes)
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+    # Depois das conexões: a partir do Python 3.12, wait_closed também espera que elas terminem.
+    await servidor.wait_closed()
+
+def encerra():
+    """
+    Objetivo: Encerrar o conjunto de threads e gravar as escritas ainda pendentes.
+
+    Returns:
+        None
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    _travas.clear()
+    auxiliar.descarrega_escritas()
+
+async def _serve(args: dict):
+    """Objetivo: Abre o servidor e o mantém atendendo até o processo ser interrompido."""
+    servidor = await cria_servidor(**args)
+    enderecos = args["caminho_unix"] or ", ".join(str(s.getsockname()) for s in servidor.sockets)
+    print(f"Serviço ({auxiliar.BACKEND_ARMAZENAMENTO}) atendendo em {enderecos}.")
+    try:
+        await servidor.serve_forever()
+    finally:
+        await fecha_servidor(servidor)
+
+def main(argv: list = None) -> int:
+    """
+    Objetivo: Ler os parâmetros da linha de comando e executar o serviço até ser interrompido (Ctrl+C).
+
+    Args:
+        argv (list, optional): Os argumentos (sem o nome do programa). Padrão para None (sys.argv).
+
+    Returns:
+        int: O código de saída do processo.
+    """
+    parser = argparse.ArgumentParser(prog="python servico.py", description="Serviço HTTP/JSON do sistema de listas.")
+    parser.add_argument("--host", default=None, help=f"Endereço TCP (padrão: {HOST_PADRAO}).")
+    parser.add_argument("--porta", type=int, default=None, help=f"Porta TCP (padrão: {PORTA_PADRAO}).")
+    parser.add_argument("--unix", dest="caminho_unix", default=None, help="Atender em um socket Unix neste caminho.")
+    parser.add_argument("--trabalhadores", type=int, default=None, help="Threads de armazenamento.")
+    args = vars(parser.parse_args(argv))
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        print("Serviço encerrado.")
+    finally:
+        encerra()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
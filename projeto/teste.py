@@ -7,18 +7,19 @@ Os testes abrangem casos de sucesso, erro e borda, validando os fluxos principai
 Regras e Observações:
 - Não utiliza unittest, pytest ou qualquer estrutura de classes; apenas funções e asserts nativos do Python.
 - Todos os dados de teste são mantidos em uma pasta isolada (`json_test`), evitando impacto em dados reais.
-- Para rodar, utilize: `python teste.py`
+- Para rodar, utilize: `python teste.py` (ou `PROG_MODULAR_BACKEND=sqlite python teste.py` para o backend SQLite,
+  com o banco também em `json_test`; os testes que conferem os arquivos do backend JSON usam sempre esse backend).
 - Abrange funções dos arquivos: aluno.py, auxiliar.py, cadastro.py, main.py, professor.py.
 
 Ao final, será exibido "TODOS OS TESTES PASSARAM COM SUCESSO" se todos os testes forem bem-sucedidos.
 """
 
-import sys, shutil, traceback
+import sys, shutil, traceback, functools
 from pathlib import Path
 import json
 
 sys.path.insert(0, str(Path(__file__).parent))
-import auxiliar, aluno, professor, cadastro, main
+import auxiliar, aluno, professor, cadastro, main, progresso, armazenamento_sqlite, listas_exercicios
 
 BASE = Path(__file__).parent
 JSON_TEST_DIR = BASE / "json_test"
@@ -41,6 +42,24 @@ def _patch_modules():
         mod.TURMAS_JSON_PATH = str(TURMAS_JSON)
         mod.USUARIOS_JSON_PATH = str(USUARIOS_JSON)
         mod.PROGRESO_ALUNOS_JSON_PATH = str(PROGRESSO_JSON)
+    auxiliar.SQLITE_DB_PATH = str(JSON_TEST_DIR / "prog_modular.db")
+
+def _sincroniza_backend():
+    """Com o backend SQLite (PROG_MODULAR_BACKEND=sqlite), copia para o banco de teste os dados gravados nos JSONs de teste."""
+    if auxiliar.BACKEND_ARMAZENAMENTO == "sqlite":
+        armazenamento_sqlite.importa_json()
+
+def _backend_json(teste):
+    """Executa com o backend JSON um teste que confere os arquivos desse backend, qualquer que seja o configurado."""
+    @functools.wraps(teste)
+    def executa():
+        backend_original = auxiliar.BACKEND_ARMAZENAMENTO
+        auxiliar.BACKEND_ARMAZENAMENTO = "json"
+        try:
+            return teste()
+        finally:
+            auxiliar.BACKEND_ARMAZENAMENTO = backend_original
+    return executa
 
 _reset_fs()
 _patch_modules()
@@ -88,6 +107,7 @@ def criar_usuarios_json(dados=None):
         }
     with open(USUARIOS_JSON, "w", encoding="utf-8") as f:
         json.dump(dados, f, ensure_ascii=False, indent=2)
+    _sincroniza_backend()
 
 def criar_turmas_json(dados=None):
     """Cria um turmas.json de teste."""
@@ -104,6 +124,7 @@ def criar_turmas_json(dados=None):
         }
     with open(TURMAS_JSON, "w", encoding="utf-8") as f:
         json.dump(dados, f, ensure_ascii=False, indent=2)
+    _sincroniza_backend()
 
 def criar_progresso_json(dados=None):
     """Cria um progresso_alunos.json de teste."""
@@ -119,6 +140,7 @@ def criar_progresso_json(dados=None):
         }
     with open(PROGRESSO_JSON, "w", encoding="utf-8") as f:
         json.dump(dados, f, ensure_ascii=False, indent=2)
+    _sincroniza_backend()
 
 def criar_lista_exemplo(nome="matematica.json", dados=None):
     """Cria uma lista de exercícios de teste no diretório de listas."""
@@ -136,6 +158,7 @@ def criar_lista_exemplo(nome="matematica.json", dados=None):
     LISTAS_DIR.mkdir(parents=True, exist_ok=True)
     with open(LISTAS_DIR / nome, "w", encoding="utf-8") as f:
         json.dump(dados, f, ensure_ascii=False, indent=2)
+    _sincroniza_backend()
 
 # ---------------------- TESTES AUXILIAR ----------------------
 def test_save_and_load_json():
@@ -173,6 +196,38 @@ def test_load_json_corrompido():
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
 
+def test_load_json_cache():
+    """Testa se o cache de leitura entrega cópias isoladas e percebe alterações no arquivo."""
+    _reset_fs()
+    fp = str(JSON_TEST_DIR / "cache.json")
+    try:
+        auxiliar.save_json({"a": [1, 2]}, fp)
+        primeiro = auxiliar.load_json(fp, {})
+        primeiro["a"].append(3)
+        assert auxiliar.load_json(fp, {}) == {"a": [1, 2]}, "Alterar o retorno não deveria afetar o cache"
+        with open(fp, "w", encoding="utf-8") as f:
+            json.dump({"a": [9, 9]}, f)
+        assert auxiliar.load_json(fp, {}) == {"a": [9, 9]}, "O cache deveria perceber a alteração do arquivo"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_save_json_lote():
+    """Testa o agrupamento de gravações em lote e a gravação atômica (sem arquivos temporários restantes)."""
+    _reset_fs()
+    fp = JSON_TEST_DIR / "lote.json"
+    try:
+        with auxiliar.lote_escrita():
+            auxiliar.save_json({"v": 1}, str(fp))
+            auxiliar.save_json({"v": 2}, str(fp))
+            assert not fp.exists(), "Dentro do lote a gravação deveria ser adiada"
+            assert auxiliar.load_json(str(fp), {}) == {"v": 2}, "Leitura deveria enxergar a gravação pendente"
+        assert json.loads(fp.read_text(encoding="utf-8")) == {"v": 2}, "Lote não gravado ao final"
+        assert not list(JSON_TEST_DIR.glob(".*.tmp")), "Arquivo temporário não foi removido"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
 # ---------------------- TESTES CADASTRO ----------------------
 def test_cria_usuario_e_login():
     """Testa criação e autenticação de usuário."""
@@ -187,6 +242,7 @@ def test_cria_usuario_e_login():
         }
     }
     auxiliar.save_json(usuarios, str(USUARIOS_JSON))
+    _sincroniza_backend()
     try:
         user = cadastro.entra_conta("1234567", "abc")
         assert user is not None and user["nome"] == "Teste", "Login deveria funcionar"
@@ -196,14 +252,125 @@ def test_cria_usuario_e_login():
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
 
+@_backend_json
+def test_diretorio_usuarios():
+    """Testa o diretório indexado de usuários: inserção, busca, crescimento do índice, edição externa e compactação."""
+    import diretorio_usuarios
+    _reset_fs()
+    criar_usuarios_json()
+    capacidade_anterior = diretorio_usuarios.CAPACIDADE_INICIAL
+    diretorio_usuarios.CAPACIDADE_INICIAL = 8 # Força o índice a crescer durante o teste.
+    try:
+        assert cadastro.entra_conta("1234567", "abc") is not None, "Usuário de usuarios.json não encontrado"
+        tamanho_json = USUARIOS_JSON.stat().st_size
+        for m in range(2000000, 2000020):
+            assert diretorio_usuarios.insere({"matricula": m, "nome": f"U{m}", "idade": 20, "tipo": "aluno", "senha": "x"}), f"Falha ao inserir {m}"
+        assert not diretorio_usuarios.insere({"matricula": 2000005, "nome": "Outro"}), "Inseriu matrícula duplicada"
+        assert USUARIOS_JSON.stat().st_size == tamanho_json, "Inserção não deveria reescrever usuarios.json"
+        assert cadastro.entra_conta("2000013", "x")["nome"] == "U2000013", "Usuário inserido não encontrado"
+        assert diretorio_usuarios.busca("9999999") is None, "Encontrou matrícula inexistente"
+        assert set(diretorio_usuarios.busca_varios([2000001, 1234567, 5])) == {"2000001", "1234567"}, "Busca múltipla incorreta"
+        # Edição externa de usuarios.json: o diretório é reconstruído sem perder os usuários inseridos.
+        criar_usuarios_json({"5555555": {"matricula": 5555555, "nome": "Externo", "idade": 30, "tipo": "aluno", "senha": "e"}})
+        assert diretorio_usuarios.busca("5555555")["nome"] == "Externo", "Edição externa não aplicada"
+        assert diretorio_usuarios.busca("2000019") is not None, "Usuário inserido perdido na reconstrução"
+        # Registro acrescentado ao log sem atualizar o índice (ex: falha entre as duas gravações).
+        with open(diretorio_usuarios._log_path(), "ab") as f:
+            f.write(diretorio_usuarios._linha_registro("6666666", {"matricula": 6666666, "nome": "Recuperado"}))
+        assert diretorio_usuarios.busca("6666666")["nome"] == "Recuperado", "Registro não indexado após falha"
+        assert diretorio_usuarios.compacta()["status"] == "sucesso", "Falha na compactação"
+        # 20 inseridos + 1234567 (senha regravada no login) + o usuário externo + o recuperado.
+        assert len(auxiliar.load_json(str(USUARIOS_JSON), {})) == 23, "usuarios.json incompleto após compactação"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        diretorio_usuarios.CAPACIDADE_INICIAL = capacidade_anterior
+
+def test_senhas_e_sessao():
+    """Testa o hash das senhas, a migração de senhas em texto puro no login e os tokens de sessão."""
+    import senhas
+    _reset_fs()
+    criar_usuarios_json()
+    iteracoes_anteriores = senhas.ITERACOES_PBKDF2
+    senhas.ITERACOES_PBKDF2 = 1000 # Custo baixo para o teste ser rápido.
+    try:
+        armazenada = senhas.gera_hash("segredo")
+        assert armazenada.startswith("pbkdf2_sha256$1000$") and "segredo" not in armazenada, "Formato do hash incorreto"
+        assert senhas.verifica("segredo", armazenada) and senhas.verifica("segredo", armazenada), "Senha correta recusada"
+        assert not senhas.verifica("outra", armazenada), "Senha errada aceita (com cache)"
+        assert not senhas.verifica("outra", armazenada, usar_cache=False), "Senha errada aceita (sem cache)"
+        # Login com a senha antiga em texto puro: aceito e regravado como hash.
+        assert cadastro.entra_conta("1234567", "abc") is not None, "Login com senha em texto puro falhou"
+        assert senhas.eh_hash(auxiliar.get_backend().busca_usuario("1234567")["senha"]), "Senha não migrada no login"
+        assert cadastro.entra_conta("1234567", "abc") is not None, "Login após a migração falhou"
+        assert cadastro.entra_conta("1234567", "xyz") is None, "Login com senha errada após a migração"
+        assert senhas.migra_senhas()["mensagem"].startswith("1 "), "Migração em lote não converteu a senha restante"
+        # Sessões: token assinado, com expiração.
+        sessao = cadastro.inicia_sessao("7654321", "prof")
+        assert sessao["status"] == "sucesso" and "senha" not in sessao["usuario"], "Sessão não iniciada"
+        assert cadastro.usuario_da_sessao(sessao["token"])["nome"] == "Prof Teste", "Token válido recusado"
+        assert cadastro.usuario_da_sessao(sessao["token"][:-1] + "x") is None, "Token adulterado aceito"
+        assert cadastro.usuario_da_sessao(senhas.emite_token(7654321, validade_s=-1)) is None, "Token expirado aceito"
+        assert cadastro.inicia_sessao("7654321", "errada")["status"] == "erro", "Sessão iniciada com senha errada"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        senhas.ITERACOES_PBKDF2 = iteracoes_anteriores
+
+def test_importacao_em_lote():
+    """Testa a criação de contas e a matrícula em lote a partir de CSV/JSONL, com erros relatados por linha."""
+    import importacao, senhas
+    _reset_fs()
+    criar_usuarios_json()
+    criar_turmas_json()
+    iteracoes_anteriores = senhas.ITERACOES_PBKDF2
+    senhas.ITERACOES_PBKDF2 = 1000
+    try:
+        csv_usuarios = JSON_TEST_DIR / "usuarios.csv"
+        csv_usuarios.write_text(
+            "matricula,nome,idade,tipo,senha\n"
+            "2000001,Ana,19,aluno,s1\n"
+            "123,Curta,20,aluno,s2\n"          # Linha 3: matrícula inválida.
+            "2000002,Bia,21,Aluno,s3\n"
+            "1234567,Existente,20,aluno,s4\n"  # Linha 5: já cadastrada.
+            "2000001,Repetida,22,aluno,s5\n"   # Linha 6: repetida no arquivo.
+            "2000003,Caio,0,aluno,s6\n",       # Linha 7: idade inválida.
+            encoding="utf-8")
+        resultado = importacao.importa_usuarios(str(csv_usuarios))
+        assert resultado["status"] == "aviso" and resultado["criados"] == 2, f"Importação incorreta: {resultado['mensagem']}"
+        assert [erro["linha"] for erro in resultado["erros"]] == [3, 5, 6, 7], "Erros por linha incorretos"
+        assert cadastro.entra_conta("2000002", "s3")["tipo"] == "aluno", "Conta importada não entra"
+        assert senhas.eh_hash(auxiliar.get_backend().busca_usuario("2000001")["senha"]), "Senha importada sem hash"
+
+        jsonl_matriculas = JSON_TEST_DIR / "matriculas.jsonl"
+        jsonl_matriculas.write_text(
+            '{"turma": "Turma B", "matricula": 2000001}\n'
+            '{"turma": "Turma B", "matricula": "2000002"}\n'
+            '{"turma": "Turma B", "matricula": 7654321}\n'   # Linha 3: professor.
+            'isto não é json\n'                                # Linha 4: JSON inválido.
+            '{"turma": "Turma Z", "matricula": 2000001}\n'   # Linha 5: turma inexistente.
+            '{"turma": "Turma A", "matricula": 1234567}\n',  # Linha 6: já matriculado.
+            encoding="utf-8")
+        resultado = importacao.importa_matriculas(str(jsonl_matriculas))
+        assert resultado["inseridos"] == 2, f"Matrículas incorretas: {resultado['mensagem']}"
+        assert [erro["linha"] for erro in resultado["erros"]] == [3, 4, 5, 6], "Erros por linha incorretos"
+        assert auxiliar.get_backend().busca_turma("Turma B")["alunos"] == [2000001, 2000002], "Alunos não gravados na turma"
+        assert aluno._get_aluno_turmas_e_listas(2000002) == {"Turma B": []}, "Índice de matrículas não atualizado"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        senhas.ITERACOES_PBKDF2 = iteracoes_anteriores
+
 # ---------------------- TESTES PROFESSOR ----------------------
 def test_cria_turma():
     """Testa criação de turma."""
     _reset_fs()
     try:
         professor.cria_turma("Turma Teste")
-        turmas = auxiliar.load_json(str(TURMAS_JSON), {})
-        assert "Turma Teste" in turmas, "Turma não foi criada"
+        assert "Turma Teste" in auxiliar.get_backend().lista_turmas(), "Turma não foi criada"
         return True, "OK"
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
@@ -216,13 +383,12 @@ def test_insere_e_remove_aluno():
     usuarios = {"1234567": {"matricula": 1234567, "nome": "Aluno", "idade": 18, "tipo": "aluno", "senha": "abc"}}
     auxiliar.save_json(turmas, str(TURMAS_JSON))
     auxiliar.save_json(usuarios, str(USUARIOS_JSON))
+    _sincroniza_backend()
     try:
         professor.insere_aluno("Turma Teste", 1234567)
-        turmas = auxiliar.load_json(str(TURMAS_JSON), {})
-        assert 1234567 in turmas["Turma Teste"]["alunos"], "Aluno não inserido"
+        assert 1234567 in auxiliar.get_backend().busca_turma("Turma Teste")["alunos"], "Aluno não inserido"
         professor.remove_aluno("Turma Teste", 1234567)
-        turmas = auxiliar.load_json(str(TURMAS_JSON), {})
-        assert 1234567 not in turmas["Turma Teste"]["alunos"], "Aluno não removido"
+        assert 1234567 not in auxiliar.get_backend().busca_turma("Turma Teste")["alunos"], "Aluno não removido"
         return True, "OK"
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
@@ -254,6 +420,207 @@ def test_cria_exercicio():
         return False, f"{type(e).__name__}: {e}"
 
 # ---------------------- TESTES ALUNO ----------------------
+@_backend_json
+def test_listas_formato_acrescimo():
+    """Testa o formato de acréscimo das listas: conversão, acréscimo sem regravar, lote de exercícios e linha cortada."""
+    _reset_fs()
+    criar_lista_exemplo()
+    criar_lista_exemplo("antiga.json")
+    caminho = LISTAS_DIR / "matematica.json"
+    try:
+        exercicios = auxiliar.get_backend().carrega_lista("matematica.json")
+        assert len(exercicios) == 1, "Lista antiga não lida"
+        professor.cria_exercicio(exercicios, "Soma", "1+1?", ["2", "3", "4"], "a", "matematica.json")
+        assert [ex["Enunciado"] for ex in exercicios] == ["Quanto é 2+2?", "1+1?"], "Lista convertida incorretamente"
+        conteudo = caminho.read_bytes()
+        assert conteudo.startswith(listas_exercicios.serializa([])), "Cabeçalho do formato de acréscimo ausente"
+
+        # Um novo exercício só acrescenta linhas: o arquivo (inode) e o conteúdo anterior são mantidos.
+        inode = caminho.stat().st_ino
+        professor.cria_exercicio(exercicios, "Soma", "3+3?", ["5", "6", "7"], "b", "matematica.json")
+        assert caminho.stat().st_ino == inode and caminho.read_bytes().startswith(conteudo), "Lista regravada"
+
+        # Lote: os válidos são acrescentados juntos e os inválidos relatados pela posição.
+        lote = [{"tema": "Sub", "enunciado": "3-1?", "alternativas": ["1", "2", "3"], "resposta_correta": "B"},
+                {"tema": "Sub", "enunciado": "sem alternativas", "alternativas": ["1"], "resposta_correta": "a"},
+                {"tema": "Sub", "enunciado": "5-1?", "alternativas": ["4", "5", "6"], "resposta_correta": "a"}]
+        resultado = professor.cria_exercicios("matematica.json", lote)
+        assert resultado["status"] == "aviso" and resultado["criados"] == 2 and resultado["total"] == 5, resultado["mensagem"]
+        assert [erro["registro"] for erro in resultado["erros"]] == [2], "Erro do lote não relatado"
+
+        # Uma linha cortada (queda no meio de um acréscimo) é ignorada e descartada no acréscimo seguinte.
+        with open(caminho, "ab") as f:
+            f.write(b'{"Tema": "Cortado", "Enun')
+        assert len(auxiliar.get_backend().carrega_lista("matematica.json")) == 5, "Linha cortada interpretada"
+        professor.cria_exercicio([], "Mult", "2*2?", ["4", "5", "6"], "a", "matematica.json")
+        lista = auxiliar.get_backend().carrega_lista("matematica.json")
+        assert [ex["Tema"] for ex in lista] == ["Soma", "Soma", "Soma", "Sub", "Sub", "Mult"], "Acréscimo após linha cortada incorreto"
+        # O catálogo, estendido a cada acréscimo sem reler a lista, confere com o calculado sobre a lista inteira.
+        entrada = auxiliar.get_backend().catalogo_listas()["matematica.json"]
+        completo = auxiliar.resumo_lista(lista, listas_exercicios.serializa(lista))
+        assert (entrada["hash"], entrada["exercicios"], entrada["temas"]) == (completo["hash"], 6, ["Mult", "Soma", "Sub"]), \
+            "Catálogo estendido incorretamente"
+
+        # Acréscimo feito por outro processo: a leitura seguinte vê as linhas novas.
+        with open(caminho, "ab") as f:
+            f.write(listas_exercicios.serializa([{"Tema": "Externo"}])[len(listas_exercicios.serializa([])):])
+        assert auxiliar.get_backend().carrega_lista("matematica.json")[-1] == {"Tema": "Externo"}, "Acréscimo externo não lido"
+        # O acréscimo externo não atualizou o catálogo: o próximo acréscimo refaz a entrada a partir do arquivo.
+        assert professor.cria_exercicio([], "Div", "4/2?", ["2", "3", "4"], "a", "matematica.json")["status"] == "sucesso"
+        lista = auxiliar.get_backend().carrega_lista("matematica.json")
+        assert auxiliar.get_backend().catalogo_listas()["matematica.json"]["hash"] == \
+            auxiliar.resumo_lista(lista, listas_exercicios.serializa(lista))["hash"], "Catálogo não refeito após acréscimo externo"
+
+        resultado = listas_exercicios.converte_listas()
+        assert resultado["convertidas"] == 1, resultado["mensagem"]
+        assert (LISTAS_DIR / "antiga.json").read_bytes().startswith(listas_exercicios.serializa([])), "Lista antiga não convertida"
+        assert auxiliar.get_backend().carrega_lista("antiga.json")[0]["RespostaCorreta"] == "b", "Conversão alterou a lista"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+@_backend_json
+def test_leitura_paginada():
+    """Testa a leitura paginada das listas: índice de posições, acréscimos, índice inválido, formato antigo e a tela paginada."""
+    import builtins, io, contextlib
+    _reset_fs()
+    backend = auxiliar.get_backend()
+    caminho = str(LISTAS_DIR / "banco.json")
+    exercicios = [{"Tema": f"T{i}", "Enunciado": f"{i}?", "Alternativa A": "1", "Alternativa B": "2",
+                   "Alternativa C": "3", "RespostaCorreta": "a"} for i in range(25)]
+    indexacoes = []
+    indexa_original = listas_exercicios._indexa_linhas
+    def conta_indexacoes(conteudo, base, posicoes):
+        indexacoes.append(len(conteudo))
+        return indexa_original(conteudo, base, posicoes)
+    listas_exercicios._indexa_linhas = conta_indexacoes
+    input_original = builtins.input
+    try:
+        backend.salva_lista("banco.json", exercicios)
+        assert backend.carrega_pagina_lista("banco.json", 10, 5) == (exercicios[10:15], 25), "Página incorreta"
+        assert listas_exercicios.exercicio(caminho, 24) == exercicios[24] and listas_exercicios.exercicio(caminho, 25) is None, \
+            "Exercício pela posição incorreto"
+        assert Path(listas_exercicios._indice_path(caminho)).exists(), "Índice de posições não gravado"
+
+        # Em outro processo (sem nada em memória), o índice gravado é usado sem interpretar a lista.
+        listas_exercicios._indices.clear()
+        del indexacoes[:]
+        assert backend.carrega_pagina_lista("banco.json", 20, 10) == (exercicios[20:], 25), "Página final incorreta"
+        assert indexacoes == [], "Lista indexada de novo"
+
+        # Acréscimo: só as linhas novas são indexadas.
+        novos = [{"Tema": "Novo", "Enunciado": "n?"}, {"Tema": "Novo", "Enunciado": "m?"}]
+        backend.acrescenta_exercicios("banco.json", novos)
+        listas_exercicios._indices.clear()
+        assert listas_exercicios.quantidade(caminho) == 27 and listas_exercicios.exercicio(caminho, 26) == novos[1], \
+            "Acréscimo não indexado"
+        assert indexacoes == [len(listas_exercicios.serializa(novos)) - len(listas_exercicios.serializa([]))], \
+            f"Indexação não incremental: {indexacoes}"
+
+        # Índice corrompido ou de uma versão anterior da lista: é refeito.
+        Path(listas_exercicios._indice_path(caminho)).write_bytes(b"lixo")
+        listas_exercicios._indices.clear()
+        assert backend.carrega_pagina_lista("banco.json", 25, 10) == (novos, 27), "Índice inválido usado"
+        backend.salva_lista("banco.json", exercicios[:3])
+        assert backend.carrega_pagina_lista("banco.json", 0, 10) == (exercicios[:3], 3), "Índice de outra versão usado"
+
+        # Formato antigo: lido inteiro, sem índice.
+        criar_lista_exemplo("antiga.json")
+        pagina, total = backend.carrega_pagina_lista("antiga.json", 0, 10)
+        assert total == 1 and pagina[0]["RespostaCorreta"] == "b", "Lista antiga não paginada"
+        assert not Path(listas_exercicios._indice_path(str(LISTAS_DIR / "antiga.json"))).exists(), "Índice de lista antiga"
+        assert backend.carrega_pagina_lista("inexistente.json", 0, 10) == ([], 0), "Lista inexistente"
+
+        # Tela paginada: uma página por vez, avançando com Enter e saltando pelo número da página.
+        backend.salva_lista("banco.json", exercicios)
+        opcoes = iter(["", "3", ""])
+        builtins.input = lambda prompt="": next(opcoes)
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            aluno._navega_paginas("banco.json", aluno._exibe_exercicio)
+        texto = saida.getvalue()
+        assert "Página 1 de 3" in texto and "Página 2 de 3" in texto and "Página 3 de 3" in texto, "Páginas não exibidas"
+        assert texto.count("Exercício ") == 25, "Exercícios exibidos incorretamente"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        listas_exercicios._indexa_linhas = indexa_original
+        builtins.input = input_original
+
+@_backend_json
+def test_catalogo_listas():
+    """Testa o catálogo de listas: metadados, atualização por cria_exercicio e conferência pelo mtime do diretório."""
+    import armazenamento_json
+    _reset_fs()
+    criar_lista_exemplo()
+    aberturas = []
+    resumo_original = armazenamento_json._resumo_arquivo_lista
+    def conta_aberturas(caminho):
+        aberturas.append(Path(caminho).name)
+        return resumo_original(caminho)
+    armazenamento_json._resumo_arquivo_lista = conta_aberturas
+    try:
+        catalogo = professor.get_catalogo_listas()
+        assert list(catalogo) == ["matematica.json"], "Lista não catalogada"
+        conteudo = (LISTAS_DIR / "matematica.json").read_bytes()
+        assert catalogo["matematica.json"]["tamanho"] == len(conteudo), "Tamanho incorreto"
+        exercicios = auxiliar.get_backend().carrega_lista("matematica.json")
+        canonico = listas_exercicios.serializa(exercicios)
+        assert catalogo["matematica.json"]["hash"] == auxiliar.resumo_lista(exercicios, canonico)["hash"], "Hash incorreto"
+        assert catalogo["matematica.json"]["exercicios"] == len(exercicios), "Quantidade de exercícios incorreta"
+
+        # cria_exercicio atualiza a entrada: a conferência seguinte não abre nenhuma lista.
+        del aberturas[:]
+        professor.cria_exercicio(exercicios, "Álgebra", "x+1=2?", ["0", "1", "2"], "b", "matematica.json")
+        professor.cria_exercicio([], "Geografia", "Capital?", ["A", "B", "C"], "a", "nova.json")
+        aberturas_gravacao = len(aberturas)
+        catalogo = professor.get_catalogo_listas()
+        assert len(aberturas) == aberturas_gravacao, f"Listas reabertas: {aberturas[aberturas_gravacao:]}"
+        assert "Álgebra" in catalogo["matematica.json"]["temas"], "Tema novo fora do catálogo"
+        assert catalogo["nova.json"]["exercicios"] == 1 and professor.get_listas_existentes() == ["matematica.json", "nova.json"], \
+            "Lista nova fora do catálogo"
+
+        # Alteração feita por fora: o diretório muda e só a lista alterada é aberta de novo.
+        del aberturas[:]
+        auxiliar.save_json([], str(LISTAS_DIR / "nova.json"))
+        assert professor.get_catalogo_listas()["nova.json"]["exercicios"] == 0, "Alteração externa não detectada"
+        assert aberturas == ["nova.json"], f"Listas abertas sem necessidade: {aberturas}"
+
+        # Com o diretório inalterado há tempo suficiente, o catálogo é usado sem nenhum os.stat das listas.
+        catalogo_path = armazenamento_json._catalogo_listas_path()
+        gravado = auxiliar.load_json(catalogo_path)
+        gravado["verificado_ns"] = gravado["diretorio"] + auxiliar._JANELA_RECENTE_NS
+        auxiliar.save_json(gravado, catalogo_path)
+        assert armazenamento_json.catalogo_listas(somente_leitura=True) is auxiliar.load_json(catalogo_path, somente_leitura=True)["listas"], \
+            "Catálogo não usado diretamente"
+
+        # Um acréscimo vai para o log do catálogo, sem regravar a base; a leitura compacta um log grande.
+        quantidade = armazenamento_json.catalogo_listas()["matematica.json"]["exercicios"]
+        base_antes = Path(catalogo_path).read_bytes()
+        professor.cria_exercicio([], "Álgebra", "2x=4?", ["1", "2", "3"], "b", "matematica.json")
+        assert Path(catalogo_path).read_bytes() == base_antes, "Base do catálogo regravada por um acréscimo"
+        log_path = Path(armazenamento_json._catalogo_log_path())
+        assert len(log_path.read_bytes().splitlines()) == 1, "Acréscimo fora do log do catálogo"
+        assert armazenamento_json.catalogo_listas()["matematica.json"]["exercicios"] == quantidade + 1, \
+            "Registro do log não aplicado"
+        limite_original = armazenamento_json.CATALOGO_LOG_MAX_REGISTROS
+        armazenamento_json.CATALOGO_LOG_MAX_REGISTROS = 0
+        try:
+            armazenamento_json.catalogo_listas()
+        finally:
+            armazenamento_json.CATALOGO_LOG_MAX_REGISTROS = limite_original
+        assert log_path.read_bytes() == b"", "Log do catálogo não compactado"
+        base = auxiliar.load_json(catalogo_path)
+        assert base["listas"]["matematica.json"]["exercicios"] == quantidade + 1 and base["log"][0] == log_path.stat().st_ino, \
+            "Compactação incorreta"
+        assert armazenamento_json.catalogo_listas()["matematica.json"]["exercicios"] == quantidade + 1, "Catálogo compactado incorreto"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        armazenamento_json._resumo_arquivo_lista = resumo_original
+
 def test_get_aluno_turmas_e_listas():
     """Testa se retorna corretamente as turmas e listas de um aluno."""
     _reset_fs()
@@ -264,6 +631,7 @@ def test_get_aluno_turmas_e_listas():
         }
     }
     auxiliar.save_json(turmas, str(TURMAS_JSON))
+    _sincroniza_backend()
     try:
         result = aluno._get_aluno_turmas_e_listas(1234567)
         assert "Turma A" in result and "matematica.json" in result["Turma A"], "Turma/lista não encontrada"
@@ -271,16 +639,699 @@ def test_get_aluno_turmas_e_listas():
     except Exception as e:
         return False, f"{type(e).__name__}: {e}"
 
+def test_indice_matriculas():
+    """Testa se o índice de matrículas acompanha inserções/remoções e se reconstrói após edição externa."""
+    _reset_fs()
+    criar_usuarios_json()
+    try:
+        professor.cria_turma("Turma X")
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {}, "Aluno não deveria ter turmas"
+        professor.insere_aluno("Turma X", 1234567)
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {"Turma X": []}, "Índice não atualizado na inserção"
+        professor.remove_aluno("Turma X", 1234567)
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {}, "Índice não atualizado na remoção"
+        criar_turmas_json()
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {"Turma A": ["matematica.json"]}, "Índice não reconstruído"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+@_backend_json
+def test_turmas_particionadas():
+    """Testa o documento por turma: catálogo, importação do turmas.json antigo e alterações que só regravam a própria turma."""
+    import armazenamento_json
+    _reset_fs()
+    criar_usuarios_json()
+    criar_turmas_json()
+    try:
+        assert armazenamento_json.lista_turmas() == ["Turma A", "Turma B"], "Turmas antigas não importadas"
+        assert not TURMAS_JSON.exists() and (JSON_TEST_DIR / "turmas.json.migrado").exists(), "turmas.json não renomeado"
+        catalogo = auxiliar.load_json(str(JSON_TEST_DIR / "turmas" / "catalogo.json"), {})
+        assert set(catalogo) == {"Turma A", "Turma B"}, "Catálogo incorreto"
+        caminho_a = JSON_TEST_DIR / "turmas" / catalogo["Turma A"]
+        caminho_b = JSON_TEST_DIR / "turmas" / catalogo["Turma B"]
+        assert auxiliar.load_json(str(caminho_a), {})["alunos"] == [1234567], "Documento da turma incorreto"
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {"Turma A": ["matematica.json"]}, "Índice não construído"
+
+        versao_a = auxiliar.versao_json(str(caminho_a))
+        versao_catalogo = auxiliar.versao_json(str(JSON_TEST_DIR / "turmas" / "catalogo.json"))
+        assert professor.insere_aluno("Turma B", 1234567)["status"] == "sucesso", "Falha ao inserir aluno"
+        assert auxiliar.versao_json(str(caminho_a)) == versao_a, "Alterar uma turma regravou outra"
+        assert auxiliar.versao_json(str(JSON_TEST_DIR / "turmas" / "catalogo.json")) == versao_catalogo, "Catálogo regravado"
+        assert auxiliar.load_json(str(caminho_b), {})["alunos"] == [1234567], "Documento da turma não gravado"
+
+        # Uma nova turma com caracteres especiais ganha seu próprio arquivo e entra no catálogo.
+        assert professor.cria_turma("Turma A/B ç")["status"] == "sucesso", "Falha ao criar turma"
+        assert professor.cria_turma("Turma A/B ç")["status"] == "erro", "Turma duplicada criada"
+        assert len(list((JSON_TEST_DIR / "turmas").glob("*.json"))) == 4, "Arquivo da nova turma não criado"
+        assert armazenamento_json.lista_turmas()[-1] == "Turma A/B ç", "Nova turma fora do catálogo"
+
+        # Uma turma removida por fora (turmas.json restaurado) some do menu do aluno, mesmo que o índice ainda a cite.
+        criar_turmas_json({"Turma B": {"alunos": [], "listas": []}})
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {"Turma A": ["matematica.json"]}, "Turma removida ainda aparece"
+        assert armazenamento_json.migra_turmas_monolitico()["status"] == "aviso", "Migração repetida"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_matriculas_ordenadas():
+    """Testa se os alunos da turma são gravados em ordem, sem duplicatas, e se o conjunto em memória segue edições externas."""
+    _reset_fs()
+    alunos_teste = {str(m): {"matricula": m, "nome": f"Aluno {m}", "idade": 20, "tipo": "aluno", "senha": "abc"}
+                    for m in (3000003, 1000001, 2000002)}
+    criar_usuarios_json(alunos_teste)
+    try:
+        professor.cria_turma("Turma O")
+        for m in (3000003, 1000001, 2000002):
+            assert professor.insere_aluno("Turma O", m)["status"] == "sucesso", f"Falha ao inserir {m}"
+        assert professor.insere_aluno("Turma O", 1000001)["status"] == "erro", "Inseriu aluno duplicado"
+        assert auxiliar.get_backend().busca_turma("Turma O")["alunos"] == [1000001, 2000002, 3000003], "Alunos não gravados em ordem"
+        assert professor.remove_aluno("Turma O", 2000002)["status"] == "sucesso", "Falha ao remover aluno"
+        assert professor.remove_aluno("Turma O", 2000002)["status"] == "erro", "Removeu aluno inexistente"
+        criar_turmas_json({"Turma O": {"alunos": [], "listas": []}}) # Edição externa do arquivo.
+        assert professor.insere_aluno("Turma O", 1000001)["status"] == "sucesso", "Conjunto em memória desatualizado"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_motor_correcao():
+    """Testa o motor de correção: um aluno, uma turma (matriz) e a equivalência entre os dois caminhos."""
+    import correcao
+    exercicios = [{"RespostaCorreta": "b"}, {"RespostaCorreta": "A"}, {"RespostaCorreta": ""}, {"RespostaCorreta": "c"}]
+    respostas_turma = [{"0": "b", "1": "c", "2": "a"}, {"0": "b", "1": "a", "3": "c"}, {}]
+    try:
+        resultado = correcao.corrige_aluno(exercicios, respostas_turma[0])
+        assert resultado["situacoes"] == [correcao.ACERTO, correcao.ERRO, correcao.ERRO, correcao.NAO_RESPONDIDA], "Situações incorretas"
+        assert (resultado["acertos"], resultado["erros"], resultado["nao_respondidas"]) == (1, 2, 1), "Totais incorretos"
+        gabarito_cod = correcao.codifica_gabarito(correcao.gabarito(exercicios))
+        linhas = [correcao.codifica_respostas(r, len(exercicios)) for r in respostas_turma]
+        turma = correcao.corrige_turma(gabarito_cod, linhas)
+        assert turma["acertos_por_aluno"] == [1, 3, 0], f"Acertos por aluno incorretos: {turma['acertos_por_aluno']}"
+        assert turma["nao_respondidas_por_aluno"] == [1, 1, 4], "Não respondidas por aluno incorretas"
+        assert turma["acertos_por_questao"] == [2, 1, 0, 1], "Acertos por questão incorretos"
+        assert turma["respondidas_por_questao"] == [2, 2, 1, 1], "Respondidas por questão incorretas"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_correcao_vetorizada():
+    """Testa se a correção da turma com NumPy e a correção com 'array' dão o mesmo resultado (pulado sem NumPy)."""
+    import random, correcao
+    if correcao.np is None:
+        return True, "PULADO: NumPy não instalado; o caminho vetorizado de corrige_turma não foi executado"
+    gerador = random.Random(2024)
+    letras = ["", "a", "b", "c", "d", "e", "ab"] # Inclui sem resposta e resposta inválida.
+    num_questoes = 37
+    gabarito_cod = correcao.codifica_gabarito([gerador.choice(letras) for _ in range(num_questoes)])
+    linhas = [correcao.codifica_respostas({str(i): gerador.choice(letras) for i in range(num_questoes) if gerador.random() < 0.8},
+                                          num_questoes) for _ in range(50)]
+    np_original = correcao.np
+    try:
+        for alunos in (linhas, linhas[:1], []):
+            vetorizado = correcao.corrige_turma(gabarito_cod, alunos)
+            correcao.np = None
+            try:
+                com_array = correcao.corrige_turma(gabarito_cod, alunos)
+            finally:
+                correcao.np = np_original
+            assert vetorizado == com_array, f"Caminhos divergentes com {len(alunos)} aluno(s)"
+            assert all(type(v) is int for v in vetorizado["acertos_por_aluno"]), "Tipos do NumPy no resultado"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_estatisticas_turma():
+    """Testa se as estatísticas da turma acompanham as respostas e as matrículas e conferem com a reconstrução."""
+    import builtins, estatisticas, gabaritos
+    _reset_fs()
+    criar_usuarios_json()
+    criar_lista_exemplo(dados=[
+        {"Tema": "Soma", "Enunciado": "2+2?", "Alternativa A": "3", "Alternativa B": "4", "Alternativa C": "5", "RespostaCorreta": "b"},
+        {"Tema": "Soma", "Enunciado": "1+1?", "Alternativa A": "2", "Alternativa B": "3", "Alternativa C": "4", "RespostaCorreta": "a"},
+    ])
+    input_original = builtins.input
+    try:
+        professor.cria_turma("Turma E")
+        professor.insere_aluno("Turma E", 1234567)
+        professor.passa_lista("matematica.json", "Turma E")
+        lista = professor.visualiza_turma("Turma E")["listas"][0]
+        assert lista["num_alunos_contribuintes"] == 0, "Estatísticas iniciais deveriam estar zeradas"
+
+        # Aluno responde a 1ª questão corretamente e a 2ª errado.
+        # As estatísticas são gravadas uma vez ao completar a lista, não a cada resposta.
+        respostas = iter(["b", "c", ""])
+        builtins.input = lambda prompt="": next(respostas)
+        gravacoes = []
+        atualiza_original = estatisticas.atualiza_alunos
+        def conta_gravacoes(*args):
+            gravacoes.append(args)
+            return atualiza_original(*args)
+        estatisticas.atualiza_alunos = conta_gravacoes
+        try:
+            aluno.responder_lista(1234567, "matematica.json", auxiliar.load_json(str(LISTAS_DIR / "matematica.json")))
+        finally:
+            estatisticas.atualiza_alunos = atualiza_original
+        assert len(gravacoes) == 1, f"Estatísticas atualizadas {len(gravacoes)} vezes"
+        lista = professor.visualiza_turma("Turma E")["listas"][0]
+        assert lista["indice_acerto"] == "50.00%", f"Índice incorreto: {lista['indice_acerto']}"
+        assert [q["acertos"] for q in lista["questoes"]] == [1, 0], "Acertos por questão incorretos"
+        incremental = auxiliar.get_backend().carrega_estatisticas_turma("Turma E")
+        estatisticas.reconstroi_estatisticas("Turma E")
+        assert auxiliar.get_backend().carrega_estatisticas_turma("Turma E") == incremental, "Divergência com a reconstrução"
+
+        # Repetir uma atualização já contabilizada (ex: evento já lido pelo recálculo) não conta o aluno duas vezes.
+        backend = auxiliar.get_backend()
+        gabarito_lista = gabaritos.da_lista("matematica.json")
+        progresso_lista = auxiliar.get_backend().carrega_progresso_aluno(1234567)["matematica.json"]
+        estatisticas.atualiza_aluno(1234567, "matematica.json", gabarito_lista, None, progresso_lista)
+        assert backend.carrega_estatisticas_turma("Turma E") == incremental, "Atualização repetida contada duas vezes"
+        # Um evento anterior ao cálculo fica em uma entrada parcial, incorporada pelo recálculo sem contar duas vezes.
+        backend.salva_estatisticas_turma("Turma E", {})
+        estatisticas.atualiza_aluno(1234567, "matematica.json", gabarito_lista, None, progresso_lista)
+        assert backend.carrega_estatisticas_turma("Turma E")["matematica.json"].get("parcial"), "Entrada parcial não criada"
+        assert professor.visualiza_turma("Turma E")["listas"][0]["num_alunos_contribuintes"] == 1, "Aluno contado duas vezes"
+        assert backend.carrega_estatisticas_turma("Turma E") == incremental, "Recálculo com entrada parcial incorreto"
+        # As contribuições dos alunos ficam fora das estatísticas lidas ao visualizar a turma.
+        entrada = backend.carrega_estatisticas_turma("Turma E")["matematica.json"]
+        assert "alunos" not in entrada, "Contribuições dos alunos nas estatísticas da turma"
+        # Contadores que não conferem com as contribuições (ex: gravação interrompida) são descartados e recalculados.
+        backend.salva_estatisticas_turma("Turma E", {"matematica.json": dict(entrada, acertos=99)})
+        estatisticas.atualiza_aluno(1234567, "matematica.json", gabarito_lista, None, progresso_lista)
+        assert professor.visualiza_turma("Turma E")["listas"][0]["indice_acerto"] == "50.00%", "Contadores divergentes usados"
+        assert backend.carrega_estatisticas_turma("Turma E") == incremental, "Recálculo após divergência incorreto"
+        # Com o hash da lista inalterado, visualizar a turma não carrega a lista.
+        carrega_original = backend.carrega_lista
+        def carrega_proibido(*args, **kwargs):
+            raise AssertionError("Lista carregada ao visualizar a turma")
+        backend.carrega_lista = carrega_proibido
+        try:
+            assert professor.visualiza_turma("Turma E")["listas"][0]["indice_acerto"] == "50.00%", "Índice incorreto"
+        finally:
+            backend.carrega_lista = carrega_original
+
+        # Ao sair da turma, a contribuição do aluno é retirada; ao voltar, é incluída de novo.
+        professor.remove_aluno("Turma E", 1234567)
+        assert professor.visualiza_turma("Turma E")["listas"][0]["num_alunos_contribuintes"] == 0, "Remoção não refletida"
+        professor.insere_aluno("Turma E", 1234567)
+        assert professor.visualiza_turma("Turma E")["listas"][0]["indice_acerto"] == "50.00%", "Reinserção não refletida"
+
+        # Refazer a lista zera a contribuição até as novas respostas.
+        respostas = iter(["s", "parar"])
+        aluno.responder_lista(1234567, "matematica.json", auxiliar.load_json(str(LISTAS_DIR / "matematica.json")))
+        assert professor.visualiza_turma("Turma E")["listas"][0]["num_alunos_contribuintes"] == 0, "Reinício não refletido"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        builtins.input = input_original
+
+def test_envio_respostas():
+    """Testa o envio da lista inteira (um aluno e em lote): validação, conclusão da lista, resultado e estatísticas."""
+    import estatisticas
+    _reset_fs()
+    criar_usuarios_json({
+        "1234567": {"matricula": 1234567, "nome": "Aluno Teste", "idade": 20, "tipo": "aluno", "senha": "abc"},
+        "2345678": {"matricula": 2345678, "nome": "Aluna Teste", "idade": 21, "tipo": "aluno", "senha": "def"},
+        "7654321": {"matricula": 7654321, "nome": "Prof Teste", "idade": 40, "tipo": "professor", "senha": "prof"},
+    })
+    criar_lista_exemplo(dados=[
+        {"Tema": "Soma", "Enunciado": "2+2?", "Alternativa A": "3", "Alternativa B": "4", "Alternativa C": "5", "RespostaCorreta": "b"},
+        {"Tema": "Soma", "Enunciado": "1+1?", "Alternativa A": "2", "Alternativa B": "3", "Alternativa C": "N/A", "RespostaCorreta": "a"},
+        {"Tema": "Soma", "Enunciado": "0+0?", "Alternativa A": "0", "Alternativa B": "1", "Alternativa C": "2", "RespostaCorreta": "a"},
+    ])
+    try:
+        professor.cria_turma("Turma E")
+        professor.insere_alunos("Turma E", [1234567, 2345678])
+        professor.passa_lista("matematica.json", "Turma E")
+
+        resultado = aluno.envia_respostas(1234567, "matematica.json", {0: "b", "1": "c"})
+        assert resultado["status"] == "erro", "Alternativa inexistente aceita"
+        assert "matematica.json" not in auxiliar.get_backend().carrega_progresso_aluno(1234567), "Envio inválido gravado"
+
+        resultado = aluno.envia_respostas(1234567, "matematica.json", {0: "B", "1": "b", 2: ""})
+        assert resultado["status"] == "sucesso", resultado["mensagem"]
+        assert (resultado["acertos"], resultado["erros"], resultado["nao_respondidas"]) == (1, 1, 1), "Correção incorreta"
+        assert resultado["erros_detalhes"][0]["exercicio"] == 2 and resultado["erros_detalhes"][0]["sua_resposta"] == "3", "Detalhes incorretos"
+        dados = auxiliar.get_backend().carrega_progresso_aluno(1234567)["matematica.json"]
+        assert dados == {"progresso": 3, "respostas": {"0": "b", "1": "b"}, "status": "completo"}, "Envio não gravado"
+
+        resultado = aluno.envia_respostas_lote([
+            {"matricula": 2345678, "lista": "matematica.json", "respostas": {"0": "b", "1": "a", "2": "a"}},
+            {"matricula": 7654321, "lista": "matematica.json", "respostas": {"0": "b"}},  # Fora da turma.
+            {"matricula": 1234567, "lista": "portugues.json", "respostas": {}},           # Lista inexistente.
+            {"matricula": 1234567, "lista": "matematica.json", "respostas": {"0": "a", "1": "a"}},
+            {"matricula": 1234567, "lista": "matematica.json", "respostas": {"0": "b"}},  # Repetido no lote.
+        ])
+        assert resultado["status"] == "aviso" and resultado["enviados"] == 2, resultado["mensagem"]
+        assert [erro["registro"] for erro in resultado["erros"]] == [2, 3, 5], "Erros por envio incorretos"
+        assert resultado["resultados"][0]["acertos"] == 3, "Correção do lote incorreta"
+        lista = professor.visualiza_turma("Turma E")["listas"][0]
+        assert [q["acertos"] for q in lista["questoes"]] == [1, 2, 1], "Estatísticas não atualizadas"
+        incremental = auxiliar.get_backend().carrega_estatisticas_turma("Turma E")
+        estatisticas.reconstroi_estatisticas("Turma E")
+        assert auxiliar.get_backend().carrega_estatisticas_turma("Turma E") == incremental, "Divergência com a reconstrução"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_servico_http():
+    """Testa o serviço HTTP/JSON: login, autorização por tipo, rotas do professor e do aluno e envio de respostas."""
+    import asyncio, http.client, threading, servico
+    _reset_fs()
+    criar_usuarios_json()
+    criar_turmas_json()
+    criar_lista_exemplo()
+    loop = asyncio.new_event_loop()
+    servidor = loop.run_until_complete(servico.cria_servidor("127.0.0.1", 0, trabalhadores=4))
+    porta = servidor.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def requisicao(metodo, caminho, corpo=None, token=None):
+        conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=10)
+        cabecalhos = {"Content-Type": "application/json"}
+        if token:
+            cabecalhos["Authorization"] = f"Bearer {token}"
+        conexao.request(metodo, caminho, json.dumps(corpo) if corpo is not None else None, cabecalhos)
+        resposta = conexao.getresponse()
+        dados = json.loads(resposta.read())
+        conexao.close()
+        return resposta.status, dados
+
+    try:
+        assert requisicao("POST", "/sessao", {"matricula": "7654321", "senha": "errada"})[0] == 401, "Senha errada aceita"
+        token_prof = requisicao("POST", "/sessao", {"matricula": "7654321", "senha": "prof"})[1]["token"]
+        token_aluno = requisicao("POST", "/sessao", {"matricula": 1234567, "senha": "abc"})[1]["token"]
+        assert requisicao("GET", "/turmas")[0] == 401, "Rota acessada sem sessão"
+        assert requisicao("GET", "/turmas", token=token_aluno)[0] == 403, "Aluno acessou rota de professor"
+        assert requisicao("PUT", "/turmas", token=token_prof)[0] == 405, "Método incorreto aceito"
+
+        assert requisicao("POST", "/turmas", {"nome": "Turma C"}, token_prof)[0] == 200, "Turma não criada"
+        assert requisicao("POST", "/turmas/Turma%20C/alunos", {"matriculas": [1234567]}, token_prof)[1]["inseridos"] == 1, "Aluno não inserido"
+        assert requisicao("POST", "/turmas/Turma%20C/listas", {"lista": "matematica.json"}, token_prof)[0] == 200, "Lista não associada"
+        assert requisicao("POST", "/turmas/Turma%20C/listas", {}, token_prof)[0] == 400, "Campo ausente aceito"
+        assert requisicao("GET", "/turmas", token=token_prof)[1]["turmas"] == ["Turma A", "Turma B", "Turma C"], "Turmas incorretas"
+
+        # Nomes de lista que sairiam do diretório de listas são recusados antes de chegar ao backend.
+        exercicio = {"tema": "X", "enunciado": "Y", "alternativas": ["1", "2", "3"], "resposta_correta": "a"}
+        for caminho in ("/listas/..%2Fusuarios.json/exercicios", "/listas/.oculta.json/exercicios", "/listas/lista.txt/exercicios"):
+            assert requisicao("POST", caminho, exercicio, token_prof)[0] == 400, f"Nome de lista inválido aceito: {caminho}"
+        assert requisicao("GET", "/aluno/listas/..%2Fturmas.json", token=token_aluno)[0] == 400, "Nome de lista inválido aceito"
+        assert requisicao("POST", "/turmas/Turma%20C/listas", {"lista": "../usuarios.json"}, token_prof)[0] == 400, \
+            "Nome de lista inválido associado"
+        assert json.loads(USUARIOS_JSON.read_text(encoding="utf-8"))["7654321"]["tipo"] == "professor", "Arquivo fora das listas alterado"
+
+        status, dados = requisicao("GET", "/aluno/listas/matematica.json", token=token_aluno)
+        assert status == 200 and "RespostaCorreta" not in dados["exercicios"][0], "Gabarito exposto ao aluno"
+        status, dados = requisicao("POST", "/aluno/listas/matematica.json/respostas", {"respostas": {"0": "b"}}, token_aluno)
+        assert status == 200 and dados["acertos"] == 1, f"Envio incorreto: {dados['mensagem']}"
+        assert requisicao("GET", "/aluno/listas", token=token_aluno)[1]["turmas"]["Turma C"][0]["status"] == "completo", "Status não atualizado"
+        dados = requisicao("GET", "/turmas/Turma%20C", token=token_prof)[1]
+        assert dados["listas"][0]["indice_acerto"] == "100.00%", "Estatísticas não atualizadas"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(servico.fecha_servidor(servidor))
+        loop.close()
+        servico.encerra()
+
+def test_modo_lote():
+    """Testa o modo em lote do main.py: comandos executados em ordem, erros por linha, relatórios e vazão."""
+    import senhas
+    _reset_fs()
+    criar_usuarios_json()
+    iteracoes_anteriores = senhas.ITERACOES_PBKDF2
+    senhas.ITERACOES_PBKDF2 = 1000
+    comandos = [
+        {"comando": "create_user", "matricula": 3000001, "nome": "Ana", "idade": 19, "tipo": "aluno", "senha": "s1"},
+        {"comando": "create_user", "matricula": 1234567, "nome": "Repetido", "idade": 19, "tipo": "aluno", "senha": "s2"},  # Linha 2.
+        {"comando": "create_turma", "nome": "Turma L"},
+        {"comando": "create_exercise", "lista": "lote.json", "tema": "Soma", "enunciado": "2+2?",
+         "alternativas": ["3", "4", "5"], "resposta_correta": "B"},
+        {"comando": "enroll", "turma": "Turma L", "matriculas": [3000001, 1234567]},
+        {"comando": "assign_list", "turma": "Turma L", "lista": "lote.json"},
+        {"comando": "submit_answers", "matricula": 3000001, "lista": "lote.json", "respostas": {"0": "b"}},
+        {"comando": "voar"},                                                                                          # Linha 8.
+        {"comando": "enroll", "turma": "Turma L"},                                                                    # Linha 9.
+        {"comando": "report", "turma": "Turma L"},
+    ]
+    arquivo = JSON_TEST_DIR / "comandos.jsonl"
+    arquivo.write_text("".join(json.dumps(comando) + "\n" for comando in comandos), encoding="utf-8")
+    try:
+        resultado = main.executa_lote(str(arquivo), commit_a_cada=3)
+        assert resultado["status"] == "aviso" and resultado["executados"] == 8, resultado["mensagem"]
+        assert [erro["linha"] for erro in resultado["erros"]] == [2, 8, 9], f"Erros por linha incorretos: {resultado['erros']}"
+        assert resultado["comandos_por_segundo"] > 0, "Vazão não calculada"
+        relatorio = resultado["relatorios"][0]
+        assert relatorio["linha"] == 10 and relatorio["resultado"]["listas"][0]["indice_acerto"] == "100.00%", "Relatório incorreto"
+        auxiliar.limpa_cache_json()
+        assert auxiliar.get_backend().busca_turma("Turma L")["listas"] == ["lote.json"], "Alterações não gravadas"
+        assert cadastro.entra_conta("3000001", "s1")["nome"] == "Ana", "Usuário do lote não entra"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        senhas.ITERACOES_PBKDF2 = iteracoes_anteriores
+
+def test_diario_progresso():
+    """Testa o registro de eventos no diário de progresso, a releitura e a compactação."""
+    _reset_fs()
+    try:
+        progresso.registra_evento(1234567, "matematica.json", "resposta", indice=0, resposta="b", progresso=1)
+        progresso.registra_evento(1234567, "matematica.json", "completo")
+        dados = progresso.carrega_progresso_aluno(1234567)["matematica.json"]
+        assert dados == {"progresso": 1, "respostas": {"0": "b"}, "status": "completo"}, "Diário não reaplicado"
+        progresso.compacta_progresso(1234567)
+        snapshot = auxiliar.load_json(progresso._shard_path("1234567"), {})
+        # No snapshot, as respostas ficam na forma compacta (um caractere por questão; ver respostas.py).
+        assert snapshot["matematica.json"] == {"progresso": 1, "respostas": "b", "status": "completo"}, "Compactação não gravou o snapshot"
+        assert progresso.carrega_progresso_aluno(1234567)["matematica.json"] == dados, "Snapshot compactado lido incorretamente"
+        assert progresso.carrega_progresso_aluno(1234567)["matematica.json"] == dados, "Progresso mudou após compactar"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_respostas_compactas():
+    """Testa a representação compacta das respostas: interface de dicionário, forma gravada, correção e diário."""
+    import correcao
+    from respostas import Respostas
+    _reset_fs()
+    try:
+        respostas = Respostas()
+        respostas["2"] = "c"
+        respostas["0"] = "b"
+        assert respostas == {"0": "b", "2": "c"} and len(respostas) == 2 and "1" not in respostas, "Interface de dicionário incorreta"
+        assert respostas.get("1") is None and list(respostas) == ["0", "2"], "Consulta incorreta"
+        assert respostas.serializa() == "b.c" and Respostas("b.c") == respostas, "Forma serializada incorreta"
+
+        # Valores fora do formato (dados antigos) são mantidos sem perda.
+        antigas = Respostas({"0": "a", "1": "B", "2": "não respondida"})
+        assert antigas["1"] == "B" and antigas.serializa() == {"0": "a", "1": "B", "2": "não respondida"}, "Valor antigo perdido"
+        exercicios = [{"RespostaCorreta": "a"}, {"RespostaCorreta": "b"}, {"RespostaCorreta": "c"}]
+        for dados in ({"0": "a", "1": "B", "2": "não respondida"}, {"0": "b", "2": "c"}):
+            assert correcao.corrige_aluno(exercicios, Respostas(dados)) == correcao.corrige_aluno(exercicios, dados), \
+                f"Correção diferente para {dados}"
+
+        # Progresso: respostas carregadas como Respostas e gravadas com um caractere por questão.
+        for i, letra in enumerate("abcab"):
+            progresso.registra_evento(1234567, "matematica.json", "resposta", indice=i, resposta=letra, progresso=i + 1)
+        progresso.registra_evento(1234567, "portugues.json", "envio", respostas={"0": "c", "1": "a"}, progresso=2)
+        diario = Path(progresso._journal_path(progresso._shard_path("1234567"))).read_text(encoding="utf-8")
+        assert '"respostas": "ca"' in diario, "Envio não gravado na forma compacta"
+        carregado = progresso.carrega_progresso_aluno(1234567)
+        assert isinstance(carregado["matematica.json"]["respostas"], Respostas), "Respostas não carregadas na forma compacta"
+        assert carregado["portugues.json"]["respostas"] == {"0": "c", "1": "a"}, "Envio não reaplicado"
+        progresso.compacta_progresso(1234567)
+        snapshot = auxiliar.load_json(progresso._shard_path("1234567"), {})
+        assert snapshot["matematica.json"]["respostas"] == "abcab", "Snapshot sem a forma compacta"
+        assert progresso.carrega_progresso_aluno(1234567) == carregado, "Snapshot compactado lido incorretamente"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+@_backend_json
+def test_modelos():
+    """Testa os modelos de domínio: valores pré-calculados, interface de dicionário, conversões e uso pelos backends."""
+    import pickle
+    from modelos import Exercicio, Progresso, Usuario, para_json
+    _reset_fs()
+    criar_usuarios_json()
+    criar_lista_exemplo(dados=[
+        {"Tema": "Soma", "Enunciado": "2+2?", "Alternativa A": "3", "Alternativa B": "4", "Alternativa C": "5", "RespostaCorreta": "B"},
+        {"Tema": "Soma", "Enunciado": "1+1?", "Alternativa A": "N/A", "Alternativa B": "2", "Alternativa C": "3",
+         "RespostaCorreta": "b", "Dica": "pares"},
+    ])
+    try:
+        dados = {"Tema": "Soma", "Enunciado": "1+1?", "Alternativa A": "N/A", "Alternativa B": "2", "Alternativa C": "3",
+                 "RespostaCorreta": "b", "Dica": "pares"}
+        ex = Exercicio.from_json(dados)
+        assert ex.opcoes == ("b", "c") and ex.resposta == "b" and ex.indice_resposta == 1, "Valores pré-calculados incorretos"
+        assert ex.texto_opcao("b") == "2" and ex.texto_opcao("a") is None, "Texto da alternativa incorreto"
+        assert ex == dados and ex.to_json() == dados and ex["Dica"] == "pares", "Conversão para JSON com perda"
+        assert pickle.loads(pickle.dumps(ex)) == dados and json.loads(json.dumps(ex, default=para_json)) == dados, \
+            "Cópia ou serialização incorreta"
+        ex["RespostaCorreta"] = "c"
+        assert ex.resposta == "c" and ex.indice_resposta == 2, "Valores não recalculados após alteração"
+        assert not hasattr(ex, "__dict__"), "Modelo sem __slots__"
+
+        # Listas: o cache guarda Exercicio; carrega() continua retornando dicionários novos.
+        compartilhados = listas_exercicios.carrega(str(LISTAS_DIR / "matematica.json"), somente_leitura=True)
+        assert all(isinstance(e, Exercicio) for e in compartilhados), "Cache sem modelos"
+        assert compartilhados[1].opcoes == ("b", "c") and compartilhados[0].resposta == "b", "Modelo da lista incorreto"
+        copias = auxiliar.get_backend().carrega_lista("matematica.json")
+        assert type(copias[0]) is dict and copias[1]["Dica"] == "pares", "carrega_lista deveria retornar dicionários"
+
+        # Usuários e progresso.
+        usuario = auxiliar.get_backend().busca_usuario("1234567")
+        assert isinstance(usuario, Usuario) and usuario["tipo"] == "aluno" and usuario.nome == "Aluno Teste", "Usuário incorreto"
+        progresso.registra_evento(1234567, "matematica.json", "resposta", indice=1, resposta="c", progresso=2)
+        dados_lista = progresso.carrega_progresso_aluno(1234567)["matematica.json"]
+        assert isinstance(dados_lista, Progresso) and dados_lista.respostas == {"1": "c"}, "Progresso incorreto"
+        assert dados_lista.to_json() == {"progresso": 2, "respostas": ".c", "status": "iniciado"}, "Forma gravada incorreta"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_gabarito_compilado():
+    """Testa o gabarito compilado: correção por questão, cache em memória e em disco, nova versão da lista e correção imediata."""
+    import builtins, contextlib, io, correcao, gabaritos
+    _reset_fs()
+    criar_usuarios_json()
+    criar_lista_exemplo(dados=[
+        {"Tema": "Soma", "Enunciado": "2+2?", "Alternativa A": "3", "Alternativa B": "4", "Alternativa C": "5", "RespostaCorreta": "b"},
+        {"Tema": "Soma", "Enunciado": "1+1?", "Alternativa A": "N/A", "Alternativa B": "2", "Alternativa C": "3", "RespostaCorreta": "ab"},
+    ])
+    input_original = builtins.input
+    try:
+        exercicios = auxiliar.load_json(str(LISTAS_DIR / "matematica.json"))
+        compilado = correcao.compila(exercicios)
+        assert compilado == ["b", "ab"] and list(compilado.codigos) == [2, correcao._GABARITO_INVALIDO], "Códigos incorretos"
+        assert compilado.corrige(0, "b") == correcao.ACERTO and compilado.corrige(0, "a") == correcao.ERRO, "Correção incorreta"
+        assert compilado.corrige(0, None) == correcao.NAO_RESPONDIDA, "Questão sem resposta incorreta"
+        assert compilado.opcao_valida(1, "b") and not compilado.opcao_valida(1, "a"), "Máscara de opções incorreta"
+        assert correcao.corrige_aluno(compilado, {"0": "b", "1": "b"}) == correcao.corrige_aluno(exercicios, {"0": "b", "1": "b"}), \
+            "Correção com o gabarito compilado diverge"
+
+        # Compilado uma vez por versão da lista: gravado em disco e reaproveitado da memória.
+        gabarito = gabaritos.da_lista("matematica.json")
+        arquivo = Path(gabaritos._gabarito_path(gabarito.hash))
+        assert gabarito == compilado and arquivo.exists(), "Gabarito não gravado em disco"
+        assert gabaritos.da_lista("matematica.json") is gabarito, "Gabarito não reaproveitado da memória"
+        gabaritos._cache.clear()
+        do_disco = gabaritos.da_lista("matematica.json")
+        assert do_disco is not gabarito and do_disco == gabarito and do_disco.codigos == gabarito.codigos \
+            and do_disco.mascaras == gabarito.mascaras, "Gabarito lido do disco incorreto"
+
+        # Exercícios alterados no lugar (mesma quantidade): o gabarito guardado não é usado para eles.
+        alterados = auxiliar.get_backend().carrega_lista("matematica.json")
+        alterados[0]["RespostaCorreta"] = "c"
+        assert gabaritos.da_lista("matematica.json", alterados) == ["c", "ab"], "Gabarito desatualizado para exercícios alterados"
+        assert gabaritos.da_lista("matematica.json") is do_disco, "Gabarito guardado substituído"
+
+        # Exercícios carregados com o hash da versão: o gabarito guardado é usado sem reserializar a lista.
+        exercicios_versao, hash_versao = auxiliar.get_backend().carrega_lista_versionada("matematica.json", somente_leitura=True)
+        assert hash_versao == auxiliar.get_backend().catalogo_listas()["matematica.json"]["hash"], "Hash da versão carregada incorreto"
+        serializa_original = listas_exercicios.serializa
+        def serializa_proibido(*args, **kwargs):
+            raise AssertionError("Lista reserializada")
+        listas_exercicios.serializa = serializa_proibido
+        try:
+            assert gabaritos.da_lista("matematica.json", exercicios_versao, hash_versao) is do_disco, \
+                "Gabarito guardado não usado para a versão catalogada"
+        finally:
+            listas_exercicios.serializa = serializa_original
+
+        # Alterar a lista gera um novo gabarito.
+        professor.cria_exercicios("matematica.json", [{"tema": "Soma", "enunciado": "3+3?", "alternativas": ["6", "7", "8"],
+                                                        "resposta_correta": "a"}])
+        novo = gabaritos.da_lista("matematica.json")
+        assert novo.hash != gabarito.hash and novo == ["b", "ab", "a"], "Gabarito não acompanhou a alteração da lista"
+        antigo = gabaritos.da_lista("matematica.json", exercicios_versao, hash_versao)
+        assert antigo == ["b", "ab"] and gabaritos.da_lista("matematica.json") is novo, "Versão anterior usou o gabarito atual"
+
+        # Correção imediata ao responder.
+        respostas = iter(["b", "parar"])
+        builtins.input = lambda prompt="": next(respostas)
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            aluno.responder_lista(1234567, "matematica.json", auxiliar.get_backend().carrega_lista("matematica.json"),
+                                  feedback_imediato=True)
+        assert "Resposta correta!" in saida.getvalue(), "Correção imediata não exibida"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        builtins.input = input_original
+
+def test_migra_progresso_monolitico():
+    """Testa a divisão do progresso_alunos.json antigo em partições por aluno."""
+    _reset_fs()
+    criar_progresso_json()
+    try:
+        assert progresso.carrega_progresso_aluno(1234567)["matematica.json"]["progresso"] == 1, "Formato antigo não lido"
+        resultado = progresso.migra_progresso_monolitico()
+        assert resultado["status"] == "sucesso", resultado["mensagem"]
+        assert not PROGRESSO_JSON.exists(), "Arquivo antigo deveria ter sido renomeado"
+        assert progresso.carrega_progresso_aluno(1234567)["matematica.json"]["respostas"] == {"0": "b"}, "Progresso perdido na migração"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_metricas():
+    """Testa a instrumentação: contadores por arquivo e por operação, exportação e ausência de coleta quando desativada."""
+    import metricas
+    _reset_fs()
+    caminho = str(JSON_TEST_DIR / "metricas.json")
+    try:
+        metricas.zera()
+        auxiliar.save_json({"a": 1}, caminho) # Desativada: nada é registrado.
+        assert metricas.instantaneo()["arquivos"] == {}, "Coletou métricas com a instrumentação desativada"
+        metricas.ativa()
+        auxiliar.save_json({"a": 2}, caminho)
+        auxiliar.load_json(caminho)
+        auxiliar.load_json(caminho)
+        with metricas.cronometro("teste.operacao"):
+            pass
+        dados = metricas.instantaneo()
+        contadores = dados["arquivos"][caminho]
+        assert contadores["gravacoes"] == 1 and contadores["bytes_gravados"] > 0, "Gravação não registrada"
+        assert contadores["leituras_disco"] + contadores["leituras_cache"] == 2, "Leituras não registradas"
+        assert dados["operacoes"]["teste.operacao"]["chamadas"] == 1, "Operação não registrada"
+        saida = JSON_TEST_DIR / "metricas.prom"
+        metricas.grava(str(saida))
+        assert 'prog_modular_operacao_chamadas_total{operacao="teste.operacao"} 1' in saida.read_text(encoding="utf-8"), "Formato Prometheus incorreto"
+        assert json.loads(metricas.formata_json())["operacoes"]["teste.operacao"]["erros"] == 0, "Formato JSON incorreto"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        metricas.desativa()
+        metricas.zera()
+
+def test_backend_sqlite():
+    """Testa a importação dos JSONs para o backend SQLite e as operações de professor/aluno sobre ele."""
+    _reset_fs()
+    criar_usuarios_json()
+    criar_turmas_json()
+    criar_progresso_json()
+    criar_lista_exemplo()
+    backend_original = auxiliar.BACKEND_ARMAZENAMENTO
+    auxiliar.BACKEND_ARMAZENAMENTO = "sqlite"
+    try:
+        armazenamento_sqlite.importa_json()
+        assert cadastro.entra_conta("1234567", "abc") is not None, "Usuário não importado"
+        assert aluno._get_aluno_turmas_e_listas(1234567) == {"Turma A": ["matematica.json"]}, "Matrícula não importada"
+        assert professor.insere_aluno("Turma B", 1234567)["status"] == "sucesso", "Inserção falhou"
+        assert professor.insere_aluno("Turma B", 1234567)["status"] == "erro", "Inserção duplicada aceita"
+        assert professor.passa_lista("matematica.json", "Turma B")["status"] == "sucesso", "Associação falhou"
+        resultado = professor.visualiza_turma("Turma A")
+        assert resultado["listas"][0]["indice_acerto"] == "100.00%", "Índice de acerto incorreto"
+        assert aluno.envia_respostas(1234567, "matematica.json", {0: "c"})["erros"] == 1, "Envio incorreto"
+        assert armazenamento_sqlite.carrega_progresso_aluno(1234567)["matematica.json"] == {
+            "progresso": 1, "respostas": {"0": "c"}, "status": "completo"}, "Envio não gravado"
+        assert professor.visualiza_turma("Turma A")["listas"][0]["indice_acerto"] == "0.00%", "Estatísticas não atualizadas"
+        exercicios = armazenamento_sqlite.carrega_lista("matematica.json")
+        professor.cria_exercicio(exercicios, "Álgebra", "x+1=2?", ["0", "1", "2"], "b", "matematica.json")
+        catalogo = professor.get_catalogo_listas()["matematica.json"]
+        assert catalogo["exercicios"] == len(exercicios) and "Álgebra" in catalogo["temas"], "Catálogo SQLite não atualizado"
+        assert catalogo["hash"] == auxiliar.resumo_lista(exercicios, listas_exercicios.serializa(exercicios))["hash"], "Hash incorreto"
+        assert armazenamento_sqlite.carrega_pagina_lista("matematica.json", 1, 10) == (exercicios[1:], 2), "Página SQLite incorreta"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    finally:
+        armazenamento_sqlite.fecha_conexao()
+        auxiliar.BACKEND_ARMAZENAMENTO = backend_original
+
+def test_concorrencia_processos():
+    """Testa gravações concorrentes: atualiza_json refaz a alteração após um conflito e vários processos não perdem atualizações."""
+    from benchmark.concorrencia import executa_concorrencia
+    _reset_fs()
+    try:
+        caminho = str(JSON_TEST_DIR / "contador.json")
+        auxiliar.save_json({"valor": 0}, caminho)
+        chamadas = []
+        def incrementa(dados):
+            if not chamadas: # Outro "processo" grava entre a leitura e a gravação desta alteração.
+                auxiliar.save_json({"valor": 10}, caminho)
+            chamadas.append(dados["valor"])
+            dados["valor"] += 1
+            return True, dados["valor"]
+        assert auxiliar.atualiza_json(caminho, incrementa) == 11, "Alteração não refeita sobre os dados novos"
+        assert chamadas == [0, 10] and auxiliar.load_json(caminho)["valor"] == 11, "Conflito não detectado"
+        with auxiliar.trava_arquivo(caminho), auxiliar.trava_arquivo(caminho): # Reentrante na mesma thread.
+            pass
+
+        relatorio = executa_concorrencia(processos=(3,), operacoes=8, diretorio=str(JSON_TEST_DIR / "conc"))
+        rodada = relatorio["rodadas"][0]
+        assert rodada["erros"] == 0, rodada["primeiros_erros"]
+        assert not any(rodada["atualizacoes_perdidas"].values()), f"Atualizações perdidas: {rodada['atualizacoes_perdidas']}"
+        assert rodada["operacoes"] == 96 and relatorio["sem_perdas"], "Relatório incompleto"
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+def test_benchmark():
+    """Testa o benchmark em escala mínima: relatório completo e caminhos de 'auxiliar' restaurados ao final."""
+    from benchmark import executa_benchmark
+    _reset_fs()
+    caminho_turmas = auxiliar.TURMAS_JSON_PATH
+    try:
+        relatorio = executa_benchmark(str(JSON_TEST_DIR / "bench"), repeticoes=2, alunos=20, turmas=3, listas=6,
+                                      exercicios_por_lista=3, iteracoes_pbkdf2=1000)
+        assert auxiliar.TURMAS_JSON_PATH == caminho_turmas, "Caminhos de auxiliar não restaurados"
+        assert relatorio["geracao"]["usuarios"] == 30, "Quantidade de usuários gerados incorreta"
+        for nome in ("entra_conta", "insere_aluno", "passa_lista", "visualiza_turma",
+                     "_get_aluno_turmas_e_listas", "responder_lista"):
+            medidas = relatorio["operacoes"][nome]
+            assert medidas["repeticoes"] == 2, f"Operação {nome} não medida"
+            assert medidas["latencia_ms"]["p50"] <= medidas["latencia_ms"]["maximo"], f"Percentis incoerentes em {nome}"
+        assert relatorio["autenticacao"]["iteracoes_pbkdf2"] == 1000, "Custo do PBKDF2 não aplicado"
+        assert relatorio["autenticacao"]["logins_por_segundo_por_nucleo"] > 0, "Logins por segundo não calculados"
+        json.dumps(relatorio) # O relatório deve ser serializável em JSON.
+        return True, "OK"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
 def run_all_tests():
     tests = [
         ("test_save_and_load_json", test_save_and_load_json),
         ("test_load_json_inexistente", test_load_json_inexistente),
         ("test_load_json_corrompido", test_load_json_corrompido),
+        ("test_load_json_cache", test_load_json_cache),
+        ("test_save_json_lote", test_save_json_lote),
         ("test_cria_usuario_e_login", test_cria_usuario_e_login),
+        ("test_diretorio_usuarios", test_diretorio_usuarios),
+        ("test_senhas_e_sessao", test_senhas_e_sessao),
+        ("test_importacao_em_lote", test_importacao_em_lote),
         ("test_cria_turma", test_cria_turma),
         ("test_insere_e_remove_aluno", test_insere_e_remove_aluno),
         ("test_cria_exercicio", test_cria_exercicio),
+        ("test_listas_formato_acrescimo", test_listas_formato_acrescimo),
+        ("test_catalogo_listas", test_catalogo_listas),
+        ("test_leitura_paginada", test_leitura_paginada),
         ("test_get_aluno_turmas_e_listas", test_get_aluno_turmas_e_listas),
+        ("test_indice_matriculas", test_indice_matriculas),
+        ("test_turmas_particionadas", test_turmas_particionadas),
+        ("test_matriculas_ordenadas", test_matriculas_ordenadas),
+        ("test_motor_correcao", test_motor_correcao),
+        ("test_correcao_vetorizada", test_correcao_vetorizada),
+        ("test_estatisticas_turma", test_estatisticas_turma),
+        ("test_envio_respostas", test_envio_respostas),
+        ("test_servico_http", test_servico_http),
+        ("test_modo_lote", test_modo_lote),
+        ("test_diario_progresso", test_diario_progresso),
+        ("test_respostas_compactas", test_respostas_compactas),
+        ("test_modelos", test_modelos),
+        ("test_gabarito_compilado", test_gabarito_compilado),
+        ("test_migra_progresso_monolitico", test_migra_progresso_monolitico),
+        ("test_metricas", test_metricas),
+        ("test_backend_sqlite", test_backend_sqlite),
+        ("test_concorrencia_processos", test_concorrencia_processos),
+        ("test_benchmark", test_benchmark),
         # Adicione mais funções de teste conforme necessário
     ]
     total = len(tests)
@@ -294,7 +1345,7 @@ def run_all_tests():
             ok = False
             msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
         if ok:
-            relatorio.append(f"[OK]   {nome}")
+            relatorio.append(f"[OK]   {nome}" + (f" ({msg})" if msg != "OK" else ""))
             passed += 1
         else:
             relatorio.append(f"[FAIL] {nome} -> {msg}")